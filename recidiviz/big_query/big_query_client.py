@@ -310,15 +310,19 @@ class BigQueryClient:
         self,
         query_job: bigquery.QueryJob,
         page_size: int,
-        process_fn: Callable[[bigquery.table.Row], None],
+        process_fn: Callable[[List[bigquery.table.Row]], None],
     ) -> None:
         """Reads the given result set from the given query job in pages to limit how many rows are read into memory at
-        any given time, processing the results of each row with the given callable.
+        any given time, processing each page of rows with the given callable.
+
+        The result set is read in a single linear pass, following the page token returned with each page rather than
+        re-reading from an offset.
 
         Args:
             query_job: the query job from which to process results.
             page_size: the maximum number of rows to read in at a time.
-            process_fn: a callable function which takes in one row from the result set and performs some operation.
+            process_fn: a callable function which takes in a batch of rows from the result set and performs some
+                operation.
         """
 
     @abc.abstractmethod
@@ -408,8 +412,9 @@ class BigQueryClient:
         destination_dataset_ref: bigquery.DatasetReference,
         destination_table_id: str,
         destination_table_schema: List[bigquery.SchemaField],
+        source_format: str = bigquery.SourceFormat.CSV,
     ) -> bigquery.job.LoadJob:
-        """Inserts rows from CSV data in GCS into a table in BigQuery.
+        """Inserts rows from CSV (or other bigquery.SourceFormat) data in GCS into a table in BigQuery.
 
         Given a desired table name, source data URI and destination schema, inserts the data into the BigQuery table.
 
@@ -424,6 +429,9 @@ class BigQueryClient:
             destination_table_id: String name of the table to import.
             destination_table_schema: Defines a list of field schema information for each expected column in the input
                 file.
+            source_format: The bigquery.SourceFormat of the data at the source URI. For self-describing formats
+                (e.g. PARQUET), the schema is read from the source file and destination_table_schema is not sent
+                with the load job.
         Returns:
             The LoadJob object containing job details.
         """
@@ -707,6 +715,7 @@ class BigQueryClientImpl(BigQueryClient):
         destination_table_id: str,
         destination_table_schema: List[bigquery.SchemaField],
         write_disposition: bigquery.WriteDisposition,
+        source_format: str = bigquery.SourceFormat.CSV,
     ) -> bigquery.job.LoadJob:
         """Triggers a load job, i.e. a job that will copy all of the data from the given Cloud Storage source into
         the given BigQuery destination. Returns once the job has been started."""
@@ -716,9 +725,10 @@ class BigQueryClientImpl(BigQueryClient):
         destination_table_ref = destination_dataset_ref.table(destination_table_id)
 
         job_config = bigquery.LoadJobConfig()
-        job_config.schema = destination_table_schema
-        job_config.source_format = bigquery.SourceFormat.CSV
-        job_config.allow_quoted_newlines = True
+        job_config.source_format = source_format
+        if source_format == bigquery.SourceFormat.CSV:
+            job_config.schema = destination_table_schema
+            job_config.allow_quoted_newlines = True
         job_config.write_disposition = write_disposition
 
         load_job = self.client.load_table_from_uri(
@@ -844,39 +854,25 @@ class BigQueryClientImpl(BigQueryClient):
         self,
         query_job: bigquery.QueryJob,
         page_size: int,
-        process_fn: Callable[[bigquery.table.Row], None],
+        process_fn: Callable[[List[bigquery.table.Row]], None],
     ) -> None:
         logging.debug(
             "Querying for first page of results to perform %s...", process_fn.__name__
         )
 
-        start_index = 0
-
-        while True:
-            page_rows: bigquery.table.RowIterator = query_job.result(
-                max_results=page_size, start_index=start_index
-            )
-            logging.debug(
-                "Retrieved result set from query page of size [%d] starting at index [%d]",
-                page_size,
-                start_index,
-            )
-
-            rows_processed = 0
-            for row in page_rows:
-                process_fn(row)
-                rows_processed += 1
+        # Iterating over the pages of the RowIterator follows the page token returned with each page, so the result
+        # set is read once from start to finish.
+        row_iterator: bigquery.table.RowIterator = query_job.result(page_size=page_size)
 
-            logging.debug(
-                "Processed [%d] rows from query page starting at index [%d]",
-                rows_processed,
-                start_index,
-            )
-            if rows_processed == 0:
-                break
+        rows_processed = 0
+        for page in row_iterator.pages:
+            page_rows = list(page)
+            if not page_rows:
+                continue
 
-            start_index += rows_processed
-            logging.debug("Processed [%d] rows...", start_index)
+            process_fn(page_rows)
+            rows_processed += len(page_rows)
+            logging.debug("Processed [%d] rows...", rows_processed)
 
     def copy_view(
         self,
@@ -1082,6 +1078,7 @@ class BigQueryClientImpl(BigQueryClient):
         destination_dataset_ref: bigquery.DatasetReference,
         destination_table_id: str,
         destination_table_schema: List[bigquery.SchemaField],
+        source_format: str = bigquery.SourceFormat.CSV,
     ) -> bigquery.job.LoadJob:
         return self._load_table_from_cloud_storage_async(
             source_uri=source_uri,
@@ -1089,6 +1086,7 @@ class BigQueryClientImpl(BigQueryClient):
             destination_table_id=destination_table_id,
             destination_table_schema=destination_table_schema,
             write_disposition=bigquery.WriteDisposition.WRITE_APPEND,
+            source_format=source_format,
         )
 
     def delete_from_table_async(
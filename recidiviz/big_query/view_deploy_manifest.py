@@ -0,0 +1,134 @@
+# Recidiviz - a data platform for criminal justice reform
+# Copyright (C) 2021 Recidiviz, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# =============================================================================
+"""Tracks the content of the views deployed to BigQuery so that deploys can skip views that have not changed.
+
+Each view is assigned a content hash built from its rendered view query, its materialized table id and the content
+hashes of all of its parent views in the DAG. A view's hash therefore changes whenever the view itself or any view
+upstream of it changes. The hashes of the last successfully deployed views are stored as a JSON manifest in GCS.
+"""
+import hashlib
+import json
+import logging
+from typing import Dict, Optional
+
+from recidiviz.big_query.big_query_view import BigQueryView
+from recidiviz.big_query.big_query_view_dag_walker import (
+    BigQueryViewDagWalker,
+    DagKey,
+)
+from recidiviz.cloud_storage.gcs_file_system import GCSFileSystem
+from recidiviz.cloud_storage.gcsfs_path import GcsfsFilePath
+from recidiviz.utils import metadata
+
+# Bump this to invalidate all stored hashes, e.g. when the steps taken to deploy a single view change.
+VIEW_DEPLOY_MANIFEST_VERSION = 1
+
+VIEW_DEPLOY_MANIFEST_FILE_NAME = "view_deploy_manifest.json"
+
+
+def view_deploy_manifest_path(project_id: Optional[str] = None) -> GcsfsFilePath:
+    if not project_id:
+        project_id = metadata.project_id()
+    return GcsfsFilePath.from_absolute_path(
+        f"gs://{project_id}-configs/{VIEW_DEPLOY_MANIFEST_FILE_NAME}"
+    )
+
+
+def _manifest_key(view: BigQueryView) -> str:
+    return f"{view.dataset_id}.{view.view_id}"
+
+
+def compute_view_content_hashes(
+    dag_walker: BigQueryViewDagWalker,
+) -> Dict[DagKey, str]:
+    """Returns a content hash for every view in the DAG, keyed by DAG key. Parents that are not views in the DAG
+    (i.e. source tables) only contribute to the hash through the text of the view query that references them.
+    """
+    hashes: Dict[DagKey, str] = {}
+
+    def _hash_for_key(key: DagKey) -> str:
+        if key in hashes:
+            return hashes[key]
+        node = dag_walker.nodes_by_key[key]
+        parent_hashes = sorted(
+            _hash_for_key(parent_key)
+            for parent_key in node.parent_keys
+            if parent_key in dag_walker.nodes_by_key
+        )
+        content = json.dumps(
+            [
+                VIEW_DEPLOY_MANIFEST_VERSION,
+                node.view.view_query,
+                node.view.materialized_view_table_id,
+                parent_hashes,
+            ]
+        )
+        hashes[key] = hashlib.sha256(content.encode("utf-8")).hexdigest()
+        return hashes[key]
+
+    for dag_key in dag_walker.nodes_by_key:
+        _hash_for_key(dag_key)
+    return hashes
+
+
+class ViewDeployManifest:
+    """The content hashes of the views as of the last successful deploy, read from and written to GCS."""
+
+    def __init__(self, fs: GCSFileSystem, path: GcsfsFilePath):
+        self.fs = fs
+        self.path = path
+        self.hashes_by_view: Dict[str, str] = self._load()
+        self._updated_hashes_by_view: Dict[str, str] = {}
+
+    def _load(self) -> Dict[str, str]:
+        if not self.fs.exists(self.path):
+            return {}
+        contents = json.loads(self.fs.download_as_string(self.path))
+        if contents.get("version") != VIEW_DEPLOY_MANIFEST_VERSION:
+            logging.info(
+                "Ignoring view deploy manifest at [%s] with outdated version [%s].",
+                self.path.abs_path(),
+                contents.get("version"),
+            )
+            return {}
+        return contents["views"]
+
+    def is_unchanged(self, view: BigQueryView, content_hash: str) -> bool:
+        """Returns True if the view was deployed with the given content hash in the last successful deploy."""
+        return self.hashes_by_view.get(_manifest_key(view)) == content_hash
+
+    def update(self, content_hashes: Dict[BigQueryView, str]) -> None:
+        for view, content_hash in content_hashes.items():
+            self._updated_hashes_by_view[_manifest_key(view)] = content_hash
+        self.hashes_by_view.update(self._updated_hashes_by_view)
+
+    def save(self) -> None:
+        """Saves the updated hashes on top of the manifest as it is in GCS now, rather than as it was when this
+        manifest was loaded, so that views recorded by a deploy of another namespace that finished in the meantime are
+        kept."""
+        self.hashes_by_view = {**self._load(), **self._updated_hashes_by_view}
+        self.fs.upload_from_string(
+            self.path,
+            json.dumps(
+                {
+                    "version": VIEW_DEPLOY_MANIFEST_VERSION,
+                    "views": self.hashes_by_view,
+                },
+                sort_keys=True,
+            ),
+            content_type="application/json",
+        )
@@ -28,7 +28,15 @@ from recidiviz.big_query.big_query_view import (
     BigQueryViewBuilder,
     BigQueryViewBuilderShouldNotBuildError,
 )
-from recidiviz.big_query.big_query_view_dag_walker import BigQueryViewDagWalker
+from recidiviz.big_query.big_query_view_dag_walker import (
+    BigQueryViewDagWalker,
+    DagKey,
+)
+from recidiviz.big_query.view_deploy_manifest import (
+    ViewDeployManifest,
+    compute_view_content_hashes,
+    view_deploy_manifest_path,
+)
 from recidiviz.calculator.query.county.dataset_config import COUNTY_BASE_DATASET
 from recidiviz.calculator.query.county.view_config import (
     VIEW_BUILDERS_FOR_VIEWS_TO_UPDATE as COUNTY_VIEW_BUILDERS,
@@ -53,6 +61,7 @@ from recidiviz.calculator.query.state.view_config import (
 from recidiviz.case_triage.views.view_config import (
     VIEW_BUILDERS_FOR_VIEWS_TO_UPDATE as CASE_TRIAGE_VIEW_BUILDERS,
 )
+from recidiviz.cloud_storage.gcsfs_factory import GcsfsFactory
 from recidiviz.common.constants.states import StateCode
 from recidiviz.ingest.direct.views.view_config import (
     VIEW_BUILDERS_FOR_VIEWS_TO_UPDATE as DIRECT_INGEST_VIEW_BUILDERS,
@@ -205,6 +214,7 @@ def create_dataset_and_deploy_views_for_view_builders(
     bq_view_namespace: BigQueryViewNamespace,
     view_builders_to_update: Sequence[BigQueryViewBuilder],
     dataset_overrides: Optional[Dict[str, str]] = None,
+    skip_unchanged_views: bool = False,
 ) -> None:
     """Creates or updates all the views in the provided list with the view query in the provided view builder list. If
     any materialized view has been updated (or if an ancestor view has been updated), the view will be re-materialized
@@ -212,6 +222,14 @@ def create_dataset_and_deploy_views_for_view_builders(
 
     Should only be called if we expect the views to have changed (either the view query or schema from querying
     underlying tables), e.g. at deploy time.
+
+    If |skip_unchanged_views| is True, views whose content hash (see view_deploy_manifest.py) matches the hash
+    recorded in the view deploy manifest at the last successful deploy are not touched at all. Because the hash does
+    not capture the schemas of source tables, this should not be used when source table schemas may have changed.
+
+    The view deploy manifest is only read and saved for deploys of the real views (no |dataset_overrides|) or when
+    |skip_unchanged_views| is True, so that sandbox deploys do not add their views to the manifest or need access to
+    the configs bucket.
     """
     set_default_table_expiration_for_new_datasets = bool(dataset_overrides)
     if set_default_table_expiration_for_new_datasets:
@@ -226,7 +244,10 @@ def create_dataset_and_deploy_views_for_view_builders(
         )
 
         _create_dataset_and_deploy_views(
-            views_to_update, set_default_table_expiration_for_new_datasets
+            views_to_update,
+            set_default_table_expiration_for_new_datasets,
+            skip_unchanged_views=skip_unchanged_views,
+            update_view_deploy_manifest=skip_unchanged_views or not dataset_overrides,
         )
     except Exception as e:
         with monitoring.measurements(
@@ -286,7 +307,10 @@ def _create_all_datasets_if_necessary(
 
 
 def _create_dataset_and_deploy_views(
-    views_to_update: List[BigQueryView], set_temp_dataset_table_expiration: bool = False
+    views_to_update: List[BigQueryView],
+    set_temp_dataset_table_expiration: bool = False,
+    skip_unchanged_views: bool = False,
+    update_view_deploy_manifest: bool = False,
 ) -> None:
     """Create and update the given views and their parent datasets.
 
@@ -299,6 +323,10 @@ def _create_dataset_and_deploy_views(
         views_to_update: A list of view objects to be created or updated.
         set_temp_dataset_table_expiration: If True, new datasets will be created with an expiration of
             TEMP_DATASET_DEFAULT_TABLE_EXPIRATION_MS.
+        skip_unchanged_views: If True, views that are unchanged since the last successful deploy according to the
+            view deploy manifest are skipped. Implies update_view_deploy_manifest.
+        update_view_deploy_manifest: If True, the view deploy manifest is updated with the deployed views once all
+            views have been deployed.
     """
 
     bq_client = BigQueryClientImpl()
@@ -308,14 +336,44 @@ def _create_dataset_and_deploy_views(
 
     dag_walker = BigQueryViewDagWalker(views_to_update)
 
+    manifest: Optional[ViewDeployManifest] = None
+    content_hashes: Dict[DagKey, str] = {}
+    if skip_unchanged_views or update_view_deploy_manifest:
+        # The manifest is saved after every successful deploy of the real views, whether or not unchanged views are
+        # skipped, so that it always reflects what is currently deployed.
+        manifest = ViewDeployManifest(GcsfsFactory.build(), view_deploy_manifest_path())
+        content_hashes = compute_view_content_hashes(dag_walker)
+
     def process_fn(v: BigQueryView, parent_results: Dict[BigQueryView, bool]) -> bool:
         """Returns True if this view or any of its parents were updated."""
+        if (
+            skip_unchanged_views
+            and manifest is not None
+            and manifest.is_unchanged(v, content_hashes[(v.dataset_id, v.view_id)])
+        ):
+            logging.info(
+                "Skipping view [%s.%s] which has not changed since the last deploy.",
+                v.dataset_id,
+                v.view_id,
+            )
+            return False
         return _create_or_update_view_and_materialize_if_necessary(
             bq_client, v, parent_results
         )
 
     dag_walker.process_dag(process_fn)
 
+    if manifest is None:
+        return
+
+    manifest.update(
+        {
+            node.view: content_hashes[dag_key]
+            for dag_key, node in dag_walker.nodes_by_key.items()
+        }
+    )
+    manifest.save()
+
 
 def _create_or_update_view_and_materialize_if_necessary(
     bq_client: BigQueryClient,
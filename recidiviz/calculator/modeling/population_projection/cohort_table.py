@@ -16,71 +16,174 @@
 # =============================================================================
 """Encapsulate the population data per cohort and time step"""
 
+from typing import Dict, List, Tuple
+
+import numpy as np
 import pandas as pd
 
+# Number of time steps to allocate room for up front, the array doubles in size when it runs out of room
+_INITIAL_TS_CAPACITY = 16
+
 
 class CohortTable:
-    """Store population counts for one cohort of people that enter one category in the same year"""
+    """Store population counts for one cohort of people that enter one category in the same year
+
+    Populations are kept in a preallocated 2-D array of cohort start ts x projection ts, so that appending a cohort
+    or the counts for a new ts does not copy the whole table on every time step.
+    """
 
     def __init__(self, starting_ts: int, transition_table_max_length: int):
-        self.cohort_df = pd.DataFrame(
-            dtype=float,
-            index=range(starting_ts - transition_table_max_length, starting_ts),
+        self._start_ts: List[int] = []
+        self._projection_ts: List[int] = []
+        self._start_ts_positions: Dict[int, int] = {}
+        self._projection_ts_positions: Dict[int, int] = {}
+        self._populations = np.zeros((0, 0))
+
+        self._reset(
+            list(range(starting_ts - transition_table_max_length, starting_ts)),
+            [],
+            np.zeros((transition_table_max_length, 0)),
         )
 
-        self.retired_cohort_df = pd.DataFrame()
+    def _reset(
+        self, start_ts: List[int], projection_ts: List[int], populations: np.ndarray
+    ) -> None:
+        self._start_ts = start_ts
+        self._projection_ts = projection_ts
+        self._start_ts_positions = {ts: i for i, ts in enumerate(start_ts)}
+        self._projection_ts_positions = {ts: i for i, ts in enumerate(projection_ts)}
+        self._populations = np.zeros(
+            self._capacity(populations.shape[0], populations.shape[1])
+        )
+        self._populations[: populations.shape[0], : populations.shape[1]] = populations
 
-    def get_latest_population(self) -> pd.Series:
-        if self.cohort_df.empty:
-            return pd.Series({start_ts: 0 for start_ts in self.cohort_df.index})
+    @staticmethod
+    def _capacity(num_rows: int, num_columns: int) -> Tuple[int, int]:
+        return (
+            max(num_rows * 2, num_rows + _INITIAL_TS_CAPACITY),
+            max(num_columns * 2, _INITIAL_TS_CAPACITY),
+        )
+
+    def _ensure_capacity(self, num_rows: int, num_columns: int) -> None:
+        if (
+            num_rows <= self._populations.shape[0]
+            and num_columns <= self._populations.shape[1]
+        ):
+            return
+        populations = self._populations
+        self._populations = np.zeros(self._capacity(num_rows, num_columns))
+        self._populations[: populations.shape[0], : populations.shape[1]] = populations
+
+    def _used_populations(self) -> np.ndarray:
+        return self._populations[: len(self._start_ts), : len(self._projection_ts)]
+
+    @property
+    def cohort_df(self) -> pd.DataFrame:
+        """DataFrame of the population per cohort start ts (index) and projection ts (columns). The DataFrame shares
+        memory with the table, so it should be treated as read only."""
+        return pd.DataFrame(
+            self._used_populations(),
+            index=pd.Index(self._start_ts, dtype=int),
+            columns=pd.Index(self._projection_ts, dtype=int),
+            copy=False,
+        )
 
-        return self.cohort_df.iloc[:, -1]
+    @property
+    def start_ts_values(self) -> np.ndarray:
+        """The start ts of each cohort, in the same order as get_latest_population_values()"""
+        return np.array(self._start_ts, dtype=int)
+
+    def get_latest_population_values(self) -> np.ndarray:
+        """Return the population of each cohort at the latest ts, or zeros if no ts has been recorded yet"""
+        if not self._projection_ts:
+            return np.zeros(len(self._start_ts))
+        return self._populations[: len(self._start_ts), len(self._projection_ts) - 1]
+
+    def get_latest_population(self) -> pd.Series:
+        return pd.Series(
+            self.get_latest_population_values().copy(),
+            index=pd.Index(self._start_ts, dtype=int),
+        )
 
     def get_per_ts_population(self) -> pd.Series:
-        return self.cohort_df.sum(axis=0)
+        return pd.Series(
+            self._used_populations().sum(axis=0),
+            index=pd.Index(self._projection_ts, dtype=int),
+        )
 
     def append_ts_end_count(self, cohort_sizes: pd.Series, projection_ts: int) -> None:
-        """Append the cohort sizes for the end of the projection ts"""
-        latest_population = self.get_latest_population()
-        if (round(cohort_sizes, 8) > round(latest_population, 8)).any():
+        """Append the cohort sizes for the end of the projection ts. Cohorts missing from `cohort_sizes` are empty"""
+        self.append_ts_end_values(
+            cohort_sizes.reindex(self._start_ts, fill_value=0).to_numpy(dtype=float),
+            projection_ts,
+        )
+
+    def append_ts_end_values(
+        self, cohort_sizes: np.ndarray, projection_ts: int
+    ) -> None:
+        """Append the cohort sizes for the end of the projection ts, given in the same order as the cohorts"""
+        latest_population = self.get_latest_population_values()
+        too_large = np.round(cohort_sizes, 8) > np.round(latest_population, 8)
+        if too_large.any():
+            start_ts = np.array(self._start_ts)[too_large]
             raise ValueError(
                 "Cannot append cohort data that is larger than the latest population\n"
-                f"Latest population: {latest_population[cohort_sizes > latest_population]}\n"
-                f"Attempting to append: {cohort_sizes[cohort_sizes > latest_population]}"
+                f"Latest population: {pd.Series(latest_population[too_large], index=start_ts)}\n"
+                f"Attempting to append: {pd.Series(cohort_sizes[too_large], index=start_ts)}"
             )
 
-        if projection_ts in self.cohort_df.columns:
+        if projection_ts in self._projection_ts_positions:
             raise ValueError(f"Cannot overwrite cohort for time {projection_ts}")
 
-        self.cohort_df[projection_ts] = cohort_sizes
+        column = len(self._projection_ts)
+        self._ensure_capacity(len(self._start_ts), column + 1)
+        self._populations[: len(self._start_ts), column] = cohort_sizes
+        self._projection_ts.append(projection_ts)
+        self._projection_ts_positions[projection_ts] = column
 
     def append_cohort(self, cohort_size: float, projection_ts: int) -> None:
         """Add a new cohort to the bottom of the cohort table"""
-        if projection_ts not in self.cohort_df.columns:
+        if projection_ts not in self._projection_ts_positions:
             raise ValueError(
                 f"Cannot append cohort with start time {projection_ts} outside of CohortTable timeline "
-                f"{self.cohort_df.columns}"
+                f"{self._projection_ts}"
             )
-        if projection_ts in self.cohort_df.index:
+        if projection_ts in self._start_ts_positions:
             raise ValueError(f"Cannot overwrite cohort for time {projection_ts}")
-        self.cohort_df = self.cohort_df.append(
-            pd.DataFrame({projection_ts: [cohort_size]}, index=[projection_ts])
-        ).fillna(0)
+
+        row = len(self._start_ts)
+        self._ensure_capacity(row + 1, len(self._projection_ts))
+        self._populations[row, : len(self._projection_ts)] = 0
+        self._populations[
+            row, self._projection_ts_positions[projection_ts]
+        ] = cohort_size
+        self._start_ts.append(projection_ts)
+        self._start_ts_positions[projection_ts] = row
 
     def scale_cohort_size(self, scalar: float) -> None:
         if scalar < 0:
             raise ValueError(f"Cannot scale cohort by a negative factor: {scalar}")
-        self.cohort_df *= scalar
-
-    def get_cohort_timeline(self, cohort_start_year: int) -> pd.DataFrame:
-        return self.cohort_df.loc[cohort_start_year]
+        self._used_populations()[:] *= scalar
+
+    def get_cohort_timeline(self, cohort_start_year: int) -> pd.Series:
+        return pd.Series(
+            self._populations[
+                self._start_ts_positions[cohort_start_year], : len(self._projection_ts)
+            ].copy(),
+            index=pd.Index(self._projection_ts, dtype=int),
+            name=cohort_start_year,
+        )
 
-    def pop_cohorts(self):
+    def pop_cohorts(self) -> pd.DataFrame:
         """pop cohort_df for cross-simulation flow"""
         cohort_df = self.cohort_df
-        self.cohort_df = pd.DataFrame()
+        self._reset([], [], np.zeros((0, 0)))
         return cohort_df
 
     def ingest_cross_simulation_cohorts(self, cross_simulation_flows: pd.DataFrame):
         """ingest new cohort_df from cross-simulation flow"""
-        self.cohort_df = cross_simulation_flows
+        self._reset(
+            list(cross_simulation_flows.index),
+            list(cross_simulation_flows.columns),
+            cross_simulation_flows.to_numpy(dtype=float),
+        )
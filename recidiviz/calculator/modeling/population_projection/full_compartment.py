@@ -55,8 +55,8 @@ class FullCompartment(SparkCompartment):
         # transition tables object from compartment out
         self.transition_tables = transition_tables
 
-        # Series containing compartment population at the end of each ts in the simulation
-        self.end_ts_populations = pd.Series(dtype=float)
+        # compartment population at the end of each ts in the simulation
+        self.end_ts_populations: Dict[int, float] = {}
 
     def single_cohort_intitialize(self, total_population: int) -> None:
         """Populate cohort table with single starting cohort"""
@@ -73,43 +73,46 @@ class FullCompartment(SparkCompartment):
             self.current_ts, self.policy_ts
         )
 
-        latest_ts_pop = self.cohorts.get_latest_population()
+        latest_ts_pop = self.cohorts.get_latest_population_values()
 
-        # convert index from starting year to years in compartment
-        latest_ts_pop.index = self.current_ts - latest_ts_pop.index
+        # convert cohort start ts to ts in compartment
+        ts_in_compartment = self.current_ts - self.cohorts.start_ts_values
 
         # no cohort should start in cohort after current_ts
-        if any(latest_ts_pop.index <= 0):
+        if any(ts_in_compartment <= 0):
             raise ValueError(
                 "Cohort cannot start after current time step\n"
                 f"Current time step: {self.current_ts}\n"
-                f"Cohort start times: {self.current_ts - latest_ts_pop.index}"
+                f"Cohort start times: {self.cohorts.start_ts_values}"
             )
 
-        latest_ts_pop_short = latest_ts_pop[
-            latest_ts_pop.index <= len(per_ts_transitions)
-        ]
-        latest_ts_pop_long = latest_ts_pop[
-            latest_ts_pop.index > len(per_ts_transitions)
-        ]
+        is_short = ts_in_compartment <= len(per_ts_transitions)
+        latest_ts_pop_long = latest_ts_pop[~is_short]
         if not np.isclose(latest_ts_pop_long, 0, SIG_FIGS).all():
             raise ValueError(
                 f"cohorts not empty after max sentence: {latest_ts_pop_long}"
             )
 
-        # broadcast latest cohort populations onto transition table
-        latest_ts_pop_short = per_ts_transitions.mul(latest_ts_pop_short, axis=0)
-
-        latest_ts_pop = latest_ts_pop_long.append(latest_ts_pop_short.remaining)
+        # look up the transition probabilities for each cohort, cohorts missing from the table have no transitions
+        transition_rows = per_ts_transitions.index.get_indexer(
+            ts_in_compartment[is_short]
+        )
+        transitions = per_ts_transitions.to_numpy(dtype=float)[transition_rows]
+        transitions[transition_rows == -1] = np.nan
 
-        # convert index back to starting year from years in compartment
-        latest_ts_pop.index = self.current_ts - latest_ts_pop.index
+        # broadcast latest cohort populations onto transition table
+        latest_ts_pop_short = transitions * latest_ts_pop[is_short, np.newaxis]
 
-        self.cohorts.append_ts_end_count(latest_ts_pop.sort_index(), self.current_ts)
+        end_ts_pop = latest_ts_pop.copy()
+        end_ts_pop[is_short] = latest_ts_pop_short[
+            :, per_ts_transitions.columns.get_loc("remaining")
+        ]
+        self.cohorts.append_ts_end_values(end_ts_pop, self.current_ts)
 
+        total_outflows = np.nansum(latest_ts_pop_short, axis=0)
         outflow_dict = {
-            outflow: latest_ts_pop_short.sum(axis=0)[outflow]
-            for outflow in latest_ts_pop_short.columns
+            outflow: total_outflows[i]
+            for i, outflow in enumerate(per_ts_transitions.columns)
             if outflow not in ["death", "remaining"]
         }
         return outflow_dict
@@ -175,9 +178,7 @@ class FullCompartment(SparkCompartment):
                 f"Cannot prepare_for_next_step() if population already recorded for this time step \n"
                 f"time step {self.current_ts} already in end_ts_populations {self.end_ts_populations}"
             )
-        self.end_ts_populations = self.end_ts_populations.append(
-            pd.Series({self.current_ts: self.get_current_population()})
-        )
+        self.end_ts_populations[self.current_ts] = self.get_current_population()
 
         super().prepare_for_next_step()
 
@@ -213,10 +214,10 @@ class FullCompartment(SparkCompartment):
 
     def get_per_ts_population(self):
         """Return the per_ts projected population as a pd.Series of counts per EOTS"""
-        return self.end_ts_populations
+        return pd.Series(self.end_ts_populations, dtype=float)
 
     def get_current_population(self):
-        return self.cohorts.get_latest_population().sum()
+        return self.cohorts.get_latest_population_values().sum()
 
     def get_cohort_df(self):
         return self.cohorts.pop_cohorts()
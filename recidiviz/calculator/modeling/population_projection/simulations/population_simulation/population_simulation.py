@@ -16,6 +16,7 @@
 # =============================================================================
 """Simulation object that models a given policy scenario"""
 
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, Any, Tuple, Optional
 from time import time
 import pandas as pd
@@ -25,6 +26,16 @@ from recidiviz.calculator.modeling.population_projection.simulations.sub_simulat
 )
 
 
+def _step_independent_sub_simulation(
+    sub_simulation: SubSimulation, num_ts: int
+) -> SubSimulation:
+    """Step a sub simulation that does not exchange cohorts with any other sub simulation. Run in a worker process."""
+    for _ in range(num_ts):
+        sub_simulation.step_forward()
+        sub_simulation.ingest_cross_simulation_cohorts(sub_simulation.cross_flow())
+    return sub_simulation
+
+
 class PopulationSimulation:
     """Control the many sub simulations for one scenario (baseline/control or policy)"""
 
@@ -46,13 +57,14 @@ class PopulationSimulation:
     def get_population_projections(self) -> pd.DataFrame:
         return self.population_projections
 
-    def simulate_policies(self) -> pd.DataFrame:
-        """Run a population projection and return population counts by year, compartment, and sub-group."""
+    def simulate_policies(self, max_workers: int = 1) -> pd.DataFrame:
+        """Run a population projection and return population counts by year, compartment, and sub-group.
+        `max_workers` is the number of processes to step sub simulations in, see step_forward()"""
 
         start = time()
 
         # Run the sub simulations for each ts
-        self.step_forward(self.projection_time_steps)
+        self.step_forward(self.projection_time_steps, max_workers)
 
         #  Store the results in one Dataframe
         for simulation_group_id, simulation_obj in self.sub_simulations.items():
@@ -66,8 +78,32 @@ class PopulationSimulation:
 
         return self.population_projections
 
-    def step_forward(self, num_ts: int) -> None:
-        """Steps forward in the projection by some number of steps."""
+    def step_forward(self, num_ts: int, max_workers: int = 1) -> None:
+        """Steps forward in the projection by some number of steps.
+
+        If `max_workers` is more than 1 and cohorts never move between sub groups, each sub simulation is stepped
+        through all time steps in its own process. Otherwise cross-simulation flows are exchanged after every step.
+        """
+        if (
+            max_workers > 1
+            and len(self.sub_simulations) > 1
+            and not self._has_cross_simulation_flows()
+        ):
+            with ProcessPoolExecutor(
+                max_workers=min(max_workers, len(self.sub_simulations))
+            ) as executor:
+                futures = {
+                    sub_group_id: executor.submit(
+                        _step_independent_sub_simulation, simulation_obj, num_ts
+                    )
+                    for sub_group_id, simulation_obj in self.sub_simulations.items()
+                }
+                self.sub_simulations = {
+                    sub_group_id: future.result()
+                    for sub_group_id, future in futures.items()
+                }
+            return
+
         for _ in range(num_ts):
             for simulation_obj in self.sub_simulations.values():
                 simulation_obj.step_forward()
@@ -100,6 +136,12 @@ class PopulationSimulation:
                 ].drop("sub_group_id", axis=1)
                 simulation_obj.ingest_cross_simulation_cohorts(sub_group_cohorts)
 
+    def _has_cross_simulation_flows(self) -> bool:
+        return (
+            type(self).update_cohort_attributes
+            is not PopulationSimulation.update_cohort_attributes
+        )
+
     @staticmethod
     def update_cohort_attributes(cross_simulation_flows: pd.DataFrame) -> pd.DataFrame:
         """Should change sub_group_id for each row to whatever simulation that cohort should move to in the next ts"""
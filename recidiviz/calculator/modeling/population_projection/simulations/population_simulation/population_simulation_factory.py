@@ -16,6 +16,7 @@
 # =============================================================================
 """Composition object for PopulationSimulation."""
 
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, List, Any
 from time import time
 from warnings import warn
@@ -54,6 +55,7 @@ class PopulationSimulationFactory:
         microsim_data: pd.DataFrame,
         should_initialize_compartment_populations: bool,
         should_scale_populations_after_step: bool,
+        max_workers: int = 1,
     ) -> PopulationSimulation:
         """
         Initializes sub-simulations
@@ -79,6 +81,8 @@ class PopulationSimulationFactory:
             start cohort
         `should_scale_populations_after_step` should be True if compartment populations should be scaled to match
             total_population_data after each step forward
+        `max_workers` is the number of processes to build sub simulations (including fitting their admissions
+            models) and step them forward in
         """
         start = time()
 
@@ -144,6 +148,7 @@ class PopulationSimulationFactory:
             sub_group_ids_dict,
             should_initialize_compartment_populations,
             should_scale_populations_after_step,
+            max_workers,
         )
 
         population_simulation = PopulationSimulation(
@@ -155,7 +160,7 @@ class PopulationSimulationFactory:
 
         # run simulation up to the start_year
         population_simulation.step_forward(
-            user_inputs["start_time_step"] - first_relevant_ts
+            user_inputs["start_time_step"] - first_relevant_ts, max_workers
         )
 
         print("initialization time: ", time() - start)
@@ -206,9 +211,11 @@ class PopulationSimulationFactory:
         sub_group_ids_dict: Dict[str, Dict[str, Any]],
         should_initialize_compartment_populations: bool,
         should_scale_populations_after_step: bool,
+        max_workers: int,
     ) -> Dict[str, SubSimulation]:
-        """Helper function for initialize_simulation. Initialize one sub simulation per sub-population."""
-        sub_simulations = dict()
+        """Helper function for initialize_simulation. Initialize one sub simulation per sub-population, in parallel if
+        `max_workers` is greater than 1."""
+        sub_simulation_kwargs: Dict[str, Dict[str, Any]] = dict()
 
         # reset indices to facilitate unused data tracking
         transitions_data = transitions_data.reset_index(drop=True)
@@ -247,7 +254,7 @@ class PopulationSimulationFactory:
                 policy_list, sub_group_ids_dict[sub_group_id]
             )
 
-            sub_simulations[sub_group_id] = SubSimulationFactory.build_sub_simulation(
+            sub_simulation_kwargs[sub_group_id] = dict(
                 outflows_data=disaggregated_outflows_data,
                 transitions_data=disaggregated_transitions_data,
                 total_population_data=disaggregated_total_population_data,
@@ -271,7 +278,25 @@ class PopulationSimulationFactory:
                 Warning,
             )
 
-        return sub_simulations
+        if max_workers == 1 or len(sub_simulation_kwargs) == 1:
+            return {
+                sub_group_id: SubSimulationFactory.build_sub_simulation(**kwargs)
+                for sub_group_id, kwargs in sub_simulation_kwargs.items()
+            }
+
+        with ProcessPoolExecutor(
+            max_workers=min(max_workers, len(sub_simulation_kwargs))
+        ) as executor:
+            futures = {
+                sub_group_id: executor.submit(
+                    SubSimulationFactory.build_sub_simulation, **kwargs
+                )
+                for sub_group_id, kwargs in sub_simulation_kwargs.items()
+            }
+            return {
+                sub_group_id: future.result()
+                for sub_group_id, future in futures.items()
+            }
 
     @classmethod
     def _check_inputs_valid(
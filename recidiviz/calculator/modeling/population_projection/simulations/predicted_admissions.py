@@ -15,10 +15,18 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 # =============================================================================
 """outflow calculating object for ShellCompartments"""
+import hashlib
+import os
+import pickle
+import tempfile
+from collections import OrderedDict
 from enum import Enum, auto
 from typing import Optional, Dict, Tuple
+from warnings import warn
 
+import statsmodels
 from statsmodels.tsa.arima_model import ARIMA, ARIMAResults
+import numpy as np
 import pandas as pd
 
 ORDER = (1, 1, 0)
@@ -27,6 +35,87 @@ MIN_THRESHOLD_PCT = 0.5
 MAX_THRESHOLD_PCT = 0.5
 CONFIDENCE_INTERVAL_SIZE = 0.95
 
+# Directory to also cache fitted ARIMA models in, keyed by a hash of the data and order they were fit with, so they can
+# be shared across processes and runs. Models are only cached in memory unless this is set with the
+# RECIDIVIZ_ARIMA_CACHE_DIR environment variable or set_arima_cache_dir(). The cached models are pickled, so the
+# directory must only be writable by the current user.
+_arima_cache_dir: Optional[str] = os.environ.get("RECIDIVIZ_ARIMA_CACHE_DIR")
+# Maximum number of models to keep in memory, evicting the least recently used model beyond that
+_MAX_IN_MEMORY_ARIMA_MODELS = 256
+# Models fit or loaded from disk by this process, keyed the same way, from least to most recently used
+_fitted_arima_models: "OrderedDict[str, ARIMAResults]" = OrderedDict()
+
+
+def set_arima_cache_dir(cache_dir: Optional[str]) -> None:
+    """Set the directory to cache fitted ARIMA models in, or None to only cache them in memory"""
+    global _arima_cache_dir
+    _arima_cache_dir = cache_dir
+
+
+def _arima_cache_key(values: np.ndarray, order: Tuple[int, int, int]) -> str:
+    data_hash = hashlib.sha256(
+        f"{statsmodels.__version__}:{order}:{values.shape}".encode()
+    )
+    data_hash.update(np.ascontiguousarray(values, dtype=float).tobytes())
+    return data_hash.hexdigest()
+
+
+def _private_arima_cache_dir() -> Optional[str]:
+    """Return the ARIMA cache directory, creating it if needed, or None if there is none or it is not private to the
+    current user. Loading a model unpickles it, so a directory others can write to must not be read from."""
+    if not _arima_cache_dir:
+        return None
+
+    os.makedirs(_arima_cache_dir, mode=0o700, exist_ok=True)
+    dir_stat = os.stat(_arima_cache_dir)
+    if dir_stat.st_uid != os.getuid() or dir_stat.st_mode & 0o077:
+        warn(
+            f"ARIMA cache directory {_arima_cache_dir} is not private to the current user, only caching models in "
+            f"memory",
+            Warning,
+        )
+        return None
+    return _arima_cache_dir
+
+
+def _cache_in_memory(cache_key: str, fitted_model: ARIMAResults) -> None:
+    _fitted_arima_models[cache_key] = fitted_model
+    _fitted_arima_models.move_to_end(cache_key)
+    while len(_fitted_arima_models) > _MAX_IN_MEMORY_ARIMA_MODELS:
+        _fitted_arima_models.popitem(last=False)
+
+
+def fit_arima_model(
+    values: np.ndarray, order: Tuple[int, int, int] = ORDER
+) -> ARIMAResults:
+    """Fit an ARIMA model to `values`, or return the model previously fit to the same values and order from the
+    in-memory or on-disk cache. Fitting is deterministic, so cached models give the same forecasts."""
+    cache_key = _arima_cache_key(values, order)
+    if cache_key in _fitted_arima_models:
+        _fitted_arima_models.move_to_end(cache_key)
+        return _fitted_arima_models[cache_key]
+
+    cache_dir = _private_arima_cache_dir()
+    cache_path = os.path.join(cache_dir, f"{cache_key}.pickle") if cache_dir else None
+    fitted_model = None
+    if cache_path and os.path.exists(cache_path):
+        try:
+            with open(cache_path, "rb") as cache_file:
+                fitted_model = pickle.load(cache_file)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            fitted_model = None
+
+    if fitted_model is None:
+        fitted_model = ARIMA(values, order=order).fit(disp=False)
+        if cache_path:
+            # Write to a temporary file first so concurrent simulations never read a partially written model
+            with tempfile.NamedTemporaryFile(dir=cache_dir, delete=False) as temp_file:
+                pickle.dump(fitted_model, temp_file)
+            os.replace(temp_file.name, cache_path)
+
+    _cache_in_memory(cache_key, fitted_model)
+    return fitted_model
+
 
 class PredictionDirectionType(Enum):
     FORWARD = auto()
@@ -154,14 +243,14 @@ class PredictedAdmissions:
                         outflow, missing_data_backward
                     ] = historical_data.loc[outflow, min_data_ts]
                 else:
-                    model_backcast = (
-                        ARIMA(row.iloc[::-1].dropna().values, order=ORDER)
-                        .fit(disp=False)
-                        .forecast(
-                            steps=len(missing_data_backward),
-                            alpha=(1 - CONFIDENCE_INTERVAL_SIZE),
-                        )[0]
-                    )
+                    model_backcast = fit_arima_model(
+                        row.iloc[::-1].dropna().values
+                    ).forecast(
+                        steps=len(missing_data_backward),
+                        alpha=(1 - CONFIDENCE_INTERVAL_SIZE),
+                    )[
+                        0
+                    ]
 
                     # flip the predictions back around so they're ordered correctly for the historical data indexing
                     historical_data.loc[
@@ -175,14 +264,10 @@ class PredictedAdmissions:
                         outflow, missing_data_forward
                     ] = historical_data.loc[outflow, max_data_ts]
                 else:
-                    model_forecast = (
-                        ARIMA(row.dropna().values, order=ORDER)
-                        .fit(disp=False)
-                        .forecast(
-                            steps=len(missing_data_forward),
-                            alpha=(1 - CONFIDENCE_INTERVAL_SIZE),
-                        )[0]
-                    )
+                    model_forecast = fit_arima_model(row.dropna().values).forecast(
+                        steps=len(missing_data_forward),
+                        alpha=(1 - CONFIDENCE_INTERVAL_SIZE),
+                    )[0]
 
                     historical_data.loc[outflow, missing_data_forward] = model_forecast
         return historical_data, constant_admissions
@@ -192,15 +277,12 @@ class PredictedAdmissions:
         # A dictionary is created for each admission type with both a forecasting model and a backcasting model
         trained_model_dict = {}
         for outflow_compartment, row in self.historical_data.iterrows():
-            model_forecast = ARIMA(row.values, order=ORDER)
-            model_backcast = ARIMA(row.iloc[::-1].values, order=ORDER)
-
             trained_model_dict[
                 (outflow_compartment, PredictionDirectionType.FORWARD)
-            ] = model_forecast.fit(disp=False)
+            ] = fit_arima_model(row.values)
             trained_model_dict[
                 (outflow_compartment, PredictionDirectionType.BACKWARD)
-            ] = model_backcast.fit(disp=False)
+            ] = fit_arima_model(row.iloc[::-1].values)
 
         self.trained_model_dict = trained_model_dict
 
@@ -12,7 +12,8 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 # =============================================================================
 """SuperSimulation composed object for initializing simulations."""
-from typing import Dict, Any, List
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, List, Tuple
 from datetime import datetime
 from warnings import warn
 import matplotlib.pyplot as plt
@@ -33,12 +34,43 @@ from recidiviz.calculator.modeling.population_projection.simulations.super_simul
 )
 
 
+# User inputs, data inputs, policy list, and first relevant ts to build a PopulationSimulation with
+PopulationSimulationInputs = Tuple[
+    Dict[str, Any], Dict[str, Any], List[SparkPolicy], int
+]
+
+
+def _build_and_simulate_population_simulation(
+    user_inputs: Dict[str, Any],
+    data_inputs: Dict[str, Any],
+    policy_list: List[SparkPolicy],
+    first_relevant_ts: int,
+    max_workers: int = 1,
+) -> PopulationSimulation:
+    """Build and run one PopulationSimulation. Defined at the module level so it can run in a worker process."""
+    population_simulation = PopulationSimulationFactory.build_population_simulation(
+        user_inputs=user_inputs,
+        policy_list=policy_list,
+        first_relevant_ts=first_relevant_ts,
+        max_workers=max_workers,
+        **data_inputs,
+    )
+    population_simulation.simulate_policies(max_workers)
+    return population_simulation
+
+
 class Simulator:
-    """Runs simulations for SuperSimulation."""
+    """Runs simulations for SuperSimulation.
 
-    def __init__(self, microsim: bool) -> None:
+    With `max_workers` greater than 1, independent scenarios are built and simulated in a pool of that many
+    processes, and a single scenario builds and steps its sub simulations in parallel instead. Policies must then be
+    picklable, e.g. use functools.partial of module level functions rather than lambdas.
+    """
+
+    def __init__(self, microsim: bool, max_workers: int = 1) -> None:
         self.pop_simulations: Dict[str, PopulationSimulation] = dict()
         self.microsim = microsim
+        self.max_workers = max_workers
 
     def get_population_simulations(self) -> Dict[str, PopulationSimulation]:
         if not self.pop_simulations:
@@ -65,16 +97,13 @@ class Simulator:
         """
         self._reset_pop_simulations()
 
-        self.pop_simulations["policy"] = self._build_population_simulation(
-            user_inputs, data_inputs, policy_list, first_relevant_ts
-        )
-        self.pop_simulations["control"] = self._build_population_simulation(
-            user_inputs, data_inputs, [], first_relevant_ts
+        self._run_population_simulations(
+            {
+                "policy": (user_inputs, data_inputs, policy_list, first_relevant_ts),
+                "control": (user_inputs, data_inputs, [], first_relevant_ts),
+            }
         )
 
-        self.pop_simulations["policy"].simulate_policies()
-        self.pop_simulations["control"].simulate_policies()
-
         results = {
             scenario: self.pop_simulations[scenario].get_population_projections()
             for scenario in self.pop_simulations
@@ -116,19 +145,20 @@ class Simulator:
             )
 
         # Run one simulation for the min, max, and middle confidence intervals
+        scenario_inputs: Dict[str, PopulationSimulationInputs] = {}
         for projection_type in [
             ProjectionType.LOW.value,
             ProjectionType.MIDDLE.value,
             ProjectionType.HIGH.value,
         ]:
             user_inputs["projection_type"] = projection_type
-            self.pop_simulations[
-                f"baseline_{projection_type}"
-            ] = self._build_population_simulation(
-                user_inputs, data_inputs, [], first_relevant_ts
+            scenario_inputs[f"baseline_{projection_type}"] = (
+                dict(user_inputs),
+                data_inputs,
+                [],
+                first_relevant_ts,
             )
-
-            self.pop_simulations[f"baseline_{projection_type}"].simulate_policies()
+        self._run_population_simulations(scenario_inputs)
 
         if display_compartments:
             simulation_results = self._format_simulation_results(
@@ -165,15 +195,18 @@ class Simulator:
     ) -> None:
         self._reset_pop_simulations()
 
-        for start_date, data_inputs in run_date_data_inputs.items():
-            user_inputs["projection_type"] = ProjectionType.MIDDLE.value
-            self.pop_simulations[
-                f"baseline_{start_date}"
-            ] = self._build_population_simulation(
-                user_inputs, data_inputs, [], run_date_first_relevant_ts[start_date]
-            )
-
-            self.pop_simulations[f"baseline_{start_date}"].simulate_policies()
+        user_inputs["projection_type"] = ProjectionType.MIDDLE.value
+        self._run_population_simulations(
+            {
+                f"baseline_{start_date}": (
+                    user_inputs,
+                    data_inputs,
+                    [],
+                    run_date_first_relevant_ts[start_date],
+                )
+                for start_date, data_inputs in run_date_data_inputs.items()
+            }
+        )
 
     def get_cohort_hydration_simulations(
         self,
@@ -188,16 +221,17 @@ class Simulator:
         """
         self._reset_pop_simulations()
 
-        for ts in np.arange(range_start, range_end, step_size):
-            self.pop_simulations[
-                f"backfill_period_{ts}_time_steps"
-            ] = self._build_population_simulation(
-                user_inputs,
-                data_inputs,
-                [],
-                first_relevant_ts=user_inputs["start_time_step"] - ts,
-            )
-            self.pop_simulations[f"backfill_period_{ts}_time_steps"].simulate_policies()
+        self._run_population_simulations(
+            {
+                f"backfill_period_{ts}_time_steps": (
+                    user_inputs,
+                    data_inputs,
+                    [],
+                    user_inputs["start_time_step"] - ts,
+                )
+                for ts in np.arange(range_start, range_end, step_size)
+            }
+        )
         return self.pop_simulations
 
     def get_sub_group_ids_dict(self) -> Dict[str, Dict[str, Any]]:
@@ -271,16 +305,28 @@ class Simulator:
     def _reset_pop_simulations(self) -> None:
         self.pop_simulations = {}
 
-    @staticmethod
-    def _build_population_simulation(
-        user_inputs: Dict[str, Any],
-        data_inputs: Dict[str, Any],
-        policy_list: List[SparkPolicy],
-        first_relevant_ts: int,
-    ) -> PopulationSimulation:
-        return PopulationSimulationFactory.build_population_simulation(
-            user_inputs=user_inputs,
-            policy_list=policy_list,
-            first_relevant_ts=first_relevant_ts,
-            **data_inputs,
-        )
+    def _run_population_simulations(
+        self, scenario_inputs: Dict[str, PopulationSimulationInputs]
+    ) -> None:
+        """Build and simulate a PopulationSimulation for each scenario, in parallel if max_workers allows it. The
+        simulations are stored in the order of `scenario_inputs` either way."""
+        if self.max_workers == 1 or len(scenario_inputs) == 1:
+            for scenario, inputs in scenario_inputs.items():
+                self.pop_simulations[
+                    scenario
+                ] = _build_and_simulate_population_simulation(
+                    *inputs, max_workers=self.max_workers
+                )
+            return
+
+        with ProcessPoolExecutor(
+            max_workers=min(self.max_workers, len(scenario_inputs))
+        ) as executor:
+            futures = {
+                scenario: executor.submit(
+                    _build_and_simulate_population_simulation, *inputs
+                )
+                for scenario, inputs in scenario_inputs.items()
+            }
+            for scenario, future in futures.items():
+                self.pop_simulations[scenario] = future.result()
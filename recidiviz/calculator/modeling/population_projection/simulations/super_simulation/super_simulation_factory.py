@@ -41,7 +41,11 @@ class SuperSimulationFactory:
     # TODO(#5185): incorporate dataclass
 
     @classmethod
-    def build_super_simulation(cls, yaml_file_path: str) -> SuperSimulation:
+    def build_super_simulation(
+        cls, yaml_file_path: str, max_workers: int = 1
+    ) -> SuperSimulation:
+        """Build a SuperSimulation from the model inputs in `yaml_file_path`. With `max_workers` greater than 1,
+        simulations are run in a pool of that many processes."""
         model_params = cls.get_model_params(yaml_file_path)
 
         if "big_query_simulation_tag" in model_params["data_inputs_raw"].keys():
@@ -65,7 +69,7 @@ class SuperSimulationFactory:
             microsim,
         )
 
-        simulator = Simulator(microsim)
+        simulator = Simulator(microsim, max_workers)
         validator = Validator(microsim)
         exporter = Exporter(microsim, model_params["compartment_costs"])
 
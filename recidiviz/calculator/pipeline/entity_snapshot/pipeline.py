@@ -0,0 +1,154 @@
+# Recidiviz - a data platform for criminal justice reform
+# Copyright (C) 2021 Recidiviz, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# =============================================================================
+"""Extracts and hydrates the root entities read by the calculation pipelines once, and writes them to sharded
+snapshot files under --hydrated_snapshot_root.
+
+The calculation pipelines read these files instead of running their own BigQuery extraction and hydration when they
+are run with the same --hydrated_snapshot_root, so the snapshot should be written before those pipelines run.
+"""
+import argparse
+from typing import List, Optional, Tuple, Type
+
+import apache_beam as beam
+from apache_beam.options.pipeline_options import SetupOptions, PipelineOptions
+
+from recidiviz.calculator.pipeline.utils.extractor_utils import (
+    BuildRootEntity,
+    WriteHydratedRootEntities,
+    delete_hydrated_root_entities,
+    hydrated_root_entities_path,
+)
+from recidiviz.calculator.query.state.dataset_config import STATE_BASE_DATASET
+from recidiviz.persistence.database.schema.state import schema
+from recidiviz.persistence.entity.state import entities
+
+# The root entity classes, along with whether their related entities are hydrated, that the calculation pipelines
+# build with BuildRootEntity. Pipelines can only read the snapshot for entities listed here.
+SNAPSHOT_ROOT_ENTITIES: List[Tuple[Type[entities.Entity], bool]] = [
+    (entities.StatePerson, True),
+    (entities.StateSentenceGroup, True),
+    (entities.StateIncarcerationSentence, True),
+    (entities.StateSupervisionSentence, True),
+    (entities.StateIncarcerationPeriod, True),
+    (entities.StateSupervisionPeriod, True),
+    (entities.StateSupervisionPeriod, False),
+    (entities.StateSupervisionViolation, True),
+    (entities.StateSupervisionViolationResponse, True),
+    (entities.StateProgramAssignment, True),
+    (entities.StateAssessment, False),
+    (entities.StateSupervisionContact, False),
+]
+
+
+def get_arg_parser() -> argparse.ArgumentParser:
+    """Returns the parser for the command-line arguments for this pipeline."""
+    parser = argparse.ArgumentParser()
+
+    parser.add_argument(
+        "--data_input",
+        type=str,
+        help="BigQuery dataset to query.",
+        default=STATE_BASE_DATASET,
+    )
+
+    parser.add_argument(
+        "--state_code",
+        dest="state_code",
+        type=str,
+        help="The state_code to write hydrated entities for.",
+        required=True,
+    )
+
+    parser.add_argument(
+        "--hydrated_snapshot_root",
+        type=str,
+        help="The path (e.g. gs://bucket/snapshots) to write the hydrated entities to.",
+        required=True,
+    )
+
+    parser.add_argument(
+        "--person_filter_ids",
+        type=int,
+        nargs="+",
+        help="An optional list of DB person_id values. When present, the snapshot will only include entities for "
+        "these people.",
+    )
+
+    return parser
+
+
+def run(
+    apache_beam_pipeline_options: PipelineOptions,
+    data_input: str,
+    state_code: str,
+    hydrated_snapshot_root: str,
+    person_filter_ids: Optional[List[int]] = None,
+) -> None:
+    """Runs the entity snapshot pipeline."""
+
+    # Workaround to load SQLAlchemy objects at start of pipeline. This is necessary because the BuildRootEntity
+    # function tries to access attributes of relationship properties on the SQLAlchemy room_schema_class before they
+    # have been loaded. However, if *any* SQLAlchemy objects have been instantiated, then the relationship properties
+    # are loaded and their attributes can be successfully accessed.
+    _ = schema.StatePerson()
+
+    apache_beam_pipeline_options.view_as(SetupOptions).save_main_session = True
+
+    # Get pipeline job details
+    all_pipeline_options = apache_beam_pipeline_options.get_all_options()
+    project_id = all_pipeline_options["project"]
+
+    if project_id is None:
+        raise ValueError(f"No project set in pipeline options: {all_pipeline_options}")
+
+    input_dataset = project_id + "." + data_input
+
+    person_id_filter_set = set(person_filter_ids) if person_filter_ids else None
+
+    file_path_prefixes = {
+        (root_entity_class, build_related_entities): hydrated_root_entities_path(
+            hydrated_snapshot_root,
+            state_code,
+            root_entity_class,
+            build_related_entities,
+        )
+        for root_entity_class, build_related_entities in SNAPSHOT_ROOT_ENTITIES
+    }
+
+    # Clear out any earlier snapshot, whose shards would otherwise be read along with the new ones
+    for file_path_prefix in file_path_prefixes.values():
+        delete_hydrated_root_entities(file_path_prefix)
+
+    with beam.Pipeline(options=apache_beam_pipeline_options) as p:
+        for root_entity_class, build_related_entities in SNAPSHOT_ROOT_ENTITIES:
+            hydration = "hydrated" if build_related_entities else "unhydrated"
+            _ = (
+                p
+                | f"Load {hydration} {root_entity_class.__name__}s"
+                >> BuildRootEntity(
+                    dataset=input_dataset,
+                    root_entity_class=root_entity_class,
+                    unifying_id_field=entities.StatePerson.get_class_id_name(),
+                    build_related_entities=build_related_entities,
+                    unifying_id_field_filter_set=person_id_filter_set,
+                    state_code=state_code,
+                )
+                | f"Write {hydration} {root_entity_class.__name__}s"
+                >> WriteHydratedRootEntities(
+                    file_path_prefixes[(root_entity_class, build_related_entities)]
+                )
+            )
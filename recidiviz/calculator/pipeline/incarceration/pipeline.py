@@ -352,6 +352,7 @@ def run(
     state_code: str,
     calculation_end_month: Optional[str],
     person_filter_ids: Optional[List[int]],
+    hydrated_snapshot_root: Optional[str] = None,
 ):
     """Runs the incarceration calculation pipeline."""
 
@@ -388,6 +389,7 @@ def run(
             build_related_entities=True,
             unifying_id_field_filter_set=person_id_filter_set,
             state_code=state_code,
+            hydrated_snapshot_root=hydrated_snapshot_root,
         )
 
         # Get StateSentenceGroups
@@ -398,6 +400,7 @@ def run(
             build_related_entities=True,
             unifying_id_field_filter_set=person_id_filter_set,
             state_code=state_code,
+            hydrated_snapshot_root=hydrated_snapshot_root,
         )
 
         # Get StateIncarcerationSentences
@@ -411,6 +414,7 @@ def run(
                 build_related_entities=True,
                 unifying_id_field_filter_set=person_id_filter_set,
                 state_code=state_code,
+                hydrated_snapshot_root=hydrated_snapshot_root,
             )
         )
 
@@ -422,6 +426,7 @@ def run(
             build_related_entities=True,
             unifying_id_field_filter_set=person_id_filter_set,
             state_code=state_code,
+            hydrated_snapshot_root=hydrated_snapshot_root,
         )
 
         if state_code == "US_MO":
@@ -319,6 +319,7 @@ def run(
     state_code: str,
     calculation_end_month: Optional[str],
     person_filter_ids: Optional[List[int]],
+    hydrated_snapshot_root: Optional[str] = None,
 ):
     """Runs the program calculation pipeline."""
 
@@ -355,6 +356,7 @@ def run(
             build_related_entities=True,
             unifying_id_field_filter_set=person_id_filter_set,
             state_code=state_code,
+            hydrated_snapshot_root=hydrated_snapshot_root,
         )
 
         # Get StateProgramAssignments
@@ -365,6 +367,7 @@ def run(
             build_related_entities=True,
             unifying_id_field_filter_set=person_id_filter_set,
             state_code=state_code,
+            hydrated_snapshot_root=hydrated_snapshot_root,
         )
 
         # Get StateAssessments
@@ -375,6 +378,7 @@ def run(
             build_related_entities=False,
             unifying_id_field_filter_set=person_id_filter_set,
             state_code=state_code,
+            hydrated_snapshot_root=hydrated_snapshot_root,
         )
 
         # Get StateSupervisionPeriods
@@ -385,6 +389,7 @@ def run(
             build_related_entities=False,
             unifying_id_field_filter_set=person_id_filter_set,
             state_code=state_code,
+            hydrated_snapshot_root=hydrated_snapshot_root,
         )
 
         supervision_period_to_agent_associations_as_kv = (
@@ -351,6 +351,7 @@ def run(
     metric_types: List[str],
     state_code: str,
     person_filter_ids: Optional[List[int]],
+    hydrated_snapshot_root: Optional[str] = None,
 ):
     """Runs the recidivism calculation pipeline."""
 
@@ -389,6 +390,7 @@ def run(
             build_related_entities=True,
             unifying_id_field_filter_set=person_id_filter_set,
             state_code=state_code,
+            hydrated_snapshot_root=hydrated_snapshot_root,
         )
 
         # Get StateIncarcerationPeriods
@@ -399,6 +401,7 @@ def run(
             build_related_entities=True,
             unifying_id_field_filter_set=person_id_filter_set,
             state_code=state_code,
+            hydrated_snapshot_root=hydrated_snapshot_root,
         )
 
         # Get StateSupervisionViolations
@@ -409,6 +412,7 @@ def run(
             build_related_entities=True,
             unifying_id_field_filter_set=person_id_filter_set,
             state_code=state_code,
+            hydrated_snapshot_root=hydrated_snapshot_root,
         )
 
         # TODO(#2769): Don't bring this in as a root entity
@@ -423,6 +427,7 @@ def run(
                 build_related_entities=True,
                 unifying_id_field_filter_set=person_id_filter_set,
                 state_code=state_code,
+                hydrated_snapshot_root=hydrated_snapshot_root,
             )
         )
 
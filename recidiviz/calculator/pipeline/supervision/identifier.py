@@ -19,7 +19,17 @@ supervision sentences as successfully completed or not."""
 import logging
 from collections import defaultdict
 from datetime import date
-from typing import List, Dict, Tuple, Optional, Any, NamedTuple, Type, Set
+from typing import (
+    List,
+    Dict,
+    Tuple,
+    Optional,
+    Any,
+    NamedTuple,
+    Type,
+    Set,
+    Iterator,
+)
 
 import attr
 from dateutil.relativedelta import relativedelta
@@ -371,8 +381,6 @@ def find_time_buckets_for_supervision_period(
                 "dropped at this point."
             )
 
-    event_date = start_date
-
     (
         supervising_officer_external_id,
         level_1_supervision_location_external_id,
@@ -410,113 +418,156 @@ def find_time_buckets_for_supervision_period(
         termination_date if termination_date else date.today() + relativedelta(days=1)
     )
 
-    while event_date < end_date:
-        if on_supervision_on_date(
+    projected_end_date = _get_projected_end_date(
+        incarceration_sentences=incarceration_sentences,
+        supervision_sentences=supervision_sentences,
+        period=supervision_period,
+    )
+
+    for event_date in _days_counted_towards_supervision_population(
+        supervision_period=supervision_period,
+        end_date=end_date,
+        supervision_sentences=supervision_sentences,
+        incarceration_sentences=incarceration_sentences,
+        incarceration_period_index=incarceration_period_index,
+    ):
+        supervision_type = get_month_supervision_type(
             event_date,
             supervision_sentences,
             incarceration_sentences,
             supervision_period,
-            incarceration_period_index,
-        ):
-
-            supervision_type = get_month_supervision_type(
-                event_date,
-                supervision_sentences,
-                incarceration_sentences,
-                supervision_period,
-            )
+        )
 
-            assessment_score = None
-            assessment_level = None
-            assessment_type = None
+        assessment_score = None
+        assessment_level = None
+        assessment_type = None
 
-            most_recent_assessment = assessment_utils.find_most_recent_applicable_assessment_of_class_for_state(
+        most_recent_assessment = (
+            assessment_utils.find_most_recent_applicable_assessment_of_class_for_state(
                 event_date,
                 assessments,
                 assessment_class=StateAssessmentClass.RISK,
                 state_code=supervision_period.state_code,
             )
+        )
 
-            if most_recent_assessment:
-                assessment_score = most_recent_assessment.assessment_score
-                assessment_level = most_recent_assessment.assessment_level
-                assessment_type = most_recent_assessment.assessment_type
+        if most_recent_assessment:
+            assessment_score = most_recent_assessment.assessment_score
+            assessment_level = most_recent_assessment.assessment_level
+            assessment_type = most_recent_assessment.assessment_type
 
-            violation_history = get_violation_and_response_history(
-                event_date, violation_responses
-            )
+        violation_history = get_violation_and_response_history(
+            event_date, violation_responses
+        )
 
-            is_on_supervision_last_day_of_month = event_date == last_day_of_month(
-                event_date
-            )
+        is_on_supervision_last_day_of_month = event_date == last_day_of_month(
+            event_date
+        )
 
-            case_compliance: Optional[SupervisionCaseCompliance] = None
+        case_compliance: Optional[SupervisionCaseCompliance] = None
 
-            # For now, we are only calculating case compliance at the end of each month
-            if is_on_supervision_last_day_of_month:
-                case_compliance = None
+        # For now, we are only calculating case compliance at the end of each month
+        if is_on_supervision_last_day_of_month:
+            case_compliance = None
 
-                if state_specific_case_compliance_manager:
-                    case_compliance = state_specific_case_compliance_manager.get_case_compliance_on_date(
+            if state_specific_case_compliance_manager:
+                case_compliance = (
+                    state_specific_case_compliance_manager.get_case_compliance_on_date(
                         event_date
                     )
-
-            deprecated_supervising_district_external_id = (
-                level_2_supervision_location_external_id
-                or level_1_supervision_location_external_id
-            )
-
-            supervision_level_downgrade_occurred = False
-            previous_supervision_level = None
-            if event_date == supervision_period.start_date:
-                (
-                    supervision_level_downgrade_occurred,
-                    previous_supervision_level,
-                ) = _get_supervision_downgrade_details_if_downgrade_occurred(
-                    supervision_period_index, supervision_period
                 )
 
-            projected_end_date = _get_projected_end_date(
-                incarceration_sentences=incarceration_sentences,
-                supervision_sentences=supervision_sentences,
-                period=supervision_period,
-            )
+        deprecated_supervising_district_external_id = (
+            level_2_supervision_location_external_id
+            or level_1_supervision_location_external_id
+        )
 
-            supervision_day_buckets.append(
-                NonRevocationReturnSupervisionTimeBucket(
-                    state_code=supervision_period.state_code,
-                    year=event_date.year,
-                    month=event_date.month,
-                    event_date=event_date,
-                    supervision_type=supervision_type,
-                    case_type=case_type,
-                    assessment_score=assessment_score,
-                    assessment_level=assessment_level,
-                    assessment_type=assessment_type,
-                    most_severe_violation_type=violation_history.most_severe_violation_type,
-                    most_severe_violation_type_subtype=violation_history.most_severe_violation_type_subtype,
-                    most_severe_response_decision=violation_history.most_severe_response_decision,
-                    response_count=violation_history.response_count,
-                    supervising_officer_external_id=supervising_officer_external_id,
-                    supervising_district_external_id=deprecated_supervising_district_external_id,
-                    level_1_supervision_location_external_id=level_1_supervision_location_external_id,
-                    level_2_supervision_location_external_id=level_2_supervision_location_external_id,
-                    supervision_level=supervision_period.supervision_level,
-                    supervision_level_raw_text=supervision_period.supervision_level_raw_text,
-                    is_on_supervision_last_day_of_month=is_on_supervision_last_day_of_month,
-                    case_compliance=case_compliance,
-                    judicial_district_code=judicial_district_code,
-                    supervision_level_downgrade_occurred=supervision_level_downgrade_occurred,
-                    previous_supervision_level=previous_supervision_level,
-                    projected_end_date=projected_end_date,
-                )
+        supervision_level_downgrade_occurred = False
+        previous_supervision_level = None
+        if event_date == supervision_period.start_date:
+            (
+                supervision_level_downgrade_occurred,
+                previous_supervision_level,
+            ) = _get_supervision_downgrade_details_if_downgrade_occurred(
+                supervision_period_index, supervision_period
             )
 
-        event_date = event_date + relativedelta(days=1)
+        supervision_day_buckets.append(
+            NonRevocationReturnSupervisionTimeBucket(
+                state_code=supervision_period.state_code,
+                year=event_date.year,
+                month=event_date.month,
+                event_date=event_date,
+                supervision_type=supervision_type,
+                case_type=case_type,
+                assessment_score=assessment_score,
+                assessment_level=assessment_level,
+                assessment_type=assessment_type,
+                most_severe_violation_type=violation_history.most_severe_violation_type,
+                most_severe_violation_type_subtype=violation_history.most_severe_violation_type_subtype,
+                most_severe_response_decision=violation_history.most_severe_response_decision,
+                response_count=violation_history.response_count,
+                supervising_officer_external_id=supervising_officer_external_id,
+                supervising_district_external_id=deprecated_supervising_district_external_id,
+                level_1_supervision_location_external_id=level_1_supervision_location_external_id,
+                level_2_supervision_location_external_id=level_2_supervision_location_external_id,
+                supervision_level=supervision_period.supervision_level,
+                supervision_level_raw_text=supervision_period.supervision_level_raw_text,
+                is_on_supervision_last_day_of_month=is_on_supervision_last_day_of_month,
+                case_compliance=case_compliance,
+                judicial_district_code=judicial_district_code,
+                supervision_level_downgrade_occurred=supervision_level_downgrade_occurred,
+                previous_supervision_level=previous_supervision_level,
+                projected_end_date=projected_end_date,
+            )
+        )
 
     return supervision_day_buckets
 
 
+def _days_counted_towards_supervision_population(
+    supervision_period: StateSupervisionPeriod,
+    end_date: date,
+    supervision_sentences: List[StateSupervisionSentence],
+    incarceration_sentences: List[StateIncarcerationSentence],
+    incarceration_period_index: IncarcerationPeriodIndex,
+) -> Iterator[date]:
+    """Yields, in order, each day from the start of the |supervision_period| up to the |end_date| on which the person
+    counts towards the supervision population for that period. Produces the same days as calling
+    on_supervision_on_date for every day of the period, but computes the spans during which the person is not
+    incarcerated once for the whole period, rather than re-checking the incarceration periods for every day.
+    """
+    if not supervision_period.start_date:
+        raise ValueError(
+            f"Expected start date for period {supervision_period.supervision_period_id}, found None"
+        )
+
+    revocation_admission_dates = {
+        admission_date
+        for admission_date in incarceration_period_index.incarceration_periods_by_admission_date
+        if has_revocation_admission_on_date(admission_date, incarceration_period_index)
+    }
+
+    supervision_population_ranges = incarceration_period_index.portions_of_range_not_excluded_from_supervision_population(
+        DateRange(
+            lower_bound_inclusive_date=supervision_period.start_date,
+            upper_bound_exclusive_date=end_date,
+        )
+    )
+
+    for supervision_population_range in supervision_population_ranges:
+        event_date = supervision_population_range.lower_bound_inclusive_date
+        while event_date < supervision_population_range.upper_bound_exclusive_date:
+            if event_date not in revocation_admission_dates and supervision_period_counts_towards_supervision_population_in_date_range_state_specific(
+                date_range=DateRange.for_day(event_date),
+                incarceration_sentences=incarceration_sentences,
+                supervision_sentences=supervision_sentences,
+                supervision_period=supervision_period,
+            ):
+                yield event_date
+            event_date = event_date + relativedelta(days=1)
+
+
 def supervision_period_counts_towards_supervision_population_in_date_range(
     date_range: DateRange,
     incarceration_period_index: IncarcerationPeriodIndex,
@@ -352,6 +352,7 @@ def run(
     state_code: str,
     calculation_end_month: Optional[str],
     person_filter_ids: Optional[List[int]],
+    hydrated_snapshot_root: Optional[str] = None,
 ) -> None:
     """Runs the supervision calculation pipeline."""
 
@@ -388,6 +389,7 @@ def run(
             build_related_entities=True,
             unifying_id_field_filter_set=person_id_filter_set,
             state_code=state_code,
+            hydrated_snapshot_root=hydrated_snapshot_root,
         )
 
         # Get StateIncarcerationPeriods
@@ -398,6 +400,7 @@ def run(
             build_related_entities=True,
             unifying_id_field_filter_set=person_id_filter_set,
             state_code=state_code,
+            hydrated_snapshot_root=hydrated_snapshot_root,
         )
 
         # Get StateSupervisionViolations
@@ -408,6 +411,7 @@ def run(
             build_related_entities=True,
             unifying_id_field_filter_set=person_id_filter_set,
             state_code=state_code,
+            hydrated_snapshot_root=hydrated_snapshot_root,
         )
 
         # TODO(#2769): Don't bring this in as a root entity
@@ -422,6 +426,7 @@ def run(
                 build_related_entities=True,
                 unifying_id_field_filter_set=person_id_filter_set,
                 state_code=state_code,
+                hydrated_snapshot_root=hydrated_snapshot_root,
             )
         )
 
@@ -433,6 +438,7 @@ def run(
             build_related_entities=True,
             unifying_id_field_filter_set=person_id_filter_set,
             state_code=state_code,
+            hydrated_snapshot_root=hydrated_snapshot_root,
         )
 
         # Get StateIncarcerationSentences
@@ -443,6 +449,7 @@ def run(
             build_related_entities=True,
             unifying_id_field_filter_set=person_id_filter_set,
             state_code=state_code,
+            hydrated_snapshot_root=hydrated_snapshot_root,
         )
 
         # Get StateSupervisionPeriods
@@ -453,6 +460,7 @@ def run(
             build_related_entities=True,
             unifying_id_field_filter_set=person_id_filter_set,
             state_code=state_code,
+            hydrated_snapshot_root=hydrated_snapshot_root,
         )
 
         # Get StateAssessments
@@ -463,6 +471,7 @@ def run(
             build_related_entities=False,
             unifying_id_field_filter_set=person_id_filter_set,
             state_code=state_code,
+            hydrated_snapshot_root=hydrated_snapshot_root,
         )
 
         supervision_contacts = p | "Load StateSupervisionContacts" >> BuildRootEntity(
@@ -472,6 +481,7 @@ def run(
             build_related_entities=False,
             unifying_id_field_filter_set=person_id_filter_set,
             state_code=state_code,
+            hydrated_snapshot_root=hydrated_snapshot_root,
         )
 
         supervision_period_to_agent_associations_as_kv = (
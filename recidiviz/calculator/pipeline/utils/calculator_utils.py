@@ -16,7 +16,8 @@
 # =============================================================================
 """Utils for the various calculation pipelines."""
 import datetime
-from typing import Optional, List, Any, Dict, Type, Tuple, TypeVar
+from functools import lru_cache
+from typing import Optional, List, Any, Dict, FrozenSet, Type, Tuple, TypeVar
 
 import attr
 from dateutil.relativedelta import relativedelta
@@ -361,7 +362,7 @@ def characteristics_dict_builder(
 
     """
     characteristics: Dict[str, Any] = {}
-    metric_attributes = attr.fields_dict(metric_class).keys()
+    plan = metric_field_plan(type(event), metric_class)
 
     person_attributes = person_characteristics(
         person, event_date, person_metadata, pipeline
@@ -369,41 +370,76 @@ def characteristics_dict_builder(
 
     # Add relevant demographic and person-level dimensions
     for attribute, value in person_attributes.items():
-        if attribute in metric_attributes:
+        if attribute in plan.metric_attributes:
             characteristics[attribute] = value
 
-    fields_not_in_events = list(attr.fields_dict(RecidivizMetric).keys())
-    fields_not_in_events.extend(attr.fields_dict(PersonLevelMetric).keys())
-    fields_not_in_events.extend(
-        [
-            # These are determined by the period of time the metric describes
-            "year",
-            "month",
-            "follow_up_period",
-            # This is set by the contents of the `violation_type_frequency_counter` on
-            # RevocationReturnSupervisionTimeBuckets
-            "violation_count_type",
-            # These are currently being set in the `Produce...Metrics` step of each pipeline.
-            "did_recidivate",
-            "days_served",
-        ]
+    # Add attributes from the event that are relevant to the metric_class
+    for event_attribute in plan.event_attributes:
+        attribute_value = getattr(event, event_attribute)
+        if attribute_value is not None:
+            characteristics[event_attribute] = attribute_value
+
+    return characteristics
+
+
+@attr.s(frozen=True)
+class MetricFieldPlan:
+    """The fields to copy into the characteristics dictionary for a given event type and metric class, computed once
+    per pair instead of reflecting over the metric class for every event."""
+
+    # All field names on the metric class
+    metric_attributes: FrozenSet[str] = attr.ib()
+
+    # The field names on the metric class that are populated from attributes of the same name on the event
+    event_attributes: Tuple[str, ...] = attr.ib()
+
+
+# Fields on a metric that are never populated from the attributes of the event
+_FIELDS_NOT_IN_EVENTS: FrozenSet[str] = frozenset(
+    [
+        *attr.fields_dict(RecidivizMetric).keys(),
+        *attr.fields_dict(PersonLevelMetric).keys(),
+        # These are determined by the period of time the metric describes
+        "year",
+        "month",
+        "follow_up_period",
+        # This is set by the contents of the `violation_type_frequency_counter` on
+        # RevocationReturnSupervisionTimeBuckets
+        "violation_count_type",
+        # These are currently being set in the `Produce...Metrics` step of each pipeline.
+        "did_recidivate",
+        "days_served",
+    ]
+)
+
+
+@lru_cache(maxsize=None)
+def metric_field_plan(
+    event_cls: Type[IdentifierEvent], metric_class: Type[RecidivizMetric]
+) -> MetricFieldPlan:
+    """Returns the MetricFieldPlan for populating the |metric_class| from events of type |event_cls|. Raises if the
+    metric class has a field that is expected to come from the event but that the event type does not have."""
+    metric_attributes = attr.fields_dict(metric_class).keys()
+    event_cls_attributes = (
+        attr.fields_dict(event_cls).keys() if attr.has(event_cls) else set()
     )
 
-    # Add attributes from the event that are relevant to the metric_class
+    event_attributes: List[str] = []
     for metric_attribute in metric_attributes:
-        if (
-            hasattr(event, metric_attribute)
-            and metric_attribute not in fields_not_in_events
+        if metric_attribute in _FIELDS_NOT_IN_EVENTS:
+            continue
+        if metric_attribute not in event_cls_attributes and not hasattr(
+            event_cls, metric_attribute
         ):
-            attribute_value = getattr(event, metric_attribute)
-            if attribute_value is not None:
-                characteristics[metric_attribute] = attribute_value
-        elif metric_attribute not in fields_not_in_events:
             raise ValueError(
-                f"Did not find expected field [{metric_attribute}] in {event.__class__}. Metric class: {metric_class}"
+                f"Did not find expected field [{metric_attribute}] in {event_cls}. Metric class: {metric_class}"
             )
+        event_attributes.append(metric_attribute)
 
-    return characteristics
+    return MetricFieldPlan(
+        metric_attributes=frozenset(metric_attributes),
+        event_attributes=tuple(event_attributes),
+    )
 
 
 def safe_list_index(list_of_values: List[Any], value: Any, default: int) -> int:
@@ -24,9 +24,15 @@ from apache_beam import Pipeline
 from more_itertools import one
 
 import apache_beam as beam
+from apache_beam.io.filesystems import FileSystems
 from apache_beam.typehints import with_input_types, with_output_types
 
 from recidiviz.calculator.pipeline.utils.execution_utils import select_all_query
+from recidiviz.calculator.pipeline.utils.slotted_entities import slotted_entity_class
+from recidiviz.calculator.pipeline.utils.state_entity_coder import (
+    ENTITY_SCHEMA_FINGERPRINT,
+    StateEntityCoder,
+)
 from recidiviz.common.attr_mixins import BuildableAttr
 from recidiviz.persistence.database.base_schema import StateBase
 from recidiviz.persistence.entity import entity_utils
@@ -52,6 +58,7 @@ class BuildRootEntity(beam.PTransform):
         build_related_entities: bool,
         state_code: str,
         unifying_id_field_filter_set: Optional[Set[int]] = None,
+        hydrated_snapshot_root: Optional[str] = None,
     ):
         """Initializes the PTransform with the required arguments.
 
@@ -69,6 +76,10 @@ class BuildRootEntity(beam.PTransform):
             unifying_id_field_filter_set: When non-empty, we will only build entity
                 objects that can be connected to root entities with one of these
                 unifying ids.
+            hydrated_snapshot_root: When set, the root entities are read from the
+                snapshot of already hydrated entities under this path, written by
+                the entity_snapshot pipeline, instead of being extracted from
+                BigQuery and hydrated.
         """
 
         super().__init__()
@@ -90,6 +101,7 @@ class BuildRootEntity(beam.PTransform):
         self._build_related_entities = build_related_entities
         self._unifying_id_field_filter_set = unifying_id_field_filter_set
         self._state_code = state_code
+        self._hydrated_snapshot_root = hydrated_snapshot_root
 
         if not dataset:
             raise ValueError("No valid data source passed to the pipeline.")
@@ -111,6 +123,21 @@ class BuildRootEntity(beam.PTransform):
     def expand(self, input_or_inputs):
         """Does the work of fetching the root and related entities and grouping them"""
 
+        if self._hydrated_snapshot_root:
+            return (
+                input_or_inputs | f"Read hydrated {self._root_entity_class.__name__}"
+                f" instances from snapshot"
+                >> ReadHydratedRootEntities(
+                    file_path_prefix=hydrated_root_entities_path(
+                        self._hydrated_snapshot_root,
+                        self._state_code,
+                        self._root_entity_class,
+                        self._build_related_entities,
+                    ),
+                    unifying_id_field_filter_set=self._unifying_id_field_filter_set,
+                )
+            )
+
         # Get root entities
         root_entities = (
             input_or_inputs | f"Extract root {self._root_entity_class.__name__}"
@@ -164,6 +191,116 @@ class BuildRootEntity(beam.PTransform):
         )
 
 
+# Coder for the (unifying_id, hydrated root entity) tuples stored in hydrated entity snapshots
+HYDRATED_ROOT_ENTITY_CODER = beam.coders.TupleCoder(
+    [beam.coders.VarIntCoder(), StateEntityCoder()]
+)
+
+
+def hydrated_root_entities_path(
+    snapshot_root: str,
+    state_code: str,
+    root_entity_class: Type[state_entities.Entity],
+    build_related_entities: bool,
+) -> str:
+    """Returns the path prefix of the snapshot files under |snapshot_root| holding
+    the |root_entity_class| entities for |state_code|, as built by BuildRootEntity
+    with the given |build_related_entities|.
+
+    The path includes the schema fingerprint of the entities module, so that
+    snapshots written before a change to the entities are never read by pipelines
+    built from the changed entities."""
+    hydration = "with_related_entities" if build_related_entities else "root_only"
+    return "/".join(
+        [
+            snapshot_root.rstrip("/"),
+            f"schema_{ENTITY_SCHEMA_FINGERPRINT}",
+            state_code.upper(),
+            root_entity_class.__name__,
+            hydration,
+            "shard",
+        ]
+    )
+
+
+def delete_hydrated_root_entities(file_path_prefix: str) -> None:
+    """Deletes any snapshot files under |file_path_prefix|. WriteToTFRecord does
+    not remove shards left by an earlier write, which ReadHydratedRootEntities
+    would otherwise still read if that write used a different number of shards."""
+    match_result = FileSystems.match([f"{file_path_prefix}*"])[0]
+    paths = [metadata.path for metadata in match_result.metadata_list]
+    if paths:
+        logging.info(
+            "Deleting [%s] existing snapshot files under [%s]",
+            len(paths),
+            file_path_prefix,
+        )
+        FileSystems.delete(paths)
+
+
+class WriteHydratedRootEntities(beam.PTransform):
+    """Writes the (unifying_id, Entity) tuples output by BuildRootEntity to
+    sharded, gzipped TFRecord files under |file_path_prefix|, so that they can be
+    read by ReadHydratedRootEntities without being extracted and hydrated again.
+
+    Existing files under |file_path_prefix| must be deleted with
+    delete_hydrated_root_entities before the pipeline runs.
+    """
+
+    def __init__(self, file_path_prefix: str):
+        super().__init__()
+        self._file_path_prefix = file_path_prefix
+
+    def expand(self, input_or_inputs):
+        return (
+            input_or_inputs
+            | "Write hydrated entities to snapshot"
+            >> beam.io.WriteToTFRecord(
+                self._file_path_prefix,
+                coder=HYDRATED_ROOT_ENTITY_CODER,
+                file_name_suffix=".tfrecord.gz",
+            )
+        )
+
+
+class ReadHydratedRootEntities(beam.PTransform):
+    """Reads the (unifying_id, Entity) tuples written by WriteHydratedRootEntities
+    under |file_path_prefix|. Fails when the pipeline is built if there are no
+    snapshot files under |file_path_prefix|, such as when the snapshot was written
+    with a different version of the entities module."""
+
+    def __init__(
+        self,
+        file_path_prefix: str,
+        unifying_id_field_filter_set: Optional[Set[int]] = None,
+    ):
+        super().__init__()
+        self._file_path_prefix = file_path_prefix
+        self._unifying_id_field_filter_set = unifying_id_field_filter_set
+
+    # pylint: disable=arguments-differ
+    def expand(self, pipeline: Pipeline):
+        hydrated_entities = (
+            pipeline
+            | "Read hydrated entities from snapshot"
+            >> beam.io.ReadFromTFRecord(
+                f"{self._file_path_prefix}*",
+                coder=HYDRATED_ROOT_ENTITY_CODER,
+                validate=True,
+            )
+        )
+
+        if not self._unifying_id_field_filter_set:
+            return hydrated_entities
+
+        return hydrated_entities | "Filter hydrated entities by unifying id" >> (
+            beam.Filter(
+                lambda element, unifying_ids: element[0] in unifying_ids,
+                self._unifying_id_field_filter_set,
+            )
+        )
+
+
 TypeToLift = TypeVar("TypeToLift")
 
 
@@ -623,7 +760,11 @@ class _HydrateRootEntity(beam.DoFn):
         entity_class = kwargs.get("entity_class")
         unifying_id_field = kwargs.get("unifying_id_field")
 
-        hydrated_entity = entity_class.build_from_dictionary(element)
+        # Pipelines hold many hydrated entities in memory at once, so build the
+        # slotted variant of the entity class
+        hydrated_entity = slotted_entity_class(entity_class).build_from_dictionary(
+            element
+        )
 
         unifying_id = _get_value_from_element(element, unifying_id_field)
 
@@ -698,7 +839,11 @@ class _HydrateEntity(beam.DoFn):
         outer_connection_id_field = kwargs.get("outer_connection_id_field")
         inner_connection_id_field = kwargs.get("inner_connection_id_field")
 
-        hydrated_entity = entity_class.build_from_dictionary(element)
+        # Pipelines hold many hydrated entities in memory at once, so build the
+        # slotted variant of the entity class
+        hydrated_entity = slotted_entity_class(entity_class).build_from_dictionary(
+            element
+        )
 
         if outer_connection_id_field not in element:
             logging.warning(
@@ -66,6 +66,53 @@ class IncarcerationPeriodIndex:
             if ip.custodial_authority != StateCustodialAuthority.SUPERVISION_AUTHORITY
         ]
 
+    # Sorted, non-overlapping date ranges covering every day on which this person has been incarcerated, where the
+    # incarceration prevents the person from being counted simultaneously in the supervision population.
+    date_ranges_excluded_from_supervision_population: List[DateRange] = attr.ib()
+
+    @date_ranges_excluded_from_supervision_population.default
+    def _date_ranges_excluded_from_supervision_population(self) -> List[DateRange]:
+        """Merges the durations of all incarceration periods not under supervision authority into a sorted list of
+        non-overlapping date ranges."""
+        durations = sorted(
+            (
+                ip.duration
+                for ip in self.incarceration_periods_not_under_supervision_authority
+            ),
+            key=lambda duration: duration.lower_bound_inclusive_date,
+        )
+
+        merged_ranges: List[DateRange] = []
+        for duration in durations:
+            if (
+                duration.upper_bound_exclusive_date
+                <= duration.lower_bound_inclusive_date
+            ):
+                continue
+
+            if (
+                merged_ranges
+                and duration.lower_bound_inclusive_date
+                <= merged_ranges[-1].upper_bound_exclusive_date
+            ):
+                last_range = merged_ranges[-1]
+                merged_ranges[-1] = DateRange(
+                    lower_bound_inclusive_date=last_range.lower_bound_inclusive_date,
+                    upper_bound_exclusive_date=max(
+                        last_range.upper_bound_exclusive_date,
+                        duration.upper_bound_exclusive_date,
+                    ),
+                )
+            else:
+                merged_ranges.append(
+                    DateRange(
+                        lower_bound_inclusive_date=duration.lower_bound_inclusive_date,
+                        upper_bound_exclusive_date=duration.upper_bound_exclusive_date,
+                    )
+                )
+
+        return merged_ranges
+
     # A set of tuples in the format (year, month) for each month of which this person has been incarcerated for any
     # portion of the month, where the incarceration prevents the person from being counted simultaneously in the
     # supervision population.
@@ -199,6 +246,42 @@ class IncarcerationPeriodIndex:
 
         return True
 
+    def portions_of_range_not_excluded_from_supervision_population(
+        self, range_to_cover: DateRange
+    ) -> List[DateRange]:
+        """Returns the sorted portions of the |range_to_cover| during which this person is not incarcerated in a period
+        that prevents them from being counted in the supervision population. A day is in one of the returned ranges
+        if and only if is_excluded_from_supervision_population_for_range returns False for that day."""
+        remaining_ranges: List[DateRange] = []
+        lower_bound_inclusive_date = range_to_cover.lower_bound_inclusive_date
+
+        for excluded_range in self.date_ranges_excluded_from_supervision_population:
+            if excluded_range.upper_bound_exclusive_date <= lower_bound_inclusive_date:
+                continue
+            if (
+                excluded_range.lower_bound_inclusive_date
+                >= range_to_cover.upper_bound_exclusive_date
+            ):
+                break
+            if excluded_range.lower_bound_inclusive_date > lower_bound_inclusive_date:
+                remaining_ranges.append(
+                    DateRange(
+                        lower_bound_inclusive_date=lower_bound_inclusive_date,
+                        upper_bound_exclusive_date=excluded_range.lower_bound_inclusive_date,
+                    )
+                )
+            lower_bound_inclusive_date = excluded_range.upper_bound_exclusive_date
+
+        if lower_bound_inclusive_date < range_to_cover.upper_bound_exclusive_date:
+            remaining_ranges.append(
+                DateRange(
+                    lower_bound_inclusive_date=lower_bound_inclusive_date,
+                    upper_bound_exclusive_date=range_to_cover.upper_bound_exclusive_date,
+                )
+            )
+
+        return remaining_ranges
+
     def incarceration_admissions_between_dates(
         self, start_date: date, end_date: date
     ) -> bool:
@@ -223,6 +306,12 @@ class IncarcerationPeriodIndex:
         for incarceration_period in incarceration_periods_subset:
             new_remaining_ranges_to_cover = []
             for time_range in remaining_ranges_to_cover:
+                if not DateRangeDiff(
+                    range_1=incarceration_period.duration, range_2=time_range
+                ).overlapping_range:
+                    # The period does not cover any part of this range
+                    new_remaining_ranges_to_cover.append(time_range)
+                    continue
                 new_remaining_ranges_to_cover.extend(
                     DateRangeDiff(
                         range_1=incarceration_period.duration, range_2=time_range
@@ -0,0 +1,658 @@
+# Recidiviz - a data platform for criminal justice reform
+# Copyright (C) 2021 Recidiviz, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# =============================================================================
+"""In-process batch engine for running the calculation pipelines on a single machine without Beam.
+
+Persons are hydrated from a local Postgres snapshot of the state database, reference views are read from
+newline-delimited JSON files (one file per view, named <view_name>.json), and the identifier and calculator steps of
+the pipeline are run by calling the pipeline's DoFns directly, spread over a multiprocessing pool. Metrics are written
+as newline-delimited JSON files to a local directory, one file per Dataflow metrics table.
+"""
+import datetime
+import json
+import logging
+import multiprocessing
+import os
+from collections import defaultdict
+from enum import Enum
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+import apache_beam as beam
+import attr
+import sqlalchemy
+from more_itertools import one
+
+from recidiviz.calculator.dataflow_output_storage_config import (
+    DATAFLOW_METRICS_TO_TABLES,
+)
+from recidiviz.calculator.pipeline.incarceration import (
+    pipeline as incarceration_pipeline,
+)
+from recidiviz.calculator.pipeline.incarceration.metrics import (
+    IncarcerationMetricType,
+)
+from recidiviz.calculator.pipeline.program import pipeline as program_pipeline
+from recidiviz.calculator.pipeline.program.metrics import ProgramMetricType
+from recidiviz.calculator.pipeline.recidivism import pipeline as recidivism_pipeline
+from recidiviz.calculator.pipeline.recidivism.metrics import (
+    ReincarcerationRecidivismMetricType,
+)
+from recidiviz.calculator.pipeline.supervision import pipeline as supervision_pipeline
+from recidiviz.calculator.pipeline.supervision.metrics import SupervisionMetricType
+from recidiviz.calculator.pipeline.utils.entity_hydration_utils import (
+    ConvertSentencesToStateSpecificType,
+)
+from recidiviz.calculator.pipeline.utils.metric_utils import (
+    RecidivizMetric,
+    json_serializable_metric_key,
+)
+from recidiviz.calculator.pipeline.utils.person_utils import BuildPersonMetadata
+from recidiviz.calculator.query.state.views.reference.incarceration_period_judicial_district_association import (
+    INCARCERATION_PERIOD_JUDICIAL_DISTRICT_ASSOCIATION_VIEW_NAME,
+)
+from recidiviz.calculator.query.state.views.reference.persons_to_recent_county_of_residence import (
+    PERSONS_TO_RECENT_COUNTY_OF_RESIDENCE_VIEW_NAME,
+)
+from recidiviz.calculator.query.state.views.reference.supervision_period_judicial_district_association import (
+    SUPERVISION_PERIOD_JUDICIAL_DISTRICT_ASSOCIATION_VIEW_NAME,
+)
+from recidiviz.calculator.query.state.views.reference.supervision_period_to_agent_association import (
+    SUPERVISION_PERIOD_TO_AGENT_ASSOCIATION_VIEW_NAME,
+)
+from recidiviz.calculator.query.state.views.reference.us_mo_sentence_statuses import (
+    US_MO_SENTENCE_STATUSES_VIEW_NAME,
+)
+from recidiviz.persistence.database.schema.state import schema
+from recidiviz.persistence.database.schema_entity_converter import (
+    schema_entity_converter as converter,
+)
+from recidiviz.persistence.database.session import Session
+from recidiviz.persistence.entity.base_entity import Entity
+from recidiviz.persistence.entity.entity_utils import get_all_entities_from_tree
+from recidiviz.persistence.entity.state import entities
+
+# The static reference table used to build the PersonMetadata for each person
+STATE_RACE_ETHNICITY_POPULATION_COUNTS_TABLE_NAME = (
+    "state_race_ethnicity_population_counts"
+)
+
+# The default number of persons hydrated and calculated by a worker at a time
+DEFAULT_PERSON_BATCH_SIZE = 500
+
+EntityT = TypeVar("EntityT", bound=Entity)
+
+# Reference view rows for a single person, keyed by view name
+ReferenceRowsByView = Dict[str, List[Dict[str, Any]]]
+
+
+@attr.s(frozen=True)
+class LocalPipelineSpec:
+    """Describes how to run one calculation pipeline in-process: how to group a person's hydrated entity graph into the
+    inputs the pipeline's identifier expects, and which of the pipeline's DoFns to call for each step."""
+
+    # The DoFn that identifies the events for a person, e.g. ClassifySupervisionTimeBuckets
+    classify_events_fn_cls: Type[beam.DoFn] = attr.ib()
+
+    # The DoFn that maps a person's events to metric combinations
+    calculate_metric_combinations_fn_cls: Type[beam.DoFn] = attr.ib()
+
+    # The DoFn that builds RecidivizMetrics from the metric combinations
+    produce_metrics_fn_cls: Type[beam.DoFn] = attr.ib()
+
+    # The enum of metric types produced by this pipeline
+    metric_type_cls: Type[Enum] = attr.ib()
+
+    # Builds the dictionary of identifier arguments from the person and their reference view rows
+    build_person_entities: Callable[
+        [entities.StatePerson, List[Entity], ReferenceRowsByView],
+        Dict[str, Iterable[Any]],
+    ] = attr.ib()
+
+    # The reference views, keyed by person_id, that this pipeline reads
+    reference_view_names: Tuple[str, ...] = attr.ib()
+
+    # Whether the metric calculation step takes calculation_end_month and calculation_month_count
+    uses_calculation_limit_args: bool = attr.ib()
+
+
+def _entities_of_type(
+    person_tree_entities: List[Entity], entity_cls: Type[EntityT]
+) -> List[EntityT]:
+    return [e for e in person_tree_entities if isinstance(e, entity_cls)]
+
+
+def _state_specific_sentences(
+    person: entities.StatePerson,
+    person_tree_entities: List[Entity],
+    reference_rows: ReferenceRowsByView,
+) -> Tuple[
+    List[entities.StateIncarcerationSentence], List[entities.StateSupervisionSentence]
+]:
+    """Converts the person's sentences to their state-specific subclasses, if necessary, using the same DoFn the
+    pipelines use."""
+    incarceration_sentences: List[entities.StateIncarcerationSentence] = []
+    supervision_sentences: List[entities.StateSupervisionSentence] = []
+
+    for output in ConvertSentencesToStateSpecificType().process(
+        (
+            person.person_id,
+            {
+                "incarceration_sentences": _entities_of_type(
+                    person_tree_entities, entities.StateIncarcerationSentence
+                ),
+                "supervision_sentences": _entities_of_type(
+                    person_tree_entities, entities.StateSupervisionSentence
+                ),
+                "sentence_statuses": reference_rows.get(
+                    US_MO_SENTENCE_STATUSES_VIEW_NAME, []
+                ),
+            },
+        )
+    ):
+        _, sentence = output.value
+        if output.tag == "incarceration_sentences":
+            incarceration_sentences.append(sentence)
+        else:
+            supervision_sentences.append(sentence)
+
+    return incarceration_sentences, supervision_sentences
+
+
+def _incarceration_person_entities(
+    person: entities.StatePerson,
+    person_tree_entities: List[Entity],
+    reference_rows: ReferenceRowsByView,
+) -> Dict[str, Iterable[Any]]:
+    incarceration_sentences, supervision_sentences = _state_specific_sentences(
+        person, person_tree_entities, reference_rows
+    )
+
+    # Replace the sentences on each sentence group with their state-specific versions
+    for sentence_group in person.sentence_groups:
+        sentence_group.incarceration_sentences = [
+            s for s in incarceration_sentences if s.sentence_group is sentence_group
+        ]
+        sentence_group.supervision_sentences = [
+            s for s in supervision_sentences if s.sentence_group is sentence_group
+        ]
+
+    return {
+        "person": [person],
+        "sentence_groups": person.sentence_groups,
+        "incarceration_period_judicial_district_association": reference_rows.get(
+            INCARCERATION_PERIOD_JUDICIAL_DISTRICT_ASSOCIATION_VIEW_NAME, []
+        ),
+        "persons_to_recent_county_of_residence": reference_rows.get(
+            PERSONS_TO_RECENT_COUNTY_OF_RESIDENCE_VIEW_NAME, []
+        ),
+    }
+
+
+def _supervision_person_entities(
+    person: entities.StatePerson,
+    person_tree_entities: List[Entity],
+    reference_rows: ReferenceRowsByView,
+) -> Dict[str, Iterable[Any]]:
+    incarceration_sentences, supervision_sentences = _state_specific_sentences(
+        person, person_tree_entities, reference_rows
+    )
+
+    return {
+        "person": [person],
+        "assessments": _entities_of_type(
+            person_tree_entities, entities.StateAssessment
+        ),
+        "incarceration_periods": _entities_of_type(
+            person_tree_entities, entities.StateIncarcerationPeriod
+        ),
+        "supervision_periods": _entities_of_type(
+            person_tree_entities, entities.StateSupervisionPeriod
+        ),
+        "supervision_sentences": supervision_sentences,
+        "incarceration_sentences": incarceration_sentences,
+        "violation_responses": _entities_of_type(
+            person_tree_entities, entities.StateSupervisionViolationResponse
+        ),
+        "supervision_contacts": _entities_of_type(
+            person_tree_entities, entities.StateSupervisionContact
+        ),
+        "supervision_period_judicial_district_association": reference_rows.get(
+            SUPERVISION_PERIOD_JUDICIAL_DISTRICT_ASSOCIATION_VIEW_NAME, []
+        ),
+        "supervision_period_to_agent_association": reference_rows.get(
+            SUPERVISION_PERIOD_TO_AGENT_ASSOCIATION_VIEW_NAME, []
+        ),
+    }
+
+
+def _recidivism_person_entities(
+    person: entities.StatePerson,
+    person_tree_entities: List[Entity],
+    reference_rows: ReferenceRowsByView,
+) -> Dict[str, Iterable[Any]]:
+    return {
+        "person": [person],
+        "incarceration_periods": _entities_of_type(
+            person_tree_entities, entities.StateIncarcerationPeriod
+        ),
+        "persons_to_recent_county_of_residence": reference_rows.get(
+            PERSONS_TO_RECENT_COUNTY_OF_RESIDENCE_VIEW_NAME, []
+        ),
+    }
+
+
+def _program_person_entities(
+    person: entities.StatePerson,
+    person_tree_entities: List[Entity],
+    reference_rows: ReferenceRowsByView,
+) -> Dict[str, Iterable[Any]]:
+    return {
+        "person": [person],
+        "program_assignments": _entities_of_type(
+            person_tree_entities, entities.StateProgramAssignment
+        ),
+        "assessments": _entities_of_type(
+            person_tree_entities, entities.StateAssessment
+        ),
+        "supervision_periods": _entities_of_type(
+            person_tree_entities, entities.StateSupervisionPeriod
+        ),
+        "supervision_period_to_agent_association": reference_rows.get(
+            SUPERVISION_PERIOD_TO_AGENT_ASSOCIATION_VIEW_NAME, []
+        ),
+    }
+
+
+LOCAL_PIPELINE_SPECS: Dict[str, LocalPipelineSpec] = {
+    "incarceration": LocalPipelineSpec(
+        classify_events_fn_cls=incarceration_pipeline.ClassifyIncarcerationEvents,
+        calculate_metric_combinations_fn_cls=incarceration_pipeline.CalculateIncarcerationMetricCombinations,
+        produce_metrics_fn_cls=incarceration_pipeline.ProduceIncarcerationMetric,
+        metric_type_cls=IncarcerationMetricType,
+        build_person_entities=_incarceration_person_entities,
+        reference_view_names=(
+            INCARCERATION_PERIOD_JUDICIAL_DISTRICT_ASSOCIATION_VIEW_NAME,
+            PERSONS_TO_RECENT_COUNTY_OF_RESIDENCE_VIEW_NAME,
+            US_MO_SENTENCE_STATUSES_VIEW_NAME,
+        ),
+        uses_calculation_limit_args=True,
+    ),
+    "supervision": LocalPipelineSpec(
+        classify_events_fn_cls=supervision_pipeline.ClassifySupervisionTimeBuckets,
+        calculate_metric_combinations_fn_cls=supervision_pipeline.CalculateSupervisionMetricCombinations,
+        produce_metrics_fn_cls=supervision_pipeline.ProduceSupervisionMetrics,
+        metric_type_cls=SupervisionMetricType,
+        build_person_entities=_supervision_person_entities,
+        reference_view_names=(
+            SUPERVISION_PERIOD_JUDICIAL_DISTRICT_ASSOCIATION_VIEW_NAME,
+            SUPERVISION_PERIOD_TO_AGENT_ASSOCIATION_VIEW_NAME,
+            US_MO_SENTENCE_STATUSES_VIEW_NAME,
+        ),
+        uses_calculation_limit_args=True,
+    ),
+    "recidivism": LocalPipelineSpec(
+        classify_events_fn_cls=recidivism_pipeline.ClassifyReleaseEvents,
+        calculate_metric_combinations_fn_cls=recidivism_pipeline.CalculateRecidivismMetricCombinations,
+        produce_metrics_fn_cls=recidivism_pipeline.ProduceReincarcerationRecidivismMetric,
+        metric_type_cls=ReincarcerationRecidivismMetricType,
+        build_person_entities=_recidivism_person_entities,
+        reference_view_names=(PERSONS_TO_RECENT_COUNTY_OF_RESIDENCE_VIEW_NAME,),
+        uses_calculation_limit_args=False,
+    ),
+    "program": LocalPipelineSpec(
+        classify_events_fn_cls=program_pipeline.ClassifyProgramAssignments,
+        calculate_metric_combinations_fn_cls=program_pipeline.CalculateProgramMetricCombinations,
+        produce_metrics_fn_cls=program_pipeline.ProduceProgramMetrics,
+        metric_type_cls=ProgramMetricType,
+        build_person_entities=_program_person_entities,
+        reference_view_names=(SUPERVISION_PERIOD_TO_AGENT_ASSOCIATION_VIEW_NAME,),
+        uses_calculation_limit_args=True,
+    ),
+}
+
+
+@attr.s(frozen=True)
+class LocalBatchRunConfig:
+    """The arguments for a local batch run of a calculation pipeline."""
+
+    # The pipeline to run, one of the keys of LOCAL_PIPELINE_SPECS
+    pipeline: str = attr.ib(validator=attr.validators.in_(LOCAL_PIPELINE_SPECS))
+
+    # The state to calculate metrics for, e.g. 'US_ND'
+    state_code: str = attr.ib()
+
+    # SQLAlchemy URL of the Postgres database holding the state snapshot
+    database_url: str = attr.ib()
+
+    # Directory of newline-delimited JSON files containing the reference views, one file per view. A missing file is
+    # treated as an empty view.
+    reference_view_dir: str = attr.ib()
+
+    # Directory where the metric output files are written
+    output_dir: str = attr.ib()
+
+    # The metric types to calculate, or 'ALL'
+    metric_types: Set[str] = attr.ib(factory=lambda: {"ALL"})
+
+    calculation_end_month: Optional[str] = attr.ib(default=None)
+    calculation_month_count: int = attr.ib(default=-1)
+
+    # If set, only the persons with these ids are calculated
+    person_id_filter_set: Optional[Set[int]] = attr.ib(default=None)
+
+    # The number of worker processes. With a single process, all work happens in the calling process.
+    num_processes: int = attr.ib(default=1)
+
+    person_batch_size: int = attr.ib(default=DEFAULT_PERSON_BATCH_SIZE)
+
+    @property
+    def spec(self) -> LocalPipelineSpec:
+        return LOCAL_PIPELINE_SPECS[self.pipeline]
+
+    @property
+    def metric_inclusions(self) -> Dict[Enum, bool]:
+        return {
+            metric_type: metric_type.value in self.metric_types
+            or "ALL" in self.metric_types
+            for metric_type in self.spec.metric_type_cls
+        }
+
+
+def read_reference_view_rows(
+    reference_view_dir: str, view_name: str, state_code: str
+) -> List[Dict[str, Any]]:
+    """Reads the rows of the given view for the given state from <reference_view_dir>/<view_name>.json."""
+    path = os.path.join(reference_view_dir, f"{view_name}.json")
+    if not os.path.exists(path):
+        logging.warning(
+            "No file found for reference view [%s] at [%s]", view_name, path
+        )
+        return []
+
+    rows = []
+    with open(path, "r") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            row = json.loads(line)
+            if row.get("state_code") == state_code:
+                rows.append(row)
+    return rows
+
+
+def _rows_by_person_id(rows: List[Dict[str, Any]]) -> Dict[int, List[Dict[str, Any]]]:
+    result: Dict[int, List[Dict[str, Any]]] = defaultdict(list)
+    for row in rows:
+        person_id = row.get("person_id")
+        if person_id:
+            result[int(person_id)].append(row)
+    return result
+
+
+@attr.s
+class _ReferenceData:
+    """Reference view rows needed by every person in a run."""
+
+    # Rows of each per-person reference view, keyed by view name and then by person_id
+    rows_by_view_and_person: Dict[str, Dict[int, List[Dict[str, Any]]]] = attr.ib()
+
+    state_race_ethnicity_population_counts: List[Dict[str, Any]] = attr.ib()
+
+    @classmethod
+    def load(cls, config: LocalBatchRunConfig) -> "_ReferenceData":
+        return cls(
+            rows_by_view_and_person={
+                view_name: _rows_by_person_id(
+                    read_reference_view_rows(
+                        config.reference_view_dir, view_name, config.state_code
+                    )
+                )
+                for view_name in config.spec.reference_view_names
+            },
+            state_race_ethnicity_population_counts=read_reference_view_rows(
+                config.reference_view_dir,
+                STATE_RACE_ETHNICITY_POPULATION_COUNTS_TABLE_NAME,
+                config.state_code,
+            ),
+        )
+
+    def rows_for_person(self, person_id: Optional[int]) -> ReferenceRowsByView:
+        if person_id is None:
+            return {}
+        return {
+            view_name: rows_by_person.get(person_id, [])
+            for view_name, rows_by_person in self.rows_by_view_and_person.items()
+        }
+
+
+def calculate_metrics_for_person(
+    spec: LocalPipelineSpec,
+    person: entities.StatePerson,
+    reference_rows: ReferenceRowsByView,
+    state_race_ethnicity_population_counts: List[Dict[str, Any]],
+    metric_inclusions: Dict[Enum, bool],
+    calculation_end_month: Optional[str],
+    calculation_month_count: int,
+    pipeline_options: Dict[str, Any],
+) -> Iterator[RecidivizMetric]:
+    """Runs the identifier, calculator and metric producing steps of the pipeline described by |spec| for a single,
+    fully hydrated |person|, yielding each RecidivizMetric produced."""
+    if person.person_id is None:
+        raise ValueError(f"Found person without a person_id: {person}")
+
+    person_tree_entities = get_all_entities_from_tree(person)
+    person_entities = spec.build_person_entities(
+        person, person_tree_entities, reference_rows
+    )
+
+    for _, (classified_person, events) in spec.classify_events_fn_cls().process(
+        (person.person_id, person_entities)
+    ):
+        _, person_metadata = one(
+            BuildPersonMetadata().process(
+                (person.person_id, classified_person),
+                state_race_ethnicity_population_counts,
+            )
+        )
+
+        calculate_args: List[Any] = []
+        if spec.uses_calculation_limit_args:
+            calculate_args = [calculation_end_month, calculation_month_count]
+
+        produce_metrics_fn = spec.produce_metrics_fn_cls()
+        for metric_combination in spec.calculate_metric_combinations_fn_cls().process(
+            (classified_person, events, person_metadata),
+            *calculate_args,
+            metric_inclusions,
+        ):
+            yield from produce_metrics_fn.process(
+                metric_combination, **pipeline_options
+            )
+
+
+def _writable_metric(metric: RecidivizMetric) -> Tuple[str, Dict[str, Any]]:
+    """Returns the name of the table the metric belongs in and the metric in the format written to BigQuery."""
+    return (
+        DATAFLOW_METRICS_TO_TABLES[type(metric)],
+        json_serializable_metric_key(metric.__dict__),
+    )
+
+
+@attr.s
+class _WorkerContext:
+    config: LocalBatchRunConfig = attr.ib()
+    engine: sqlalchemy.engine.Engine = attr.ib()
+    reference_data: _ReferenceData = attr.ib()
+    pipeline_options: Dict[str, Any] = attr.ib()
+
+
+# Set in each worker process by _init_worker
+_worker_context: Optional[_WorkerContext] = None
+
+
+def _init_worker(config: LocalBatchRunConfig, pipeline_options: Dict[str, Any]) -> None:
+    global _worker_context
+    _worker_context = _WorkerContext(
+        config=config,
+        engine=sqlalchemy.create_engine(config.database_url),
+        reference_data=_ReferenceData.load(config),
+        pipeline_options=pipeline_options,
+    )
+
+
+def _teardown_worker() -> None:
+    global _worker_context
+    if _worker_context:
+        _worker_context.engine.dispose()
+    _worker_context = None
+
+
+def _hydrate_persons(
+    engine: sqlalchemy.engine.Engine, state_code: str, person_ids: List[int]
+) -> List[entities.StatePerson]:
+    """Reads the full entity trees of the given persons from the database and converts them to entities."""
+    session = Session(bind=engine)
+    try:
+        schema_persons = (
+            session.query(schema.StatePerson)
+            .filter(schema.StatePerson.state_code == state_code)
+            .filter(schema.StatePerson.person_id.in_(person_ids))
+            .all()
+        )
+        return _entities_of_type(
+            converter.convert_schema_objects_to_entity(
+                schema_persons, populate_back_edges=True
+            ),
+            entities.StatePerson,
+        )
+    finally:
+        session.close()
+
+
+def _calculate_batch(person_ids: List[int]) -> Dict[str, List[Dict[str, Any]]]:
+    """Hydrates and calculates metrics for a batch of persons in the current worker, returning the writable metrics
+    keyed by output table."""
+    if not _worker_context:
+        raise ValueError("Worker context not initialized.")
+
+    config = _worker_context.config
+    output: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+
+    for person in _hydrate_persons(
+        _worker_context.engine, config.state_code, person_ids
+    ):
+        for metric in calculate_metrics_for_person(
+            config.spec,
+            person,
+            _worker_context.reference_data.rows_for_person(person.person_id),
+            _worker_context.reference_data.state_race_ethnicity_population_counts,
+            config.metric_inclusions,
+            config.calculation_end_month,
+            config.calculation_month_count,
+            _worker_context.pipeline_options,
+        ):
+            table, metric_dict = _writable_metric(metric)
+            output[table].append(metric_dict)
+
+    return output
+
+
+def _read_person_ids(config: LocalBatchRunConfig) -> List[int]:
+    engine = sqlalchemy.create_engine(config.database_url)
+    session = Session(bind=engine)
+    try:
+        query = session.query(schema.StatePerson.person_id).filter(
+            schema.StatePerson.state_code == config.state_code
+        )
+        if config.person_id_filter_set:
+            query = query.filter(
+                schema.StatePerson.person_id.in_(config.person_id_filter_set)
+            )
+        return sorted(res[0] for res in query.all())
+    finally:
+        session.close()
+        engine.dispose()
+
+
+def run_local_batch(config: LocalBatchRunConfig) -> Dict[str, int]:
+    """Calculates the metrics of the configured pipeline for every person in the state and writes them to
+    <output_dir>/<table>.json, one JSON metric per line.
+
+    Returns the number of metrics written to each table.
+    """
+    person_ids = _read_person_ids(config)
+    batches = [
+        person_ids[i : i + config.person_batch_size]
+        for i in range(0, len(person_ids), config.person_batch_size)
+    ]
+    logging.info(
+        "Calculating [%s] metrics for [%s] persons in [%s] batches with [%s] processes",
+        config.pipeline,
+        len(person_ids),
+        len(batches),
+        config.num_processes,
+    )
+
+    pipeline_options: Dict[str, Any] = {
+        "job_timestamp": datetime.datetime.now().strftime("%Y-%m-%d_%H_%M_%S.%f")
+    }
+
+    os.makedirs(config.output_dir, exist_ok=True)
+    output_files: Dict[str, Any] = {}
+    counts: Dict[str, int] = defaultdict(int)
+
+    def _write(batch_output: Dict[str, List[Dict[str, Any]]]) -> None:
+        for table, metric_dicts in batch_output.items():
+            if table not in output_files:
+                output_files[table] = open(
+                    os.path.join(config.output_dir, f"{table}.json"), "w"
+                )
+            for metric_dict in metric_dicts:
+                output_files[table].write(json.dumps(metric_dict) + "\n")
+            counts[table] += len(metric_dicts)
+
+    try:
+        if config.num_processes == 1:
+            _init_worker(config, pipeline_options)
+            for batch in batches:
+                _write(_calculate_batch(batch))
+        else:
+            with multiprocessing.Pool(
+                processes=config.num_processes,
+                initializer=_init_worker,
+                initargs=(config, pipeline_options),
+            ) as pool:
+                for batch_output in pool.imap_unordered(_calculate_batch, batches):
+                    _write(batch_output)
+    finally:
+        _teardown_worker()
+        for f in output_files.values():
+            f.close()
+
+    logging.info("Finished writing metrics: %s", dict(counts))
+    return dict(counts)
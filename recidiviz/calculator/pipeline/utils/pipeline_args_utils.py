@@ -80,6 +80,14 @@ def add_shared_pipeline_arguments(
         "metrics for these people and will not output to BQ.",
     )
 
+    parser.add_argument(
+        "--hydrated_snapshot_root",
+        type=str,
+        help="An optional path (e.g. gs://bucket/snapshots) to the hydrated entities written by the entity_snapshot "
+        "pipeline. When present, entities are read from these files instead of being extracted from BQ and "
+        "hydrated by this pipeline.",
+    )
+
     if include_calculation_limit_args:
         # Only for pipelines that may receive these arguments
         parser.add_argument(
@@ -0,0 +1,127 @@
+# Recidiviz - a data platform for criminal justice reform
+# Copyright (C) 2021 Recidiviz, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# =============================================================================
+"""Slotted variants of the entity classes in persistence/entity/state/entities.py, which are hydrated by the
+calculation pipelines.
+
+Instances of the entity classes each hold their field values in a per-instance __dict__, which makes up most of the
+memory used by a hydrated person. The variants here are generated from the attrs definitions of the entity classes,
+with the same fields, validators and methods, but store their field values in __slots__ instead.
+
+Each variant reports the entity class it was generated from as its __class__, so isinstance checks against the
+entity classes, attr.fields(entity.__class__) and entity equality all treat a variant as an instance of that entity
+class. Use type(entity) to tell the two apart. Copies made with attr.evolve are instances of the entity class.
+
+The variants are not frozen, since the calculation pipelines normalize some hydrated entities, such as incarceration
+periods, in place.
+"""
+import sys
+import types
+from typing import Any, Dict, Tuple, Type
+
+import attr
+
+from recidiviz.persistence.entity.base_entity import Entity
+from recidiviz.persistence.entity.entity_utils import get_all_entity_classes_in_module
+from recidiviz.persistence.entity.state import entities as state_entities
+
+# Members of the entity classes that are generated by attrs or Python for each class, and so are not copied over to
+# the slotted variants
+_CLASS_MEMBERS_TO_SKIP = {
+    "__abstractmethods__",
+    "__annotations__",
+    "__dict__",
+    "__doc__",
+    "__getstate__",
+    "__init__",
+    "__match_args__",
+    "__module__",
+    "__new__",
+    "__qualname__",
+    "__repr__",
+    "__setattr__",
+    "__setstate__",
+    "__slots__",
+    "__weakref__",
+    "_abc_impl",
+}
+
+
+def _new_slotted_entity(slotted_class: Type[Any]) -> Any:
+    return object.__new__(slotted_class)
+
+
+def _reduce_slotted_entity(self: Any) -> Tuple[Any, ...]:
+    # The default reduce uses __class__, which would unpickle an instance of the entity class
+    return _new_slotted_entity, (type(self),), self.__getstate__()
+
+
+def _build_slotted_class(entity_class: Type[Entity]) -> Type[Any]:
+    """Returns a slotted variant of |entity_class|, with the same fields and methods."""
+    namespace: Dict[str, Any] = {}
+    for base_class in reversed(entity_class.__mro__[:-1]):
+        for name, value in vars(base_class).items():
+            if name in _CLASS_MEMBERS_TO_SKIP or name.startswith("__attrs"):
+                continue
+            function = getattr(value, "__func__", value)
+            if (
+                isinstance(function, types.FunctionType)
+                and "__class__" in function.__code__.co_freevars
+            ):
+                # Methods that call super() are bound to the original class hierarchy
+                raise ValueError(
+                    f"Cannot copy [{name}], which calls super(), to a slotted variant of [{entity_class.__name__}]"
+                )
+            namespace[name] = value
+
+    for attribute in attr.fields(entity_class):
+        namespace[attribute.name] = attr.ib(
+            default=attribute.default,
+            validator=attribute.validator,
+            converter=attribute.converter,
+            repr=attribute.repr,
+            type=attribute.type,
+            kw_only=attribute.kw_only,
+        )
+
+    namespace["__class__"] = property(lambda _: entity_class)
+    namespace["__reduce__"] = _reduce_slotted_entity
+    namespace["__module__"] = __name__
+    namespace["__qualname__"] = entity_class.__name__
+    namespace["__doc__"] = f"Slotted variant of {entity_class.__name__}."
+
+    return attr.s(slots=True, eq=False)(type(entity_class.__name__, (), namespace))
+
+
+_SLOTTED_CLASSES: Dict[Type[Entity], Type[Any]] = {}
+for _entity_class in sorted(
+    get_all_entity_classes_in_module(state_entities),
+    key=lambda entity_class: entity_class.__name__,
+):
+    _slotted_class = _build_slotted_class(_entity_class)
+    _SLOTTED_CLASSES[_entity_class] = _slotted_class
+    # Module level, so that instances can be pickled
+    setattr(sys.modules[__name__], _entity_class.__name__, _slotted_class)
+
+
+def slotted_entity_class(entity_class: Type[Entity]) -> Type[Entity]:
+    """Returns the slotted variant of the given state entity class."""
+    return _SLOTTED_CLASSES[entity_class]
+
+
+def all_slotted_entity_classes() -> Tuple[Type[Entity], ...]:
+    """Returns the slotted variants of all state entity classes, ordered by class name."""
+    return tuple(_SLOTTED_CLASSES.values())
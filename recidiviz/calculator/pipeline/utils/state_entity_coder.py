@@ -0,0 +1,442 @@
+# Recidiviz - a data platform for criminal justice reform
+# Copyright (C) 2021 Recidiviz, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# =============================================================================
+"""A compact Beam coder for graphs of entities in persistence/entity/state/entities.py.
+
+The default pickle coder writes the module path, class name and field names of every entity in a graph, which
+makes up most of the payload of a hydrated StatePerson. This coder instead derives a fixed encoding for each entity
+class from its attr fields, so that only the field values themselves are written.
+
+An encoded graph is the schema fingerprint of the coder that wrote it, then the class index of the root entity, followed by one record per entity, in the order in which the
+entities are first reached from the root. A record is a bitmask of the fields that are set, followed by the values of
+those fields in the order they are declared on the class. References to other entities are written as the index of
+the referenced entity, or as 0 followed by the class index of the referenced entity if it is being reached for the
+first time, in which case its record follows the records of all entities reached before it. This means back-edges
+and other references to entities already in the graph cost a single index, and graphs of any depth are encoded and
+decoded without recursion.
+
+Enums are written as the index of the value in its enum class, and are decoded back to the shared enum members.
+
+Encoded entities can only be decoded by a coder built from the same version of the entities module. The schema
+fingerprint is a hash of the class names, field names and kinds, and enum members that the encoding is derived from,
+and decoding a graph written with a different fingerprint raises an error instead of setting the wrong fields. Graphs that
+cannot be encoded this way, such as those holding state-specific subclasses of the entity classes, are pickled by
+StateEntityCoder instead.
+"""
+import hashlib
+import struct
+from datetime import date
+from enum import Enum
+from operator import attrgetter
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+
+import apache_beam as beam
+import attr
+
+from recidiviz.calculator.pipeline.utils.slotted_entities import (
+    all_slotted_entity_classes,
+)
+from recidiviz.common import attr_utils
+from recidiviz.persistence.entity.base_entity import Entity
+from recidiviz.persistence.entity.entity_utils import get_all_entity_classes_in_module
+from recidiviz.persistence.entity.state import entities as state_entities
+
+# Kinds of fields on an entity class, each with their own encoding
+_STR = 0
+_INT = 1
+_BOOL = 2
+_DATE = 3
+_FLOAT = 4
+_ENUM = 5
+_ENTITY = 6
+_ENTITY_LIST = 7
+
+_DOUBLE = struct.Struct(">d")
+
+
+@attr.s(frozen=True)
+class _EntityClassPlan:
+    """The fixed encoding of the fields of one entity class."""
+
+    entity_class: Type[Entity] = attr.ib()
+    class_index: int = attr.ib()
+    field_names: Tuple[str, ...] = attr.ib()
+    field_kinds: Tuple[int, ...] = attr.ib()
+    # For enum fields, the members of the enum class, in definition order. None for all other fields.
+    enum_members: Tuple[Optional[Tuple[Enum, ...]], ...] = attr.ib()
+    enum_indices: Tuple[Optional[Dict[Enum, int]], ...] = attr.ib()
+    get_field_values: Callable[[Entity], Tuple[Any, ...]] = attr.ib()
+    entity_list_field_names: Tuple[str, ...] = attr.ib()
+    bitmask_length: int = attr.ib()
+    is_slotted: bool = attr.ib()
+
+
+def _field_kind(entity_class: Type[Entity], attribute: attr.Attribute) -> int:
+    if attr_utils.is_list(attribute):
+        return _ENTITY_LIST
+    if attr_utils.is_forward_ref(attribute):
+        return _ENTITY
+    if attr_utils.is_enum(attribute):
+        return _ENUM
+    if attr_utils.is_str(attribute):
+        return _STR
+    if attr_utils.is_bool(attribute):
+        return _BOOL
+    if attr_utils.is_int(attribute):
+        return _INT
+    if attr_utils.is_date(attribute):
+        return _DATE
+    if attr_utils.is_float(attribute):
+        return _FLOAT
+    raise ValueError(
+        f"Unsupported type [{attribute.type}] for field [{attribute.name}] on [{entity_class.__name__}]"
+    )
+
+
+def _build_class_plan(entity_class: Type[Entity], class_index: int) -> _EntityClassPlan:
+    attributes = attr.fields(entity_class)
+    field_names = tuple(attribute.name for attribute in attributes)
+    field_kinds = tuple(
+        _field_kind(entity_class, attribute) for attribute in attributes
+    )
+    enum_members = tuple(
+        tuple(attr_utils.get_enum_cls(attribute))  # type: ignore[arg-type]
+        if kind == _ENUM
+        else None
+        for attribute, kind in zip(attributes, field_kinds)
+    )
+    enum_indices = tuple(
+        {member: i for i, member in enumerate(members)} if members is not None else None
+        for members in enum_members
+    )
+    getter = attrgetter(*field_names)
+    return _EntityClassPlan(
+        entity_class=entity_class,
+        class_index=class_index,
+        field_names=field_names,
+        field_kinds=field_kinds,
+        enum_members=enum_members,
+        enum_indices=enum_indices,
+        get_field_values=getter if len(field_names) > 1 else lambda e: (getter(e),),
+        entity_list_field_names=tuple(
+            name for name, kind in zip(field_names, field_kinds) if kind == _ENTITY_LIST
+        ),
+        bitmask_length=(len(field_names) + 7) // 8,
+        is_slotted="__slots__" in vars(entity_class),
+    )
+
+
+# The entity classes ordered by class name, followed by their slotted variants, so that class indices are the same
+# in every process
+_CLASS_PLANS: List[_EntityClassPlan] = [
+    _build_class_plan(entity_class, class_index)
+    for class_index, entity_class in enumerate(
+        [
+            *sorted(
+                get_all_entity_classes_in_module(state_entities),
+                key=lambda entity_class: entity_class.__name__,
+            ),
+            *all_slotted_entity_classes(),
+        ]
+    )
+]
+_CLASS_PLANS_BY_CLASS: Dict[Type[Entity], _EntityClassPlan] = {
+    plan.entity_class: plan for plan in _CLASS_PLANS
+}
+
+
+def _schema_fingerprint(class_plans: List[_EntityClassPlan]) -> bytes:
+    """Returns a hash of everything about the entity classes that the encoding of a graph depends on."""
+    schema = [
+        [
+            plan.entity_class.__name__,
+            plan.is_slotted,
+            list(plan.field_names),
+            list(plan.field_kinds),
+            [
+                [member.name for member in members] if members is not None else None
+                for members in plan.enum_members
+            ],
+        ]
+        for plan in class_plans
+    ]
+    return hashlib.sha256(repr(schema).encode("utf-8")).digest()[:8]
+
+
+_SCHEMA_FINGERPRINT: bytes = _schema_fingerprint(_CLASS_PLANS)
+
+# Identifies the version of the entities module that graphs are encoded with, for use in the paths of persisted
+# encoded graphs
+ENTITY_SCHEMA_FINGERPRINT: str = _SCHEMA_FINGERPRINT.hex()
+
+
+def _write_uvarint(out: bytearray, value: int) -> None:
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_uvarint(data: bytes, pos: int) -> Tuple[int, int]:
+    result = 0
+    shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, pos
+        shift += 7
+
+
+def _plan_for(entity: Entity) -> _EntityClassPlan:
+    plan = _CLASS_PLANS_BY_CLASS.get(type(entity))
+    if plan is None:
+        raise ValueError(
+            f"Cannot encode [{type(entity).__name__}], which is not a state entity class"
+        )
+    return plan
+
+
+def _new_entity(entity_class: Type[Entity]) -> Entity:
+    # Skips the attr class checks in the Entity and mixin constructors, which have
+    # already been checked when building the class plans
+    return object.__new__(entity_class)
+
+
+def encode_entity_graph(root: Entity) -> bytes:
+    """Encodes the graph of all entities reachable from |root|."""
+    out = bytearray(_SCHEMA_FINGERPRINT)
+    _write_uvarint(out, _plan_for(root).class_index)
+
+    graph_entities: List[Entity] = [root]
+    entity_indices: Dict[int, int] = {id(root): 0}
+
+    def write_reference(entity: Entity) -> None:
+        entity_index = entity_indices.get(id(entity))
+        if entity_index is not None:
+            _write_uvarint(out, entity_index + 1)
+            return
+        out.append(0)
+        _write_uvarint(out, _plan_for(entity).class_index)
+        entity_indices[id(entity)] = len(graph_entities)
+        graph_entities.append(entity)
+
+    i = 0
+    while i < len(graph_entities):
+        entity = graph_entities[i]
+        plan = _CLASS_PLANS_BY_CLASS[type(entity)]
+
+        bitmask_position = len(out)
+        out.extend(bytes(plan.bitmask_length))
+        bitmask = 0
+
+        field_index = -1
+        for value, kind in zip(plan.get_field_values(entity), plan.field_kinds):
+            field_index += 1
+            if value is None or (kind == _ENTITY_LIST and not value):
+                continue
+            bitmask |= 1 << field_index
+            try:
+                if kind == _STR:
+                    encoded = value.encode("utf-8")
+                    if len(encoded) < 0x80:
+                        out.append(len(encoded))
+                    else:
+                        _write_uvarint(out, len(encoded))
+                    out += encoded
+                elif kind == _ENUM:
+                    member_index = plan.enum_indices[field_index][value]  # type: ignore[index]
+                    if member_index < 0x80:
+                        out.append(member_index)
+                    else:
+                        _write_uvarint(out, member_index)
+                elif kind == _ENTITY_LIST:
+                    _write_uvarint(out, len(value))
+                    for child in value:
+                        write_reference(child)
+                elif kind == _ENTITY:
+                    write_reference(value)
+                elif kind == _DATE:
+                    if type(value) is not date:  # pylint: disable=unidiomatic-typecheck
+                        raise TypeError(f"Expected date, found {type(value)}")
+                    _write_uvarint(out, value.toordinal())
+                elif kind == _INT:
+                    # Zigzag encoding, so that small negative values stay small
+                    _write_uvarint(out, value << 1 if value >= 0 else (~value << 1) | 1)
+                elif kind == _BOOL:
+                    out.append(1 if value else 0)
+                else:
+                    out.extend(_DOUBLE.pack(value))
+            except (AttributeError, KeyError, TypeError, struct.error) as e:
+                raise ValueError(
+                    f"Cannot encode value [{value!r}] of field [{plan.field_names[field_index]}] on "
+                    f"[{plan.entity_class.__name__}]"
+                ) from e
+
+        out[
+            bitmask_position : bitmask_position + plan.bitmask_length
+        ] = bitmask.to_bytes(plan.bitmask_length, "little")
+        i += 1
+
+    return bytes(out)
+
+
+def decode_entity_graph(data: bytes) -> Entity:
+    """Decodes a graph of entities encoded by encode_entity_graph, returning its root. Raises a ValueError if the
+    graph was encoded with a different version of the entities module."""
+    fingerprint = data[: len(_SCHEMA_FINGERPRINT)]
+    if fingerprint != _SCHEMA_FINGERPRINT:
+        raise ValueError(
+            f"Cannot decode entity graph encoded with schema fingerprint [{fingerprint.hex()}], expected "
+            f"[{ENTITY_SCHEMA_FINGERPRINT}]"
+        )
+    root_class_index, pos = _read_uvarint(data, len(_SCHEMA_FINGERPRINT))
+    root_plan = _CLASS_PLANS[root_class_index]
+    graph_entities: List[Entity] = [_new_entity(root_plan.entity_class)]
+    plans: List[_EntityClassPlan] = [root_plan]
+
+    def read_reference(pos: int) -> Tuple[Entity, int]:
+        reference, pos = _read_uvarint(data, pos)
+        if reference:
+            return graph_entities[reference - 1], pos
+        class_index, pos = _read_uvarint(data, pos)
+        plan = _CLASS_PLANS[class_index]
+        entity = _new_entity(plan.entity_class)
+        graph_entities.append(entity)
+        plans.append(plan)
+        return entity, pos
+
+    i = 0
+    while i < len(graph_entities):
+        entity = graph_entities[i]
+        plan = plans[i]
+
+        bitmask = int.from_bytes(data[pos : pos + plan.bitmask_length], "little")
+        pos += plan.bitmask_length
+
+        values: Dict[str, Any] = dict.fromkeys(plan.field_names)
+        for name in plan.entity_list_field_names:
+            values[name] = []
+
+        # Only visit the fields that are set, in field order
+        while bitmask:
+            lowest_bit = bitmask & -bitmask
+            bitmask ^= lowest_bit
+            field_index = lowest_bit.bit_length() - 1
+            kind = plan.field_kinds[field_index]
+
+            value: Any
+            if kind == _STR:
+                length = data[pos]
+                if length < 0x80:
+                    pos += 1
+                else:
+                    length, pos = _read_uvarint(data, pos)
+                value = data[pos : pos + length].decode("utf-8")
+                pos += length
+            elif kind == _ENUM:
+                member_index = data[pos]
+                if member_index < 0x80:
+                    pos += 1
+                else:
+                    member_index, pos = _read_uvarint(data, pos)
+                value = plan.enum_members[field_index][member_index]  # type: ignore[index]
+            elif kind == _ENTITY_LIST:
+                length, pos = _read_uvarint(data, pos)
+                value = []
+                for _ in range(length):
+                    child, pos = read_reference(pos)
+                    value.append(child)
+            elif kind == _ENTITY:
+                value, pos = read_reference(pos)
+            elif kind == _DATE:
+                ordinal, pos = _read_uvarint(data, pos)
+                value = date.fromordinal(ordinal)
+            elif kind == _INT:
+                zigzag, pos = _read_uvarint(data, pos)
+                value = zigzag >> 1 if not zigzag & 1 else ~(zigzag >> 1)
+            elif kind == _BOOL:
+                value = data[pos] == 1
+                pos += 1
+            else:
+                (value,) = _DOUBLE.unpack_from(data, pos)
+                pos += _DOUBLE.size
+            values[plan.field_names[field_index]] = value
+
+        if plan.is_slotted:
+            for name, value in values.items():
+                setattr(entity, name, value)
+        else:
+            entity.__dict__.update(values)
+        i += 1
+
+    return graph_entities[0]
+
+
+class StateEntityCoder(beam.coders.Coder):
+    """Coder for state entities, along with all entities reachable from them, that falls back to pickling any value
+    that cannot be encoded with encode_entity_graph. This includes graphs with instances of state-specific subclasses
+    of the entity classes, such as UsMoSupervisionSentence, or with field values that don't match their declared
+    types."""
+
+    _PICKLED = b"\x00"
+    _ENTITY_GRAPH = b"\x01"
+
+    def __init__(self) -> None:
+        self._pickle_coder = beam.coders.PickleCoder()
+
+    def encode(self, value: Any) -> bytes:
+        if type(value) in _CLASS_PLANS_BY_CLASS:
+            try:
+                return self._ENTITY_GRAPH + encode_entity_graph(value)
+            except ValueError:
+                pass
+        return self._PICKLED + self._pickle_coder.encode(value)
+
+    def decode(self, encoded: bytes) -> Any:
+        if encoded[:1] == self._ENTITY_GRAPH:
+            return decode_entity_graph(encoded[1:])
+        return self._pickle_coder.decode(encoded[1:])
+
+    def is_deterministic(self) -> bool:
+        # Entity graphs are always encoded the same way, but pickled values may not be
+        return False
+
+    def to_type_hint(self) -> Any:
+        return Any
+
+
+class StateEntityFastPrimitivesCoder(beam.coders.FastPrimitivesCoder):
+    """The default FastPrimitivesCoder, which encodes primitives, tuples, lists and dicts itself, except that the state
+    entities it finds in them are encoded with StateEntityCoder instead of being pickled."""
+
+    def __init__(self) -> None:
+        super().__init__(fallback_coder=StateEntityCoder())
+
+    @classmethod
+    def from_type_hint(
+        cls, unused_typehint: Any, unused_registry: Any
+    ) -> "StateEntityFastPrimitivesCoder":
+        return cls()
+
+
+# Use StateEntityCoder for any PCollection with elements declared to be of a state entity type, and
+# StateEntityFastPrimitivesCoder in place of the pickling FastPrimitivesCoder for PCollections of any other type
+# without a registered coder, such as the output of CoGroupByKey.
+for _plan in _CLASS_PLANS:
+    beam.coders.registry.register_coder(_plan.entity_class, StateEntityCoder)
+beam.coders.registry.register_fallback_coder(StateEntityFastPrimitivesCoder)
@@ -477,7 +477,7 @@ class UsMoIncarcerationSentence(
         ]
 
         sentence_dict = {
-            **sentence.__dict__,
+            **attr.asdict(sentence, recurse=False),
             "base_sentence": sentence,
             "sentence_statuses": sentence_statuses_converted,
             **subclass_args,
@@ -503,7 +503,7 @@ class UsMoSupervisionSentence(
             for status_dict_raw in sentence_statuses_raw
         ]
         sentence_dict = {
-            **sentence.__dict__,
+            **attr.asdict(sentence, recurse=False),
             "base_sentence": sentence,
             "sentence_statuses": sentence_statuses_converted,
             **subclass_args,
@@ -21,7 +21,7 @@ import logging
 import os
 import tempfile
 import uuid
-from typing import List, Optional, TextIO, Union, Iterator, Callable, Dict
+from typing import List, Optional, TextIO, Union, Iterator, Callable, Dict, BinaryIO
 
 import pysftp
 from paramiko import SFTPFile
@@ -71,6 +71,35 @@ class GcsfsFileContentsHandle(FileContentsHandle[str, TextIO]):
             os.remove(self.local_file_path)
 
 
+class GcsfsBinaryFileContentsHandle(FileContentsHandle[bytes, BinaryIO]):
+    """A handle for a local file with non-text contents (e.g. Parquet)."""
+
+    _READ_BLOCK_SIZE_BYTES = 1024 * 1024
+
+    def __init__(self, local_file_path: str, cleanup_file: bool = True):
+        super().__init__(local_file_path=local_file_path)
+        self.cleanup_file = cleanup_file
+
+    def get_contents_iterator(self) -> Iterator[bytes]:
+        """Lazy function (generator) to read a file block by block."""
+        with self.open() as f:
+            while True:
+                block = f.read(self._READ_BLOCK_SIZE_BYTES)
+                if not block:
+                    break
+                yield block
+
+    def open(self) -> BinaryIO:
+        return open(self.local_file_path, mode="rb")
+
+    def __del__(self) -> None:
+        """This ensures that the file contents on local disk are deleted when
+        this handle is garbage collected.
+        """
+        if self.cleanup_file and os.path.exists(self.local_file_path):
+            os.remove(self.local_file_path)
+
+
 class GcsfsSftpFileContentsHandle(FileContentsHandle[bytes, SFTPFile]):
     def __init__(self, local_file_path: str, sftp_connection: pysftp.Connection):
         super().__init__(local_file_path=local_file_path)
@@ -93,7 +93,25 @@ class EntityEnumMeta(EnumMeta):
     ) -> Optional["EntityEnum"]:
         """Attempts to parse |label| using the default map of |cls| and the
         provided |override_map|. Ignores punctuation by treating punctuation as
-        a separator, e.g. `(N/A)` will map to the same value as `N A`."""
+        a separator, e.g. `(N/A)` will map to the same value as `N A`.
+
+        Results are memoized in the parse cache of |enum_overrides|."""
+        cached_results = enum_overrides.parse_cache.results_by_enum_class[cls]
+        try:
+            result = cached_results[label]
+            enum_overrides.parse_cache.hits += 1
+            return result
+        except KeyError:
+            pass
+
+        result = cls._parse_to_enum_uncached(label, enum_overrides)
+        enum_overrides.parse_cache.misses += 1
+        cached_results[label] = result
+        return result
+
+    def _parse_to_enum_uncached(
+        cls: Type[ClsT], label: str, enum_overrides: "EnumOverrides"
+    ) -> Optional["EntityEnum"]:
         label = normalize(label, remove_punctuation=True)
         if enum_overrides.should_ignore(label, cls):
             return None
@@ -28,6 +28,22 @@ EnumMapper = Callable[[str], Optional[EntityEnum]]
 EnumIgnorePredicate = Callable[[str], bool]
 EntityEnumType = Union[Type[EntityEnum], EntityEnumMeta]
 
+
+@attr.s
+class EnumParseCache:
+    """Memoized results of EntityEnum.parse for a single EnumOverrides, keyed by enum class and then by the raw,
+    un-normalized label. Filled lazily as labels are parsed. Labels that fail to parse are not cached.
+    """
+
+    results_by_enum_class: Dict[
+        EntityEnumType, Dict[str, Optional[EntityEnum]]
+    ] = attr.ib(factory=lambda: defaultdict(dict))
+
+    # Number of parses served from / added to the cache, for tuning
+    hits: int = attr.ib(default=0)
+    misses: int = attr.ib(default=0)
+
+
 # pylint doesn't support custom decorators, so these attributes can't be subscripted.
 # https://github.com/PyCQA/pylint/issues/1694
 # pylint: disable=unsubscriptable-object
@@ -42,6 +58,11 @@ class EnumOverrides:
     _ignores: Dict[EntityEnumType, Set[str]] = attr.ib()
     _ignore_predicates_dict: Dict[EntityEnumType, Set[EnumIgnorePredicate]] = attr.ib()
 
+    # Shared by everything parsing enums with this EnumOverrides, e.g. all entity helpers of a single converter.
+    parse_cache: EnumParseCache = attr.ib(
+        factory=EnumParseCache, init=False, eq=False, repr=False
+    )
+
     def should_ignore(self, label: str, enum_class: EntityEnumType) -> bool:
         label = normalize(label, remove_punctuation=True)
         predicate_calls = (
@@ -121,7 +142,8 @@ class EnumOverrides:
             the bond_status_mapper returns an enum value. Mappings *between* entity types are not allowed.
 
             Note: take care not to add multiple mappers which map the same field value to different enums, as
-            EnumOverrides.parse will throw an exception.
+            EnumOverrides.parse will throw an exception. |mapper| must only depend on the value it is given, as
+            parse results are cached per label (see EnumParseCache).
             """
             if from_field is None:
                 from_field = mapped_cls
@@ -150,7 +172,9 @@ class EnumOverrides:
         def ignore_with_predicate(
             self, predicate: EnumIgnorePredicate, from_field: EntityEnumType
         ) -> "EnumOverrides.Builder":
-            """Marks strings matching |predicate| as ignored values for |from_field| enum class."""
+            """Marks strings matching |predicate| as ignored values for |from_field| enum class. |predicate| must only
+            depend on the value it is given, as parse results are cached per label (see EnumParseCache).
+            """
             self._ignore_predicates_dict[from_field].add(predicate)
             return self
 
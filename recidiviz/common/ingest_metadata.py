@@ -55,3 +55,7 @@ class IngestMetadata(DefaultableAttr):
 
     # The default facility id for the region e.g. 01CNT02502506100
     facility_id: Optional[str] = attr.ib(default=None)
+
+    # Whether historical snapshots are written with set-based statements rather
+    # than one ORM object at a time
+    use_bulk_historical_snapshot_writes: bool = attr.ib(default=False)
@@ -20,6 +20,7 @@ normalizing, etc).
 """
 
 import datetime
+import functools
 import json
 import locale
 import re
@@ -32,6 +33,30 @@ from dateutil.relativedelta import relativedelta
 
 from recidiviz.common.date import munge_date_string
 
+# Explicit formats that dateparser is known to parse to the exact same datetime (it prefers month-first ordering for
+# English dates). Strings matching one of these are parsed with strptime rather than the much slower dateparser.parse.
+_KNOWN_DATETIME_FORMATS = (
+    "%Y-%m-%d",
+    "%m/%d/%Y",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d %H:%M:%S.%f",
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y-%m-%d %H:%M",
+    "%m/%d/%Y %H:%M:%S",
+    "%m/%d/%Y %H:%M",
+    "%m/%d/%Y %I:%M:%S %p",
+    "%m/%d/%Y %I:%M %p",
+    "%m-%d-%Y",
+    "%Y/%m/%d",
+)
+
+# Max number of distinct date strings for which parse results are memoized.
+_DATE_STRING_CACHE_SIZE = 2 ** 16
+
+# The format that most recently matched a date string. Date strings usually arrive in bulk from a single column of a
+# single file, so this is tried first.
+_last_matched_datetime_format = _KNOWN_DATETIME_FORMATS[0]
+
 
 def parse_dollars(dollar_string: str) -> int:
     """Parses a string and returns an int dollar amount"""
@@ -225,15 +250,13 @@ def parse_datetime(
     ):
         return None
 
-    if is_yyyymmdd_date(date_string):
-        as_date = parse_yyyymmdd_date(date_string)
-        if not as_date:
-            raise ValueError(
-                f"Parsed date for string [{date_string}] is unexpectedly None."
-            )
-        return datetime.datetime(
-            year=as_date.year, month=as_date.month, day=as_date.day
-        )
+    as_datetime = _parse_yyyymmdd_datetime(date_string)
+    if as_datetime:
+        return as_datetime
+
+    as_datetime = _parse_datetime_with_known_format(date_string)
+    if as_datetime:
+        return as_datetime
 
     settings: Dict[str, Any] = {"PREFER_DAY_OF_MONTH": "first"}
     if from_dt:
@@ -291,20 +314,45 @@ def parse_datetime_with_negative_component(
     return parsed_date
 
 
-def is_yyyymmdd_date(date_string: str) -> bool:
+@functools.lru_cache(maxsize=_DATE_STRING_CACHE_SIZE)
+def _parse_yyyymmdd_datetime(date_string: str) -> Optional[datetime.datetime]:
+    # Any string strptime can match against %Y%m%d is made up entirely of digits
+    if not date_string.isdigit():
+        return None
     try:
-        datetime.datetime.strptime(date_string, "%Y%m%d")
+        return datetime.datetime.strptime(date_string, "%Y%m%d")
     except ValueError:
-        return False
+        return None
 
-    return True
 
+@functools.lru_cache(maxsize=_DATE_STRING_CACHE_SIZE)
+def _parse_datetime_with_known_format(date_string: str) -> Optional[datetime.datetime]:
+    """Returns the datetime for |date_string| if it matches one of the _KNOWN_DATETIME_FORMATS, otherwise None, in
+    which case the string must be parsed by dateparser. Results do not depend on the current date, so are memoized.
+    """
+    global _last_matched_datetime_format
 
-def parse_yyyymmdd_date(date_str: str) -> Optional[datetime.date]:
-    if not is_yyyymmdd_date(date_str):
+    # All known formats start with a digit
+    if not date_string[:1].isdigit():
         return None
 
-    return datetime.datetime.strptime(date_str, "%Y%m%d").date()
+    for date_format in (_last_matched_datetime_format, *_KNOWN_DATETIME_FORMATS):
+        try:
+            parsed = datetime.datetime.strptime(date_string, date_format)
+        except ValueError:
+            continue
+        _last_matched_datetime_format = date_format
+        return parsed
+    return None
+
+
+def is_yyyymmdd_date(date_string: str) -> bool:
+    return _parse_yyyymmdd_datetime(date_string) is not None
+
+
+def parse_yyyymmdd_date(date_str: str) -> Optional[datetime.date]:
+    as_datetime = _parse_yyyymmdd_datetime(date_str)
+    return as_datetime.date() if as_datetime else None
 
 
 def parse_date(
@@ -317,8 +365,9 @@ def parse_date(
     if _is_str_field_zeros(date_string):
         return None
 
-    if is_yyyymmdd_date(date_string):
-        return parse_yyyymmdd_date(date_string)
+    as_date = parse_yyyymmdd_date(date_string)
+    if as_date:
+        return as_date
 
     parsed = parse_datetime(date_string, from_dt=from_dt)
     return parsed.date() if parsed else None
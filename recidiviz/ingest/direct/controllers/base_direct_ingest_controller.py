@@ -330,7 +330,17 @@ class BaseDirectIngestController(Ingestor, Generic[IngestArgsType, ContentsHandl
         )
 
         ingest_metadata = self._get_ingest_metadata(args)
-        persist_success = persistence.write(ingest_info_proto, ingest_metadata)
+        if (
+            self.system_level == SystemLevel.STATE
+            and self.region.persistence_write_shards
+        ):
+            persist_success = persistence.write_sharded(
+                ingest_info_proto,
+                ingest_metadata,
+                num_shards=self.region.persistence_write_shards,
+            )
+        else:
+            persist_success = persistence.write(ingest_info_proto, ingest_metadata)
 
         if not persist_success:
             raise DirectIngestError(
@@ -347,6 +357,9 @@ class BaseDirectIngestController(Ingestor, Generic[IngestArgsType, ContentsHandl
             args.ingest_time,
             self.get_enum_overrides(),
             self.system_level,
+            use_bulk_historical_snapshot_writes=bool(
+                self.region.use_bulk_historical_snapshot_writes
+            ),
         )
 
     def ingest_process_lock_for_region(self) -> str:
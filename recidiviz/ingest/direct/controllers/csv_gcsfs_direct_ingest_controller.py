@@ -138,7 +138,7 @@ class CsvGcsfsDirectIngestController(GcsfsDirectIngestController):
         delegate = DirectIngestFileSplittingGcsfsCsvReaderDelegate(
             path, self.fs, self.temp_output_directory_path
         )
-        self.csv_reader.streaming_read(
+        self.csv_reader.parallel_streaming_read(
             path, delegate=delegate, chunk_size=self.ingest_file_split_line_limit
         )
         output_paths = [path for path, _ in delegate.output_paths_with_columns]
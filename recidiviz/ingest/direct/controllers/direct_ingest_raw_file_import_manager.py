@@ -20,17 +20,24 @@ import logging
 import os
 import string
 import time
+from enum import Enum
 from types import ModuleType
 from typing import List, Dict, Any, Set, Optional, Tuple
 
 import attr
 import gcsfs
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 from google.api_core.exceptions import BadRequest
 from google.cloud import bigquery
 
 from recidiviz.big_query.big_query_client import BigQueryClient
 from recidiviz.cloud_functions.cloud_function_utils import GCSFS_NO_CACHING
+from recidiviz.cloud_storage.gcs_file_system import (
+    GcsfsBinaryFileContentsHandle,
+    generate_random_temp_path,
+)
 from recidiviz.common import attr_validators
 from recidiviz.ingest.direct import regions
 from recidiviz.ingest.direct.controllers.direct_ingest_gcs_file_system import (
@@ -217,6 +224,23 @@ class DirectIngestRawFileConfig:
         )
 
 
+class RawDataStagingFileFormat(Enum):
+    """The format that normalized chunks of a raw data file are written to in GCS before they are loaded into
+    BigQuery. Values are the corresponding bigquery.SourceFormat for the load job.
+    """
+
+    # Plain text, with the column schema sent along with each load job.
+    CSV = bigquery.SourceFormat.CSV
+
+    # Snappy-compressed, self-describing columnar files with the column schema embedded in each file. These are
+    # typically much smaller than the equivalent CSV and avoid re-escaping every value as text.
+    PARQUET = bigquery.SourceFormat.PARQUET
+
+    @property
+    def file_extension(self) -> str:
+        return self.value.lower()
+
+
 @attr.s
 class DirectIngestRegionRawFileConfig:
     """Class that parses and stores raw data import configs for a region"""
@@ -227,6 +251,10 @@ class DirectIngestRegionRawFileConfig:
     yaml_config_file_dir: str = attr.ib()
     raw_file_configs: Dict[str, DirectIngestRawFileConfig] = attr.ib()
 
+    # The format to stage raw files for this region in before they are loaded into BigQuery. Set with the optional
+    # staging_file_format field of the region's default raw data yaml, and defaults to CSV.
+    staging_file_format: RawDataStagingFileFormat = attr.ib()
+
     def _region_ingest_dir(self) -> str:
         return os.path.join(
             os.path.dirname(self.region_module.__file__), f"{self.region_code.lower()}"
@@ -240,13 +268,30 @@ class DirectIngestRegionRawFileConfig:
     def _raw_data_file_configs(self) -> Dict[str, DirectIngestRawFileConfig]:
         return self._get_raw_data_file_configs()
 
+    @staging_file_format.default
+    def _staging_file_format(self) -> RawDataStagingFileFormat:
+        default_file_path = self._default_config_file_path()
+        if not os.path.exists(default_file_path):
+            return RawDataStagingFileFormat.CSV
+
+        default_contents = YAMLDict.from_path(default_file_path)
+        staging_file_format = default_contents.pop_optional("staging_file_format", str)
+        return (
+            RawDataStagingFileFormat[staging_file_format]
+            if staging_file_format
+            else RawDataStagingFileFormat.CSV
+        )
+
+    def _default_config_file_path(self) -> str:
+        return os.path.join(
+            self.yaml_config_file_dir, f"{self.region_code}_default.yaml"
+        )
+
     def _get_raw_data_file_configs(self) -> Dict[str, DirectIngestRawFileConfig]:
         """Returns list of file tags we expect to see on raw files for this region."""
         if os.path.isdir(self.yaml_config_file_dir):
-            default_filename = f"{self.region_code}_default.yaml"
-            default_file_path = os.path.join(
-                self.yaml_config_file_dir, default_filename
-            )
+            default_file_path = self._default_config_file_path()
+            default_filename = os.path.basename(default_file_path)
             if not os.path.exists(default_file_path):
                 raise ValueError(
                     f"Missing default raw data configs for region: {self.region_code}"
@@ -308,6 +353,48 @@ _DEFAULT_BQ_UPLOAD_CHUNK_SIZE = 250000
 # "5 operations every 10 seconds per table" rate limit (with a little buffer): https://cloud.google.com/bigquery/quotas
 _PER_TABLE_UPDATE_RATE_LIMITING_SEC = 2.5
 
+_BQ_TYPE_TO_ARROW_TYPE = {
+    bigquery.enums.SqlTypeNames.STRING.value: pa.string(),
+    bigquery.enums.SqlTypeNames.INTEGER.value: pa.int64(),
+    # Parquet timestamps that are not adjusted to UTC are loaded into BigQuery as DATETIME values.
+    bigquery.enums.SqlTypeNames.DATETIME.value: pa.timestamp("us"),
+}
+
+
+def _create_raw_table_schema_from_columns(
+    columns: List[str],
+) -> List[bigquery.SchemaField]:
+    """Creates schema for use in `to_gbq` based on the provided columns."""
+    schema = []
+    for name in columns:
+        typ_str = bigquery.enums.SqlTypeNames.STRING.value
+        mode = "NULLABLE"
+        if name == _FILE_ID_COL_NAME:
+            mode = "REQUIRED"
+            typ_str = bigquery.enums.SqlTypeNames.INTEGER.value
+        if name == _UPDATE_DATETIME_COL_NAME:
+            mode = "REQUIRED"
+            typ_str = bigquery.enums.SqlTypeNames.DATETIME.value
+        schema.append(bigquery.SchemaField(name=name, field_type=typ_str, mode=mode))
+    return schema
+
+
+def _create_arrow_schema_from_raw_table_schema(
+    schema: List[bigquery.SchemaField],
+) -> pa.Schema:
+    """Creates the Arrow schema used to write Parquet files that will load into a table with the given BigQuery
+    schema."""
+    return pa.schema(
+        [
+            pa.field(
+                field.name,
+                _BQ_TYPE_TO_ARROW_TYPE[field.field_type],
+                nullable=field.mode != "REQUIRED",
+            )
+            for field in schema
+        ]
+    )
+
 
 class DirectIngestRawFileImportManager:
     """Class that stores raw data import configs for a region, with functionality for executing an import of a specific
@@ -324,6 +411,7 @@ class DirectIngestRawFileImportManager:
         big_query_client: BigQueryClient,
         region_raw_file_config: Optional[DirectIngestRegionRawFileConfig] = None,
         upload_chunk_size: int = _DEFAULT_BQ_UPLOAD_CHUNK_SIZE,
+        staging_file_format: Optional[RawDataStagingFileFormat] = None,
     ):
 
         self.region = region
@@ -340,6 +428,11 @@ class DirectIngestRawFileImportManager:
             )
         )
         self.upload_chunk_size = upload_chunk_size
+        self.staging_file_format = (
+            staging_file_format
+            if staging_file_format
+            else self.region_raw_file_config.staging_file_format
+        )
         self.csv_reader = GcsfsCsvReader(
             gcsfs.GCSFileSystem(
                 project=metadata.project_id(), cache_timeout=GCSFS_NO_CACHING
@@ -442,10 +535,14 @@ class DirectIngestRawFileImportManager:
         columns = self._get_validated_columns(path, file_config)
 
         delegate = DirectIngestRawDataSplittingGcsfsCsvReaderDelegate(
-            path, self.fs, file_metadata, self.temp_output_directory_path
+            path,
+            self.fs,
+            file_metadata,
+            self.temp_output_directory_path,
+            self.staging_file_format,
         )
 
-        self.csv_reader.streaming_read(
+        self.csv_reader.parallel_streaming_read(
             path,
             delegate=delegate,
             chunk_size=self.upload_chunk_size,
@@ -492,9 +589,10 @@ class DirectIngestRawFileImportManager:
                         dataset_id
                     ),
                     destination_table_id=parts.file_tag,
-                    destination_table_schema=self._create_raw_table_schema_from_columns(
+                    destination_table_schema=_create_raw_table_schema_from_columns(
                         columns
                     ),
+                    source_format=self.staging_file_format.value,
                 )
                 logging.info("Load job [%s] for chunk [%d] started", load_job.job_id, i)
 
@@ -607,26 +705,6 @@ class DirectIngestRawFileImportManager:
         )
         return column_name
 
-    @staticmethod
-    def _create_raw_table_schema_from_columns(
-        columns: List[str],
-    ) -> List[bigquery.SchemaField]:
-        """Creates schema for use in `to_gbq` based on the provided columns."""
-        schema = []
-        for name in columns:
-            typ_str = bigquery.enums.SqlTypeNames.STRING.value
-            mode = "NULLABLE"
-            if name == _FILE_ID_COL_NAME:
-                mode = "REQUIRED"
-                typ_str = bigquery.enums.SqlTypeNames.INTEGER.value
-            if name == _UPDATE_DATETIME_COL_NAME:
-                mode = "REQUIRED"
-                typ_str = bigquery.enums.SqlTypeNames.DATETIME.value
-            schema.append(
-                bigquery.SchemaField(name=name, field_type=typ_str, mode=mode)
-            )
-        return schema
-
     @staticmethod
     def _common_read_csv_kwargs(
         file_config: DirectIngestRawFileConfig,
@@ -652,11 +730,13 @@ class DirectIngestRawDataSplittingGcsfsCsvReaderDelegate(
         fs: DirectIngestGCSFileSystem,
         file_metadata: DirectIngestFileMetadata,
         temp_output_directory_path: GcsfsDirectoryPath,
+        staging_file_format: RawDataStagingFileFormat = RawDataStagingFileFormat.CSV,
     ):
 
         super().__init__(path, fs, include_header=False)
         self.file_metadata = file_metadata
         self.temp_output_directory_path = temp_output_directory_path
+        self.staging_file_format = staging_file_format
 
     def transform_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
         # Stripping white space from all fields
@@ -671,7 +751,40 @@ class DirectIngestRawDataSplittingGcsfsCsvReaderDelegate(
         name, _extension = os.path.splitext(self.path.file_name)
 
         return GcsfsFilePath.from_directory_and_file_name(
-            self.temp_output_directory_path, f"temp_{name}_{chunk_num}.csv"
+            self.temp_output_directory_path,
+            f"temp_{name}_{chunk_num}.{self.staging_file_format.file_extension}",
+        )
+
+    def upload_dataframe(self, output_path: GcsfsFilePath, df: pd.DataFrame) -> None:
+        if self.staging_file_format == RawDataStagingFileFormat.CSV:
+            super().upload_dataframe(output_path, df)
+            return
+
+        if self.staging_file_format != RawDataStagingFileFormat.PARQUET:
+            raise ValueError(
+                f"Unexpected staging file format [{self.staging_file_format}]"
+            )
+
+        # Empty values are loaded as NULL from CSV files - mirror that here, otherwise they would be loaded as empty
+        # strings.
+        raw_data_columns = [
+            c
+            for c in df.columns
+            if c not in (_FILE_ID_COL_NAME, _UPDATE_DATETIME_COL_NAME)
+        ]
+        df[raw_data_columns] = df[raw_data_columns].mask(df[raw_data_columns] == "")
+
+        arrow_schema = _create_arrow_schema_from_raw_table_schema(
+            _create_raw_table_schema_from_columns(list(df.columns))
+        )
+        table = pa.Table.from_pandas(df, schema=arrow_schema, preserve_index=False)
+
+        local_path = generate_random_temp_path()
+        pq.write_table(table, local_path, compression="snappy")
+        self.fs.upload_from_contents_handle_stream(
+            output_path,
+            GcsfsBinaryFileContentsHandle(local_path),
+            "application/octet-stream",
         )
 
     @staticmethod
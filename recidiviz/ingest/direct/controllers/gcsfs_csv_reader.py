@@ -16,7 +16,25 @@
 # =============================================================================
 """Streaming read functionality for Google Cloud Storage CSV files."""
 import abc
-from typing import Iterator, List, Optional, Any, TextIO
+import codecs
+import collections
+import csv
+import io
+import logging
+import re
+from concurrent import futures
+from typing import (
+    Any,
+    BinaryIO,
+    Deque,
+    Dict,
+    Generator,
+    Iterator,
+    List,
+    Optional,
+    TextIO,
+    Tuple,
+)
 
 import gcsfs
 import pandas as pd
@@ -29,6 +47,30 @@ COMMON_RAW_FILE_ENCODINGS = [
     "ISO-8859-1",  # Also known as 'latin-1', used in the census and lots of other government data
 ]
 
+# Files must be at least twice this size to be read in parallel byte ranges - for smaller files the overhead of
+# aligning and fetching ranges separately is not worth it and we fall back to a serial streaming read.
+DEFAULT_PARALLEL_READ_MIN_RANGE_SIZE_BYTES = 64 * 1024 * 1024
+DEFAULT_PARALLEL_READ_MAX_WORKERS = 8
+
+# Number of bytes at the start of the file we decode up front to rule out encodings before reading any ranges.
+ENCODING_SNIFF_SAMPLE_SIZE_BYTES = 4 * 1024 * 1024
+
+# Size of the blocks we read when scanning a byte range for quote characters / record boundaries.
+_SCAN_BLOCK_SIZE_BYTES = 8 * 1024 * 1024
+
+# Pandas read_csv() arguments that change how records are delimited or counted in a way that cannot be reproduced
+# when each byte range is parsed independently. Reads with any of these set fall back to a serial streaming read.
+_PARALLEL_READ_UNSUPPORTED_KWARGS = {
+    "chunksize",
+    "comment",
+    "doublequote",
+    "escapechar",
+    "iterator",
+    "lineterminator",
+    "nrows",
+    "skipfooter",
+}
+
 
 class GcsfsCsvReaderDelegate:
     """A delegate for handling various events that happen during a GcsfsCsvReader streaming_read() call."""
@@ -78,16 +120,34 @@ class GcsfsCsvReader:
     def __init__(self, fs: gcsfs.GCSFileSystem):
         self.gcs_file_system = fs
 
-    def _file_pointer_for_path(self, path: GcsfsFilePath, encoding: str) -> TextIO:
-        """Returns a file pointer for the given path."""
-
+    @staticmethod
+    def _token() -> str:
         # From the GCSFileSystem docs (https://gcsfs.readthedocs.io/en/latest/api.html#gcsfs.core.GCSFileSystem),
         # 'google_default' means we should look for local credentials set up via `gcloud login`. The project this is
         # reading from may have to match the project default you have set locally (check via `gcloud info` and set via
         # `gcloud config set project [PROJECT_ID]`. If we are running in the GCP environment, we should be able to query
         # the internal metadata for credentials.
-        token = "google_default" if not environment.in_gcp() else "cloud"
-        return self.gcs_file_system.open(path.uri(), encoding=encoding, token=token)
+        return "google_default" if not environment.in_gcp() else "cloud"
+
+    def _file_pointer_for_path(self, path: GcsfsFilePath, encoding: str) -> TextIO:
+        """Returns a file pointer for the given path."""
+        return self.gcs_file_system.open(
+            path.uri(), encoding=encoding, token=self._token()
+        )
+
+    def _binary_file_pointer_for_path(self, path: GcsfsFilePath) -> BinaryIO:
+        """Returns a binary file pointer for the given path, which supports seeking to arbitrary byte offsets."""
+        return self.gcs_file_system.open(path.uri(), mode="rb", token=self._token())
+
+    def _file_size_for_path(self, path: GcsfsFilePath) -> int:
+        """Returns the size of the file at the given path, in bytes."""
+        return self.gcs_file_system.size(path.uri())
+
+    def _read_byte_range(self, path: GcsfsFilePath, start: int, end: int) -> bytes:
+        """Returns the bytes in the range [start, end) of the file at the given path."""
+        with self._binary_file_pointer_for_path(path) as fp:
+            fp.seek(start)
+            return fp.read(end - start)
 
     def streaming_read(
         self,
@@ -154,3 +214,387 @@ class GcsfsCsvReader:
         raise ValueError(
             f"Unable to read path [{path.abs_path()}] for any of these encodings: {encodings_to_try}"
         )
+
+    def parallel_streaming_read(
+        self,
+        path: GcsfsFilePath,
+        delegate: GcsfsCsvReaderDelegate,
+        chunk_size: int,
+        encodings_to_try: Optional[List[str]] = None,
+        max_workers: int = DEFAULT_PARALLEL_READ_MAX_WORKERS,
+        min_range_size_bytes: int = DEFAULT_PARALLEL_READ_MIN_RANGE_SIZE_BYTES,
+        **kwargs: Any,
+    ) -> None:
+        """
+        Performs a streaming read of the CSV at the provided path, splitting the file into byte ranges that are fetched
+        and parsed concurrently. Range boundaries are aligned to the start of a CSV record, taking quoted fields into
+        account, and the delegate receives chunks of exactly the same size and in the same order as it would from
+        streaming_read().
+
+        Before reading any ranges, a sample from the start of the file is decoded with each encoding so that encodings
+        that obviously do not match are rejected without reading the whole file. If an encoding passes the sample check
+        but fails further into the file, the delegate is notified via on_unicode_decode_error() as in streaming_read().
+
+        Files that are too small to be worth splitting, reads using encodings where newline / quote characters are not
+        single ASCII bytes and reads using read_csv() arguments that cannot be applied independently to each range
+        (e.g. nrows, comment, escapechar) are delegated to streaming_read().
+
+        Note: Boundary alignment assumes the quote character only appears as a field enclosure or as an escaped
+        (doubled) quote within a quoted field. Files with stray quote characters should be read with
+        quoting=csv.QUOTE_NONE.
+
+        Args:
+            path: The GCS path to read.
+            delegate: A delegate for handling read chunks one by one.
+            chunk_size: The max number of rows each chunk of the CSV should have.
+            encodings_to_try: If provided, the ordered list of file encodings we should try for the given file.
+            max_workers: The max number of byte ranges to fetch / parse concurrently.
+            min_range_size_bytes: The minimum size of each byte range.
+            kwargs: Key-value args passed through to the pandas read_csv() call.
+        """
+        if not encodings_to_try:
+            encodings_to_try = COMMON_RAW_FILE_ENCODINGS
+
+        if not self._can_read_in_byte_ranges(kwargs):
+            logging.info(
+                "Read arguments for [%s] do not support parallel reads, reading serially.",
+                path.abs_path(),
+            )
+            self.streaming_read(path, delegate, chunk_size, encodings_to_try, **kwargs)
+            return
+
+        file_size = self._file_size_for_path(path)
+        num_ranges = file_size // min_range_size_bytes
+        if num_ranges < 2:
+            self.streaming_read(path, delegate, chunk_size, encodings_to_try, **kwargs)
+            return
+
+        sample_size = min(file_size, ENCODING_SNIFF_SAMPLE_SIZE_BYTES)
+        sample = self._read_byte_range(path, 0, sample_size)
+
+        with futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for i, encoding in enumerate(encodings_to_try):
+                if not _is_byte_splittable_encoding(encoding, kwargs):
+                    logging.info(
+                        "Encoding [%s] cannot be split on byte boundaries, reading [%s] serially.",
+                        encoding,
+                        path.abs_path(),
+                    )
+                    self.streaming_read(
+                        path, delegate, chunk_size, encodings_to_try[i:], **kwargs
+                    )
+                    return
+
+                delegate.on_start_read_with_encoding(encoding)
+                try:
+                    codecs.getincrementaldecoder(encoding)().decode(
+                        sample, final=sample_size == file_size
+                    )
+                    self._read_byte_ranges_with_encoding(
+                        path,
+                        delegate,
+                        chunk_size,
+                        encoding,
+                        file_size,
+                        num_ranges,
+                        executor,
+                        2 * max_workers,
+                        kwargs,
+                    )
+                    return
+                except UnicodeError as e:
+                    should_throw = delegate.on_unicode_decode_error(encoding, e)
+                    if should_throw:
+                        raise e
+                    continue
+                except Exception as e:
+                    should_throw = delegate.on_exception(encoding, e)
+                    if should_throw:
+                        raise e
+
+        raise ValueError(
+            f"Unable to read path [{path.abs_path()}] for any of these encodings: {encodings_to_try}"
+        )
+
+    @staticmethod
+    def _can_read_in_byte_ranges(read_csv_kwargs: Dict[str, Any]) -> bool:
+        if any(arg in read_csv_kwargs for arg in _PARALLEL_READ_UNSUPPORTED_KWARGS):
+            return False
+        skiprows = read_csv_kwargs.get("skiprows")
+        if skiprows is not None and not isinstance(skiprows, int):
+            return False
+        return read_csv_kwargs.get("header", "infer") in ("infer", 0, None)
+
+    def _read_byte_ranges_with_encoding(
+        self,
+        path: GcsfsFilePath,
+        delegate: GcsfsCsvReaderDelegate,
+        chunk_size: int,
+        encoding: str,
+        file_size: int,
+        num_ranges: int,
+        executor: futures.Executor,
+        max_ranges_in_flight: int,
+        read_csv_kwargs: Dict[str, Any],
+    ) -> None:
+        """Reads the file in |num_ranges| ranges with the given encoding, passing re-chunked DataFrames to the delegate
+        in file order. As in streaming_read(), the delegate is notified of a successful read once all chunks have been
+        passed to it, or once it has stopped the iteration.
+        """
+        quotechar = _quotechar(read_csv_kwargs)
+        quotechar_bytes = quotechar.encode(encoding) if quotechar else None
+        boundaries = self._get_record_aligned_boundaries(
+            path, file_size, num_ranges, quotechar_bytes, executor
+        )
+        first_range_kwargs, subsequent_range_kwargs = self._range_read_csv_kwargs(
+            path, encoding, quotechar_bytes, read_csv_kwargs
+        )
+        reset_index = read_csv_kwargs.get("index_col") in (None, False)
+
+        pending: List[pd.DataFrame] = []
+        pending_rows = 0
+        rows_read = 0
+        chunk_num = 0
+        columns: Optional[pd.Index] = None
+
+        def next_chunk() -> pd.DataFrame:
+            nonlocal pending, pending_rows, rows_read
+            df = pd.concat(pending) if len(pending) > 1 else pending[0]
+            chunk, remainder = df.iloc[:chunk_size], df.iloc[chunk_size:]
+            pending = [remainder] if not remainder.empty else []
+            pending_rows = remainder.shape[0]
+            if reset_index and not chunk.empty:
+                chunk.index = pd.RangeIndex(rows_read, rows_read + chunk.shape[0])
+            rows_read += chunk.shape[0]
+            return chunk
+
+        range_dfs = self._iter_range_dataframes(
+            path,
+            boundaries,
+            encoding,
+            first_range_kwargs,
+            subsequent_range_kwargs,
+            executor,
+            max_ranges_in_flight,
+        )
+        try:
+            for df in range_dfs:
+                if columns is None:
+                    columns = df.columns
+                elif not df.columns.equals(columns):
+                    raise ValueError(
+                        f"Found columns {list(df.columns)} in byte range of [{path.abs_path()}] which do not match "
+                        f"expected columns {list(columns)}."
+                    )
+                if df.empty and pending:
+                    continue
+                pending.append(df)
+                pending_rows += df.shape[0]
+                while pending_rows >= chunk_size:
+                    if not delegate.on_dataframe(
+                        encoding=encoding, chunk_num=chunk_num, df=next_chunk()
+                    ):
+                        delegate.on_file_read_success(encoding)
+                        return
+                    chunk_num += 1
+        finally:
+            range_dfs.close()
+
+        # Mirror pandas, which produces a single empty chunk for a file with a header but no rows.
+        if pending and (pending_rows or chunk_num == 0):
+            delegate.on_dataframe(
+                encoding=encoding, chunk_num=chunk_num, df=next_chunk()
+            )
+        delegate.on_file_read_success(encoding)
+
+    def _iter_range_dataframes(
+        self,
+        path: GcsfsFilePath,
+        boundaries: List[int],
+        encoding: str,
+        first_range_kwargs: Dict[str, Any],
+        subsequent_range_kwargs: Dict[str, Any],
+        executor: futures.Executor,
+        max_in_flight: int,
+    ) -> Generator[pd.DataFrame, None, None]:
+        """Parses each range between consecutive boundaries in the provided executor, yielding DataFrames in file
+        order. Only a bounded number of ranges are in flight at a time so that memory usage stays proportional to the
+        number of workers, not the size of the file.
+        """
+        ranges = list(zip(boundaries, boundaries[1:]))
+        in_flight: Deque["futures.Future[Optional[pd.DataFrame]]"] = collections.deque()
+        next_range = 0
+        try:
+            while next_range < len(ranges) or in_flight:
+                while next_range < len(ranges) and len(in_flight) < max_in_flight:
+                    start, end = ranges[next_range]
+                    in_flight.append(
+                        executor.submit(
+                            self._read_range_dataframe,
+                            path,
+                            start,
+                            end,
+                            encoding,
+                            first_range_kwargs
+                            if next_range == 0
+                            else subsequent_range_kwargs,
+                        )
+                    )
+                    next_range += 1
+                df = in_flight.popleft().result()
+                if df is not None:
+                    yield df
+        finally:
+            for future in in_flight:
+                future.cancel()
+
+    def _read_range_dataframe(
+        self,
+        path: GcsfsFilePath,
+        start: int,
+        end: int,
+        encoding: str,
+        read_csv_kwargs: Dict[str, Any],
+    ) -> Optional[pd.DataFrame]:
+        contents = self._read_byte_range(path, start, end).decode(encoding)
+        try:
+            return pd.read_csv(io.StringIO(contents), dtype=str, **read_csv_kwargs)
+        except pd.errors.EmptyDataError:
+            return None
+
+    def _range_read_csv_kwargs(
+        self,
+        path: GcsfsFilePath,
+        encoding: str,
+        quotechar: Optional[bytes],
+        read_csv_kwargs: Dict[str, Any],
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Returns the read_csv() arguments to use for the first byte range and for all subsequent ranges. Only the
+        first range contains the skipped rows and header, so subsequent ranges are read with explicit column names.
+        """
+        subsequent_range_kwargs = {
+            k: v for k, v in read_csv_kwargs.items() if k != "skiprows"
+        }
+        if read_csv_kwargs.get("header", "infer") is None:
+            return read_csv_kwargs, subsequent_range_kwargs
+
+        subsequent_range_kwargs["header"] = None
+        if "names" in read_csv_kwargs:
+            return read_csv_kwargs, subsequent_range_kwargs
+
+        # Read just the (optional) skipped rows plus the header record to find the full list of column names.
+        header_end = 0
+        for _ in range(read_csv_kwargs.get("skiprows", 0) + 1):
+            header_end = self._find_record_start(path, header_end, False, quotechar)
+        header_kwargs = {
+            k: v for k, v in read_csv_kwargs.items() if k not in ("usecols", "header")
+        }
+        header_df = pd.read_csv(
+            io.StringIO(self._read_byte_range(path, 0, header_end).decode(encoding)),
+            dtype=str,
+            nrows=0,
+            **header_kwargs,
+        )
+        subsequent_range_kwargs["names"] = list(header_df.columns)
+        return read_csv_kwargs, subsequent_range_kwargs
+
+    def _get_record_aligned_boundaries(
+        self,
+        path: GcsfsFilePath,
+        file_size: int,
+        num_ranges: int,
+        quotechar: Optional[bytes],
+        executor: futures.Executor,
+    ) -> List[int]:
+        """Returns a sorted list of byte offsets, starting with 0 and ending with the file size, where each offset is
+        the start of a CSV record.
+
+        If the file may contain quoted fields, we first count the quote characters in each evenly sized segment of the
+        file in parallel. The parity of the running count tells us whether each candidate offset falls inside a quoted
+        field, so each candidate can then be advanced independently to the first newline outside of quotes. This
+        means quoted files are scanned twice, but neither pass requires reading the file serially.
+        """
+        candidates = [file_size * i // num_ranges for i in range(1, num_ranges)]
+        in_quotes = [False] * len(candidates)
+        if quotechar:
+            segments = zip([0] + candidates, candidates)
+            quote_counts = executor.map(
+                lambda segment: self._count_bytes_in_range(
+                    path, segment[0], segment[1], quotechar
+                ),
+                segments,
+            )
+            running_count = 0
+            for i, count in enumerate(quote_counts):
+                running_count += count
+                in_quotes[i] = running_count % 2 == 1
+
+        record_starts = executor.map(
+            lambda args: self._find_record_start(path, args[0], args[1], quotechar),
+            zip(candidates, in_quotes),
+        )
+        return sorted({0, file_size, *record_starts})
+
+    def _count_bytes_in_range(
+        self, path: GcsfsFilePath, start: int, end: int, byte: bytes
+    ) -> int:
+        count = 0
+        with self._binary_file_pointer_for_path(path) as fp:
+            fp.seek(start)
+            position = start
+            while position < end:
+                block = fp.read(min(_SCAN_BLOCK_SIZE_BYTES, end - position))
+                if not block:
+                    break
+                count += block.count(byte)
+                position += len(block)
+        return count
+
+    def _find_record_start(
+        self,
+        path: GcsfsFilePath,
+        offset: int,
+        in_quotes: bool,
+        quotechar: Optional[bytes],
+    ) -> int:
+        """Returns the offset of the first byte after the first newline at or after |offset| that is not inside a
+        quoted field, or the file size if there is no such newline.
+        """
+        pattern = re.compile(
+            b"\n" if not quotechar else b"[\n" + re.escape(quotechar) + b"]"
+        )
+        position = offset
+        with self._binary_file_pointer_for_path(path) as fp:
+            fp.seek(offset)
+            while True:
+                block = fp.read(_SCAN_BLOCK_SIZE_BYTES)
+                if not block:
+                    return position
+                for match in pattern.finditer(block):
+                    if match.group() == b"\n":
+                        if not in_quotes:
+                            return position + match.end()
+                    else:
+                        in_quotes = not in_quotes
+                position += len(block)
+
+
+def _is_byte_splittable_encoding(
+    encoding: str, read_csv_kwargs: Dict[str, Any]
+) -> bool:
+    """Returns True if newlines and the quote character are encoded as the same single bytes as in ASCII in this
+    encoding, meaning we can find record boundaries without decoding the file.
+    """
+    quotechar = _quotechar(read_csv_kwargs)
+    try:
+        return all(
+            c.encode(encoding) == c.encode("ascii") for c in ("\n", quotechar or "")
+        )
+    except (LookupError, UnicodeError):
+        return False
+
+
+def _quotechar(read_csv_kwargs: Dict[str, Any]) -> Optional[str]:
+    if read_csv_kwargs.get("quoting", csv.QUOTE_MINIMAL) == csv.QUOTE_NONE:
+        return None
+    return read_csv_kwargs.get("quotechar", '"')
@@ -107,16 +107,7 @@ class SplittingGcsfsCsvReaderDelegate(GcsfsCsvReaderDelegate):
             output_path.abs_path(),
         )
 
-        # We cannot use QUOTE_ALL as it results in empty values being written as "" in our temp file csv.
-        # When uploading the temp file to BQ this results in empty strings being uploaded instead of NULLs.
-        quoting = csv.QUOTE_MINIMAL
-        self.fs.upload_from_string(
-            output_path,
-            transformed_df.to_csv(
-                header=self.include_header, index=False, quoting=quoting
-            ),
-            "text/csv",
-        )
+        self.upload_dataframe(output_path, transformed_df)
         logging.info("Done writing to output path")
 
         self.output_paths_with_columns.append((output_path, transformed_df.columns))
@@ -149,6 +140,19 @@ class SplittingGcsfsCsvReaderDelegate(GcsfsCsvReaderDelegate):
             self.fs.delete(temp_output_path)
         self.output_paths_with_columns.clear()
 
+    def upload_dataframe(self, output_path: GcsfsFilePath, df: pd.DataFrame) -> None:
+        """Writes the DataFrame to the output path. By default, chunks are written as CSV files - subclasses may
+        override to write another format.
+        """
+        # We cannot use QUOTE_ALL as it results in empty values being written as "" in our temp file csv.
+        # When uploading the temp file to BQ this results in empty strings being uploaded instead of NULLs.
+        quoting = csv.QUOTE_MINIMAL
+        self.fs.upload_from_string(
+            output_path,
+            df.to_csv(header=self.include_header, index=False, quoting=quoting),
+            "text/csv",
+        )
+
     @abc.abstractmethod
     def transform_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
         pass
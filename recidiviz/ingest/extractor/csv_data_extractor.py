@@ -22,9 +22,22 @@ model and returned.
 import collections.abc
 import csv
 import logging
-from collections import defaultdict, OrderedDict
-from typing import Dict, Set, List, Callable, Optional, Iterable, Union
-
+from collections import defaultdict
+from typing import (
+    Dict,
+    Set,
+    List,
+    Callable,
+    Optional,
+    Iterable,
+    Iterator,
+    Union,
+    Tuple,
+    FrozenSet,
+    Sequence,
+)
+
+import attr
 import more_itertools
 
 from recidiviz.common.ingest_metadata import SystemLevel
@@ -58,8 +71,30 @@ class IngestFieldCoordinates:
         )
 
 
+@attr.s(frozen=True)
+class _ColumnPlan:
+    """Row-independent information about how the values in a single CSV column
+    are set on the ingest data model, compiled once from the YAML key mapping.
+    """
+
+    # The 'class.field' key that values in this column are set on, e.g.
+    # 'state_person.surname', or None if values in this column are never set
+    # directly (e.g. ignored columns or columns that are only used as keys).
+    lookup_key: Optional[str] = attr.ib()
+
+    # The class and field of |lookup_key|, pre-split
+    class_name: Optional[str] = attr.ib()
+    field_name: Optional[str] = attr.ib()
+
+    # Whether this column sets a field on a child of the primary object
+    is_child_column: bool = attr.ib()
+
+
 _DUMMY_KEY_PREFIX = "CSV_EXTRACTOR_DUMMY_KEY"
 
+# Number of CSV rows that are materialized into row dicts at a time
+_ROW_BATCH_SIZE = 1000
+
 
 class CsvDataExtractor(DataExtractor):
     """Data extractor for CSV text."""
@@ -134,6 +169,33 @@ class CsvDataExtractor(DataExtractor):
             | set(self.primary_key.keys())
         )
 
+        # Compile the key mappings once up front so that per-row extraction
+        # does not have to re-split 'class.field' strings for every cell.
+        self._column_plans: Dict[str, _ColumnPlan] = {
+            key: self._compile_column_plan(key) for key in self.all_keys
+        }
+        self._child_id_columns_by_class: Dict[str, List[str]] = defaultdict(list)
+        for col in sorted(self.child_keys):
+            child_class_name, _ = self.child_keys[col].split(".")
+            self._child_id_columns_by_class[child_class_name].append(col.strip())
+        self._ancestor_class_sequence_cache: Dict[
+            Tuple[str, FrozenSet[str]], Sequence[str]
+        ] = {}
+
+    def _compile_column_plan(self, key: str) -> _ColumnPlan:
+        if key not in self.keys:
+            return _ColumnPlan(
+                lookup_key=None, class_name=None, field_name=None, is_child_column=False
+            )
+        lookup_key = self.keys[key]
+        class_name, field_name = lookup_key.split(".")
+        return _ColumnPlan(
+            lookup_key=lookup_key,
+            class_name=class_name,
+            field_name=field_name,
+            is_child_column=key in self.child_keys,
+        )
+
     def extract_and_populate_data(
         self, content: Union[str, Iterable[str]], ingest_info: IngestInfo = None
     ) -> IngestInfo:
@@ -161,74 +223,114 @@ class CsvDataExtractor(DataExtractor):
     def _extract(self, content: Union[str, Iterable[str]], ingest_info: IngestInfo):
         """Converts entries in |content| and adds data to |ingest_info|."""
         if isinstance(content, str):
-            rows = csv.DictReader(content.splitlines())
+            reader = csv.reader(content.splitlines())
         elif isinstance(content, collections.abc.Iterable):
-            rows = csv.DictReader(content)
+            reader = csv.reader(content)
         else:
             logging.error("%r is not a string or an Iterable", content)
             return
 
-        self._extract_rows(rows, ingest_info)
-
-    def _extract_rows(self, rows: Iterable[OrderedDict], ingest_info: IngestInfo):
-        """Converts entries in |rows| and adds data to |ingest_info|."""
-
         if self.ingest_object_cache is None:
             raise ValueError("Ingest object cache unexpectedly None")
 
         seen_map: Dict[int, Set[str]] = defaultdict(set)
-        for row in rows:
-            row_with_stripped_cols = OrderedDict()
-            for key in row:
-                row_with_stripped_cols[key.strip()] = row[key]
-            row = row_with_stripped_cols
+        for row_batch in _iter_row_batches(reader, _ROW_BATCH_SIZE):
+            self._extract_rows(row_batch, ingest_info, seen_map)
+
+        for obj_dict in self.ingest_object_cache.object_by_id_cache.values():
+            for obj in obj_dict.values():
+                self._clear_dummy_id(obj)
 
+    def _extract_rows(
+        self,
+        rows: Iterable[Dict[str, str]],
+        ingest_info: IngestInfo,
+        seen_map: Dict[int, Set[str]],
+    ):
+        """Converts entries in |rows|, whose keys have already been stripped of
+        whitespace, and adds data to |ingest_info|."""
+        for row in rows:
             self._pre_process_row(row)
             primary_coordinates = self._primary_coordinates(row)
             ancestor_chain: Dict[str, str] = self._ancestor_chain(row)
 
+            # All columns that set fields on the same class share an ancestor
+            # chain and creation args, so only build those once per row.
+            column_args_by_class: Dict[
+                Tuple[str, bool], Tuple[Dict[str, str], Dict[str, str]]
+            ] = {}
+
             extracted_objects_for_row = []
             for k, v in row.items():
-                k = k.strip()
-                if k not in self.all_keys:
-                    raise ValueError(f"Unmapped key: [{k}]")
-
-                if k in self.keys:
-                    cls, field = self.keys[k].split(".")
-                    if (
-                        cls == primary_coordinates.class_name
-                        and field == primary_coordinates.field_name
-                    ):
-                        # It's possible that the primary key field has been listed in key_mappings in the YAML to make
-                        # it so that section is not empty. However, if there is a primary coordinates override, we want
-                        # the value to match the overridden value so we don't skip this field if the row value is empty.
-                        v = primary_coordinates.field_value
+                plan = self._column_plan(k)
+                if plan.lookup_key is None:
+                    continue
+
+                if (
+                    plan.class_name == primary_coordinates.class_name
+                    and plan.field_name == primary_coordinates.field_name
+                ):
+                    # It's possible that the primary key field has been listed in key_mappings in the YAML to make
+                    # it so that section is not empty. However, if there is a primary coordinates override, we want
+                    # the value to match the overridden value so we don't skip this field if the row value is empty.
+                    v = primary_coordinates.field_value
 
                 if not v and not self.set_with_empty_value:
                     continue
 
-                column_ancestor_chain = ancestor_chain.copy()
-                if k in self.child_keys:
-                    child_class_to_set, _ = self.child_keys[k].split(".")
-                    self._update_column_ancestor_chain_for_child_object(
-                        row,
-                        primary_coordinates,
-                        child_class_to_set,
+                column_args_key = (plan.class_name, plan.is_child_column)
+                if column_args_key not in column_args_by_class:
+                    column_args_by_class[column_args_key] = self._get_column_args(
+                        row, plan, primary_coordinates, ancestor_chain
+                    )
+                column_ancestor_chain, create_args = column_args_by_class[
+                    column_args_key
+                ]
+
+                extracted_objects_for_row.extend(
+                    self._set_or_create_object(
+                        ingest_info,
+                        plan.lookup_key,
+                        [v],
+                        seen_map,
                         column_ancestor_chain,
+                        self.enforced_ancestor_types,
+                        **create_args,
                     )
-
-                create_args = self._get_creation_args(row, k, column_ancestor_chain)
-
-                extracted_objects_for_column = self._set_value_if_key_exists(
-                    k, v, ingest_info, seen_map, column_ancestor_chain, **create_args
                 )
-                extracted_objects_for_row.extend(extracted_objects_for_column)
 
             self._post_process_row(row, extracted_objects_for_row)
 
-        for obj_dict in self.ingest_object_cache.object_by_id_cache.values():
-            for obj in obj_dict.values():
-                self._clear_dummy_id(obj)
+    def _column_plan(self, key: str) -> _ColumnPlan:
+        plan = self._column_plans.get(key)
+        if plan is None:
+            plan = self._column_plans.get(key.strip())
+        if plan is None:
+            raise ValueError(f"Unmapped key: [{key.strip()}]")
+        return plan
+
+    def _get_column_args(
+        self,
+        row: Dict[str, str],
+        plan: _ColumnPlan,
+        primary_coordinates: IngestFieldCoordinates,
+        ancestor_chain: Dict[str, str],
+    ) -> Tuple[Dict[str, str], Dict[str, str]]:
+        """Returns the ancestor chain and creation args for the object that the
+        column described by |plan| sets a field on."""
+        column_ancestor_chain = ancestor_chain.copy()
+        if plan.is_child_column:
+            self._update_column_ancestor_chain_for_child_object(
+                row,
+                primary_coordinates,
+                plan.class_name,
+                column_ancestor_chain,
+            )
+
+        create_args = self._get_creation_args_for_class(
+            row, plan.class_name, primary_coordinates, column_ancestor_chain
+        )
+        return column_ancestor_chain, create_args
 
     def _update_column_ancestor_chain_for_child_object(
         self,
@@ -257,8 +359,8 @@ class CsvDataExtractor(DataExtractor):
             primary_coordinates.class_name
         ] = primary_coordinates.field_value
 
-        ancestor_class_sequence = get_ancestor_class_sequence(
-            child_class_to_set, column_ancestor_chain, self.enforced_ancestor_types
+        ancestor_class_sequence = self._get_ancestor_class_sequence(
+            child_class_to_set, column_ancestor_chain
         )
         i = ancestor_class_sequence.index(primary_coordinates.class_name)
         ancestor_class_sequence_below_primary = ancestor_class_sequence[i + 1 :]
@@ -273,6 +375,20 @@ class CsvDataExtractor(DataExtractor):
                 child_coordinates.class_name
             ] = child_coordinates.field_value
 
+    def _get_ancestor_class_sequence(
+        self, class_name: str, column_ancestor_chain: Dict[str, str]
+    ) -> Sequence[str]:
+        """Returns the ancestor class sequence for |class_name|, which only
+        depends on which ancestor classes are in the chain, not their ids."""
+        cache_key = (class_name, frozenset(column_ancestor_chain))
+        if cache_key not in self._ancestor_class_sequence_cache:
+            self._ancestor_class_sequence_cache[
+                cache_key
+            ] = get_ancestor_class_sequence(
+                class_name, column_ancestor_chain, self.enforced_ancestor_types
+            )
+        return self._ancestor_class_sequence_cache[cache_key]
+
     def _clear_dummy_id(self, obj: IngestObject):
         id_field_name = f"{obj.class_name()}_id"
         id_value = getattr(obj, id_field_name)
@@ -283,30 +399,6 @@ class CsvDataExtractor(DataExtractor):
         for post_hook in self.file_post_hooks:
             post_hook(ingest_info, self.ingest_object_cache)
 
-    def _set_value_if_key_exists(
-        self,
-        lookup_key: str,
-        value: str,
-        ingest_info: IngestInfo,
-        seen_map: Dict[int, Set[str]],
-        ancestor_chain: Dict[str, str] = None,
-        **create_args,
-    ) -> List[IngestObject]:
-        """If the column key is one we want to set on the object, set it on the
-        appropriate object instance."""
-        if lookup_key in self.keys:
-            return self._set_or_create_object(
-                ingest_info,
-                self.keys[lookup_key],
-                [value],
-                seen_map,
-                ancestor_chain,
-                self.enforced_ancestor_types,
-                **create_args,
-            )
-
-        return []
-
     def _instantiate_person(self, ingest_info: IngestInfo):
         if self.system_level == SystemLevel.COUNTY:
             ingest_info.create_person()
@@ -348,12 +440,10 @@ class CsvDataExtractor(DataExtractor):
 
         # Append all values in this row that are relevant to this child object,
         # ordered by CSV column name
-        cols_for_id = []
-        for col, field in self.child_keys.items():
-            this_col_class_name, _ = field.split(".")
-            if child_class_name == this_col_class_name:
-                cols_for_id.append(col)
-        child_primary_key_parts += [row[col.strip()] for col in sorted(cols_for_id)]
+        child_primary_key_parts += [
+            row[col]
+            for col in self._child_id_columns_by_class.get(child_class_name, [])
+        ]
 
         return "|".join(child_primary_key_parts)
 
@@ -391,11 +481,22 @@ class CsvDataExtractor(DataExtractor):
         primary_coordinates = self._primary_coordinates(row)
 
         current_class_name, _current_field_name = current_field.split(".")
-        if current_class_name == primary_coordinates.class_name:
+        return self._get_creation_args_for_class(
+            row, current_class_name, primary_coordinates, column_ancestor_chain
+        )
+
+    def _get_creation_args_for_class(
+        self,
+        row: Dict[str, str],
+        class_name: str,
+        primary_coordinates: IngestFieldCoordinates,
+        column_ancestor_chain: Dict[str, str],
+    ) -> Dict[str, str]:
+        if class_name == primary_coordinates.class_name:
             return {primary_coordinates.field_name: primary_coordinates.field_value}
 
         child_primary_key_coords = self._child_primary_coordinates(
-            row, current_class_name, column_ancestor_chain
+            row, class_name, column_ancestor_chain
         )
 
         return {
@@ -470,3 +571,36 @@ class CsvDataExtractor(DataExtractor):
             coordinates.append(IngestFieldCoordinates(cls, field, id_value))
 
         return coordinates
+
+
+def _iter_row_batches(
+    reader: Iterator[List[str]], batch_size: int
+) -> Iterator[List[Dict[str, str]]]:
+    """Yields the rows read by |reader| in batches of up to |batch_size| rows,
+    each row a dict keyed by the header columns stripped of whitespace.
+
+    Like csv.DictReader, the first row is treated as the header, blank lines are
+    skipped and missing trailing values are filled with None. Unlike
+    csv.DictReader, header columns are only stripped once per file rather than
+    once per row.
+    """
+    header = next(reader, None)
+    if header is None:
+        return
+
+    columns = [col.strip() for col in header]
+    num_columns = len(columns)
+    for raw_rows in more_itertools.chunked(reader, batch_size):
+        row_batch = []
+        for values in raw_rows:
+            if not values:
+                continue
+            if len(values) > num_columns:
+                raise ValueError(
+                    f"Found row with [{len(values)}] values, expected at most "
+                    f"[{num_columns}]: {values}"
+                )
+            if len(values) < num_columns:
+                values = values + [None] * (num_columns - len(values))
+            row_batch.append(dict(zip(columns, values)))
+        yield row_batch
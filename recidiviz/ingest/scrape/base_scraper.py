@@ -38,19 +38,27 @@ In order to subclass this the following functions must be implemented:
 """
 
 import abc
+import copy
 import json
 import logging
+from concurrent import futures
 from typing import Any, Dict, List, Optional, Tuple
 
 import attr
+import requests
+from google.cloud.tasks_v2.proto import queue_pb2
 from lxml import html
 from lxml.etree import XMLSyntaxError  # pylint:disable=no-name-in-module
 
 from recidiviz.common.common_utils import get_trace_id_from_flask
+from recidiviz.common.google_cloud.google_cloud_task_queue_config import (
+    BASE_SCRAPER_QUEUE_CONFIG,
+)
+from recidiviz.common.google_cloud.protobuf_builder import ProtobufBuilder
 from recidiviz.common.ingest_metadata import IngestMetadata
 from recidiviz.ingest.models.ingest_info import IngestInfo
 from recidiviz.ingest.models.scrape_key import ScrapeKey
-from recidiviz.ingest.scrape import constants, ingest_utils, sessions
+from recidiviz.ingest.scrape import constants, http_sessions, ingest_utils, sessions
 from recidiviz.ingest.scrape.errors import (
     ScraperFetchError,
     ScraperGetMoreTasksError,
@@ -60,6 +68,10 @@ from recidiviz.ingest.scrape.scraper import Scraper
 from recidiviz.ingest.scrape.task_params import QueueRequest, ScrapedData, Task
 from recidiviz.persistence import batch_persistence, persistence, single_count
 
+# Prefetched content is sent along in the body of the next task, which must
+# stay well under the App Engine task size limit of 100KB.
+MAX_PREFETCHED_CONTENT_LENGTH = 64 * 1024
+
 
 class ParsingError(Exception):
     """Exception containing the text that failed to parse"""
@@ -75,6 +87,13 @@ class BaseScraper(Scraper):
     # TODO(#1055): Remove this when batch reader is complete.
     BATCH_WRITES = True
 
+    # The max number of next tasks to fetch concurrently at the end of a task,
+    # rather than when they are run. Prefetching is limited to the rate and
+    # concurrency of the region's queue. Only tasks with an HTML response type
+    # are prefetched, and only scrapers that do not override _fetch_content
+    # should set this.
+    PREFETCH_TASK_COUNT = 0
+
     def __init__(self, region_name):
         super().__init__(region_name)
 
@@ -116,30 +135,15 @@ class BaseScraper(Scraper):
         """
         logging.info("Fetching content with endpoint: [%s]", endpoint)
 
-        # Create cookie jar to pass to fetch
-        should_proxy = self.get_region().should_proxy
-        response = self.fetch_page(
+        response = self._fetch_response(
             endpoint,
             headers=headers,
             cookies=cookies,
             params=params,
             post_data=post_data,
             json_data=json_data,
-            should_proxy=should_proxy,
         )
 
-        # Extract any cookies from the response and convert back to dict.
-        cookies.update(response.cookies.get_dict())
-
-        # If the character set was not explicitly set in the response, use the
-        # detected encoding instead of defaulting to 'ISO-8859-1'. See
-        # http://docs.python-requests.org/en/master/user/advanced/#encodings
-        if (
-            "content-type" not in response.headers
-            or "charset" not in response.headers["content-type"]
-        ) and not response.apparent_encoding == "ascii":
-            response.encoding = response.apparent_encoding
-
         if response_type is constants.ResponseType.HTML:
             try:
                 return self._parse_html_content(response.text), cookies
@@ -169,6 +173,110 @@ class BaseScraper(Scraper):
             )
         )
 
+    def _fetch_response(
+        self,
+        endpoint,
+        headers=None,
+        cookies=None,
+        params=None,
+        post_data=None,
+        json_data=None,
+    ) -> requests.Response:
+        """Fetches the page at |endpoint|, adding any cookies from the response
+        to |cookies|."""
+        should_proxy = self.get_region().should_proxy
+        response = self.fetch_page(
+            endpoint,
+            headers=headers,
+            cookies=cookies,
+            params=params,
+            post_data=post_data,
+            json_data=json_data,
+            should_proxy=should_proxy,
+            region_code=self.get_region().region_code,
+        )
+
+        # Extract any cookies from the response and convert back to dict.
+        cookies.update(response.cookies.get_dict())
+
+        # If the character set was not explicitly set in the response, use the
+        # detected encoding instead of defaulting to 'ISO-8859-1'. See
+        # http://docs.python-requests.org/en/master/user/advanced/#encodings
+        if (
+            "content-type" not in response.headers
+            or "charset" not in response.headers["content-type"]
+        ) and not response.apparent_encoding == "ascii":
+            response.encoding = response.apparent_encoding
+
+        return response
+
+    def _prefetch_tasks(self, next_tasks: List[Task]) -> List[Task]:
+        """Concurrently fetches the content of up to PREFETCH_TASK_COUNT of
+        |next_tasks|. Returns |next_tasks| with the content and any new cookies
+        set on the tasks that were prefetched. Tasks that could not be
+        prefetched are returned unchanged and will be fetched when they run.
+        """
+        to_prefetch = [
+            i
+            for i, task in enumerate(next_tasks)
+            if task.content is None
+            and task.response_type is constants.ResponseType.HTML
+        ][: self.PREFETCH_TASK_COUNT]
+        if not to_prefetch:
+            return next_tasks
+
+        queue_config = ProtobufBuilder(queue_pb2.Queue).compose(
+            BASE_SCRAPER_QUEUE_CONFIG
+        )
+        if self.region.queue:
+            queue_config = queue_config.compose(queue_pb2.Queue(**self.region.queue))
+        rate_limits = queue_config.build().rate_limits
+        rate_limiter = http_sessions.get_rate_limiter(
+            self.region.region_code, 1 / rate_limits.max_dispatches_per_second
+        )
+
+        prefetched_tasks = list(next_tasks)
+        with futures.ThreadPoolExecutor(
+            max_workers=rate_limits.max_concurrent_dispatches
+        ) as executor:
+            future_to_index = {
+                executor.submit(self._prefetch_task, next_tasks[i], rate_limiter): i
+                for i in to_prefetch
+            }
+            for future in futures.as_completed(future_to_index):
+                prefetched_tasks[future_to_index[future]] = future.result()
+        return prefetched_tasks
+
+    def _prefetch_task(
+        self, task: Task, rate_limiter: http_sessions.HostRateLimiter
+    ) -> Task:
+        # Work on copies so that the task is unchanged if the fetch fails.
+        post_data = copy.deepcopy(task.post_data)
+        self.transform_post_data(post_data)
+        cookies = dict(task.cookies)
+        try:
+            rate_limiter.wait(task.endpoint)
+            response = self._fetch_response(
+                task.endpoint,
+                headers=task.headers,
+                cookies=cookies,
+                params=task.params,
+                post_data=post_data,
+                json_data=task.json,
+            )
+        except Exception as e:
+            logging.warning(
+                "Failed to prefetch endpoint [%s], will fetch when the task is "
+                "run: %s",
+                task.endpoint,
+                e,
+            )
+            return task
+
+        if len(response.text) > MAX_PREFETCHED_CONTENT_LENGTH:
+            return task
+        return Task.evolve(task, content=response.text, cookies=cookies)
+
     @staticmethod
     def _jsonp_to_json(jsonp: str) -> str:
         """Takes 'JSONP' and turns it to a JSON string.
@@ -205,7 +313,8 @@ class BaseScraper(Scraper):
             # TODO(#680): remove this
             if task.content is not None:
                 content = self._parse_html_content(task.content)
-                cookies = None
+                # Only set if this task was prefetched by the previous task
+                cookies: Optional[Dict[str, str]] = task.cookies
             else:
                 post_data = task.post_data
 
@@ -264,11 +373,20 @@ class BaseScraper(Scraper):
                     next_tasks = self.get_more_tasks(content, task)
                 except Exception as e:
                     raise ScraperGetMoreTasksError(str(e)) from e
-                for next_task in next_tasks:
-                    # Include cookies received from response, if any
-                    if cookies:
+                # Include cookies received from response, if any
+                if cookies:
+                    next_tasks_with_cookies = []
+                    for next_task in next_tasks:
                         cookies.update(next_task.cookies)
-                        next_task = Task.evolve(next_task, cookies=cookies)
+                        next_tasks_with_cookies.append(
+                            Task.evolve(next_task, cookies=dict(cookies))
+                        )
+                    next_tasks = next_tasks_with_cookies
+
+                if self.PREFETCH_TASK_COUNT:
+                    next_tasks = self._prefetch_tasks(next_tasks)
+
+                for next_task in next_tasks:
                     self.add_task(
                         "_generic_scrape",
                         QueueRequest(
@@ -0,0 +1,118 @@
+# Recidiviz - a data platform for criminal justice reform
+# Copyright (C) 2021 Recidiviz, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# =============================================================================
+"""Pooled HTTP sessions and per-host rate limiting for scrapers.
+
+Calling requests.get/requests.post opens a new connection (through the proxy,
+if any) for every page. Instead, scrapers share a keep-alive requests.Session
+per region for the lifetime of the process. scraper_utils.get_proxies returns
+new proxy credentials on every call, and connections through a proxy can only
+be reused for the same credentials, so each region also uses a single set of
+proxy credentials for as long as its session is open.
+"""
+import threading
+import time
+from http.cookiejar import Cookie, DefaultCookiePolicy
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from recidiviz.ingest.scrape import scraper_utils
+
+# Max number of connections to keep alive per host in each session
+_POOL_MAXSIZE = 10
+
+_sessions: Dict[str, requests.Session] = {}
+_proxies: Dict[str, Optional[Dict[str, str]]] = {}
+_rate_limiters: Dict[str, "HostRateLimiter"] = {}
+_lock = threading.Lock()
+
+
+class _RejectAllCookiePolicy(DefaultCookiePolicy):
+    """Keeps the shared session from storing cookies set by responses, so
+    cookies are only ever sent when explicitly passed with a request, as is the
+    case when using requests.get/requests.post."""
+
+    def set_ok(self, cookie: Cookie, request: object) -> bool:
+        return False
+
+
+def get_session(region_code: str) -> requests.Session:
+    """Returns the pooled session to use for requests made on behalf of
+    |region_code|, creating it if necessary."""
+    with _lock:
+        if region_code not in _sessions:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_maxsize=_POOL_MAXSIZE)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            session.cookies.set_policy(_RejectAllCookiePolicy())
+            _sessions[region_code] = session
+        return _sessions[region_code]
+
+
+def get_proxies(region_code: str) -> Optional[Dict[str, str]]:
+    """Returns the proxies to use for requests made on behalf of |region_code|,
+    choosing the proxy credentials the first time they are requested so that
+    the region's requests reuse the connections through the proxy."""
+    with _lock:
+        if region_code not in _proxies:
+            _proxies[region_code] = scraper_utils.get_proxies()
+        return _proxies[region_code]
+
+
+def close_sessions() -> None:
+    """Closes all pooled sessions, along with their open connections, and drops
+    the proxy credentials chosen for each region."""
+    with _lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
+        _proxies.clear()
+        _rate_limiters.clear()
+
+
+class HostRateLimiter:
+    """Spaces out requests to each host by at least |min_interval_seconds|.
+    Safe to share across threads."""
+
+    def __init__(self, min_interval_seconds: float):
+        self.min_interval_seconds = min_interval_seconds
+        self._lock = threading.Lock()
+        self._next_request_time_by_host: Dict[str, float] = {}
+
+    def wait(self, url: str) -> None:
+        """Blocks until a request may be sent to the host of |url|."""
+        host = urlparse(url).netloc
+        with self._lock:
+            now = time.monotonic()
+            request_time = max(now, self._next_request_time_by_host.get(host, now))
+            self._next_request_time_by_host[host] = (
+                request_time + self.min_interval_seconds
+            )
+        if request_time > now:
+            time.sleep(request_time - now)
+
+
+def get_rate_limiter(region_code: str, min_interval_seconds: float) -> HostRateLimiter:
+    """Returns the rate limiter shared by all requests made on behalf of
+    |region_code| in this process, creating it if necessary."""
+    with _lock:
+        if region_code not in _rate_limiters:
+            _rate_limiters[region_code] = HostRateLimiter(min_interval_seconds)
+        return _rate_limiters[region_code]
@@ -29,7 +29,13 @@ import urllib3
 
 from recidiviz.ingest.ingestor import Ingestor
 from recidiviz.ingest.models.scrape_key import ScrapeKey
-from recidiviz.ingest.scrape import constants, scraper_utils, sessions, tracker
+from recidiviz.ingest.scrape import (
+    constants,
+    http_sessions,
+    scraper_utils,
+    sessions,
+    tracker,
+)
 from recidiviz.ingest.scrape.constants import BATCH_PUBSUB_TYPE
 from recidiviz.ingest.scrape.scraper_cloud_task_manager import ScraperCloudTaskManager
 from recidiviz.ingest.scrape.task_params import QueueRequest, Task
@@ -275,6 +281,7 @@ class Scraper(Ingestor, metaclass=abc.ABCMeta):
         post_data=None,
         json_data=None,
         should_proxy=True,
+        region_code=None,
     ):
         """Fetch content from a URL. If data is None (the default), we perform
         a GET for the page. If the data is set, it must be a dict of parameters
@@ -291,22 +298,26 @@ class Scraper(Ingestor, metaclass=abc.ABCMeta):
             extra_headers: dict of parameters to add to the headers of this
                            request
             should_proxy: (bool) whether or not to use a proxy.
+            region_code: (string) region the request is made for. Requests for
+                         the same region share a pooled session and proxy
+                         credentials.
 
         Returns:
             The content.
 
         """
         if should_proxy:
-            proxies = scraper_utils.get_proxies()
+            proxies = http_sessions.get_proxies(region_code or "")
         else:
             proxies = None
         headers = headers.copy() if headers else {}
         if "User-Agent" not in headers:
             headers.update(scraper_utils.get_headers())
+        session = http_sessions.get_session(region_code or "")
 
         try:
             if post_data is None and json_data is None:
-                page = requests.get(
+                page = session.get(
                     url,
                     proxies=proxies,
                     headers=headers,
@@ -315,7 +326,7 @@ class Scraper(Ingestor, metaclass=abc.ABCMeta):
                     verify=False,
                 )
             elif params is None:
-                page = requests.post(
+                page = session.post(
                     url,
                     proxies=proxies,
                     headers=headers,
@@ -27,13 +27,14 @@ the data point with a given set of dimensions resides in the array.
 """
 
 import gzip
-import io
 import json
 import logging
+import tempfile
 from concurrent import futures
-from typing import List, Dict, Tuple, Set, Any, Callable, Union, Sequence
+from typing import List, Dict, Tuple, Any, Sequence, IO, cast
 
 import attr
+import numpy
 from google.cloud import bigquery, storage
 
 from recidiviz.big_query.big_query_client import BigQueryClient
@@ -52,6 +53,9 @@ QUERY_PAGE_SIZE = 10000
 
 DEFAULT_DATA_VALUE = 0
 
+# The size at which the compressed output of a view is spilled from memory to disk before uploading
+TRANSMISSION_FORMAT_SPOOL_MAX_BYTES = 64 * 1024 * 1024
+
 # We set this to 10 because urllib3 (used by the Google BigQuery client) has an default limit of 10 connections and
 # we were seeing "urllib3.connectionpool:Connection pool is full, discarding connection" errors when this number
 # increased.
@@ -165,58 +169,23 @@ class OptimizedMetricBigQueryViewExporter(BigQueryViewExporter):
         dimension_keys = export_view.dimensions
         value_keys = sorted(list(set(all_keys) - set(dimension_keys)))
 
-        # Look at all records to identify full range of values for each dimension
-        dimension_values_by_key: Dict[str, Set[str]] = _initialize_dimension_manifest(
-            dimension_keys
-        )
-        assemble_manifest_fn = _gen_assemble_manifest(dimension_values_by_key)
+        # Read all records once into columns, from which both the dimension manifest and the value matrix are built
+        assembler = OptimizedMetricColumnAssembler(dimension_keys, value_keys)
         self.bq_client.paged_read_and_process(
-            query_job, QUERY_PAGE_SIZE, assemble_manifest_fn
+            query_job, QUERY_PAGE_SIZE, assembler.add_rows
         )
         logging.info(
-            "Produced dictionary-based manifest for view: %s", export_view.view_id
-        )
-        logging.debug(
-            "Dictionary-based manifest for view %s: %s",
-            export_view.view_id,
-            dimension_values_by_key,
+            "Finished paged read and process for view: %s", export_view.view_id
         )
 
-        # Transform dimension ranges into list of tuples first ordered by dimension key and internally by values
-        dimension_manifest: List[
-            Tuple[str, List[str]]
-        ] = transform_manifest_to_order_enforced_form(dimension_values_by_key)
-        logging.info(
-            "Produced ordered dimension manifest for view: %s", export_view.view_id
-        )
+        optimized_representation = assembler.build()
         logging.debug(
             "Ordered dimension manifest for view %s: %s",
             export_view.view_id,
-            dimension_manifest,
-        )
-
-        # Allocate an array with nested arrays for each dimension and value key
-        data_values: List[List[Any]] = [
-            [] for _ in range(len(dimension_keys) + len(value_keys))
-        ]
-
-        # For each data point, set its numeric values in the spot determined by its dimensional combination
-        place_value_in_matrix_fn = _gen_place_in_compact_matrix(
-            data_values, value_keys, dimension_manifest
-        )
-        self.bq_client.paged_read_and_process(
-            query_job, QUERY_PAGE_SIZE, place_value_in_matrix_fn
-        )
-        logging.info(
-            "Finished paged read and process for view: %s", export_view.view_id
+            optimized_representation.dimension_manifest,
         )
 
-        # Return the array and the dimensional manifest
-        return OptimizedMetricRepresentation(
-            value_matrix=data_values,
-            dimension_manifest=dimension_manifest,
-            value_keys=value_keys,
-        )
+        return optimized_representation
 
     def _export_optimized_format(
         self,
@@ -237,10 +206,18 @@ class OptimizedMetricBigQueryViewExporter(BigQueryViewExporter):
 
         blob = storage.Blob.from_string(output_path.uri(), client=storage_client)
         self._set_format_metadata(formatted, blob, should_compress=True)
-        blob.upload_from_string(
-            self._produce_transmission_format(formatted, should_compress=True),
-            content_type="text/plain",
-        )
+
+        # Stream the compressed output through a spooled file so that the full flattened string is never built in
+        # memory and large outputs spill to disk.
+        with tempfile.SpooledTemporaryFile(
+            max_size=TRANSMISSION_FORMAT_SPOOL_MAX_BYTES
+        ) as transmission_file:
+            self._write_transmission_format(
+                formatted, transmission_file, should_compress=True
+            )
+            blob.upload_from_file(
+                transmission_file, rewind=True, content_type="text/plain"
+            )
 
         logging.info(
             "Optimized metric file %s written to GCS bucket %s.",
@@ -276,86 +253,81 @@ class OptimizedMetricBigQueryViewExporter(BigQueryViewExporter):
         if should_compress:
             blob.content_encoding = "gzip"
 
-    def _produce_transmission_format(
-        self, formatted: OptimizedMetricRepresentation, should_compress: bool = False
-    ) -> Union[str, bytes]:
-        """Converts the value matrix into a flattened comma-separated string of values.
-
-        Returns the output as a string if should_compress is false. If should_compress is true, returns the output
-        as a gzip-compressed array of bytes.
-        """
-        flattened = [
-            value for dimension in formatted.value_matrix for value in dimension
-        ]
-        as_string = ",".join([str(value) for value in flattened])
-
-        if should_compress:
-            return self._gzip_str(as_string)
-
-        return as_string
-
     @staticmethod
-    def _gzip_str(uncompressed: str) -> bytes:
-        """Gzip-compresses the given uncompressed string."""
-        out = io.BytesIO()
-
-        with gzip.GzipFile(fileobj=out, mode="w") as fo:
-            fo.write(uncompressed.encode())
-
-        return out.getvalue()
-
-
-def _initialize_dimension_manifest(
-    dimension_keys: Tuple[str, ...]
-) -> Dict[str, Set[str]]:
-    """Initializes an empty dictionary-based dimension manifest.
+    def _write_transmission_format(
+        formatted: OptimizedMetricRepresentation,
+        fileobj: IO[bytes],
+        should_compress: bool = False,
+    ) -> None:
+        """Writes the value matrix as a flattened comma-separated string of values to the given file object, one
+        column of the matrix at a time.
 
-    Each of the given keys will be put in the dictionary with an empty set as its value.
+        If should_compress is true, the output is written as gzip-compressed bytes.
+        """
+        out: IO[bytes] = (
+            cast(IO[bytes], gzip.GzipFile(fileobj=fileobj, mode="w"))
+            if should_compress
+            else fileobj
+        )
+        try:
+            is_first_chunk = True
+            for column in formatted.value_matrix:
+                if not column:
+                    continue
+                chunk = ",".join([str(value) for value in column])
+                if not is_first_chunk:
+                    chunk = "," + chunk
+                out.write(chunk.encode())
+                is_first_chunk = False
+        finally:
+            if should_compress:
+                out.close()
+
+
+class OptimizedMetricColumnAssembler:
+    """Assembles the optimized metric representation of a result set in a single pass over its rows.
+
+    Rows are read into one column per dimension key, holding the normalized dimension values, and one column per
+    value key. Once all rows have been added, the sorted dimension manifest and the index of each row's value within
+    it are derived from each dimension column at once with NumPy.
     """
-    dimension_values_by_key: Dict[str, Set[str]] = {}
-
-    for key in dimension_keys:
-        dimension_values_by_key[key.lower()] = set()
-
-    return dimension_values_by_key
-
-
-def _gen_assemble_manifest(
-    dimension_values_by_key: Dict[str, Set[str]]
-) -> Callable[[bigquery.table.Row], None]:
-    """Generates and returns a function which will take a given result set row from BigQuery and update the given
-    mapping of dimension keys to sets of possible values."""
-
-    def _assemble_by_row(row: bigquery.table.Row) -> None:
-        add_to_dimension_manifest(dict(row), dimension_values_by_key)
-
-    return _assemble_by_row
 
+    def __init__(self, dimension_keys: Sequence[str], value_keys: List[str]):
+        self._dimension_keys = sorted(key.lower() for key in dimension_keys)
+        self._value_keys = value_keys
+        self._dimension_columns: Dict[str, List[str]] = {
+            key: [] for key in self._dimension_keys
+        }
+        self._value_columns: List[List[Any]] = [[] for _ in value_keys]
+
+    def add_rows(self, rows: List[bigquery.table.Row]) -> None:
+        """Adds each row's normalized dimension values and values to the columns."""
+        for row in rows:
+            data_point = dict(row)
+            for key, column in self._dimension_columns.items():
+                column.append(_normalize_dimension_value(data_point[key]))
+            for value_column, value in zip(
+                self._value_columns, get_row_values(data_point, self._value_keys)
+            ):
+                value_column.append(value)
+
+    def build(self) -> OptimizedMetricRepresentation:
+        """Returns the optimized representation of all rows added so far."""
+        dimension_manifest: List[Tuple[str, List[str]]] = []
+        dimension_index_columns: List[List[int]] = []
+        for key in self._dimension_keys:
+            sorted_values, indices = numpy.unique(
+                numpy.array(self._dimension_columns[key], dtype=str),
+                return_inverse=True,
+            )
+            dimension_manifest.append((key, sorted_values.tolist()))
+            dimension_index_columns.append(indices.tolist())
 
-def add_to_dimension_manifest(
-    data_point: Dict[str, Any], dimension_values_by_key: Dict[str, Set[str]]
-) -> Dict[str, Set[str]]:
-    """Updates the given dictionary-based dimension manifest with the dimensional contents of the given data point,
-    i.e. ensures that any new values for any dimensions in the data point are included in the manifest."""
-    for key in dimension_values_by_key.keys():
-        dimension_value = data_point[key]
-        normalized_value = _normalize_dimension_value(dimension_value)
-        dimension_values_by_key[key].add(normalized_value)
-
-    return dimension_values_by_key
-
-
-def transform_manifest_to_order_enforced_form(
-    dimension_values_by_key: Dict[str, Set[str]]
-) -> List[Tuple[str, List[str]]]:
-    """Transforms the dictionary version of the dimension manifest into list-based one which enforces ordering for
-    both dimension keys and dimension values per key."""
-    dimension_manifest: List[Tuple[str, List[str]]] = []
-    for dimension_key in sorted(dimension_values_by_key.keys()):
-        sorted_values = sorted(dimension_values_by_key[dimension_key])
-        dimension_manifest.append((dimension_key, sorted_values))
-
-    return dimension_manifest
+        return OptimizedMetricRepresentation(
+            value_matrix=dimension_index_columns + self._value_columns,
+            dimension_manifest=dimension_manifest,
+            value_keys=self._value_keys,
+        )
 
 
 def get_row_values(data_point: Dict[str, Any], value_keys: List[str]) -> List[Any]:
@@ -363,56 +335,5 @@ def get_row_values(data_point: Dict[str, Any], value_keys: List[str]) -> List[An
     return [data_point.get(vk, DEFAULT_DATA_VALUE) for vk in value_keys]
 
 
-def _gen_place_in_compact_matrix(
-    data_values: List[List[Any]],
-    value_keys: List[str],
-    dimension_manifest: List[Tuple[str, List[str]]],
-) -> Callable[[bigquery.table.Row], None]:
-    def _place_by_row(row: bigquery.table.Row) -> None:
-        data_point = dict(row)
-        place_in_compact_matrix(data_point, data_values, value_keys, dimension_manifest)
-
-    return _place_by_row
-
-
-def place_in_compact_matrix(
-    data_point: Dict[str, Any],
-    data_values: List[List[Any]],
-    value_keys: List[str],
-    dimension_manifest: List[Tuple[str, List[str]]],
-) -> None:
-    """Places the given data point within the compact matrix representation of the dataset.
-
-    The compact matrix is composed of an array of arrays: one for each dimension key and for each value key. They are
-    ordered in alphabetical order of each dimension key and then in alphabetical order of each value key. Each
-    internal array should be the same length: for each non-empty data point in the dataset, there will be a value
-    in each array at the same index. A data point's value in a given dimensional array will be the index of that
-    data point's value for the dimension within the dimension manifest. Its value in a given value array will simply
-    be that particular value.
-    """
-    for i, manifest_kv in enumerate(dimension_manifest):
-        dimension_key = manifest_kv[0].lower()
-        dimension_values = manifest_kv[1]
-
-        dimension_value = data_point.get(dimension_key, None)
-        normalized_value = _normalize_dimension_value(dimension_value)
-
-        try:
-            value_index = dimension_values.index(normalized_value)
-        except ValueError as e:
-            raise KeyError(
-                f"Dimension of [{dimension_key}: {dimension_value}] not found in dimension manifest: "
-                f"[{dimension_manifest}]. This indicates that either the manifest was not constructed from "
-                "a dataset containing the given data point or a bug in the optimized view exporter. "
-                f"Data point: {data_point}"
-            ) from e
-
-        data_values[i].append(value_index)
-
-    row_values = get_row_values(data_point, value_keys)
-    for i, value in enumerate(row_values):
-        data_values[len(dimension_manifest) + i].append(value)
-
-
 def _normalize_dimension_value(dimension_value: Any) -> str:
     return str(dimension_value).lower()
@@ -138,7 +138,11 @@ def _save_record_trees(
         raise PersistenceError(f"Unexpected system level [{metadata.system_level}]")
 
     update_snapshots.update_historical_snapshots(
-        session, merged_root_people, merged_orphaned_entities, metadata
+        session,
+        merged_root_people,
+        merged_orphaned_entities,
+        metadata,
+        use_bulk_writes=metadata.use_bulk_historical_snapshot_writes,
     )
 
     return merged_root_people
@@ -27,11 +27,11 @@ import logging
 from collections import defaultdict
 
 from types import ModuleType
-from typing import List, Generic, Type, Set, Callable, Optional, Dict
+from typing import List, Generic, Type, Set, Callable, Optional, Dict, Tuple, Any
 
 import attr
 
-from sqlalchemy import text
+from sqlalchemy import inspect, text
 
 from recidiviz.persistence.database.session import Session
 from recidiviz.common.ingest_metadata import IngestMetadata, SystemLevel
@@ -97,6 +97,7 @@ class BaseHistoricalSnapshotUpdater(Generic[SchemaPersonType]):
         root_people: List[SchemaPersonType],
         orphaned_entities: List[DatabaseEntity],
         ingest_metadata: IngestMetadata,
+        use_bulk_writes: bool = False,
     ) -> None:
         """For all entities in all record trees rooted at |root_people| and all
         entities in |orphaned_entities|, performs any required historical
@@ -112,6 +113,12 @@ class BaseHistoricalSnapshotUpdater(Generic[SchemaPersonType]):
 
         If neither of these cases applies, no action will be taken on the
         entity.
+
+        If |use_bulk_writes| is True, the most recent snapshots are read as
+        plain rows instead of ORM objects, and snapshots are closed and
+        inserted with one set-based statement per historical table instead of
+        through the session's unit of work. Snapshots written this way are not
+        present in the session's identity map.
         """
         logging.info(
             "Beginning historical snapshot updates for %s record tree(s) and %s"
@@ -139,6 +146,15 @@ class BaseHistoricalSnapshotUpdater(Generic[SchemaPersonType]):
             len(context_registry.all_contexts()),
         )
 
+        if use_bulk_writes:
+            # As below, provided start and end times are only relevant for
+            # root_people.
+            self.set_provided_start_and_end_times(root_people, context_registry)
+            self._update_historical_snapshots_in_bulk(
+                session, context_registry, ingest_metadata.ingest_time, schema
+            )
+            return
+
         most_recent_snapshots = self._fetch_most_recent_snapshots_for_all_entities(
             session, root_entities, schema
         )
@@ -204,6 +220,38 @@ class BaseHistoricalSnapshotUpdater(Generic[SchemaPersonType]):
         """Returns a list containing the most recent snapshot for each ID in
         |entity_ids| with type |master_class|
         """
+        history_table_class = _get_historical_class(master_class, schema)
+        history_table_name = history_table_class.__table__.name
+        snapshot_ids = self._fetch_most_recent_snapshot_ids_for_entity_type(
+            session, master_class, entity_ids, schema
+        )
+
+        # Removing the below early return will pass in tests but fail in
+        # production, because SQLite allows "IN ()" but Postgres does not
+        if not snapshot_ids:
+            return []
+
+        filter_statement = (
+            "{historical_table}.{primary_key_column} IN ({ids_list})".format(
+                historical_table=history_table_name,
+                primary_key_column=history_table_class.get_primary_key_column_name(),
+                ids_list=", ".join([str(id) for id in snapshot_ids]),
+            )
+        )
+
+        return session.query(history_table_class).filter(text(filter_statement)).all()
+
+    @staticmethod
+    def _fetch_most_recent_snapshot_ids_for_entity_type(
+        session: Session,
+        master_class: Type,
+        entity_ids: Set[int],
+        schema: ModuleType,
+    ) -> List[int]:
+        """Returns a list containing the id of the most recent snapshot for
+        each ID in |entity_ids| with type |master_class|, if that snapshot is
+        open.
+        """
 
         # Get name of historical table in database (as distinct from name of ORM
         # class representing historical table in code)
@@ -245,26 +293,147 @@ class BaseHistoricalSnapshotUpdater(Generic[SchemaPersonType]):
 
         # Use only results where valid_to is None to exclude any overlapping
         # non-open snapshots
-        snapshot_ids = [
+        return [
             snapshot_id
             for snapshot_id, master_id, valid_to in results
             if valid_to is None
         ]
 
-        # Removing the below early return will pass in tests but fail in
-        # production, because SQLite allows "IN ()" but Postgres does not
-        if not snapshot_ids:
-            return []
+    def _update_historical_snapshots_in_bulk(
+        self,
+        session: Session,
+        context_registry: "_SnapshotContextRegistry",
+        snapshot_time: datetime,
+        schema: ModuleType,
+    ) -> None:
+        """Writes snapshots for all new and changed entities in
+        |context_registry|, issuing at most one UPDATE and one multi-row INSERT
+        per historical table.
 
-        filter_statement = (
-            "{historical_table}.{primary_key_column} IN ({ids_list})".format(
-                historical_table=history_table_name,
-                primary_key_column=history_table_class.get_primary_key_column_name(),
-                ids_list=", ".join([str(id) for id in snapshot_ids]),
+        Follows the same rules as _write_snapshots, except that an entity is
+        compared to its most recent snapshot as a single tuple of its shared
+        column values, read without loading the snapshot as an ORM object.
+        """
+
+        # Snapshots reference their master entities, which must be written
+        # before the snapshot rows are inserted outside of the unit of work.
+        session.flush()
+
+        for (
+            master_type_name,
+            contexts_by_id,
+        ) in context_registry.snapshot_contexts.items():
+            master_class = getattr(schema, master_type_name)
+            historical_class = _get_historical_class(master_class, schema)
+            historical_table = historical_class.__table__
+            column_keys = _column_keys_by_property_name(historical_class)
+            shared_property_names = sorted(
+                self._get_shared_column_property_names(master_class, historical_class)
             )
-        )
+            # See module assumption #2
+            master_key_property_name = (
+                historical_class.get_property_name_by_column_name(
+                    master_class.get_primary_key_column_name()
+                )
+            )
+            row_property_names = sorted(
+                set(shared_property_names)
+                | {master_key_property_name, "valid_from", "valid_to"}
+            )
+            historical_key_column = historical_table.c[
+                column_keys[historical_class.get_primary_key_column_name()]
+            ]
+
+            current_values_by_entity_id: Dict[int, Tuple[Any, ...]] = {}
+            snapshot_ids_by_entity_id: Dict[int, int] = {}
+            snapshot_ids = self._fetch_most_recent_snapshot_ids_for_entity_type(
+                session, master_class, set(contexts_by_id.keys()), schema
+            )
+            if snapshot_ids:
+                snapshot_rows = (
+                    session.query(
+                        getattr(
+                            historical_class,
+                            historical_class.get_primary_key_column_name(),
+                        ),
+                        getattr(historical_class, master_key_property_name),
+                        *[
+                            getattr(historical_class, name)
+                            for name in shared_property_names
+                        ],
+                    )
+                    .filter(historical_key_column.in_(snapshot_ids))
+                    .all()
+                )
+                for snapshot_id, entity_id, *values in snapshot_rows:
+                    if entity_id in snapshot_ids_by_entity_id:
+                        raise ValueError(
+                            "Snapshot already registered for master entity with type "
+                            f"{master_type_name} and primary key {entity_id}"
+                        )
+                    snapshot_ids_by_entity_id[entity_id] = snapshot_id
+                    current_values_by_entity_id[entity_id] = tuple(values)
+
+            snapshot_ids_to_close: List[int] = []
+            new_snapshot_rows: List[Dict[str, Any]] = []
+            for entity_id, context in contexts_by_id.items():
+                entity = context.schema_object
+                entity_values = tuple(
+                    getattr(entity, name) for name in shared_property_names
+                )
 
-        return session.query(history_table_class).filter(text(filter_statement)).all()
+                if entity_id in snapshot_ids_by_entity_id:
+                    if current_values_by_entity_id[entity_id] == entity_values:
+                        continue
+                    snapshot_ids_to_close.append(snapshot_ids_by_entity_id[entity_id])
+                    valid_from = snapshot_time
+                    provided_start_time, provided_end_time = None, None
+                else:
+                    (
+                        provided_start_time,
+                        provided_end_time,
+                    ) = self._get_validated_provided_times(context, snapshot_time)
+                    valid_from = _valid_from_for_new_entity(
+                        provided_start_time, provided_end_time, snapshot_time
+                    )
+
+                new_snapshot = historical_class()
+                self._copy_entity_fields_to_historical_snapshot(entity, new_snapshot)
+                new_snapshot.valid_from = valid_from
+                new_snapshot.valid_to = None
+                new_snapshot_rows.append(
+                    _snapshot_row(new_snapshot, column_keys, row_property_names)
+                )
+
+                if provided_start_time and provided_end_time:
+                    initial_snapshot = historical_class()
+                    self._copy_entity_fields_to_historical_snapshot(
+                        entity, initial_snapshot
+                    )
+                    initial_snapshot.valid_from = provided_start_time
+                    initial_snapshot.valid_to = provided_end_time
+                    self.post_process_initial_snapshot(context, initial_snapshot)
+                    new_snapshot_rows.append(
+                        _snapshot_row(initial_snapshot, column_keys, row_property_names)
+                    )
+
+            if snapshot_ids_to_close:
+                session.execute(
+                    historical_table.update()
+                    .where(historical_key_column.in_(snapshot_ids_to_close))
+                    .values({column_keys["valid_to"]: snapshot_time})
+                )
+            if new_snapshot_rows:
+                session.execute(historical_table.insert(), new_snapshot_rows)
+
+            logging.info(
+                "Closed %s and inserted %s snapshots in [%s]",
+                len(snapshot_ids_to_close),
+                len(new_snapshot_rows),
+                historical_table.name,
+            )
+
+        logging.info("All historical snapshots written")
 
     def _write_snapshots(
         self,
@@ -332,10 +501,47 @@ class BaseHistoricalSnapshotUpdater(Generic[SchemaPersonType]):
             context.schema_object, new_historical_snapshot
         )
 
+        (
+            provided_start_time,
+            provided_end_time,
+        ) = self._get_validated_provided_times(context, snapshot_time)
+
+        new_historical_snapshot.valid_from = _valid_from_for_new_entity(
+            provided_start_time, provided_end_time, snapshot_time
+        )
+
+        # Snapshot must be merged separately from record tree, as they are not
+        # included in the ORM model relationships (to avoid needing to load
+        # the entire snapshot chain at once)
+        session.merge(new_historical_snapshot)
+
+        # If both start and end time were provided, an earlier snapshot needs to
+        # be created, reflecting the state of the entity before its current
+        # completed state
+        if provided_start_time and provided_end_time:
+            initial_snapshot = historical_class()
+            self._copy_entity_fields_to_historical_snapshot(
+                context.schema_object, initial_snapshot
+            )
+            initial_snapshot.valid_from = provided_start_time
+            initial_snapshot.valid_to = provided_end_time
+
+            self.post_process_initial_snapshot(context, initial_snapshot)
+
+            session.merge(initial_snapshot)
+
+    @staticmethod
+    def _get_validated_provided_times(
+        context: "_SnapshotContext", snapshot_time: datetime
+    ) -> Tuple[Optional[datetime], Optional[datetime]]:
+        """Returns the provided start and end times on |context|, dropping any
+        that are not earlier than |snapshot_time|. If there is a conflict
+        between provided start and end time (i.e. start time is after end
+        time), end time will govern.
+        """
         provided_start_time = None
         provided_end_time = None
 
-        # Validate provided start and end times
         if (
             context.provided_start_time
             and context.provided_start_time.date() < snapshot_time.date()
@@ -355,32 +561,7 @@ class BaseHistoricalSnapshotUpdater(Generic[SchemaPersonType]):
         ):
             provided_start_time = None
 
-        if provided_start_time is not None and provided_end_time is None:
-            new_historical_snapshot.valid_from = provided_start_time
-        elif provided_end_time is not None:
-            new_historical_snapshot.valid_from = provided_end_time
-        else:
-            new_historical_snapshot.valid_from = snapshot_time
-
-        # Snapshot must be merged separately from record tree, as they are not
-        # included in the ORM model relationships (to avoid needing to load
-        # the entire snapshot chain at once)
-        session.merge(new_historical_snapshot)
-
-        # If both start and end time were provided, an earlier snapshot needs to
-        # be created, reflecting the state of the entity before its current
-        # completed state
-        if provided_start_time and provided_end_time:
-            initial_snapshot = historical_class()
-            self._copy_entity_fields_to_historical_snapshot(
-                context.schema_object, initial_snapshot
-            )
-            initial_snapshot.valid_from = provided_start_time
-            initial_snapshot.valid_to = provided_end_time
-
-            self.post_process_initial_snapshot(context, initial_snapshot)
-
-            session.merge(initial_snapshot)
+        return provided_start_time, provided_end_time
 
     def _write_snapshots_for_existing_entities(
         self,
@@ -563,6 +744,44 @@ def _get_historical_class(
     return getattr(schema, historical_class_name)
 
 
+def _valid_from_for_new_entity(
+    provided_start_time: Optional[datetime],
+    provided_end_time: Optional[datetime],
+    snapshot_time: datetime,
+) -> datetime:
+    """Returns the start time of the open snapshot for an entity with no
+    existing snapshots, given its validated provided start and end times.
+    """
+    if provided_start_time is not None and provided_end_time is None:
+        return provided_start_time
+    if provided_end_time is not None:
+        return provided_end_time
+    return snapshot_time
+
+
+def _column_keys_by_property_name(historical_class: Type) -> Dict[str, str]:
+    """Returns a map of ORM attribute names on |historical_class| to the keys
+    of the corresponding columns on its table.
+    """
+    return {
+        column_attr.key: column_attr.columns[0].key
+        for column_attr in inspect(historical_class).column_attrs
+    }
+
+
+def _snapshot_row(
+    historical_snapshot: DatabaseEntity,
+    column_keys: Dict[str, str],
+    property_names: List[str],
+) -> Dict[str, Any]:
+    """Returns the values of |property_names| on an unsaved
+    |historical_snapshot| as a row for a Core INSERT, keyed by column key.
+    """
+    return {
+        column_keys[name]: getattr(historical_snapshot, name) for name in property_names
+    }
+
+
 def _get_master_class(
     historical_class: Type[DatabaseEntity], schema: ModuleType
 ) -> Type:
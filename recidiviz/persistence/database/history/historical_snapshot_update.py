@@ -47,6 +47,7 @@ def update_historical_snapshots(
     root_people: List[SchemaPersonType],
     orphaned_schema_objects: List[DatabaseEntity],
     ingest_metadata: IngestMetadata,
+    use_bulk_writes: bool = False,
 ) -> None:
     """For all entities in all record trees rooted at |root_people| and all
     entities in |orphaned_schema_objects|, performs any required historical
@@ -61,14 +62,26 @@ def update_historical_snapshots(
     start time of |snapshot_time|.
 
     If neither of these cases applies, no action will be taken on the entity.
+
+    If |use_bulk_writes| is True, snapshots are compared and written with
+    set-based statements rather than through the ORM unit of work. See
+    BaseHistoricalSnapshotUpdater.update_historical_snapshots.
     """
     if all(isinstance(person, county_schema.Person) for person in root_people):
         CountyHistoricalSnapshotUpdater().update_historical_snapshots(
-            session, root_people, orphaned_schema_objects, ingest_metadata
+            session,
+            root_people,
+            orphaned_schema_objects,
+            ingest_metadata,
+            use_bulk_writes=use_bulk_writes,
         )
     elif all(isinstance(person, state_schema.StatePerson) for person in root_people):
         StateHistoricalSnapshotUpdater().update_historical_snapshots(
-            session, root_people, orphaned_schema_objects, ingest_metadata
+            session,
+            root_people,
+            orphaned_schema_objects,
+            ingest_metadata,
+            use_bulk_writes=use_bulk_writes,
         )
     else:
         raise ValueError(
@@ -102,8 +102,10 @@ def _entity_graph_eq(
     if e1 is None:
         return True
 
-    type1 = type(e1)
-    type2 = type(e2)
+    # Compare __class__ rather than type(), so that entities are equal to any
+    # variants that stand in for their class, such as slotted pipeline entities
+    type1 = e1.__class__
+    type2 = e2.__class__
     if type1 != type2:
         return False
 
@@ -268,12 +270,13 @@ def _eq_shallow_id(
     """Generates a string id for an entity that is used to optimize equality
     checks between entities - if the shallow ids don't match, then the entities
     are definitely not equal."""
-    id_parts = [f"{type(entity)}"]
-    for field in attr.fields_dict(type(entity)).keys():
-        if should_ignore_field_cb(type(entity), field):
+    entity_class = entity.__class__
+    id_parts = [f"{entity_class}"]
+    for field in attr.fields_dict(entity_class).keys():
+        if should_ignore_field_cb(entity_class, field):
             continue
         v = getattr(entity, field)
-        if isinstance(v, list) or issubclass(type(v), Entity):
+        if isinstance(v, (list, Entity)):
             # For entity/list types, we can't use a string representation
             # because that would turn into a recursive graph search of its own.
             # However, the existence / non-existence of the object does still
@@ -361,7 +361,7 @@ def _get_all_entity_field_names(
 
         # TODO(#1908): Update traversal logic if relationship fields can be
         # different types aside from Entity and List
-        if issubclass(type(v), Entity):
+        if isinstance(v, Entity):
             is_back_edge = direction_checker.is_back_edge(entity, field)
             if is_back_edge:
                 back_edges.add(field)
@@ -60,6 +60,7 @@ from recidiviz.persistence.entity_matching.state.state_matching_utils import (
     read_db_entity_trees_of_cls_to_merge,
     get_multiparent_classes,
     db_id_or_object_id,
+    DbEntityTreeExternalIdIndex,
 )
 from recidiviz.persistence.entity.entity_utils import (
     is_placeholder,
@@ -787,6 +788,7 @@ class StateEntityMatcher(BaseEntityMatcher[entities.StatePerson]):
         individual_match_results: List[IndividualMatchResult] = []
         matched_entities_by_db_id: Dict[int, List[DatabaseEntity]] = {}
         error_count = 0
+        db_entity_tree_index = DbEntityTreeExternalIdIndex(db_entity_trees)
         for ingested_entity_tree in ingested_entity_trees:
             try:
                 match_result = self._match_entity_tree(
@@ -794,9 +796,13 @@ class StateEntityMatcher(BaseEntityMatcher[entities.StatePerson]):
                     db_entity_trees=db_entity_trees,
                     matched_entities_by_db_ids=matched_entities_by_db_id,
                     root_entity_cls=root_entity_cls,
+                    db_entity_tree_index=db_entity_tree_index,
                 )
                 individual_match_results.append(match_result)
                 error_count += match_result.error_count
+                db_entity_tree_index.update(
+                    [tree.entity for tree in match_result.merged_entity_trees]
+                )
             except EntityMatchingError as e:
                 if isinstance(ingested_entity_tree.entity, root_entity_cls):
                     ingested_entity = ingested_entity_tree.entity
@@ -851,11 +857,14 @@ class StateEntityMatcher(BaseEntityMatcher[entities.StatePerson]):
         db_entity_trees: List[EntityTree],
         matched_entities_by_db_ids: Dict[int, List[DatabaseEntity]],
         root_entity_cls: Type,
+        db_entity_tree_index: Optional[DbEntityTreeExternalIdIndex] = None,
     ) -> IndividualMatchResult:
         """Attempts to match the provided |ingested_entity_tree| to one of the
         provided |db_entity_trees|. If a successful match is found, merges the
         ingested entity onto the matching database entity and performs entity
-        matching on all children of the matched entities.
+        matching on all children of the matched entities. If provided,
+        |db_entity_tree_index| is used to narrow down the candidate matches
+        among the |db_entity_trees|.
         Returns the results of matching as an IndividualMatchResult.
         """
 
@@ -867,7 +876,9 @@ class StateEntityMatcher(BaseEntityMatcher[entities.StatePerson]):
                 root_entity_cls=root_entity_cls,
             )
 
-        db_match_tree = self._get_match(ingested_entity_tree, db_entity_trees)
+        db_match_tree = self._get_match(
+            ingested_entity_tree, db_entity_trees, db_entity_tree_index
+        )
 
         if not db_match_tree:
             return self._match_unmatched_tree(
@@ -1326,7 +1337,10 @@ class StateEntityMatcher(BaseEntityMatcher[entities.StatePerson]):
         return cached_matches
 
     def _get_match(
-        self, ingested_entity_tree: EntityTree, db_entity_trees: List[EntityTree]
+        self,
+        ingested_entity_tree: EntityTree,
+        db_entity_trees: List[EntityTree],
+        db_entity_tree_index: Optional[DbEntityTreeExternalIdIndex] = None,
     ) -> Optional[EntityTree]:
         """With the provided |ingested_entity_tree|, this attempts to find a
         match among the provided |db_entity_trees|. If a match is found, it is
@@ -1335,6 +1349,12 @@ class StateEntityMatcher(BaseEntityMatcher[entities.StatePerson]):
         db_match_candidates = db_entity_trees
         if isinstance(ingested_entity_tree.entity, self.root_entity_cls):
             db_match_candidates = self.get_cached_matches(ingested_entity_tree.entity)
+        elif db_entity_tree_index is not None:
+            indexed_candidates = db_entity_tree_index.get_match_candidates(
+                ingested_entity_tree.entity
+            )
+            if indexed_candidates is not None:
+                db_match_candidates = indexed_candidates
 
         # Entities that can have multiple external IDs need special casing to
         # handle the fact that multiple DB entities could match the provided
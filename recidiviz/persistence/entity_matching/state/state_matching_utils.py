@@ -15,9 +15,10 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 # ============================================================================
 """State specific utils for entity matching. Utils in this file are generic to any DatabaseEntity."""
+import bisect
 import logging
 from collections import defaultdict
-from typing import List, cast, Optional, Set, Type, Dict, Sequence
+from typing import List, cast, Optional, Set, Type, Dict, Sequence, Tuple
 
 from recidiviz.common.constants import enum_canonical_strings
 from recidiviz.common.constants.state.state_agent import StateAgentType
@@ -212,6 +213,75 @@ def generate_child_entity_trees(
     return child_trees
 
 
+_ExternalIdIndexKey = Tuple[Type[DatabaseEntity], str]
+
+
+class DbEntityTreeExternalIdIndex:
+    """Index of DB EntityTrees by entity class and external id, used to narrow
+    down the DB entities that an ingested entity could possibly match without
+    checking is_match against every DB entity.
+
+    Outside of persons and multiple id entities, an ingested entity with an
+    external id can only match DB entities of the same class with that same
+    external id, so those are the only candidates returned for it. Candidates
+    are returned in the same order as the DB trees that were indexed.
+    """
+
+    def __init__(self, db_entity_trees: List[EntityTree]):
+        self._multiple_id_classes: Set[Type[DatabaseEntity]] = set(
+            get_multiple_id_classes()
+        )
+        self._db_entity_trees = db_entity_trees
+        self._key_by_position: List[Optional[_ExternalIdIndexKey]] = []
+        self._positions_by_entity_id: Dict[int, List[int]] = defaultdict(list)
+        self._positions_by_key: Dict[_ExternalIdIndexKey, List[int]] = defaultdict(list)
+
+        for position, db_entity_tree in enumerate(db_entity_trees):
+            key = self._get_key(db_entity_tree.entity)
+            self._key_by_position.append(key)
+            self._positions_by_entity_id[id(db_entity_tree.entity)].append(position)
+            if key is not None:
+                self._positions_by_key[key].append(position)
+
+    def _get_key(self, entity: DatabaseEntity) -> Optional[_ExternalIdIndexKey]:
+        if entity.__class__ in self._multiple_id_classes:
+            return None
+        external_id = entity.get_external_id()
+        if external_id is None:
+            return None
+        return entity.__class__, external_id
+
+    def get_match_candidates(
+        self, ingested_entity: DatabaseEntity
+    ) -> Optional[List[EntityTree]]:
+        """Returns all indexed DB trees that could match the provided
+        |ingested_entity|, or None if the index cannot narrow down the
+        candidates for this entity and all DB trees must be considered.
+        """
+        key = self._get_key(ingested_entity)
+        if key is None:
+            return None
+        return [self._db_entity_trees[p] for p in self._positions_by_key.get(key, [])]
+
+    def update(self, entities: List[DatabaseEntity]) -> None:
+        """Re-indexes any indexed DB trees for the provided |entities| whose
+        external id has changed since they were indexed, e.g. because an
+        ingested entity that was matched without an external id was merged onto
+        them.
+        """
+        for entity in entities:
+            for position in self._positions_by_entity_id.get(id(entity), []):
+                old_key = self._key_by_position[position]
+                new_key = self._get_key(entity)
+                if old_key == new_key:
+                    continue
+                if old_key is not None:
+                    self._positions_by_key[old_key].remove(position)
+                if new_key is not None:
+                    bisect.insort(self._positions_by_key[new_key], position)
+                self._key_by_position[position] = new_key
+
+
 def is_multiple_id_entity(entity: DatabaseEntity):
     """Returns True if the given entity can have multiple external ids."""
     return entity.__class__ in get_multiple_id_classes()
@@ -17,8 +17,14 @@
 """Contains logic for communicating with the persistence layer."""
 import datetime
 import logging
-from typing import Callable, List, Optional, Union, Dict
+import multiprocessing
+import pickle
+import zlib
+from concurrent import futures
+from multiprocessing.managers import SyncManager
+from typing import Callable, List, Optional, Union, Dict, Tuple, cast
 
+import attr
 import psycopg2
 from psycopg2.errorcodes import SERIALIZATION_FAILURE
 import sqlalchemy
@@ -31,10 +37,12 @@ from recidiviz.common.constants.county.booking import CustodyStatus
 from recidiviz.common.constants.county.hold import HoldStatus
 from recidiviz.common.constants.county.sentence import SentenceStatus
 from recidiviz.common.ingest_metadata import IngestMetadata, SystemLevel
+from recidiviz.ingest.models import ingest_info as ingest_info_py
 from recidiviz.ingest.models.ingest_info_pb2 import IngestInfo
+from recidiviz.ingest.scrape import ingest_utils
 from recidiviz.persistence import persistence_utils
 from recidiviz.persistence.database import database
-from recidiviz.persistence.database.base_schema import JailsBase
+from recidiviz.persistence.database.base_schema import JailsBase, StateBase
 from recidiviz.persistence.database.schema.county import dao as county_dao
 from recidiviz.persistence.database.schema_entity_converter import (
     schema_entity_converter as converter,
@@ -42,12 +50,17 @@ from recidiviz.persistence.database.schema_entity_converter import (
 from recidiviz.persistence.database.schema_utils import schema_base_for_system_level
 from recidiviz.persistence.database.session import Session
 from recidiviz.persistence.database.session_factory import SessionFactory
+from recidiviz.persistence.database.sqlalchemy_engine_manager import (
+    SQLAlchemyEngineManager,
+)
 from recidiviz.persistence.database_invariant_validator import (
     database_invariant_validator,
 )
 from recidiviz.persistence.entity.county import entities as county_entities
+from recidiviz.persistence.entity.entities import EntityPersonType
 from recidiviz.persistence.entity_matching import entity_matching
 from recidiviz.persistence.entity_validator import entity_validator
+from recidiviz.persistence.errors import PersistenceError
 from recidiviz.persistence.ingest_info_converter import ingest_info_converter
 from recidiviz.persistence.ingest_info_converter.base_converter import (
     IngestInfoConversionResult,
@@ -106,6 +119,13 @@ monitoring.register_views(
     ]
 )
 
+# Every shard of a sharded write holds a database connection open until all shards have finished entity matching, so
+# the number of shards must stay within the default SQLAlchemy connection pool limit (pool_size=5, max_overflow=10).
+MAX_WRITE_SHARDS = 10
+
+# How often shards waiting on the rest of a sharded write check whether they are blocking another shard.
+_SHARD_LOCK_CHECK_INTERVAL_SECONDS = 10
+
 OVERALL_THRESHOLD = "overall_threshold"
 ENUM_THRESHOLD = "enum_threshold"
 ENTITY_MATCHING_THRESHOLD = "entity_matching_threshold"
@@ -446,26 +466,8 @@ def write(
     }
     total_people = _get_total_people(ingest_info, ingest_metadata)
     with monitoring.measurements(mtags) as measurements:
-
-        # Convert the people one at a time and count the errors as they happen.
-        conversion_result: IngestInfoConversionResult = (
-            ingest_info_converter.convert_to_persistence_entities(
-                ingest_info, ingest_metadata
-            )
-        )
-
-        people, data_validation_errors = entity_validator.validate(
-            conversion_result.people
-        )
-        logging.info(
-            "Converted [%s] people with [%s] enum_parsing_errors, [%s]"
-            " general_parsing_errors, [%s] protected_class_errors and "
-            "[%s] data_validation_errors",
-            len(people),
-            conversion_result.enum_parsing_errors,
-            conversion_result.general_parsing_errors,
-            conversion_result.protected_class_errors,
-            data_validation_errors,
+        conversion_result, people, data_validation_errors = _convert_and_validate(
+            ingest_info, ingest_metadata
         )
         measurements.measure_int_put(m_people, len(people))
 
@@ -571,7 +573,506 @@ def write(
         return True
 
 
+@trace.span
+def write_sharded(
+    ingest_info: IngestInfo,
+    ingest_metadata: IngestMetadata,
+    num_shards: int,
+    run_txn_fn: Callable[
+        [Session, MeasurementMap, Callable[[Session], bool], Optional[int]], bool
+    ] = retry_transaction,
+) -> bool:
+    """Like write(), but for state ingest_infos splits the people into |num_shards| shards by a hash of their external
+    ids and converts, entity matches and writes each shard in its own worker process and transaction. Work therefore
+    scales with the available cores, and a serialization failure only retries the affected shard rather than the whole
+    file.
+
+    Error thresholds are still evaluated against the error counts aggregated across all shards: no shard commits until
+    every shard has finished conversion, entity matching and database invariant validation, after which every shard
+    either commits or rolls back based on the same abort decision. Shards do commit independently, so if a shard fails
+    after others have committed (e.g. because it exhausted its serialization failure retries), the committed shards
+    are not rolled back.
+
+    If shards end up blocking each other on row locks, falls back to an unsharded write().
+    """
+    if ingest_metadata.system_level != SystemLevel.STATE:
+        raise ValueError(
+            f"Sharded writes are only supported for [{SystemLevel.STATE}], found [{ingest_metadata.system_level}]"
+        )
+    if not 1 <= num_shards <= MAX_WRITE_SHARDS:
+        raise ValueError(
+            f"Expected num_shards between 1 and {MAX_WRITE_SHARDS}, found [{num_shards}]"
+        )
+
+    ingest_info_validator.validate(ingest_info)
+
+    shards = _shard_ingest_info(ingest_info, num_shards)
+    if len(shards) < 2 or not should_persist():
+        return write(ingest_info, ingest_metadata, run_txn_fn)
+
+    logging.info(
+        "Writing [%s] people in [%s] shards of sizes [%s]",
+        len(ingest_info.state_people),
+        len(shards),
+        [len(shard.state_people) for shard in shards],
+    )
+
+    mtags: Dict[str, Union[bool, str]] = {
+        monitoring.TagKey.SHOULD_PERSIST: True,
+        monitoring.TagKey.PERSISTED: False,
+    }
+    # The manager and worker processes are forked and the workers open their own connections, so they must not
+    # inherit any pooled ones.
+    engine = SQLAlchemyEngineManager.get_engine_for_schema_base(StateBase)
+    if engine is not None:
+        engine.dispose()
+
+    with monitoring.measurements(
+        mtags
+    ) as measurements, multiprocessing.Manager() as manager:
+        coordinator = _ShardedWriteCoordinator(manager, len(shards), ingest_metadata)
+
+        # The shards and metadata (whose enum overrides hold arbitrary callables) are handed to the forked workers
+        # when they start rather than being pickled with each task.
+        with futures.ProcessPoolExecutor(
+            max_workers=len(shards),
+            mp_context=multiprocessing.get_context("fork"),
+            initializer=_init_shard_worker,
+            initargs=(
+                _ShardWorkerContext(shards, ingest_metadata, coordinator, run_txn_fn),
+            ),
+        ) as executor:
+            shard_futures = [
+                executor.submit(_convert_match_and_write_shard, shard_index)
+                for shard_index in range(len(shards))
+            ]
+            futures.wait(shard_futures)
+
+        exceptions: List[BaseException] = [
+            e for e in (f.exception() for f in shard_futures) if e is not None
+        ]
+        results = [f.result() for f in shard_futures if f.exception() is None]
+        for result in results:
+            measurements.measure_int_put(m_retries, result.num_retries)
+
+        if not any(isinstance(e, _CrossShardLockConflictError) for e in exceptions):
+            measurements.measure_int_put(
+                m_people, sum(result.num_people for result in results)
+            )
+            if exceptions:
+                e = exceptions[0]
+                logging.error(
+                    "An exception was raised in write_sharded(): [%s]",
+                    type(e).__name__,
+                    exc_info=e,
+                )
+                mtags[monitoring.TagKey.ERROR] = type(e).__name__
+                measurements.measure_int_put(m_errors, 1)
+                raise e
+
+            if not all(result.success for result in results):
+                return False
+
+            mtags[monitoring.TagKey.PERSISTED] = True
+            return True
+
+    logging.warning(
+        "Shards blocked each other on row locks, falling back to an unsharded write."
+    )
+    return write(ingest_info, ingest_metadata, run_txn_fn)
+
+
+def _convert_and_validate(
+    ingest_info: IngestInfo, ingest_metadata: IngestMetadata
+) -> Tuple[IngestInfoConversionResult, List[EntityPersonType], int]:
+    """Converts the people in |ingest_info| to entities and validates them, returning the conversion result, the valid
+    people and the number of data validation errors.
+    """
+    # Convert the people one at a time and count the errors as they happen.
+    conversion_result: IngestInfoConversionResult = (
+        ingest_info_converter.convert_to_persistence_entities(
+            ingest_info, ingest_metadata
+        )
+    )
+
+    people, data_validation_errors = entity_validator.validate(conversion_result.people)
+    logging.info(
+        "Converted [%s] people with [%s] enum_parsing_errors, [%s]"
+        " general_parsing_errors, [%s] protected_class_errors and "
+        "[%s] data_validation_errors",
+        len(people),
+        conversion_result.enum_parsing_errors,
+        conversion_result.general_parsing_errors,
+        conversion_result.protected_class_errors,
+        data_validation_errors,
+    )
+    return conversion_result, people, data_validation_errors
+
+
 def _get_total_people(ingest_info: IngestInfo, ingest_metadata: IngestMetadata) -> int:
     if ingest_metadata.system_level == SystemLevel.COUNTY:
         return len(ingest_info.people)
     return len(ingest_info.state_people)
+
+
+@attr.s(frozen=True)
+class _ShardCounts:
+    """Error accounting for a single shard of a sharded write, collected after conversion, entity matching and database
+    invariant validation have run for that shard."""
+
+    total_people: int = attr.ib()
+    enum_parsing_errors: int = attr.ib()
+    general_parsing_errors: int = attr.ib()
+    protected_class_errors: int = attr.ib()
+    data_validation_errors: int = attr.ib()
+    entity_matching_errors: int = attr.ib()
+    total_root_entities: int = attr.ib()
+    database_invariant_errors: int = attr.ib()
+
+
+@attr.s(frozen=True)
+class _ShardWriteResult:
+    """The outcome of a single shard of a sharded write, returned from its worker process."""
+
+    success: bool = attr.ib()
+    num_people: int = attr.ib()
+    num_retries: int = attr.ib()
+
+
+class _CrossShardLockConflictError(PersistenceError):
+    """Raised when a shard of a sharded write is blocked on a row lock held by another shard of the same write. Since
+    no shard commits until every shard has finished entity matching, the shards would otherwise wait on each other
+    forever."""
+
+
+class _ShardedWriteCoordinator:
+    """Aggregates error counts across the shards of a sharded write so that _should_abort is evaluated against the
+    totals for the whole IngestInfo, exactly as it would be for an unsharded write.
+
+    Each shard reports its counts once it has finished entity matching and then blocks, holding its transaction open,
+    until every shard has reported. At that point all shards see the same abort decision and either commit or roll
+    back independently.
+
+    The shared state lives in |manager|, so the coordinator can be used from the worker processes of the write.
+    """
+
+    def __init__(
+        self,
+        manager: SyncManager,
+        num_shards: int,
+        ingest_metadata: IngestMetadata,
+    ):
+        self._num_shards = num_shards
+        self._ingest_metadata = ingest_metadata
+
+        self._condition = manager.Condition()
+        self._backend_pid_by_shard = manager.dict()
+        self._counts_by_shard = manager.dict()
+        self._state = manager.Namespace(failed=False, should_abort=None)
+
+    def register_backend(self, shard_index: int, session: Session) -> None:
+        """Records the Postgres backend serving |session|, which is used to detect shards blocking each other."""
+        backend_pid = session.execute("SELECT pg_backend_pid()").scalar()
+        with self._condition:
+            self._backend_pid_by_shard[shard_index] = backend_pid
+
+    def report(self, shard_index: int, counts: _ShardCounts, session: Session) -> bool:
+        """Records the |counts| for the given shard, waits until every other shard has done the same and returns
+        whether the write should be aborted.
+
+        A shard that reports again (e.g. because its transaction was retried after a serialization failure) replaces
+        its previous counts and the abort decision is recomputed.
+        """
+        with self._condition:
+            self._counts_by_shard[shard_index] = counts
+            self._state.should_abort = None
+            self._condition.notify_all()
+
+            while (
+                not self._state.failed and len(self._counts_by_shard) < self._num_shards
+            ):
+                if not self._condition.wait(_SHARD_LOCK_CHECK_INTERVAL_SECONDS):
+                    self._check_for_lock_conflicts(session)
+
+            if self._state.failed:
+                logging.info(
+                    "Aborting shard [%s] since another shard failed", shard_index
+                )
+                return True
+
+            if self._state.should_abort is None:
+                self._state.should_abort = self._compute_should_abort()
+            return self._state.should_abort
+
+    def fail(self) -> None:
+        """Marks the write as failed, releasing and aborting any shards that are waiting on the others."""
+        with self._condition:
+            self._state.failed = True
+            self._condition.notify_all()
+
+    def _check_for_lock_conflicts(self, session: Session) -> None:
+        """Raises if any shard that has not yet reported is blocked on a lock held by another shard of this write.
+
+        Must be called while holding self._condition.
+        """
+        backend_pid_by_shard = self._backend_pid_by_shard.copy()
+        reported_shards = set(self._counts_by_shard.keys())
+        shard_backend_pids = set(backend_pid_by_shard.values())
+        for shard_index, backend_pid in backend_pid_by_shard.items():
+            if shard_index in reported_shards:
+                continue
+            blocking_pids = session.execute(
+                "SELECT pg_blocking_pids(:pid)", {"pid": backend_pid}
+            ).scalar()
+            if shard_backend_pids.intersection(blocking_pids or []):
+                self._state.failed = True
+                self._condition.notify_all()
+                raise _CrossShardLockConflictError(
+                    f"Shard [{shard_index}] is blocked on a lock held by another shard of the same write."
+                )
+
+    def _compute_should_abort(self) -> bool:
+        """Runs the same abort checks as write(), against the counts summed across all shards."""
+        all_counts: List[_ShardCounts] = list(self._counts_by_shard.values())
+        conversion_result = IngestInfoConversionResult(
+            enum_parsing_errors=sum(c.enum_parsing_errors for c in all_counts),
+            general_parsing_errors=sum(c.general_parsing_errors for c in all_counts),
+            protected_class_errors=sum(c.protected_class_errors for c in all_counts),
+        )
+        total_root_entities = sum(c.total_root_entities for c in all_counts)
+        entity_matching_errors = sum(c.entity_matching_errors for c in all_counts)
+        database_invariant_errors = sum(c.database_invariant_errors for c in all_counts)
+
+        if _should_abort(
+            total_root_entities=sum(c.total_people for c in all_counts),
+            system_level=self._ingest_metadata.system_level,
+            conversion_result=conversion_result,
+            region_code=self._ingest_metadata.region,
+            data_validation_errors=sum(c.data_validation_errors for c in all_counts),
+        ):
+            logging.info("_should_abort_ was true after converting people")
+            return True
+
+        logging.info(
+            "Completed entity matching across [%s] shards with [%s] errors and [%s] database invariant errors",
+            self._num_shards,
+            entity_matching_errors,
+            database_invariant_errors,
+        )
+        if _should_abort(
+            total_root_entities=total_root_entities,
+            system_level=self._ingest_metadata.system_level,
+            conversion_result=conversion_result,
+            region_code=self._ingest_metadata.region,
+            entity_matching_errors=entity_matching_errors,
+        ):
+            logging.info("_should_abort_ was true after entity matching")
+            return True
+
+        if _should_abort(
+            total_root_entities=total_root_entities,
+            system_level=self._ingest_metadata.system_level,
+            conversion_result=conversion_result,
+            region_code=self._ingest_metadata.region,
+            database_invariant_errors=database_invariant_errors,
+        ):
+            logging.info("_should_abort_ was true after database invariant validation")
+            return True
+
+        return False
+
+
+def _shard_ingest_info(ingest_info: IngestInfo, num_shards: int) -> List[IngestInfo]:
+    """Partitions the state people in |ingest_info| into at most |num_shards| non-empty IngestInfos by a hash of
+    their external ids.
+
+    Entity matching merges ingested people and entities that share an external id, so any two people whose trees
+    contain an object of the same type with the same id are always placed in the same shard. People without any ids
+    all go to the first shard.
+    """
+    people = ingest_utils.convert_proto_to_ingest_info(ingest_info).state_people
+    parents = list(range(len(people)))
+
+    def find(i: int) -> int:
+        while parents[i] != i:
+            parents[i] = parents[parents[i]]
+            i = parents[i]
+        return i
+
+    id_keys_by_person: List[List[str]] = []
+    first_person_by_key: Dict[str, int] = {}
+    for i, person in enumerate(people):
+        keys = _get_id_keys_from_tree(person)
+        for key in keys:
+            parents[find(i)] = find(first_person_by_key.setdefault(key, i))
+        id_keys_by_person.append(keys)
+
+    shard_key_by_group: Dict[int, str] = {}
+    for i, keys in enumerate(id_keys_by_person):
+        if keys:
+            group = find(i)
+            shard_key_by_group[group] = min(
+                [shard_key_by_group.get(group, keys[0]), *keys]
+            )
+
+    shards: List[List[ingest_info_py.StatePerson]] = [[] for _ in range(num_shards)]
+    for i, person in enumerate(people):
+        shard_key = shard_key_by_group.get(find(i))
+        shard_index = (
+            zlib.crc32(shard_key.encode()) % num_shards if shard_key is not None else 0
+        )
+        shards[shard_index].append(person)
+    return [
+        ingest_utils.convert_ingest_info_to_proto(
+            ingest_info_py.IngestInfo(state_people=shard)
+        )
+        for shard in shards
+        if shard
+    ]
+
+
+def _get_id_keys_from_tree(person: ingest_info_py.StatePerson) -> List[str]:
+    """Returns a key for the id of every object in the tree rooted at |person| that has one."""
+    keys: List[str] = []
+    stack: List[ingest_info_py.IngestObject] = [person]
+    while stack:
+        obj = stack.pop()
+        class_name = obj.class_name()
+        obj_id = getattr(obj, f"{class_name}_id", None)
+        if obj_id is not None:
+            keys.append(f"{class_name}:{obj_id}")
+        for value in vars(obj).values():
+            if isinstance(value, ingest_info_py.IngestObject):
+                stack.append(value)
+            elif isinstance(value, list):
+                stack.extend(
+                    v for v in value if isinstance(v, ingest_info_py.IngestObject)
+                )
+    return keys
+
+
+@attr.s(frozen=True)
+class _ShardWorkerContext:
+    """Everything a worker process of a sharded write needs, other than the index of the shard it writes."""
+
+    shards: List[IngestInfo] = attr.ib()
+    ingest_metadata: IngestMetadata = attr.ib()
+    coordinator: _ShardedWriteCoordinator = attr.ib()
+    run_txn_fn: Callable[
+        [Session, MeasurementMap, Callable[[Session], bool], Optional[int]], bool
+    ] = attr.ib()
+
+
+# Set in each worker process of a sharded write by _init_shard_worker.
+_shard_worker_context: Optional[_ShardWorkerContext] = None
+
+
+def _init_shard_worker(context: _ShardWorkerContext) -> None:
+    global _shard_worker_context
+    _shard_worker_context = context
+
+
+class _ShardMeasurements:
+    """Stands in for a MeasurementMap in a worker process, whose measurements would otherwise never be exported, and
+    collects the transaction retries so the parent process can record them."""
+
+    def __init__(self) -> None:
+        self.num_retries = 0
+
+    def measure_int_put(self, measure_int: measure.MeasureInt, value: int) -> None:
+        if measure_int is not m_retries:
+            raise ValueError(
+                f"Unexpected measure [{measure_int.name}] in a shard worker"
+            )
+        self.num_retries += value
+
+
+def _convert_match_and_write_shard(shard_index: int) -> _ShardWriteResult:
+    """Converts, entity matches and writes a single shard of a sharded write in its own transaction. Runs in a worker
+    process set up by _init_shard_worker."""
+    if _shard_worker_context is None:
+        raise ValueError("Shard worker process was not initialized")
+    ingest_metadata = _shard_worker_context.ingest_metadata
+    coordinator = _shard_worker_context.coordinator
+    shard = _shard_worker_context.shards[shard_index]
+    shard_measurements = _ShardMeasurements()
+
+    try:
+        conversion_result, people, data_validation_errors = _convert_and_validate(
+            shard, ingest_metadata
+        )
+
+        @trace.span
+        def match_and_write_shard(session: Session) -> bool:
+            coordinator.register_backend(shard_index, session)
+
+            logging.info(
+                "Starting entity matching for shard [%s] with [%s] people",
+                shard_index,
+                len(people),
+            )
+            entity_matching_output = entity_matching.match(
+                session, ingest_metadata.region, people
+            )
+            output_people = entity_matching_output.people
+            database_invariant_errors = (
+                database_invariant_validator.validate_invariants(
+                    session,
+                    ingest_metadata.system_level,
+                    ingest_metadata.region,
+                    output_people,
+                )
+            )
+
+            if coordinator.report(
+                shard_index,
+                _ShardCounts(
+                    total_people=len(shard.state_people),
+                    enum_parsing_errors=conversion_result.enum_parsing_errors,
+                    general_parsing_errors=conversion_result.general_parsing_errors,
+                    protected_class_errors=conversion_result.protected_class_errors,
+                    data_validation_errors=data_validation_errors,
+                    entity_matching_errors=entity_matching_output.error_count,
+                    total_root_entities=entity_matching_output.total_root_entities,
+                    database_invariant_errors=database_invariant_errors,
+                ),
+                session,
+            ):
+                return False
+
+            database.write_people(
+                session,
+                output_people,
+                ingest_metadata,
+                orphaned_entities=entity_matching_output.orphaned_entities,
+            )
+            logging.info("Successfully wrote shard [%s] to the database", shard_index)
+            return True
+
+        success = _shard_worker_context.run_txn_fn(
+            SessionFactory.for_schema_base(StateBase),
+            cast(MeasurementMap, shard_measurements),
+            match_and_write_shard,
+            5,
+        )
+    except Exception as e:
+        coordinator.fail()
+        if _is_picklable(e):
+            raise
+        # The exception is sent back to the parent process, so it must survive pickling.
+        raise PersistenceError(
+            f"Shard [{shard_index}] failed with [{type(e).__name__}]: {e}"
+        ) from e
+    return _ShardWriteResult(
+        success=success,
+        num_people=len(people),
+        num_retries=shard_measurements.num_retries,
+    )
+
+
+def _is_picklable(e: Exception) -> bool:
+    try:
+        pickle.loads(pickle.dumps(e))
+    except Exception:
+        return False
+    return True
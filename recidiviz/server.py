@@ -16,6 +16,11 @@
 # =============================================================================
 
 """Entrypoint for the application."""
+import time
+
+_SERVER_IMPORT_START = time.perf_counter()
+
+# pylint: disable=wrong-import-position
 import datetime
 import gc
 import logging
@@ -29,66 +34,21 @@ from opencensus.ext.stackdriver import trace_exporter as stackdriver_trace
 from opencensus.trace import config_integration, file_exporter, samplers
 from opencensus.trace.propagation import google_cloud_format
 
-from recidiviz.admin_panel.routes import admin_panel
-from recidiviz.backup.backup_manager import backup_manager_blueprint
-from recidiviz.calculator.calculation_data_storage_manager import (
-    calculation_data_storage_manager_blueprint,
-)
-from recidiviz.calculator.pipeline.utils.dataflow_monitor_manager import (
-    dataflow_monitor_blueprint,
-)
-from recidiviz.cloud_functions.cloud_functions import cloud_functions_blueprint
-from recidiviz.ingest.aggregate.scrape_aggregate_reports import (
-    scrape_aggregate_reports_blueprint,
-)
-from recidiviz.ingest.aggregate.single_count import store_single_count_blueprint
-from recidiviz.ingest.direct.direct_ingest_control import direct_ingest_control
-from recidiviz.ingest.justice_counts.control import justice_counts_control
-from recidiviz.ingest.scrape.infer_release import infer_release_blueprint
-from recidiviz.ingest.scrape.scraper_control import scraper_control
-from recidiviz.ingest.scrape.scraper_status import scraper_status
-from recidiviz.ingest.scrape.worker import worker
-from recidiviz.metrics.export.view_export_manager import export_blueprint
-from recidiviz.persistence.actions import actions
-from recidiviz.persistence.batch_persistence import batch_blueprint
-from recidiviz.persistence.database.bq_refresh.cloud_sql_to_bq_refresh_manager import (
-    cloud_sql_to_bq_blueprint,
-)
 from recidiviz.persistence.database.sqlalchemy_engine_manager import (
     SQLAlchemyEngineManager,
 )
-from recidiviz.reporting.reporting_endpoint import reporting_endpoint_blueprint
+from recidiviz.server_blueprint_registry import LAZY_BLUEPRINTS
 from recidiviz.utils import environment, metadata, monitoring, structured_logging, trace
-from recidiviz.validation.validation_manager import validation_manager_blueprint
+from recidiviz.utils.lazy_blueprints import LazyBlueprintLoader
 
 structured_logging.setup()
 logging.info("[%s] Running server.py", datetime.datetime.now().isoformat())
 
 app = Flask(__name__)
-app.register_blueprint(admin_panel, url_prefix="/admin")
-app.register_blueprint(scraper_control, url_prefix="/scraper")
-app.register_blueprint(scraper_status, url_prefix="/scraper")
-app.register_blueprint(worker, url_prefix="/scraper")
-app.register_blueprint(direct_ingest_control, url_prefix="/direct")
-app.register_blueprint(actions, url_prefix="/ingest")
-app.register_blueprint(infer_release_blueprint, url_prefix="/infer_release")
-app.register_blueprint(cloud_functions_blueprint, url_prefix="/cloud_function")
-app.register_blueprint(batch_blueprint, url_prefix="/batch")
-app.register_blueprint(
-    scrape_aggregate_reports_blueprint, url_prefix="/scrape_aggregate_reports"
-)
-app.register_blueprint(store_single_count_blueprint, url_prefix="/single_count")
-app.register_blueprint(cloud_sql_to_bq_blueprint, url_prefix="/cloud_sql_to_bq")
-app.register_blueprint(backup_manager_blueprint, url_prefix="/backup_manager")
-app.register_blueprint(dataflow_monitor_blueprint, url_prefix="/dataflow_monitor")
-app.register_blueprint(validation_manager_blueprint, url_prefix="/validation_manager")
-app.register_blueprint(
-    calculation_data_storage_manager_blueprint,
-    url_prefix="/calculation_data_storage_manager",
-)
-app.register_blueprint(reporting_endpoint_blueprint, url_prefix="/reporting")
-app.register_blueprint(export_blueprint, url_prefix="/export")
-app.register_blueprint(justice_counts_control, url_prefix="/justice_counts")
+blueprint_loader = LazyBlueprintLoader(app, LAZY_BLUEPRINTS)
+# Flask does not allow registering blueprints after the first request in debug mode.
+if app.debug:
+    blueprint_loader.load_all()
 
 if environment.in_gcp():
     SQLAlchemyEngineManager.init_engines_for_server_postgres_instances()
@@ -131,6 +91,11 @@ config_integration.trace_integrations(
     ]
 )
 
+logging.info(
+    "Loaded server.py in [%.3f] seconds",
+    time.perf_counter() - _SERVER_IMPORT_START,
+)
+
 
 @zope.event.classhandler.handler(events.MemoryUsageThresholdExceeded)
 def memory_condition_handler(event: events.MemoryUsageThresholdExceeded) -> None:
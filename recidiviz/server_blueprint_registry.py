@@ -0,0 +1,102 @@
+# Recidiviz - a data platform for criminal justice reform
+# Copyright (C) 2021 Recidiviz, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# =============================================================================
+"""The blueprints served by the application, see server.py."""
+from recidiviz.utils.lazy_blueprints import LazyBlueprint
+
+# Blueprints are only imported and registered once a request is made under their url prefix, see LazyBlueprintLoader.
+LAZY_BLUEPRINTS = [
+    LazyBlueprint("recidiviz.admin_panel.routes", "admin_panel", "/admin"),
+    # The scrape phases chain into each other with url_for, see scrape_phase.py.
+    LazyBlueprint(
+        "recidiviz.ingest.scrape.scraper_control",
+        "scraper_control",
+        "/scraper",
+        url_for_prefixes=["/batch"],
+    ),
+    LazyBlueprint(
+        "recidiviz.ingest.scrape.scraper_status", "scraper_status", "/scraper"
+    ),
+    LazyBlueprint("recidiviz.ingest.scrape.worker", "worker", "/scraper"),
+    LazyBlueprint(
+        "recidiviz.ingest.direct.direct_ingest_control",
+        "direct_ingest_control",
+        "/direct",
+    ),
+    LazyBlueprint("recidiviz.persistence.actions", "actions", "/ingest"),
+    LazyBlueprint(
+        "recidiviz.ingest.scrape.infer_release",
+        "infer_release_blueprint",
+        "/infer_release",
+    ),
+    LazyBlueprint(
+        "recidiviz.cloud_functions.cloud_functions",
+        "cloud_functions_blueprint",
+        "/cloud_function",
+    ),
+    LazyBlueprint(
+        "recidiviz.persistence.batch_persistence",
+        "batch_blueprint",
+        "/batch",
+        url_for_prefixes=["/infer_release"],
+    ),
+    LazyBlueprint(
+        "recidiviz.ingest.aggregate.scrape_aggregate_reports",
+        "scrape_aggregate_reports_blueprint",
+        "/scrape_aggregate_reports",
+    ),
+    LazyBlueprint(
+        "recidiviz.ingest.aggregate.single_count",
+        "store_single_count_blueprint",
+        "/single_count",
+    ),
+    LazyBlueprint(
+        "recidiviz.persistence.database.bq_refresh.cloud_sql_to_bq_refresh_manager",
+        "cloud_sql_to_bq_blueprint",
+        "/cloud_sql_to_bq",
+    ),
+    LazyBlueprint(
+        "recidiviz.backup.backup_manager", "backup_manager_blueprint", "/backup_manager"
+    ),
+    LazyBlueprint(
+        "recidiviz.calculator.pipeline.utils.dataflow_monitor_manager",
+        "dataflow_monitor_blueprint",
+        "/dataflow_monitor",
+    ),
+    LazyBlueprint(
+        "recidiviz.validation.validation_manager",
+        "validation_manager_blueprint",
+        "/validation_manager",
+    ),
+    LazyBlueprint(
+        "recidiviz.calculator.calculation_data_storage_manager",
+        "calculation_data_storage_manager_blueprint",
+        "/calculation_data_storage_manager",
+    ),
+    LazyBlueprint(
+        "recidiviz.reporting.reporting_endpoint",
+        "reporting_endpoint_blueprint",
+        "/reporting",
+    ),
+    LazyBlueprint(
+        "recidiviz.metrics.export.view_export_manager", "export_blueprint", "/export"
+    ),
+    LazyBlueprint(
+        "recidiviz.ingest.justice_counts.control",
+        "justice_counts_control",
+        "/justice_counts",
+    ),
+]
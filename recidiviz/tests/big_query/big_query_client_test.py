@@ -19,12 +19,12 @@
 # pylint: disable=protected-access
 from concurrent import futures
 import unittest
+from typing import List
 from unittest import mock
 
 import pytest
 from google.cloud import bigquery, exceptions
 from google.cloud.bigquery import SchemaField
-from mock import call
 
 from recidiviz.big_query.big_query_client import BigQueryClientImpl
 from recidiviz.big_query.big_query_view import BigQueryView
@@ -724,23 +724,17 @@ class BigQueryClientImplTest(unittest.TestCase):
             {"supervision_type": 0, "revocations": 1, "district": 2},
         )
 
-        # First call returns a single row, second call returns nothing
-        mock_query_job.result.side_effect = [[first_row], []]
+        mock_query_job.result.return_value.pages = [[first_row]]
 
         processed_results = []
 
-        def _process_fn(row: bigquery.table.Row) -> None:
-            processed_results.append(dict(row))
+        def _process_fn(rows: List[bigquery.table.Row]) -> None:
+            processed_results.append([dict(row) for row in rows])
 
         self.bq_client.paged_read_and_process(mock_query_job, 1, _process_fn)
 
-        self.assertEqual([dict(first_row)], processed_results)
-        mock_query_job.result.assert_has_calls(
-            [
-                call(max_results=1, start_index=0),
-                call(max_results=1, start_index=1),
-            ]
-        )
+        self.assertEqual([[dict(first_row)]], processed_results)
+        mock_query_job.result.assert_called_once_with(page_size=1)
 
     @mock.patch("google.cloud.bigquery.QueryJob")
     def test_paged_read_single_page_multiple_rows(
@@ -755,23 +749,17 @@ class BigQueryClientImplTest(unittest.TestCase):
             {"supervision_type": 0, "revocations": 1, "district": 2},
         )
 
-        # First call returns a single row, second call returns nothing
-        mock_query_job.result.side_effect = [[first_row, second_row], []]
+        mock_query_job.result.return_value.pages = [[first_row, second_row]]
 
         processed_results = []
 
-        def _process_fn(row: bigquery.table.Row) -> None:
-            processed_results.append(dict(row))
+        def _process_fn(rows: List[bigquery.table.Row]) -> None:
+            processed_results.append([dict(row) for row in rows])
 
         self.bq_client.paged_read_and_process(mock_query_job, 10, _process_fn)
 
-        self.assertEqual([dict(first_row), dict(second_row)], processed_results)
-        mock_query_job.result.assert_has_calls(
-            [
-                call(max_results=10, start_index=0),
-                call(max_results=10, start_index=2),
-            ]
-        )
+        self.assertEqual([[dict(first_row), dict(second_row)]], processed_results)
+        mock_query_job.result.assert_called_once_with(page_size=10)
 
     @mock.patch("google.cloud.bigquery.QueryJob")
     def test_paged_read_multiple_pages(self, mock_query_job: mock.MagicMock) -> None:
@@ -793,23 +781,31 @@ class BigQueryClientImplTest(unittest.TestCase):
             {"supervision_type": 0, "revocations": 1, "district": 2},
         )
 
-        # First two calls returns results, third call returns nothing
-        mock_query_job.result.side_effect = [[p1_r1, p1_r2], [p2_r1, p2_r2], []]
+        mock_query_job.result.return_value.pages = [[p1_r1, p1_r2], [p2_r1, p2_r2]]
 
         processed_results = []
 
-        def _process_fn(row: bigquery.table.Row) -> None:
-            processed_results.append(dict(row))
+        def _process_fn(rows: List[bigquery.table.Row]) -> None:
+            processed_results.append([dict(row) for row in rows])
 
         self.bq_client.paged_read_and_process(mock_query_job, 2, _process_fn)
 
         self.assertEqual(
-            [dict(p1_r1), dict(p1_r2), dict(p2_r1), dict(p2_r2)], processed_results
-        )
-        mock_query_job.result.assert_has_calls(
-            [
-                call(max_results=2, start_index=0),
-                call(max_results=2, start_index=2),
-                call(max_results=2, start_index=4),
-            ]
+            [[dict(p1_r1), dict(p1_r2)], [dict(p2_r1), dict(p2_r2)]],
+            processed_results,
         )
+        # The result set is requested once and its pages are followed by page token
+        mock_query_job.result.assert_called_once_with(page_size=2)
+
+    @mock.patch("google.cloud.bigquery.QueryJob")
+    def test_paged_read_no_rows(self, mock_query_job: mock.MagicMock) -> None:
+        mock_query_job.result.return_value.pages = [[]]
+
+        processed_results = []
+
+        def _process_fn(rows: List[bigquery.table.Row]) -> None:
+            processed_results.append(rows)
+
+        self.bq_client.paged_read_and_process(mock_query_job, 2, _process_fn)
+
+        self.assertEqual([], processed_results)
@@ -0,0 +1,144 @@
+# Recidiviz - a data platform for criminal justice reform
+# Copyright (C) 2021 Recidiviz, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# =============================================================================
+"""Tests for view_deploy_manifest.py."""
+import json
+import unittest
+from typing import List
+
+from recidiviz.big_query.big_query_view import BigQueryView
+from recidiviz.big_query.big_query_view_dag_walker import BigQueryViewDagWalker
+from recidiviz.big_query.view_deploy_manifest import (
+    ViewDeployManifest,
+    compute_view_content_hashes,
+    view_deploy_manifest_path,
+)
+from recidiviz.tests.cloud_storage.fake_gcs_file_system import FakeGCSFileSystem
+
+_PROJECT_ID = "fake-recidiviz-project"
+_DATASET_NAME = "my_views_dataset"
+
+
+def _build_views(child_query_suffix: str = "") -> List[BigQueryView]:
+    return [
+        BigQueryView(
+            project_id=_PROJECT_ID,
+            dataset_id=_DATASET_NAME,
+            view_id="parent_view",
+            view_query_template="SELECT * FROM `{project_id}.source_dataset.source_table`",
+            should_materialize=True,
+        ),
+        BigQueryView(
+            project_id=_PROJECT_ID,
+            dataset_id=_DATASET_NAME,
+            view_id="other_view",
+            view_query_template="SELECT 1",
+        ),
+        BigQueryView(
+            project_id=_PROJECT_ID,
+            dataset_id=_DATASET_NAME,
+            view_id="child_view",
+            view_query_template=f"SELECT * FROM `{{project_id}}.{_DATASET_NAME}.parent_view_materialized`"
+            f"{child_query_suffix}",
+        ),
+        BigQueryView(
+            project_id=_PROJECT_ID,
+            dataset_id=_DATASET_NAME,
+            view_id="grandchild_view",
+            view_query_template=f"SELECT * FROM `{{project_id}}.{_DATASET_NAME}.child_view`",
+        ),
+    ]
+
+
+class ComputeViewContentHashesTest(unittest.TestCase):
+    """Tests for compute_view_content_hashes."""
+
+    def test_hashes_stable(self) -> None:
+        hashes = compute_view_content_hashes(BigQueryViewDagWalker(_build_views()))
+        self.assertEqual(4, len(set(hashes.values())))
+        self.assertEqual(
+            hashes, compute_view_content_hashes(BigQueryViewDagWalker(_build_views()))
+        )
+
+    def test_change_propagates_to_descendants_only(self) -> None:
+        hashes = compute_view_content_hashes(BigQueryViewDagWalker(_build_views()))
+        updated_hashes = compute_view_content_hashes(
+            BigQueryViewDagWalker(_build_views(child_query_suffix=" WHERE TRUE"))
+        )
+
+        for view_id in ["parent_view", "other_view"]:
+            key = (_DATASET_NAME, view_id)
+            self.assertEqual(hashes[key], updated_hashes[key])
+        for view_id in ["child_view", "grandchild_view"]:
+            key = (_DATASET_NAME, view_id)
+            self.assertNotEqual(hashes[key], updated_hashes[key])
+
+
+class ViewDeployManifestTest(unittest.TestCase):
+    """Tests for ViewDeployManifest."""
+
+    def setUp(self) -> None:
+        self.fs = FakeGCSFileSystem()
+        self.path = view_deploy_manifest_path(_PROJECT_ID)
+
+    def test_manifest_path(self) -> None:
+        self.assertEqual(
+            "gs://fake-recidiviz-project-configs/view_deploy_manifest.json",
+            self.path.uri(),
+        )
+
+    def test_no_manifest(self) -> None:
+        view = _build_views()[0]
+        manifest = ViewDeployManifest(self.fs, self.path)
+        self.assertFalse(manifest.is_unchanged(view, "abc"))
+
+    def test_save_and_reload(self) -> None:
+        parent_view, other_view, _, _ = _build_views()
+        manifest = ViewDeployManifest(self.fs, self.path)
+        manifest.update({parent_view: "abc", other_view: "def"})
+        manifest.save()
+
+        reloaded = ViewDeployManifest(self.fs, self.path)
+        self.assertTrue(reloaded.is_unchanged(parent_view, "abc"))
+        self.assertTrue(reloaded.is_unchanged(other_view, "def"))
+        self.assertFalse(reloaded.is_unchanged(parent_view, "def"))
+
+    def test_save_keeps_concurrent_updates(self) -> None:
+        parent_view, other_view, _, _ = _build_views()
+        manifest = ViewDeployManifest(self.fs, self.path)
+        other_manifest = ViewDeployManifest(self.fs, self.path)
+
+        other_manifest.update({other_view: "def"})
+        other_manifest.save()
+        manifest.update({parent_view: "abc"})
+        manifest.save()
+
+        reloaded = ViewDeployManifest(self.fs, self.path)
+        self.assertTrue(reloaded.is_unchanged(parent_view, "abc"))
+        self.assertTrue(reloaded.is_unchanged(other_view, "def"))
+
+    def test_outdated_version_ignored(self) -> None:
+        parent_view = _build_views()[0]
+        self.fs.upload_from_string(
+            self.path,
+            json.dumps(
+                {"version": 0, "views": {"my_views_dataset.parent_view": "abc"}}
+            ),
+            content_type="application/json",
+        )
+
+        manifest = ViewDeployManifest(self.fs, self.path)
+        self.assertFalse(manifest.is_unchanged(parent_view, "abc"))
@@ -18,7 +18,7 @@
 """Tests for view_update_manager.py."""
 
 import unittest
-from typing import Tuple, Set
+from typing import List, Set, Tuple
 from unittest import mock
 from unittest.mock import patch
 
@@ -31,7 +31,9 @@ from recidiviz.big_query.view_update_manager import (
     VIEW_BUILDERS_BY_NAMESPACE,
     VIEW_SOURCE_TABLE_DATASETS,
 )
+from recidiviz.big_query.view_deploy_manifest import view_deploy_manifest_path
 from recidiviz.ingest.views.metadata_helpers import BigQueryTableChecker
+from recidiviz.tests.cloud_storage.fake_gcs_file_system import FakeGCSFileSystem
 
 _PROJECT_ID = "fake-recidiviz-project"
 _DATASET_NAME = "my_views_dataset"
@@ -51,8 +53,17 @@ class ViewManagerTest(unittest.TestCase):
         )
         self.mock_client = self.client_patcher.start().return_value
 
+        self.fake_fs = FakeGCSFileSystem()
+        self.fs_patcher = patch(
+            "recidiviz.big_query.view_update_manager.GcsfsFactory.build",
+            return_value=self.fake_fs,
+        )
+        self.fs_patcher.start()
+
     def tearDown(self) -> None:
         self.metadata_patcher.stop()
+        self.client_patcher.stop()
+        self.fs_patcher.stop()
 
     def test_create_dataset_and_deploy_views_for_view_builders(self) -> None:
         """Test that create_dataset_and_deploy_views_for_view_builders creates a dataset if necessary,
@@ -398,6 +409,34 @@ class ViewManagerTest(unittest.TestCase):
             any_order=True,
         )
 
+    def test_create_dataset_and_deploy_views_for_view_builders_dataset_override_no_manifest(
+        self,
+    ) -> None:
+        """Tests that a sandbox deploy with dataset_overrides neither reads nor saves the view deploy manifest."""
+        temp_dataset_id = "test_prefix_" + _DATASET_NAME
+        dataset = bigquery.dataset.DatasetReference(_PROJECT_ID, temp_dataset_id)
+        self.mock_client.dataset_ref_for_id.return_value = dataset
+
+        view_builder = SimpleBigQueryViewBuilder(
+            dataset_id=_DATASET_NAME,
+            view_id="my_fake_view",
+            view_query_template="SELECT NULL LIMIT 0",
+            should_materialize=True,
+        )
+
+        with patch(
+            "recidiviz.big_query.view_update_manager.ViewDeployManifest"
+        ) as mock_manifest:
+            view_update_manager.create_dataset_and_deploy_views_for_view_builders(
+                BigQueryViewNamespace.VALIDATION,
+                [view_builder],
+                dataset_overrides={_DATASET_NAME: temp_dataset_id},
+            )
+
+        mock_manifest.assert_not_called()
+        self.assertEqual(set(), self.fake_fs.uploaded_paths)
+        self.mock_client.create_or_update_view.assert_called_once()
+
     def test_create_dataset_and_update_views(self) -> None:
         """Test that create_dataset_and_update_views creates a dataset if necessary, and updates all views."""
         dataset = bigquery.dataset.DatasetReference(_PROJECT_ID, _DATASET_NAME)
@@ -427,6 +466,115 @@ class ViewManagerTest(unittest.TestCase):
             [mock.call(dataset, view) for view in mock_views], any_order=True
         )
 
+    def test_create_dataset_and_deploy_views_skip_unchanged_views(self) -> None:
+        """Tests that views that are unchanged since the last deploy are skipped, while changed views and their
+        descendants are deployed and materialized, when skip_unchanged_views is set."""
+        dataset = bigquery.dataset.DatasetReference(_PROJECT_ID, _DATASET_NAME)
+
+        def build_view_builders(
+            child_query: str,
+        ) -> List[SimpleBigQueryViewBuilder]:
+            return [
+                SimpleBigQueryViewBuilder(
+                    dataset_id=_DATASET_NAME,
+                    view_id="my_fake_view",
+                    view_query_template="SELECT NULL LIMIT 0",
+                    should_materialize=True,
+                ),
+                SimpleBigQueryViewBuilder(
+                    dataset_id=_DATASET_NAME,
+                    view_id="my_fake_view_2",
+                    view_query_template=child_query,
+                    should_materialize=True,
+                ),
+                SimpleBigQueryViewBuilder(
+                    dataset_id=_DATASET_NAME,
+                    view_id="my_fake_view_3",
+                    view_query_template=f"SELECT * FROM `{{project_id}}.{_DATASET_NAME}.my_fake_view_2`",
+                    should_materialize=True,
+                ),
+            ]
+
+        child_query = f"SELECT * FROM `{{project_id}}.{_DATASET_NAME}.my_fake_view`"
+        self.mock_client.dataset_ref_for_id.return_value = dataset
+
+        # The first deploy has no manifest, so all views are deployed
+        view_update_manager.create_dataset_and_deploy_views_for_view_builders(
+            BigQueryViewNamespace.VALIDATION,
+            build_view_builders(child_query),
+            skip_unchanged_views=True,
+        )
+        self.assertEqual(3, self.mock_client.create_or_update_view.call_count)
+        self.assertEqual(
+            {view_deploy_manifest_path(_PROJECT_ID)}, self.fake_fs.uploaded_paths
+        )
+
+        # Nothing has changed, so no views are deployed
+        self.mock_client.reset_mock()
+        view_update_manager.create_dataset_and_deploy_views_for_view_builders(
+            BigQueryViewNamespace.VALIDATION,
+            build_view_builders(child_query),
+            skip_unchanged_views=True,
+        )
+        self.mock_client.create_or_update_view.assert_not_called()
+        self.mock_client.materialize_view_to_table.assert_not_called()
+
+        # Only the changed view and its child are deployed
+        self.mock_client.reset_mock()
+        updated_view_builders = build_view_builders(child_query + " WHERE TRUE")
+        view_update_manager.create_dataset_and_deploy_views_for_view_builders(
+            BigQueryViewNamespace.VALIDATION,
+            updated_view_builders,
+            skip_unchanged_views=True,
+        )
+        self.mock_client.create_or_update_view.assert_has_calls(
+            [
+                mock.call(dataset, updated_view_builders[1].build()),
+                mock.call(dataset, updated_view_builders[2].build()),
+            ],
+            any_order=True,
+        )
+        self.assertEqual(2, self.mock_client.create_or_update_view.call_count)
+
+    def test_create_dataset_and_deploy_views_skip_unchanged_views_after_full_deploy(
+        self,
+    ) -> None:
+        """Tests that a deploy without skip_unchanged_views still updates the manifest, so that a later deploy of the
+        previous version of a view with skip_unchanged_views set redeploys it."""
+        dataset = bigquery.dataset.DatasetReference(_PROJECT_ID, _DATASET_NAME)
+        self.mock_client.dataset_ref_for_id.return_value = dataset
+
+        def build_view_builder(query: str) -> SimpleBigQueryViewBuilder:
+            return SimpleBigQueryViewBuilder(
+                dataset_id=_DATASET_NAME,
+                view_id="my_fake_view",
+                view_query_template=query,
+                should_materialize=True,
+            )
+
+        view_builder_a = build_view_builder("SELECT NULL LIMIT 0")
+        view_builder_b = build_view_builder("SELECT NULL LIMIT 1")
+
+        view_update_manager.create_dataset_and_deploy_views_for_view_builders(
+            BigQueryViewNamespace.VALIDATION,
+            [view_builder_a],
+            skip_unchanged_views=True,
+        )
+        view_update_manager.create_dataset_and_deploy_views_for_view_builders(
+            BigQueryViewNamespace.VALIDATION, [view_builder_b]
+        )
+        self.mock_client.reset_mock()
+
+        # Rolling back to the first version must redeploy the view, since BigQuery holds the second version
+        view_update_manager.create_dataset_and_deploy_views_for_view_builders(
+            BigQueryViewNamespace.VALIDATION,
+            [view_builder_a],
+            skip_unchanged_views=True,
+        )
+        self.mock_client.create_or_update_view.assert_called_once_with(
+            dataset, view_builder_a.build()
+        )
+
     def test_no_duplicate_views_in_update_list(self) -> None:
         with patch.object(
             BigQueryTableChecker, "_table_has_column"
@@ -61,3 +61,36 @@ class TestCohortTable(unittest.TestCase):
 
         for index, cohort_size in enumerate(cohort_size_list):
             self.assertEqual(cohort_size, cohort.get_cohort_timeline(1999).iloc[index])
+
+    def test_cohort_df_grows_past_initial_capacity(self):
+        """Tests the DataFrame view keeps every cohort and time step as the table grows"""
+        cohort = CohortTable(starting_ts=2000, transition_table_max_length=2)
+        for ts in range(2000, 2050):
+            cohort.append_ts_end_count(
+                cohort.get_latest_population() * 0.5, projection_ts=ts
+            )
+            cohort.append_cohort(10, ts)
+
+        cohort_df = cohort.cohort_df
+        self.assertEqual(list(range(1998, 2050)), list(cohort_df.index))
+        self.assertEqual(list(range(2000, 2050)), list(cohort_df.columns))
+        self.assertEqual(10, cohort_df.loc[2049, 2049])
+        self.assertEqual(5, cohort_df.loc[2048, 2049])
+        self.assertEqual(0, cohort_df.loc[2049, 2048])
+        pd.testing.assert_series_equal(
+            cohort_df.sum(axis=0), cohort.get_per_ts_population()
+        )
+
+    def test_pop_and_ingest_cohorts(self):
+        """Tests cohorts popped for the cross-simulation flow can be ingested again"""
+        cohort = CohortTable(starting_ts=2000, transition_table_max_length=1)
+        cohort.append_ts_end_count(pd.Series({1999: 0}), projection_ts=2000)
+        cohort.append_cohort(4, 2000)
+
+        cohort_df = cohort.pop_cohorts()
+        self.assertTrue(cohort.cohort_df.empty)
+        self.assertEqual(0, cohort.get_latest_population().sum())
+
+        cohort.ingest_cross_simulation_cohorts(cohort_df)
+        cohort.append_ts_end_count(pd.Series({1999: 0, 2000: 3}), projection_ts=2001)
+        self.assertEqual([4, 3], list(cohort.get_cohort_timeline(2000)))
@@ -0,0 +1,105 @@
+# Recidiviz - a data platform for criminal justice reform
+# Copyright (C) 2021 Recidiviz, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# =============================================================================
+"""Test the ARIMA model cache used by PredictedAdmissions"""
+# pylint: disable=protected-access
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+
+from recidiviz.calculator.modeling.population_projection.simulations import (
+    predicted_admissions,
+)
+
+
+class TestFitArimaModel(unittest.TestCase):
+    """Test that fitted ARIMA models are cached in memory and on disk"""
+
+    def setUp(self) -> None:
+        self.original_cache_dir = predicted_admissions._arima_cache_dir
+        self.cache_dir = tempfile.TemporaryDirectory()
+        predicted_admissions.set_arima_cache_dir(self.cache_dir.name)
+        self.arima_patcher = patch(
+            "recidiviz.calculator.modeling.population_projection.simulations.predicted_admissions.ARIMA"
+        )
+        self.mock_arima = self.arima_patcher.start()
+        self.mock_arima.return_value.fit.side_effect = lambda disp: "fitted_model"
+
+    def tearDown(self) -> None:
+        self.arima_patcher.stop()
+        predicted_admissions.set_arima_cache_dir(self.original_cache_dir)
+        predicted_admissions._fitted_arima_models.clear()
+        self.cache_dir.cleanup()
+
+    def test_same_data_not_refit(self) -> None:
+        values = np.array([10, 12, 11, 14])
+        self.assertEqual("fitted_model", predicted_admissions.fit_arima_model(values))
+        self.assertEqual(
+            "fitted_model", predicted_admissions.fit_arima_model(values.astype(float))
+        )
+        self.assertEqual(1, self.mock_arima.call_count)
+        self.assertEqual(1, len(os.listdir(self.cache_dir.name)))
+
+        # A new process loads the model from disk
+        predicted_admissions._fitted_arima_models.clear()
+        self.assertEqual("fitted_model", predicted_admissions.fit_arima_model(values))
+        self.assertEqual(1, self.mock_arima.call_count)
+
+    def test_different_data_or_order_refit(self) -> None:
+        predicted_admissions.fit_arima_model(np.array([10, 12, 11, 14]))
+        predicted_admissions.fit_arima_model(np.array([10, 12, 11, 15]))
+        predicted_admissions.fit_arima_model(np.array([10, 12, 11, 14]), (1, 0, 0))
+        self.assertEqual(3, self.mock_arima.call_count)
+        self.assertEqual(3, len(os.listdir(self.cache_dir.name)))
+
+    def test_no_cache_dir(self) -> None:
+        predicted_admissions.set_arima_cache_dir(None)
+        predicted_admissions.fit_arima_model(np.array([10, 12, 11, 14]))
+        predicted_admissions.fit_arima_model(np.array([10, 12, 11, 14]))
+        self.assertEqual(1, self.mock_arima.call_count)
+        self.assertEqual([], os.listdir(self.cache_dir.name))
+
+    def test_cache_dir_created_private(self) -> None:
+        cache_dir = os.path.join(self.cache_dir.name, "arima_cache")
+        predicted_admissions.set_arima_cache_dir(cache_dir)
+        predicted_admissions.fit_arima_model(np.array([10, 12, 11, 14]))
+        self.assertEqual(0o700, os.stat(cache_dir).st_mode & 0o777)
+        self.assertEqual(1, len(os.listdir(cache_dir)))
+
+    def test_shared_cache_dir_not_used(self) -> None:
+        os.chmod(self.cache_dir.name, 0o777)
+        with self.assertWarns(Warning):
+            predicted_admissions.fit_arima_model(np.array([10, 12, 11, 14]))
+        self.assertEqual([], os.listdir(self.cache_dir.name))
+
+    def test_in_memory_cache_bounded(self) -> None:
+        predicted_admissions.set_arima_cache_dir(None)
+        with patch.object(predicted_admissions, "_MAX_IN_MEMORY_ARIMA_MODELS", 2):
+            predicted_admissions.fit_arima_model(np.array([10, 12, 11, 14]))
+            predicted_admissions.fit_arima_model(np.array([10, 12, 11, 15]))
+            # Using the first model makes the second the least recently used
+            predicted_admissions.fit_arima_model(np.array([10, 12, 11, 14]))
+            predicted_admissions.fit_arima_model(np.array([10, 12, 11, 16]))
+            self.assertEqual(2, len(predicted_admissions._fitted_arima_models))
+            self.assertEqual(3, self.mock_arima.call_count)
+
+            predicted_admissions.fit_arima_model(np.array([10, 12, 11, 14]))
+            self.assertEqual(3, self.mock_arima.call_count)
+            predicted_admissions.fit_arima_model(np.array([10, 12, 11, 15]))
+            self.assertEqual(4, self.mock_arima.call_count)
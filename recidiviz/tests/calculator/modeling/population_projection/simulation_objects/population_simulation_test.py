@@ -18,7 +18,7 @@
 import unittest
 from copy import deepcopy
 import pandas as pd
-from pandas.testing import assert_index_equal
+from pandas.testing import assert_frame_equal, assert_index_equal
 
 from recidiviz.calculator.modeling.population_projection.simulations.compartment_transitions import (
     CompartmentTransitions,
@@ -300,3 +300,39 @@ class TestPopulationSimulation(unittest.TestCase):
                 False,
                 True,
             )
+
+    def test_parallel_sub_simulations_match_serial(self):
+        """Assert that stepping sub simulations in worker processes gives the same projection as stepping serially"""
+
+        def add_sub_group(data: pd.DataFrame) -> pd.DataFrame:
+            other_crime = data.copy()
+            other_crime["crime"] = "ASSAULT"
+            other_crime["total_population"] *= 2
+            return pd.concat([data, other_crime], ignore_index=True)
+
+        projections = []
+        for max_workers in [1, 2]:
+            population_simulation = (
+                PopulationSimulationFactory.build_population_simulation(
+                    add_sub_group(self.test_outflows_data),
+                    add_sub_group(self.test_transitions_data),
+                    add_sub_group(self.test_total_population_data),
+                    self.simulation_architecture,
+                    ["crime"],
+                    self.user_inputs,
+                    [],
+                    -5,
+                    pd.DataFrame(),
+                    False,
+                    True,
+                )
+            )
+            projection = population_simulation.simulate_policies(max_workers)
+            projections.append(
+                projection.sort_values(
+                    ["simulation_group", "compartment", "time_step"]
+                ).reset_index(drop=True)
+            )
+
+        self.assertEqual(2, projections[0].simulation_group.nunique())
+        assert_frame_equal(projections[0], projections[1])
@@ -0,0 +1,139 @@
+# Recidiviz - a data platform for criminal justice reform
+# Copyright (C) 2021 Recidiviz, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# =============================================================================
+"""Tests for entity_snapshot/pipeline.py."""
+import shutil
+import tempfile
+import unittest
+from datetime import date
+
+import apache_beam as beam
+from apache_beam.options.pipeline_options import PipelineOptions
+from apache_beam.testing.test_pipeline import TestPipeline
+from apache_beam.testing.util import assert_that, equal_to
+from mock import patch
+
+from recidiviz.calculator.pipeline.entity_snapshot import pipeline
+from recidiviz.calculator.pipeline.utils import extractor_utils
+from recidiviz.common.constants.person_characteristics import Gender
+from recidiviz.persistence.database.base_schema import StateBase
+from recidiviz.persistence.database.schema.state import schema
+from recidiviz.persistence.database.schema_entity_converter.state.schema_entity_converter import (
+    StateSchemaToEntityConverter,
+)
+from recidiviz.persistence.entity.state import entities
+from recidiviz.tests.calculator.calculator_test_utils import (
+    normalized_database_base_dict_list,
+)
+from recidiviz.tests.calculator.pipeline.fake_bigquery import (
+    FakeReadFromBigQueryFactory,
+)
+
+_PROJECT_ID = "recidiviz-123"
+_DATASET = "state"
+
+
+class TestEntitySnapshotPipeline(unittest.TestCase):
+    """Tests for the entity snapshot pipeline."""
+
+    def setUp(self) -> None:
+        self.fake_bq_source_factory = FakeReadFromBigQueryFactory()
+        self.snapshot_root = tempfile.mkdtemp()
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.snapshot_root)
+
+    def run_snapshot_pipeline(self, people: list) -> None:
+        data_dict = {table.name: [] for table in StateBase.metadata.sorted_tables}
+        data_dict[
+            schema.StatePerson.__tablename__
+        ] = normalized_database_base_dict_list(people)
+
+        with patch(
+            "recidiviz.calculator.pipeline.utils.extractor_utils.ReadFromBigQuery",
+            self.fake_bq_source_factory.create_fake_bq_source_constructor(
+                f"{_PROJECT_ID}.{_DATASET}", data_dict
+            ),
+        ), patch(
+            "recidiviz.calculator.pipeline.entity_snapshot.pipeline.beam.Pipeline",
+            lambda options: TestPipeline(),
+        ):
+            pipeline.run(
+                apache_beam_pipeline_options=PipelineOptions(project=_PROJECT_ID),
+                data_input=_DATASET,
+                state_code="US_XX",
+                hydrated_snapshot_root=self.snapshot_root,
+            )
+
+    def read_snapshot_people(self, expected_people: list) -> None:
+        test_pipeline = TestPipeline()
+        output = test_pipeline | extractor_utils.ReadHydratedRootEntities(
+            extractor_utils.hydrated_root_entities_path(
+                self.snapshot_root, "US_XX", entities.StatePerson, True
+            )
+        )
+        assert_that(
+            output,
+            equal_to(
+                [
+                    (person.person_id, StateSchemaToEntityConverter().convert(person))
+                    for person in expected_people
+                ]
+            ),
+        )
+        test_pipeline.run()
+
+    def testEntitySnapshotPipeline(self) -> None:
+        fake_person = schema.StatePerson(
+            person_id=12345,
+            full_name="Jack Smith",
+            birthdate=date(1970, 1, 1),
+            gender=Gender.MALE,
+            state_code="US_XX",
+        )
+
+        self.run_snapshot_pipeline([fake_person])
+
+        self.read_snapshot_people([fake_person])
+
+    def testEntitySnapshotPipeline_ReplacesEarlierSnapshot(self) -> None:
+        """Tests that shards left by an earlier snapshot with a different number of shards are not read along with the
+        new snapshot."""
+        stale_person = entities.StatePerson.new_with_defaults(
+            person_id=99999, state_code="US_XX"
+        )
+        test_pipeline = TestPipeline()
+        _ = (
+            test_pipeline
+            | beam.Create([(stale_person.person_id, stale_person)])
+            | beam.io.WriteToTFRecord(
+                extractor_utils.hydrated_root_entities_path(
+                    self.snapshot_root, "US_XX", entities.StatePerson, True
+                ),
+                coder=extractor_utils.HYDRATED_ROOT_ENTITY_CODER,
+                file_name_suffix=".tfrecord.gz",
+                num_shards=3,
+            )
+        )
+        test_pipeline.run()
+
+        fake_person = schema.StatePerson(
+            person_id=12345, full_name="Jack Smith", state_code="US_XX"
+        )
+
+        self.run_snapshot_pipeline([fake_person])
+
+        self.read_snapshot_people([fake_person])
@@ -19,11 +19,12 @@
 """Tests for supervision/identifier.py."""
 
 from collections import defaultdict
+import random
 from datetime import date
 
 import unittest
 from itertools import permutations
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterator
 from unittest import mock
 
 import attr
@@ -9423,6 +9424,147 @@ class TestFindTimeBucketsForSupervisionPeriod(unittest.TestCase):
         self.assertCountEqual(expected_buckets, supervision_time_buckets)
 
 
+class TestFindTimeBucketsForSupervisionPeriodEquivalence(unittest.TestCase):
+    """Tests that find_time_buckets_for_supervision_period produces the same buckets as checking
+    on_supervision_on_date for every day of the period, across randomly generated combinations of supervision and
+    incarceration periods."""
+
+    def setUp(self):
+        self.assessment_types_patcher = mock.patch(
+            "recidiviz.calculator.pipeline.supervision.identifier.assessment_utils."
+            "_assessment_types_of_class_for_state"
+        )
+        self.mock_assessment_types = self.assessment_types_patcher.start()
+        self.mock_assessment_types.return_value = [
+            StateAssessmentType.ORAS,
+            StateAssessmentType.LSIR,
+        ]
+
+    def tearDown(self):
+        self.assessment_types_patcher.stop()
+
+    @staticmethod
+    def _random_incarceration_periods(
+        rng: random.Random, supervision_start: date
+    ) -> List[StateIncarcerationPeriod]:
+        incarceration_periods = []
+        for ip_id in range(rng.randint(0, 5)):
+            admission_date = supervision_start + relativedelta(
+                days=rng.randint(-60, 400)
+            )
+            is_open = rng.random() < 0.1
+            incarceration_periods.append(
+                StateIncarcerationPeriod.new_with_defaults(
+                    incarceration_period_id=ip_id,
+                    external_id=f"ip{ip_id}",
+                    state_code="US_ND",
+                    status=(
+                        StateIncarcerationPeriodStatus.IN_CUSTODY
+                        if is_open
+                        else StateIncarcerationPeriodStatus.NOT_IN_CUSTODY
+                    ),
+                    admission_date=admission_date,
+                    admission_reason=rng.choice(
+                        [
+                            AdmissionReason.NEW_ADMISSION,
+                            AdmissionReason.PROBATION_REVOCATION,
+                            AdmissionReason.TEMPORARY_CUSTODY,
+                        ]
+                    ),
+                    release_date=(
+                        None
+                        if is_open
+                        else admission_date + relativedelta(days=rng.randint(0, 90))
+                    ),
+                    release_reason=None if is_open else ReleaseReason.SENTENCE_SERVED,
+                    custodial_authority=rng.choice(
+                        [
+                            StateCustodialAuthority.STATE_PRISON,
+                            StateCustodialAuthority.SUPERVISION_AUTHORITY,
+                            None,
+                        ]
+                    ),
+                )
+            )
+        return incarceration_periods
+
+    @staticmethod
+    def _days_on_supervision_checked_daily(
+        supervision_period: StateSupervisionPeriod,
+        end_date: date,
+        supervision_sentences: List[StateSupervisionSentence],
+        incarceration_sentences: List[StateIncarcerationSentence],
+        incarceration_period_index: IncarcerationPeriodIndex,
+    ) -> Iterator[date]:
+        """Yields the days on which the person counts towards the supervision population by checking every day of the
+        period, as find_time_buckets_for_supervision_period did before computing the spans once per period."""
+        event_date = supervision_period.start_date
+        while event_date < end_date:
+            if identifier.on_supervision_on_date(
+                event_date,
+                supervision_sentences,
+                incarceration_sentences,
+                supervision_period,
+                incarceration_period_index,
+            ):
+                yield event_date
+            event_date += relativedelta(days=1)
+
+    def test_find_time_buckets_for_supervision_period_matches_daily_check(self):
+        rng = random.Random(11)
+        for _ in range(100):
+            start_date = date(2018, 1, 1) + relativedelta(days=rng.randint(0, 365))
+            termination_date = start_date + relativedelta(days=rng.randint(1, 365))
+            supervision_period = StateSupervisionPeriod.new_with_defaults(
+                supervision_period_id=111,
+                external_id="sp1",
+                state_code="US_ND",
+                status=StateSupervisionPeriodStatus.TERMINATED,
+                start_date=start_date,
+                termination_date=termination_date,
+                supervision_type=StateSupervisionType.PROBATION,
+            )
+            supervision_sentence = StateSupervisionSentence.new_with_defaults(
+                state_code="US_ND",
+                supervision_sentence_id=111,
+                start_date=start_date,
+                external_id="ss1",
+                supervision_type=StateSupervisionType.PROBATION,
+                status=StateSentenceStatus.COMPLETED,
+                completion_date=termination_date,
+                supervision_periods=[supervision_period],
+            )
+            incarceration_period_index = IncarcerationPeriodIndex(
+                incarceration_periods=self._random_incarceration_periods(
+                    rng, start_date
+                )
+            )
+
+            def find_buckets() -> List[SupervisionTimeBucket]:
+                return identifier.find_time_buckets_for_supervision_period(
+                    [supervision_sentence],
+                    [],
+                    supervision_period,
+                    SupervisionPeriodIndex(supervision_periods=[supervision_period]),
+                    incarceration_period_index,
+                    [],
+                    [],
+                    [],
+                    DEFAULT_SUPERVISION_PERIOD_AGENT_ASSOCIATIONS,
+                )
+
+            supervision_time_buckets = find_buckets()
+
+            with mock.patch(
+                "recidiviz.calculator.pipeline.supervision.identifier."
+                "_days_counted_towards_supervision_population",
+                self._days_on_supervision_checked_daily,
+            ):
+                expected_buckets = find_buckets()
+
+            self.assertEqual(expected_buckets, supervision_time_buckets)
+
+
 class TestClassifySupervisionSuccess(unittest.TestCase):
     """Tests the classify_supervision_success function."""
 
@@ -19,12 +19,24 @@ import unittest
 from datetime import date
 from datetime import datetime
 
+import attr
 import pytest
 
+from recidiviz.calculator.pipeline.supervision.metrics import (
+    SupervisionPopulationMetric,
+)
+from recidiviz.calculator.pipeline.supervision.supervision_time_bucket import (
+    NonRevocationReturnSupervisionTimeBucket,
+    SupervisionStartBucket,
+)
 from recidiviz.calculator.pipeline.utils import calculator_utils
 from recidiviz.calculator.pipeline.utils.calculator_utils import person_characteristics
 from recidiviz.calculator.pipeline.utils.person_utils import PersonMetadata
 from recidiviz.common.constants.person_characteristics import Gender
+from recidiviz.common.constants.state.state_case_type import StateSupervisionCaseType
+from recidiviz.common.constants.state.state_supervision_period import (
+    StateSupervisionPeriodSupervisionType,
+)
 from recidiviz.common.constants.state.state_supervision_violation_response import (
     StateSupervisionViolationResponseDecision,
 )
@@ -485,3 +497,79 @@ class TestGetCalculationMonthUpperBoundDate(unittest.TestCase):
             _ = calculator_utils.get_calculation_month_upper_bound_date(value)
 
         assert "Invalid value for calculation_end_month" in str(e.value)
+
+
+class TestMetricFieldPlan(unittest.TestCase):
+    """Tests the metric_field_plan and characteristics_dict_builder functions."""
+
+    def test_metric_field_plan(self):
+        plan = calculator_utils.metric_field_plan(
+            NonRevocationReturnSupervisionTimeBucket, SupervisionPopulationMetric
+        )
+
+        self.assertEqual(
+            set(attr.fields_dict(SupervisionPopulationMetric).keys()),
+            plan.metric_attributes,
+        )
+        self.assertIn("supervision_type", plan.event_attributes)
+        # Populated from a property on the bucket
+        self.assertIn("date_of_supervision", plan.event_attributes)
+        for field in ["job_id", "person_id", "year", "month", "age_bucket"]:
+            self.assertNotIn(field, plan.event_attributes)
+
+        self.assertIs(
+            plan,
+            calculator_utils.metric_field_plan(
+                NonRevocationReturnSupervisionTimeBucket, SupervisionPopulationMetric
+            ),
+        )
+
+    def test_metric_field_plan_missingField(self):
+        with self.assertRaises(ValueError):
+            calculator_utils.metric_field_plan(
+                SupervisionStartBucket, SupervisionPopulationMetric
+            )
+
+    def test_characteristics_dict_builder(self):
+        person = StatePerson.new_with_defaults(
+            state_code="US_XX",
+            person_id=12345,
+            birthdate=date(1984, 8, 31),
+            gender=Gender.FEMALE,
+        )
+        bucket = NonRevocationReturnSupervisionTimeBucket(
+            state_code="US_XX",
+            year=2018,
+            month=3,
+            event_date=date(2018, 3, 31),
+            is_on_supervision_last_day_of_month=True,
+            supervision_type=StateSupervisionPeriodSupervisionType.PAROLE,
+            case_type=StateSupervisionCaseType.GENERAL,
+            supervision_level_raw_text="HIGH",
+        )
+
+        characteristics = calculator_utils.characteristics_dict_builder(
+            pipeline="supervision",
+            event=bucket,
+            metric_class=SupervisionPopulationMetric,
+            person=person,
+            event_date=bucket.event_date,
+            person_metadata=PersonMetadata(prioritized_race_or_ethnicity="BLACK"),
+        )
+
+        self.assertEqual(
+            {
+                "age_bucket": "30-34",
+                "gender": Gender.FEMALE,
+                "prioritized_race_or_ethnicity": "BLACK",
+                "person_id": 12345,
+                "supervision_type": StateSupervisionPeriodSupervisionType.PAROLE,
+                "case_type": StateSupervisionCaseType.GENERAL,
+                "supervision_level_raw_text": "HIGH",
+                "date_of_supervision": date(2018, 3, 31),
+                "is_on_supervision_last_day_of_month": True,
+                "response_count": 0,
+                "assessment_score_bucket": "NOT_ASSESSED",
+            },
+            characteristics,
+        )
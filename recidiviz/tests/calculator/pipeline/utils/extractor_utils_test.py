@@ -20,11 +20,14 @@
 
 
 """Tests for utils/extractor_utils.py."""
+import shutil
+import tempfile
 from typing import Type
 
 import unittest
 
 import apache_beam as beam
+from apache_beam.io.filesystems import FileSystems
 from apache_beam.testing.util import assert_that, equal_to
 from apache_beam.testing.test_pipeline import TestPipeline
 
@@ -33,6 +36,9 @@ import pytest
 from mock import patch
 
 from recidiviz.calculator.pipeline.utils import extractor_utils
+from recidiviz.calculator.pipeline.utils.state_entity_coder import (
+    ENTITY_SCHEMA_FINGERPRINT,
+)
 from recidiviz.common.constants.charge import ChargeStatus
 from recidiviz.common.constants.state.state_assessment import (
     StateAssessmentClass,
@@ -889,6 +895,189 @@ class TestBuildRootEntity(unittest.TestCase):
             test_pipeline.run()
 
 
+class TestHydratedRootEntitySnapshot(unittest.TestCase):
+    """Tests reading and writing snapshots of hydrated root entities."""
+
+    def setUp(self) -> None:
+        self.fake_bq_source_factory = FakeReadFromBigQueryFactory()
+        self.snapshot_root = tempfile.mkdtemp()
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.snapshot_root)
+
+    def testHydratedRootEntitiesPath(self):
+        schema_dir = f"schema_{ENTITY_SCHEMA_FINGERPRINT}"
+        self.assertEqual(
+            f"gs://bucket/snapshots/{schema_dir}/US_XX/StatePerson/with_related_entities/shard",
+            extractor_utils.hydrated_root_entities_path(
+                "gs://bucket/snapshots/", "us_xx", entities.StatePerson, True
+            ),
+        )
+        self.assertEqual(
+            f"gs://bucket/snapshots/{schema_dir}/US_XX/StateSupervisionPeriod/root_only/shard",
+            extractor_utils.hydrated_root_entities_path(
+                "gs://bucket/snapshots", "US_XX", entities.StateSupervisionPeriod, False
+            ),
+        )
+
+    def testReadHydratedRootEntities_OtherSchemaFingerprint(self):
+        """Tests that a snapshot written with a different version of the entities
+        module is not read."""
+        with patch(
+            "recidiviz.calculator.pipeline.utils.extractor_utils.ENTITY_SCHEMA_FINGERPRINT",
+            "0000000000000000",
+        ):
+            file_path_prefix = extractor_utils.hydrated_root_entities_path(
+                self.snapshot_root, "US_XX", entities.StatePerson, False
+            )
+        test_pipeline = TestPipeline()
+        _ = (
+            test_pipeline
+            | beam.Create(
+                [
+                    (
+                        1,
+                        entities.StatePerson.new_with_defaults(
+                            person_id=1, state_code="US_XX"
+                        ),
+                    )
+                ]
+            )
+            | extractor_utils.WriteHydratedRootEntities(file_path_prefix)
+        )
+        test_pipeline.run()
+
+        with self.assertRaises(IOError):
+            _ = TestPipeline() | extractor_utils.ReadHydratedRootEntities(
+                extractor_utils.hydrated_root_entities_path(
+                    self.snapshot_root, "US_XX", entities.StatePerson, False
+                )
+            )
+
+    def testBuildRootEntity_FromSnapshot(self):
+        """Tests that BuildRootEntity reads the entities written to a snapshot,
+        hydrated the same way, without querying BigQuery."""
+        fake_person = schema.StatePerson(
+            person_id=12345,
+            full_name="Jack Smith",
+            birthdate=date(1970, 1, 1),
+            gender=Gender.MALE,
+            state_code="US_XX",
+        )
+        race = schema.StatePersonRace(
+            person_race_id=111, state_code="US_XX", race=Race.WHITE, person_id=12345
+        )
+
+        fake_other_person = schema.StatePerson(
+            person_id=67890, full_name="Jill Smith", state_code="US_XX"
+        )
+
+        data_dict = {
+            schema.StatePerson.__tablename__: normalized_database_base_dict_list(
+                [fake_person, fake_other_person]
+            ),
+            schema.StatePersonRace.__tablename__: [normalized_database_base_dict(race)],
+            schema.StatePersonEthnicity.__tablename__: [],
+            schema.StatePersonAlias.__tablename__: [],
+            schema.StatePersonExternalId.__tablename__: [],
+            schema.StateSentenceGroup.__tablename__: [],
+            schema.StateAssessment.__tablename__: [],
+            schema.StateProgramAssignment.__tablename__: [],
+        }
+
+        fake_person_entity = StateSchemaToEntityConverter().convert(fake_person)
+        fake_person_entity.races = StateSchemaToEntityConverter().convert_all([race])
+        fake_other_person_entity = StateSchemaToEntityConverter().convert(
+            fake_other_person
+        )
+        dataset = "recidiviz-123.state"
+
+        with patch(
+            "recidiviz.calculator.pipeline.utils.extractor_utils.ReadFromBigQuery",
+            self.fake_bq_source_factory.create_fake_bq_source_constructor(
+                dataset, data_dict
+            ),
+        ):
+            test_pipeline = TestPipeline()
+
+            _ = (
+                test_pipeline
+                | extractor_utils.BuildRootEntity(
+                    dataset=dataset,
+                    root_entity_class=entities.StatePerson,
+                    unifying_id_field=entities.StatePerson.get_class_id_name(),
+                    build_related_entities=True,
+                    state_code="US_XX",
+                )
+                | extractor_utils.WriteHydratedRootEntities(
+                    extractor_utils.hydrated_root_entities_path(
+                        self.snapshot_root, "US_XX", entities.StatePerson, True
+                    )
+                )
+            )
+
+            test_pipeline.run()
+
+        with patch(
+            "recidiviz.calculator.pipeline.utils.extractor_utils.ReadFromBigQuery"
+        ) as mock_read_from_bq:
+            test_pipeline = TestPipeline()
+
+            output = test_pipeline | extractor_utils.BuildRootEntity(
+                dataset=dataset,
+                root_entity_class=entities.StatePerson,
+                unifying_id_field=entities.StatePerson.get_class_id_name(),
+                build_related_entities=True,
+                state_code="US_XX",
+                hydrated_snapshot_root=self.snapshot_root,
+            )
+
+            assert_that(
+                output,
+                equal_to(
+                    [
+                        (12345, fake_person_entity),
+                        (67890, fake_other_person_entity),
+                    ]
+                ),
+            )
+
+            test_pipeline.run()
+
+            mock_read_from_bq.assert_not_called()
+
+    def testReadHydratedRootEntities_UnifyingIdFilter(self):
+        fake_person_entities = [
+            (
+                person_id,
+                entities.StatePerson.new_with_defaults(
+                    person_id=person_id, state_code="US_XX"
+                ),
+            )
+            for person_id in [1, 2, 3]
+        ]
+        file_path_prefix = extractor_utils.hydrated_root_entities_path(
+            self.snapshot_root, "US_XX", entities.StatePerson, False
+        )
+
+        test_pipeline = TestPipeline()
+        _ = (
+            test_pipeline
+            | beam.Create(fake_person_entities)
+            | extractor_utils.WriteHydratedRootEntities(file_path_prefix)
+        )
+        test_pipeline.run()
+
+        test_pipeline = TestPipeline()
+        output = test_pipeline | extractor_utils.ReadHydratedRootEntities(
+            file_path_prefix, unifying_id_field_filter_set={1, 3}
+        )
+        assert_that(
+            output, equal_to([fake_person_entities[0], fake_person_entities[2]])
+        )
+        test_pipeline.run()
+
+
 class TestExtractEntity(unittest.TestCase):
     """Tests the ExtractEntity PTransform."""
 
@@ -2097,3 +2286,47 @@ class ExtractAssertMatchers:
             assert not empty
 
         return _validate_extract_relationship_property_entities
+
+    def testDeleteHydratedRootEntities(self):
+        file_path_prefix = extractor_utils.hydrated_root_entities_path(
+            self.snapshot_root, "US_XX", entities.StatePerson, False
+        )
+        other_file_path_prefix = extractor_utils.hydrated_root_entities_path(
+            self.snapshot_root, "US_XX", entities.StatePerson, True
+        )
+        fake_person_entities = [
+            (
+                person_id,
+                entities.StatePerson.new_with_defaults(
+                    person_id=person_id, state_code="US_XX"
+                ),
+            )
+            for person_id in [1, 2, 3]
+        ]
+
+        test_pipeline = TestPipeline()
+        people = test_pipeline | beam.Create(fake_person_entities)
+        _ = people | "Write stale shards" >> beam.io.WriteToTFRecord(
+            file_path_prefix,
+            coder=extractor_utils.HYDRATED_ROOT_ENTITY_CODER,
+            file_name_suffix=".tfrecord.gz",
+            num_shards=3,
+        )
+        _ = people | "Write other snapshot" >> extractor_utils.WriteHydratedRootEntities(
+            other_file_path_prefix
+        )
+        test_pipeline.run()
+
+        extractor_utils.delete_hydrated_root_entities(file_path_prefix)
+
+        self.assertEqual(
+            [],
+            FileSystems.match([f"{file_path_prefix}*"])[0].metadata_list,
+        )
+        self.assertNotEqual(
+            [],
+            FileSystems.match([f"{other_file_path_prefix}*"])[0].metadata_list,
+        )
+
+        # Deleting when there are no files is a no-op
+        extractor_utils.delete_hydrated_root_entities(file_path_prefix)
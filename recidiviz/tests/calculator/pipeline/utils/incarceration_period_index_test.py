@@ -1031,6 +1031,54 @@ class TesIsExcludedFromSupervisionPopulationForRange(unittest.TestCase):
             is_excluded_from_supervision_population=False,
         )
 
+    def test_period_ending_before_range_does_not_widen_range(self):
+        """Tests that a day in a later period is excluded when an earlier period in the same month ends before it.
+        The earlier period used to widen the range left to cover back to its own release date, leaving days before
+        the later period uncovered."""
+        incarceration_period = StateIncarcerationPeriod.new_with_defaults(
+            incarceration_period_id=111,
+            external_id="ip1",
+            state_code="US_XX",
+            admission_date=date(2020, 1, 5),
+            admission_reason=AdmissionReason.NEW_ADMISSION,
+            release_date=date(2020, 1, 10),
+            release_reason=ReleaseReason.SENTENCE_SERVED,
+            status=StateIncarcerationPeriodStatus.NOT_IN_CUSTODY,
+        )
+        incarceration_period_2 = StateIncarcerationPeriod.new_with_defaults(
+            incarceration_period_id=222,
+            external_id="ip2",
+            state_code="US_XX",
+            admission_date=date(2020, 1, 15),
+            admission_reason=AdmissionReason.NEW_ADMISSION,
+            release_date=date(2020, 1, 25),
+            release_reason=ReleaseReason.SENTENCE_SERVED,
+            status=StateIncarcerationPeriodStatus.NOT_IN_CUSTODY,
+        )
+        index = IncarcerationPeriodIndex([incarceration_period, incarceration_period_2])
+
+        self.assertTrue(
+            index.is_excluded_from_supervision_population_for_range(
+                DateRange.for_day(date(2020, 1, 20))
+            )
+        )
+        self.assertTrue(
+            index.is_excluded_from_supervision_population_for_range(
+                DateRange(date(2020, 1, 16), date(2020, 1, 25))
+            )
+        )
+        self.assertFalse(
+            index.is_excluded_from_supervision_population_for_range(
+                DateRange.for_day(date(2020, 1, 12))
+            )
+        )
+        # A day inside the earlier period is still excluded
+        self.assertTrue(
+            index.is_excluded_from_supervision_population_for_range(
+                DateRange.for_day(date(2020, 1, 7))
+            )
+        )
+
 
 class TestIncarcerationPeriodsNotUnderSupervisionAuthority(unittest.TestCase):
     """Tests the incarceration_periods_not_under_supervision_authority function."""
@@ -1100,3 +1148,124 @@ class TestIncarcerationPeriodsNotUnderSupervisionAuthority(unittest.TestCase):
                 expected_periods,
                 index.incarceration_periods_not_under_supervision_authority,
             )
+
+
+class TestPortionsOfRangeNotExcludedFromSupervisionPopulation(unittest.TestCase):
+    """Tests the portions_of_range_not_excluded_from_supervision_population function."""
+
+    def setUp(self) -> None:
+        self.incarceration_period = StateIncarcerationPeriod.new_with_defaults(
+            incarceration_period_id=111,
+            external_id="ip1",
+            state_code="US_XX",
+            admission_date=date(2020, 1, 5),
+            admission_reason=AdmissionReason.NEW_ADMISSION,
+            release_date=date(2020, 1, 10),
+            release_reason=ReleaseReason.SENTENCE_SERVED,
+            status=StateIncarcerationPeriodStatus.NOT_IN_CUSTODY,
+        )
+
+        self.incarceration_period_2 = StateIncarcerationPeriod.new_with_defaults(
+            incarceration_period_id=222,
+            external_id="ip2",
+            state_code="US_XX",
+            admission_date=date(2020, 1, 15),
+            admission_reason=AdmissionReason.NEW_ADMISSION,
+            release_date=date(2020, 1, 25),
+            release_reason=ReleaseReason.SENTENCE_SERVED,
+            status=StateIncarcerationPeriodStatus.NOT_IN_CUSTODY,
+        )
+
+        # Overlaps with incarceration_period_2
+        self.incarceration_period_3 = StateIncarcerationPeriod.new_with_defaults(
+            incarceration_period_id=333,
+            external_id="ip3",
+            state_code="US_XX",
+            admission_date=date(2020, 1, 20),
+            admission_reason=AdmissionReason.NEW_ADMISSION,
+            release_date=date(2020, 2, 3),
+            release_reason=ReleaseReason.SENTENCE_SERVED,
+            status=StateIncarcerationPeriodStatus.NOT_IN_CUSTODY,
+        )
+
+        self.incarceration_period_supervision_authority = (
+            StateIncarcerationPeriod.new_with_defaults(
+                incarceration_period_id=444,
+                external_id="ip4",
+                state_code="US_XX",
+                admission_date=date(2020, 1, 1),
+                admission_reason=AdmissionReason.NEW_ADMISSION,
+                release_date=date(2020, 3, 1),
+                release_reason=ReleaseReason.SENTENCE_SERVED,
+                status=StateIncarcerationPeriodStatus.NOT_IN_CUSTODY,
+                custodial_authority=StateCustodialAuthority.SUPERVISION_AUTHORITY,
+            )
+        )
+
+    def test_portions_of_range_not_excluded_from_supervision_population(self):
+        index = IncarcerationPeriodIndex(
+            [
+                self.incarceration_period,
+                self.incarceration_period_2,
+                self.incarceration_period_3,
+                self.incarceration_period_supervision_authority,
+            ]
+        )
+
+        self.assertEqual(
+            [
+                DateRange(date(2020, 5, 1), date(2020, 5, 3)),
+            ],
+            index.portions_of_range_not_excluded_from_supervision_population(
+                DateRange(date(2020, 5, 1), date(2020, 5, 3))
+            ),
+        )
+        self.assertEqual(
+            [
+                DateRange(date(2020, 1, 1), date(2020, 1, 5)),
+                DateRange(date(2020, 1, 10), date(2020, 1, 15)),
+                DateRange(date(2020, 2, 3), date(2020, 3, 1)),
+            ],
+            index.portions_of_range_not_excluded_from_supervision_population(
+                DateRange(date(2020, 1, 1), date(2020, 3, 1))
+            ),
+        )
+        self.assertEqual(
+            [],
+            index.portions_of_range_not_excluded_from_supervision_population(
+                DateRange(date(2020, 1, 16), date(2020, 1, 30))
+            ),
+        )
+
+    def test_portions_of_range_not_excluded_from_supervision_population_matches_daily_check(
+        self,
+    ):
+        index = IncarcerationPeriodIndex(
+            [
+                self.incarceration_period,
+                self.incarceration_period_2,
+                self.incarceration_period_3,
+                self.incarceration_period_supervision_authority,
+            ]
+        )
+
+        range_to_cover = DateRange(date(2019, 12, 1), date(2020, 3, 1))
+        expected_days = []
+        day = range_to_cover.lower_bound_inclusive_date
+        while day < range_to_cover.upper_bound_exclusive_date:
+            if not index.is_excluded_from_supervision_population_for_range(
+                DateRange.for_day(day)
+            ):
+                expected_days.append(day)
+            day += timedelta(days=1)
+
+        days = []
+        for portion in index.portions_of_range_not_excluded_from_supervision_population(
+            range_to_cover
+        ):
+            day = portion.lower_bound_inclusive_date
+            while day < portion.upper_bound_exclusive_date:
+                days.append(day)
+                day += timedelta(days=1)
+
+        self.assertEqual(expected_days, days)
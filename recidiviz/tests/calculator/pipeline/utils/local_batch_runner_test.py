@@ -0,0 +1,245 @@
+# Recidiviz - a data platform for criminal justice reform
+# Copyright (C) 2021 Recidiviz, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# =============================================================================
+"""Tests for local_batch_runner.py."""
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import date
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from recidiviz.calculator.pipeline.utils.local_batch_runner import (
+    LocalBatchRunConfig,
+    read_reference_view_rows,
+    run_local_batch,
+)
+from recidiviz.common.constants.person_characteristics import Gender, Race
+from recidiviz.common.constants.state.state_sentence import StateSentenceStatus
+from recidiviz.common.constants.state.state_supervision import StateSupervisionType
+from recidiviz.common.constants.state.state_supervision_period import (
+    StateSupervisionPeriodAdmissionReason,
+    StateSupervisionPeriodStatus,
+    StateSupervisionPeriodSupervisionType,
+    StateSupervisionPeriodTerminationReason,
+)
+from recidiviz.persistence.database.base_schema import StateBase
+from recidiviz.persistence.database.schema.state import schema
+from recidiviz.persistence.database.session_factory import SessionFactory
+from recidiviz.tools.postgres import local_postgres_helpers
+
+_STATE_CODE = "US_XX"
+
+
+def _write_ndjson(path: str, rows: List[Dict[str, Any]]) -> None:
+    with open(path, "w") as f:
+        for row in rows:
+            f.write(json.dumps(row) + "\n")
+
+
+def _read_ndjson(path: str) -> List[Dict[str, Any]]:
+    with open(path, "r") as f:
+        return [json.loads(line) for line in f]
+
+
+def _schema_person_on_supervision(person_id: int) -> schema.StatePerson:
+    supervision_period = schema.StateSupervisionPeriod(
+        state_code=_STATE_CODE,
+        county_code="124",
+        admission_reason=StateSupervisionPeriodAdmissionReason.COURT_SENTENCE.value,
+        start_date=date(2015, 3, 14),
+        termination_reason=StateSupervisionPeriodTerminationReason.DISCHARGE.value,
+        termination_date=date(2016, 12, 29),
+        supervision_type=StateSupervisionPeriodSupervisionType.PROBATION.value,
+        status=StateSupervisionPeriodStatus.PRESENT_WITHOUT_INFO.value,
+        person_id=person_id,
+    )
+    supervision_sentence = schema.StateSupervisionSentence(
+        state_code=_STATE_CODE,
+        supervision_type=StateSupervisionType.PROBATION.value,
+        start_date=date(2015, 3, 1),
+        projected_completion_date=date(2016, 12, 31),
+        completion_date=date(2016, 12, 29),
+        status=StateSentenceStatus.COMPLETED.value,
+        supervision_periods=[supervision_period],
+        person_id=person_id,
+    )
+    return schema.StatePerson(
+        person_id=person_id,
+        state_code=_STATE_CODE,
+        gender=Gender.MALE.value,
+        birthdate=date(1970, 1, 1),
+        races=[
+            schema.StatePersonRace(
+                state_code=_STATE_CODE, race=Race.BLACK.value, person_id=person_id
+            )
+        ],
+        sentence_groups=[
+            schema.StateSentenceGroup(
+                state_code=_STATE_CODE,
+                status=StateSentenceStatus.COMPLETED.value,
+                supervision_sentences=[supervision_sentence],
+                person_id=person_id,
+            )
+        ],
+    )
+
+
+@pytest.mark.uses_db
+class TestRunLocalBatch(unittest.TestCase):
+    """Tests running the supervision pipeline on a local Postgres snapshot."""
+
+    # Stores the location of the postgres DB for this test run
+    temp_db_dir: Optional[str]
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.temp_db_dir = local_postgres_helpers.start_on_disk_postgresql_database()
+
+    def setUp(self) -> None:
+        local_postgres_helpers.use_on_disk_postgresql_database(StateBase)
+
+        session = SessionFactory.for_schema_base(StateBase)
+        session.add_all(
+            [_schema_person_on_supervision(1), _schema_person_on_supervision(2)]
+        )
+        session.commit()
+        session.close()
+
+        self.reference_view_dir = tempfile.mkdtemp()
+        self.output_dir = tempfile.mkdtemp()
+        _write_ndjson(
+            os.path.join(
+                self.reference_view_dir, "state_race_ethnicity_population_counts.json"
+            ),
+            [
+                {
+                    "state_code": _STATE_CODE,
+                    "race_or_ethnicity": "BLACK",
+                    "population_count": 1,
+                    "representation_priority": 1,
+                }
+            ],
+        )
+
+    def tearDown(self) -> None:
+        local_postgres_helpers.teardown_on_disk_postgresql_database(StateBase)
+        shutil.rmtree(self.reference_view_dir)
+        shutil.rmtree(self.output_dir)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        local_postgres_helpers.stop_and_clear_on_disk_postgresql_database(
+            cls.temp_db_dir
+        )
+
+    def _config(self, **kwargs: Any) -> LocalBatchRunConfig:
+        return LocalBatchRunConfig(
+            pipeline="supervision",
+            state_code=_STATE_CODE,
+            database_url=local_postgres_helpers.on_disk_postgres_db_url(),
+            reference_view_dir=self.reference_view_dir,
+            output_dir=self.output_dir,
+            **kwargs,
+        )
+
+    def _read_output(self) -> Dict[str, List[Dict[str, Any]]]:
+        output = {}
+        for file_name in os.listdir(self.output_dir):
+            rows = _read_ndjson(os.path.join(self.output_dir, file_name))
+            for row in rows:
+                # The job id depends on the time of the run
+                row.pop("job_id")
+            output[file_name] = sorted(rows, key=json.dumps)
+        return output
+
+    def test_run_local_batch(self) -> None:
+        counts = run_local_batch(self._config())
+
+        output = self._read_output()
+        self.assertEqual({f"{table}.json" for table in counts}, set(output.keys()))
+        for table, count in counts.items():
+            self.assertEqual(count, len(output[f"{table}.json"]))
+
+        for table in [
+            "supervision_population_metrics",
+            "supervision_start_metrics",
+            "supervision_termination_metrics",
+            "supervision_success_metrics",
+        ]:
+            self.assertIn(table, counts)
+
+        person_ids = {row["person_id"] for rows in output.values() for row in rows}
+        self.assertEqual({1, 2}, person_ids)
+        for rows in output.values():
+            for row in rows:
+                self.assertEqual(_STATE_CODE, row["state_code"])
+                self.assertEqual("BLACK", row["prioritized_race_or_ethnicity"])
+
+    def test_run_local_batch_multiprocessing_matchesSingleProcess(self) -> None:
+        run_local_batch(self._config())
+        single_process_output = self._read_output()
+
+        run_local_batch(self._config(num_processes=2, person_batch_size=1))
+        multiprocess_output = self._read_output()
+
+        self.assertEqual(single_process_output, multiprocess_output)
+
+    def test_run_local_batch_metricTypesAndPersonFilter(self) -> None:
+        counts = run_local_batch(
+            self._config(
+                metric_types={"SUPERVISION_POPULATION"}, person_id_filter_set={2}
+            )
+        )
+
+        self.assertEqual(["supervision_population_metrics"], list(counts.keys()))
+        output = self._read_output()
+        self.assertEqual(
+            {2},
+            {row["person_id"] for row in output["supervision_population_metrics.json"]},
+        )
+
+
+class TestReadReferenceViewRows(unittest.TestCase):
+    """Tests for read_reference_view_rows."""
+
+    def setUp(self) -> None:
+        self.reference_view_dir = tempfile.mkdtemp()
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.reference_view_dir)
+
+    def test_read_reference_view_rows(self) -> None:
+        _write_ndjson(
+            os.path.join(self.reference_view_dir, "view.json"),
+            [
+                {"state_code": _STATE_CODE, "person_id": 1},
+                {"state_code": "US_YY", "person_id": 2},
+            ],
+        )
+
+        self.assertEqual(
+            [{"state_code": _STATE_CODE, "person_id": 1}],
+            read_reference_view_rows(self.reference_view_dir, "view", _STATE_CODE),
+        )
+
+    def test_read_reference_view_rows_missingFile(self) -> None:
+        self.assertEqual(
+            [], read_reference_view_rows(self.reference_view_dir, "view", _STATE_CODE)
+        )
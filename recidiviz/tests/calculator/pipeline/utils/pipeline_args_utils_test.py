@@ -36,6 +36,7 @@ class TestPipelineArgsUtils(unittest.TestCase):
         output="dataflow_metrics",
         metric_types={"ALL"},
         person_filter_ids=None,
+        hydrated_snapshot_root=None,
         reference_view_input="reference_views",
         static_reference_input="static_reference_tables",
         state_code=None,
@@ -156,6 +157,7 @@ class TestPipelineArgsUtils(unittest.TestCase):
             output="dataflow_metrics_2",
             metric_types={"ALL"},
             person_filter_ids=None,
+            hydrated_snapshot_root=None,
             reference_view_input="reference_views_2",
             static_reference_input="static_reference_2",
             state_code=None,
@@ -0,0 +1,129 @@
+# Recidiviz - a data platform for criminal justice reform
+# Copyright (C) 2021 Recidiviz, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# =============================================================================
+"""Tests for utils/slotted_entities.py."""
+import pickle
+import unittest
+from datetime import date
+from typing import Tuple
+
+import attr
+
+from recidiviz.calculator.pipeline.utils import state_entity_coder
+from recidiviz.calculator.pipeline.utils.slotted_entities import (
+    all_slotted_entity_classes,
+    slotted_entity_class,
+)
+from recidiviz.common.constants.state.state_incarceration_period import (
+    StateIncarcerationPeriodAdmissionReason,
+    StateIncarcerationPeriodStatus,
+)
+from recidiviz.persistence.entity.entity_utils import get_all_entity_classes_in_module
+from recidiviz.persistence.entity.state import entities
+
+
+class TestSlottedEntities(unittest.TestCase):
+    """Tests the slotted variants of the state entity classes."""
+
+    def setUp(self) -> None:
+        self.slotted_person_class = slotted_entity_class(entities.StatePerson)
+        self.slotted_period_class = slotted_entity_class(
+            entities.StateIncarcerationPeriod
+        )
+
+    def _build_periods(
+        self,
+    ) -> Tuple[entities.StateIncarcerationPeriod, entities.StateIncarcerationPeriod]:
+        period_args = {
+            "state_code": "US_XX",
+            "incarceration_period_id": 123,
+            "status": StateIncarcerationPeriodStatus.IN_CUSTODY,
+            "admission_date": date(2008, 11, 20),
+            "admission_reason": StateIncarcerationPeriodAdmissionReason.NEW_ADMISSION,
+        }
+        return (
+            entities.StateIncarcerationPeriod.new_with_defaults(**period_args),
+            self.slotted_period_class.new_with_defaults(**period_args),
+        )
+
+    def test_all_entity_classes_have_variants(self) -> None:
+        entity_classes = get_all_entity_classes_in_module(entities)
+
+        self.assertEqual(len(entity_classes), len(all_slotted_entity_classes()))
+        for entity_class in entity_classes:
+            slotted_class = slotted_entity_class(entity_class)
+            self.assertEqual(
+                [a.name for a in attr.fields(entity_class)],
+                [a.name for a in attr.fields(slotted_class)],
+            )
+
+    def test_slotted_instance(self) -> None:
+        period, slotted_period = self._build_periods()
+
+        self.assertFalse(hasattr(slotted_period, "__dict__"))
+        self.assertIsInstance(slotted_period, entities.StateIncarcerationPeriod)
+        self.assertIs(entities.StateIncarcerationPeriod, slotted_period.__class__)
+        self.assertEqual(period, slotted_period)
+        self.assertEqual(slotted_period, period)
+        self.assertEqual(period.get_id(), slotted_period.get_id())
+        self.assertEqual(period.duration, slotted_period.duration)
+
+        slotted_period.release_date = date(2009, 1, 1)
+        self.assertNotEqual(period, slotted_period)
+
+    def test_validators(self) -> None:
+        with self.assertRaises(TypeError):
+            self.slotted_period_class.new_with_defaults(
+                state_code="US_XX",
+                status=StateIncarcerationPeriodStatus.IN_CUSTODY,
+                admission_date="2008-11-20",
+            )
+
+    def test_build_from_dictionary(self) -> None:
+        person = self.slotted_person_class.build_from_dictionary(
+            {"state_code": "US_XX", "person_id": 1, "full_name": "Name"}
+        )
+
+        self.assertEqual(self.slotted_person_class, type(person))
+        self.assertEqual(
+            entities.StatePerson.new_with_defaults(
+                state_code="US_XX", person_id=1, full_name="Name"
+            ),
+            person,
+        )
+        self.assertEqual([], person.races)
+
+    def test_pickle(self) -> None:
+        _, slotted_period = self._build_periods()
+        slotted_period.person = self.slotted_person_class.new_with_defaults(
+            state_code="US_XX"
+        )
+
+        unpickled = pickle.loads(pickle.dumps(slotted_period))
+
+        self.assertEqual(self.slotted_period_class, type(unpickled))
+        self.assertEqual(self.slotted_person_class, type(unpickled.person))
+        self.assertEqual(slotted_period, unpickled)
+
+    def test_state_entity_coder(self) -> None:
+        _, slotted_period = self._build_periods()
+
+        decoded = state_entity_coder.decode_entity_graph(
+            state_entity_coder.encode_entity_graph(slotted_period)
+        )
+
+        self.assertEqual(self.slotted_period_class, type(decoded))
+        self.assertEqual(slotted_period, decoded)
@@ -0,0 +1,171 @@
+# Recidiviz - a data platform for criminal justice reform
+# Copyright (C) 2021 Recidiviz, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# =============================================================================
+"""Tests for utils/state_entity_coder.py."""
+import unittest
+from datetime import date
+from typing import Any
+
+import apache_beam as beam
+import attr
+
+from recidiviz.calculator.pipeline.utils import state_entity_coder
+from recidiviz.calculator.pipeline.utils.state_utils.us_mo.us_mo_sentence_classification import (
+    UsMoSupervisionSentence,
+)
+from recidiviz.common.constants.person_characteristics import Gender
+from recidiviz.common.constants.state.state_incarceration_period import (
+    StateIncarcerationPeriodAdmissionReason,
+    StateIncarcerationPeriodStatus,
+)
+from recidiviz.common.constants.state.state_sentence import StateSentenceStatus
+from recidiviz.persistence.entity.state import entities
+from recidiviz.tests.persistence.entity.state.entities_test_utils import (
+    generate_full_graph_state_person,
+)
+
+
+class TestEncodeEntityGraph(unittest.TestCase):
+    """Tests encode_entity_graph and decode_entity_graph."""
+
+    def test_round_trip_full_graph(self) -> None:
+        for set_back_edges in (True, False):
+            person = generate_full_graph_state_person(set_back_edges=set_back_edges)
+
+            encoded = state_entity_coder.encode_entity_graph(person)
+            decoded = state_entity_coder.decode_entity_graph(encoded)
+
+            self.assertEqual(person, decoded)
+            # Encoding is deterministic
+            self.assertEqual(encoded, state_entity_coder.encode_entity_graph(decoded))
+
+    def test_round_trip_preserves_shared_references(self) -> None:
+        person = entities.StatePerson.new_with_defaults(
+            state_code="US_XX", person_id=1, full_name="Jösé Ñuñez" * 20
+        )
+        incarceration_period = entities.StateIncarcerationPeriod.new_with_defaults(
+            state_code="US_XX",
+            incarceration_period_id=-5,
+            status=StateIncarcerationPeriodStatus.IN_CUSTODY,
+            admission_date=date(2008, 11, 20),
+            admission_reason=StateIncarcerationPeriodAdmissionReason.NEW_ADMISSION,
+            person=person,
+        )
+        sentence = entities.StateIncarcerationSentence.new_with_defaults(
+            state_code="US_XX",
+            status=StateSentenceStatus.SERVING,
+            incarceration_periods=[incarceration_period],
+            person=person,
+        )
+        incarceration_period.incarceration_sentences = [sentence]
+
+        decoded = state_entity_coder.decode_entity_graph(
+            state_entity_coder.encode_entity_graph(incarceration_period)
+        )
+
+        self.assertEqual(incarceration_period, decoded)
+        self.assertEqual(-5, decoded.incarceration_period_id)
+        self.assertIs(decoded.person, decoded.incarceration_sentences[0].person)
+        self.assertIs(
+            decoded, decoded.incarceration_sentences[0].incarceration_periods[0]
+        )
+        self.assertIs(
+            StateIncarcerationPeriodAdmissionReason.NEW_ADMISSION,
+            decoded.admission_reason,
+        )
+        self.assertEqual([], decoded.person.races)
+
+    def test_encode_invalid_field_value(self) -> None:
+        person = entities.StatePerson.new_with_defaults(state_code="US_XX")
+        person.birthdate = "1970-01-01"
+
+        with self.assertRaises(ValueError):
+            state_entity_coder.encode_entity_graph(person)
+
+    def test_decode_other_schema_fingerprint(self) -> None:
+        person = entities.StatePerson.new_with_defaults(state_code="US_XX")
+        encoded = state_entity_coder.encode_entity_graph(person)
+        fingerprint = bytes.fromhex(state_entity_coder.ENTITY_SCHEMA_FINGERPRINT)
+        self.assertTrue(encoded.startswith(fingerprint))
+
+        with self.assertRaises(ValueError):
+            state_entity_coder.decode_entity_graph(
+                bytes(len(fingerprint)) + encoded[len(fingerprint) :]
+            )
+
+    def test_schema_fingerprint_changes_with_fields(self) -> None:
+        # pylint: disable=protected-access
+        class_plans = list(state_entity_coder._CLASS_PLANS)
+        fingerprint = state_entity_coder._schema_fingerprint(class_plans)
+        self.assertEqual(
+            state_entity_coder.ENTITY_SCHEMA_FINGERPRINT, fingerprint.hex()
+        )
+
+        class_plans[0] = attr.evolve(
+            class_plans[0], field_names=tuple(reversed(class_plans[0].field_names))
+        )
+        self.assertNotEqual(
+            fingerprint, state_entity_coder._schema_fingerprint(class_plans)
+        )
+
+
+class TestStateEntityCoder(unittest.TestCase):
+    """Tests the coders registered by state_entity_coder."""
+
+    def test_registered_coders(self) -> None:
+        self.assertIsInstance(
+            beam.coders.registry.get_coder(entities.StatePerson),
+            state_entity_coder.StateEntityCoder,
+        )
+        self.assertIsInstance(
+            beam.coders.registry.get_coder(Any),
+            state_entity_coder.StateEntityFastPrimitivesCoder,
+        )
+
+    def test_nested_entities(self) -> None:
+        coder = beam.coders.registry.get_coder(Any)
+        person = generate_full_graph_state_person(set_back_edges=True)
+        value = (123, {"person": [person], "metadata": [None, 1.5, "US_XX"]})
+
+        encoded = coder.encode(value)
+
+        self.assertEqual(value, coder.decode(encoded))
+        self.assertLess(
+            len(encoded), len(beam.coders.FastPrimitivesCoder().encode(value))
+        )
+
+    def test_pickles_other_values(self) -> None:
+        coder = state_entity_coder.StateEntityCoder()
+        person = entities.StatePerson.new_with_defaults(
+            state_code="US_MO", gender=Gender.FEMALE
+        )
+        sentence = UsMoSupervisionSentence.from_supervision_sentence(
+            entities.StateSupervisionSentence.new_with_defaults(
+                state_code="US_MO", status=StateSentenceStatus.SERVING, person=person
+            ),
+            sentence_statuses_raw=[],
+        )
+        person.sentence_groups = [
+            entities.StateSentenceGroup.new_with_defaults(
+                state_code="US_MO",
+                status=StateSentenceStatus.SERVING,
+                supervision_sentences=[sentence],
+                person=person,
+            )
+        ]
+
+        for value in (person, sentence, {"not": "an entity"}):
+            self.assertEqual(value, coder.decode(coder.encode(value)))
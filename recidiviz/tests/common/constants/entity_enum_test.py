@@ -121,3 +121,44 @@ class EntityEnumTest(unittest.TestCase):
 
         with self.assertRaises(EnumParsingError):
             FakeEntityEnum.parse("A STRING TO PARSE", overrides)
+
+    def testParse_CachesResultsPerOverrides(self):
+        mapper_calls = []
+
+        def banana_mapper(raw_text: str) -> Optional[FakeEntityEnum]:
+            mapper_calls.append(raw_text)
+            return FakeEntityEnum.BANANA if raw_text == "BAN" else None
+
+        overrides_builder = EnumOverrides.Builder()
+        overrides_builder.add_mapper(banana_mapper, FakeEntityEnum)
+        overrides_builder.ignore("IGNORED", FakeEntityEnum)
+        overrides = overrides_builder.build()
+
+        for _ in range(3):
+            self.assertEqual(
+                FakeEntityEnum.BANANA, FakeEntityEnum.parse("ban", overrides)
+            )
+            self.assertEqual(
+                FakeEntityEnum.STRAWBERRY, FakeEntityEnum.parse("strawberry", overrides)
+            )
+            self.assertIsNone(FakeEntityEnum.parse("ignored", overrides))
+
+        self.assertEqual(["BAN", "BAN", "STRAWBERRY"], mapper_calls)
+        self.assertEqual(3, overrides.parse_cache.misses)
+        self.assertEqual(6, overrides.parse_cache.hits)
+
+        # A different overrides instance does not share results
+        other_overrides = overrides.to_builder().build()
+        self.assertEqual(
+            FakeEntityEnum.BANANA, FakeEntityEnum.parse("ban", other_overrides)
+        )
+        self.assertEqual(1, other_overrides.parse_cache.misses)
+        self.assertEqual(0, other_overrides.parse_cache.hits)
+
+    def testParse_InvalidString_NotCached(self):
+        overrides = EnumOverrides.empty()
+        for _ in range(2):
+            with self.assertRaises(EnumParsingError):
+                FakeEntityEnum.parse("invalid", overrides)
+        self.assertEqual(0, overrides.parse_cache.hits)
+        self.assertEqual(0, overrides.parse_cache.misses)
@@ -18,7 +18,9 @@
 import datetime
 from json.decoder import JSONDecodeError
 from unittest import TestCase
+from unittest.mock import MagicMock, patch
 
+import dateparser
 import pytest
 
 from recidiviz.common.str_field_utils import (
@@ -33,6 +35,7 @@ from recidiviz.common.str_field_utils import (
     safe_parse_date_from_date_pieces,
     normalize_flat_json,
     safe_parse_days_from_duration_str,
+    is_yyyymmdd_date,
 )
 
 
@@ -165,6 +168,67 @@ class TestStrFieldUtils(TestCase):
             "1y 1m 1d", from_dt=datetime.datetime(2000, 1, 1)
         ) == datetime.datetime(year=1998, month=11, day=30)
 
+    def test_parseDateTime_relative_notMemoized(self) -> None:
+        assert parse_datetime(
+            "1y 1m 1d", from_dt=datetime.datetime(2001, 1, 1)
+        ) == datetime.datetime(year=1999, month=11, day=30)
+        assert parse_datetime(
+            "1y 1m 1d", from_dt=datetime.datetime(2000, 1, 1)
+        ) == datetime.datetime(year=1998, month=11, day=30)
+
+    def test_parseDateTime_knownFormats_matchDateparser(self) -> None:
+        date_strings = [
+            "2016-05-14",
+            "2016-5-4",
+            "05/14/2016",
+            "5/4/2016",
+            "01/02/0500",
+            "2016-05-14 13:04:05",
+            "2016-05-14 13:04:05.123456",
+            "2016-05-14T13:04:05",
+            "2016-05-14 13:04",
+            "05/14/2016 13:04:05",
+            "05/14/2016 13:04",
+            "05/14/2016 01:04:05 PM",
+            "5/14/2016 1:04 am",
+            "12/31/2020 12:00 AM",
+            "05-14-2016",
+            "2016/05/14",
+        ]
+        for date_string in date_strings:
+            self.assertEqual(
+                dateparser.parse(
+                    date_string,
+                    languages=["en"],
+                    settings={"PREFER_DAY_OF_MONTH": "first"},
+                ),
+                parse_datetime(date_string),
+                date_string,
+            )
+
+    @patch("recidiviz.common.str_field_utils.dateparser.parse")
+    def test_parseDateTime_knownFormats_skipDateparser(
+        self, mock_parse: MagicMock
+    ) -> None:
+        assert parse_datetime("03/15/2020") == datetime.datetime(2020, 3, 15)
+        assert parse_datetime("2020-03-15 10:11:12") == datetime.datetime(
+            2020, 3, 15, 10, 11, 12
+        )
+        assert parse_date("03/15/2020") == datetime.date(2020, 3, 15)
+        # Same string, served from the cache
+        assert parse_datetime("03/15/2020") == datetime.datetime(2020, 3, 15)
+        mock_parse.assert_not_called()
+
+    def test_parseDateTime_knownFormat_invalidDate(self) -> None:
+        with pytest.raises(ValueError):
+            parse_datetime("02/30/2020")
+
+    def test_isYyyymmddDate(self) -> None:
+        assert is_yyyymmdd_date("20200315")
+        assert is_yyyymmdd_date("2020315")
+        assert not is_yyyymmdd_date("2020-03-15")
+        assert not is_yyyymmdd_date("20201315")
+
     def test_parseDateTime_zero(self) -> None:
         assert parse_datetime("0") is None
 
@@ -19,7 +19,10 @@ import unittest
 from typing import List, Any
 from unittest import mock
 
+import attr
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 from google.cloud import bigquery
 from mock import create_autospec, call, patch
 from more_itertools import one
@@ -34,6 +37,7 @@ from recidiviz.ingest.direct.controllers.direct_ingest_gcs_file_system import (
 from recidiviz.ingest.direct.controllers.direct_ingest_raw_file_import_manager import (
     DirectIngestRawFileImportManager,
     DirectIngestRegionRawFileConfig,
+    RawDataStagingFileFormat,
     RawTableColumnInfo,
 )
 from recidiviz.ingest.direct.controllers.gcsfs_direct_ingest_utils import (
@@ -165,6 +169,23 @@ class DirectIngestRegionRawFileConfigTest(unittest.TestCase):
         self.assertEqual("ISO-8859-1", config_4.encoding)
         self.assertEqual("|", config_4.separator)
 
+    def test_parse_staging_file_format(self) -> None:
+        region_config = DirectIngestRegionRawFileConfig(
+            region_code="us_xx",
+            yaml_config_file_dir=fixtures.as_filepath("us_xx"),
+        )
+        self.assertEqual(
+            RawDataStagingFileFormat.CSV, region_config.staging_file_format
+        )
+
+        region_config = DirectIngestRegionRawFileConfig(
+            region_code="us_ww",
+            yaml_config_file_dir=fixtures.as_filepath("us_ww"),
+        )
+        self.assertEqual(
+            RawDataStagingFileFormat.PARQUET, region_config.staging_file_format
+        )
+
     def test_missing_configs_for_region(self) -> None:
         with self.assertRaises(ValueError) as e:
             region_config = DirectIngestRegionRawFileConfig(
@@ -206,6 +227,8 @@ class DirectIngestRawFileImportManagerTest(unittest.TestCase):
 
         self.mock_big_query_client = create_autospec(BigQueryClient)
         self.num_lines_uploaded = 0
+        self.uploaded_parquet_schemas: List[pa.Schema] = []
+        self.uploaded_parquet_dfs: List[pd.DataFrame] = []
 
         self.mock_big_query_client.insert_into_table_from_cloud_storage_async.side_effect = (
             self.mock_import_raw_file_to_big_query
@@ -243,13 +266,20 @@ class DirectIngestRawFileImportManagerTest(unittest.TestCase):
         *,
         source_uri: str,
         destination_table_schema: List[bigquery.SchemaField],
+        source_format: str = bigquery.SourceFormat.CSV,
         **_kwargs: Any,
     ) -> mock.MagicMock:
         col_names = [schema_field.name for schema_field in destination_table_schema]
         temp_path = GcsfsFilePath.from_absolute_path(source_uri)
         local_temp_path = self.fs.gcs_file_system.real_absolute_path_for_path(temp_path)
 
-        df = pd.read_csv(local_temp_path, header=None, dtype=str)
+        if source_format == bigquery.SourceFormat.PARQUET:
+            parquet_file = pq.ParquetFile(local_temp_path)
+            self.uploaded_parquet_schemas.append(parquet_file.schema_arrow)
+            df = parquet_file.read().to_pandas()
+            self.uploaded_parquet_dfs.append(df)
+        else:
+            df = pd.read_csv(local_temp_path, header=None, dtype=str)
         for value in df.values:
             for cell in value:
                 if isinstance(cell, str):
@@ -400,6 +430,7 @@ class DirectIngestRawFileImportManagerTest(unittest.TestCase):
                 bigquery.SchemaField("file_id", "INTEGER", "REQUIRED"),
                 bigquery.SchemaField("update_datetime", "DATETIME", "REQUIRED"),
             ],
+            source_format=bigquery.SourceFormat.CSV,
         )
         self.assertEqual(2, self.num_lines_uploaded)
         self._check_no_temp_files_remain()
@@ -437,6 +468,7 @@ class DirectIngestRawFileImportManagerTest(unittest.TestCase):
                 bigquery.SchemaField("file_id", "INTEGER", "REQUIRED"),
                 bigquery.SchemaField("update_datetime", "DATETIME", "REQUIRED"),
             ],
+            source_format=bigquery.SourceFormat.CSV,
         )
         self.assertEqual(5, self.num_lines_uploaded)
         self._check_no_temp_files_remain()
@@ -475,6 +507,7 @@ class DirectIngestRawFileImportManagerTest(unittest.TestCase):
                     bigquery.SchemaField("file_id", "INTEGER", "REQUIRED"),
                     bigquery.SchemaField("update_datetime", "DATETIME", "REQUIRED"),
                 ],
+                source_format=bigquery.SourceFormat.CSV,
             )
             for uploaded_path in self.fs.gcs_file_system.uploaded_paths
         ]
@@ -522,6 +555,7 @@ class DirectIngestRawFileImportManagerTest(unittest.TestCase):
                     bigquery.SchemaField("file_id", "INTEGER", "REQUIRED"),
                     bigquery.SchemaField("update_datetime", "DATETIME", "REQUIRED"),
                 ],
+                source_format=bigquery.SourceFormat.CSV,
             )
             for uploaded_path in self.fs.gcs_file_system.uploaded_paths
         ]
@@ -535,6 +569,87 @@ class DirectIngestRawFileImportManagerTest(unittest.TestCase):
         self.assertEqual(5, self.num_lines_uploaded)
         self._check_no_temp_files_remain()
 
+    def test_import_bq_file_parquet_staging_format(self) -> None:
+        self.import_manager = DirectIngestRawFileImportManager(
+            region=self.test_region,
+            fs=self.fs,
+            ingest_directory_path=self.ingest_directory_path,
+            temp_output_directory_path=self.temp_output_path,
+            region_raw_file_config=attr.evolve(
+                self.region_raw_file_config,
+                staging_file_format=RawDataStagingFileFormat.PARQUET,
+            ),
+            big_query_client=self.mock_big_query_client,
+            upload_chunk_size=2,
+        )
+        self.import_manager.csv_reader = _TestSafeGcsCsvReader(self.fs.gcs_file_system)
+
+        file_path = path_for_fixture_file_in_test_gcs_directory(
+            directory=self.ingest_directory_path,
+            filename="tagPipeSeparatedNonUTF8.txt",
+            should_normalize=True,
+            file_type=GcsfsDirectIngestFileType.RAW_DATA,
+        )
+
+        fixture_util.add_direct_ingest_path(self.fs.gcs_file_system, file_path)
+
+        self.import_manager.import_raw_file_to_big_query(
+            file_path, self._metadata_for_unprocessed_file_path(file_path)
+        )
+
+        self.assertEqual(3, len(self.fs.gcs_file_system.uploaded_paths))
+        for uploaded_path in self.fs.gcs_file_system.uploaded_paths:
+            self.assertTrue(uploaded_path.file_name.endswith(".parquet"))
+
+        expected_insert_calls = [
+            call(
+                source_uri=uploaded_path.uri(),
+                destination_dataset_ref=bigquery.DatasetReference(
+                    self.project_id, "us_xx_raw_data"
+                ),
+                destination_table_id="tagPipeSeparatedNonUTF8",
+                destination_table_schema=[
+                    bigquery.SchemaField("PRIMARY_COL1", "STRING", "NULLABLE"),
+                    bigquery.SchemaField("COL2", "STRING", "NULLABLE"),
+                    bigquery.SchemaField("COL3", "STRING", "NULLABLE"),
+                    bigquery.SchemaField("COL4", "STRING", "NULLABLE"),
+                    bigquery.SchemaField("file_id", "INTEGER", "REQUIRED"),
+                    bigquery.SchemaField("update_datetime", "DATETIME", "REQUIRED"),
+                ],
+                source_format=bigquery.SourceFormat.PARQUET,
+            )
+            for uploaded_path in self.fs.gcs_file_system.uploaded_paths
+        ]
+        self.mock_big_query_client.insert_into_table_from_cloud_storage_async.assert_has_calls(
+            expected_insert_calls, any_order=True
+        )
+        self.assertEqual(5, self.num_lines_uploaded)
+
+        expected_schema = pa.schema(
+            [
+                pa.field("PRIMARY_COL1", pa.string()),
+                pa.field("COL2", pa.string()),
+                pa.field("COL3", pa.string()),
+                pa.field("COL4", pa.string()),
+                pa.field("file_id", pa.int64(), nullable=False),
+                pa.field("update_datetime", pa.timestamp("us"), nullable=False),
+            ]
+        )
+        for schema in self.uploaded_parquet_schemas:
+            self.assertTrue(expected_schema.equals(schema))
+
+        df = pd.concat(self.uploaded_parquet_dfs).sort_values("PRIMARY_COL1")
+        self.assertEqual(
+            ["1000", "1001", "1002", "1003", "1004"], list(df["PRIMARY_COL1"])
+        )
+        # Empty values are written as nulls, as they would be when loaded from CSV
+        self.assertEqual(
+            [None, "Y", "N", None, "Y"],
+            [None if pd.isnull(v) else v for v in df["COL4"]],
+        )
+        self.assertEqual({123}, set(df["file_id"]))
+        self._check_no_temp_files_remain()
+
     def test_import_bq_file_with_raw_file_invalid_column_chars(self) -> None:
         file_path = path_for_fixture_file_in_test_gcs_directory(
             directory=self.ingest_directory_path,
@@ -566,6 +681,7 @@ class DirectIngestRawFileImportManagerTest(unittest.TestCase):
                 bigquery.SchemaField("file_id", "INTEGER", "REQUIRED"),
                 bigquery.SchemaField("update_datetime", "DATETIME", "REQUIRED"),
             ],
+            source_format=bigquery.SourceFormat.CSV,
         )
         self.assertEqual(1, self.num_lines_uploaded)
         self._check_no_temp_files_remain()
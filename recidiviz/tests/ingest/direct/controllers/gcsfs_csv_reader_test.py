@@ -16,8 +16,10 @@
 # =============================================================================
 """Tests for the GcsfsCsvReader."""
 
+import csv
+import os
 import unittest
-from typing import IO, List, Optional
+from typing import IO, Any, List, Optional
 
 import gcsfs
 import pandas as pd
@@ -28,6 +30,9 @@ from recidiviz.ingest.direct.controllers.gcsfs_csv_reader import (
     GcsfsCsvReaderDelegate,
     COMMON_RAW_FILE_ENCODINGS,
 )
+from recidiviz.ingest.direct.controllers.gcsfs_csv_reader_delegates import (
+    ReadOneGcsfsCsvReaderDelegate,
+)
 from recidiviz.cloud_storage.gcsfs_path import GcsfsFilePath
 from recidiviz.tests.ingest import fixtures
 
@@ -63,18 +68,27 @@ class _TestGcsfsCsvReaderDelegate(GcsfsCsvReaderDelegate):
         self.successful_encoding = encoding
 
 
+def _local_path_for_uri(path_str: str) -> str:
+    if not path_str.startswith("gs://"):
+        raise ValueError(f"Expected gs:// path URI, got this instead: {path_str}")
+
+    # Convert to local absolute path
+    return "/" + path_str[len("gs://") :]
+
+
 def _fake_gcsfs_open(
     path_str: str,
     *,
-    encoding: str,
+    mode: str = "r",
+    encoding: Optional[str] = None,
     # pylint: disable=unused-argument
     token: str,
 ) -> IO:
-    if not path_str.startswith("gs://"):
-        raise ValueError(f"Expected gs:// path URI, got this instead: {path_str}")
+    return open(_local_path_for_uri(path_str), mode, encoding=encoding)
 
-    # Convert to local absolute path
-    return open("/" + path_str[len("gs://") :], encoding=encoding)
+
+def _fake_gcsfs_size(path_str: str) -> int:
+    return os.path.getsize(_local_path_for_uri(path_str))
 
 
 class GcsfsCsvReaderTest(unittest.TestCase):
@@ -84,6 +98,7 @@ class GcsfsCsvReaderTest(unittest.TestCase):
 
         self.mock_gcsfs = create_autospec(gcsfs.GCSFileSystem)
         self.mock_gcsfs.open = _fake_gcsfs_open
+        self.mock_gcsfs.size = _fake_gcsfs_size
         self.reader = GcsfsCsvReader(self.mock_gcsfs)
 
     def _validate_empty_file_result(
@@ -240,3 +255,146 @@ class GcsfsCsvReaderTest(unittest.TestCase):
         self.assertEqual({"UTF-8"}, {encoding for encoding, df in delegate.dataframes})
         self.assertEqual(0, delegate.decode_errors)
         self.assertEqual(1, delegate.exceptions)
+
+    def _assert_parallel_read_matches_serial_read(
+        self,
+        file_path: str,
+        chunk_size: int,
+        min_range_size_bytes: int,
+        **kwargs: Any,
+    ) -> _TestGcsfsCsvReaderDelegate:
+        serial_delegate = _TestGcsfsCsvReaderDelegate()
+        self.reader.streaming_read(
+            GcsfsFilePath.from_absolute_path(file_path),
+            delegate=serial_delegate,
+            chunk_size=chunk_size,
+            **kwargs,
+        )
+
+        parallel_delegate = _TestGcsfsCsvReaderDelegate()
+        self.reader.parallel_streaming_read(
+            GcsfsFilePath.from_absolute_path(file_path),
+            delegate=parallel_delegate,
+            chunk_size=chunk_size,
+            max_workers=3,
+            min_range_size_bytes=min_range_size_bytes,
+            **kwargs,
+        )
+
+        self.assertEqual(
+            serial_delegate.successful_encoding, parallel_delegate.successful_encoding
+        )
+        self.assertEqual(
+            len(serial_delegate.dataframes), len(parallel_delegate.dataframes)
+        )
+        for (serial_encoding, serial_df), (parallel_encoding, parallel_df) in zip(
+            serial_delegate.dataframes, parallel_delegate.dataframes
+        ):
+            self.assertEqual(serial_encoding, parallel_encoding)
+            pd.testing.assert_frame_equal(serial_df, parallel_df)
+        return parallel_delegate
+
+    def test_parallel_read_quoted_fields(self) -> None:
+        file_path = fixtures.as_filepath("quoted_fields.csv")
+        for chunk_size in (1, 7, 60, 1000):
+            for min_range_size_bytes in (10, 100, 1000):
+                delegate = self._assert_parallel_read_matches_serial_read(
+                    file_path, chunk_size, min_range_size_bytes
+                )
+                self.assertEqual(60, sum(df.shape[0] for _, df in delegate.dataframes))
+                self.assertEqual(["UTF-8"], delegate.encodings_attempted)
+
+    def test_parallel_read_raw_data_import_args(self) -> None:
+        file_path = fixtures.as_filepath("quoted_fields.csv")
+        columns = ["id", "notes"]
+        self._assert_parallel_read_matches_serial_read(
+            file_path,
+            chunk_size=25,
+            min_range_size_bytes=100,
+            index_col=False,
+            header=None,
+            skiprows=1,
+            usecols=columns,
+            names=columns,
+            keep_default_na=False,
+        )
+
+    def test_parallel_read_inferred_header_with_usecols(self) -> None:
+        file_path = fixtures.as_filepath("quoted_fields.csv")
+        self._assert_parallel_read_matches_serial_read(
+            file_path,
+            chunk_size=25,
+            min_range_size_bytes=100,
+            usecols=["name", "amount"],
+        )
+
+    def test_parallel_read_ignore_quotes(self) -> None:
+        file_path = fixtures.as_filepath("encoded_utf_8.csv")
+        self._assert_parallel_read_matches_serial_read(
+            file_path, chunk_size=1, min_range_size_bytes=10, quoting=csv.QUOTE_NONE
+        )
+
+    def test_parallel_read_with_failure_first(self) -> None:
+        file_path = fixtures.as_filepath("encoded_latin_1.csv")
+        delegate = self._assert_parallel_read_matches_serial_read(
+            file_path, chunk_size=1, min_range_size_bytes=10
+        )
+
+        self.assertEqual(["UTF-8", "ISO-8859-1"], delegate.encodings_attempted)
+        self.assertEqual("ISO-8859-1", delegate.successful_encoding)
+        self.assertEqual(4, len(delegate.dataframes))
+        self.assertEqual(1, delegate.decode_errors)
+        self.assertEqual(0, delegate.exceptions)
+
+    def test_parallel_read_file_with_columns_no_contents(self) -> None:
+        file_path = fixtures.as_filepath("tagB.csv")
+        delegate = self._assert_parallel_read_matches_serial_read(
+            file_path, chunk_size=10, min_range_size_bytes=10
+        )
+        self.assertEqual(1, len(delegate.dataframes))
+
+    def test_parallel_read_stops_early(self) -> None:
+        file_path = fixtures.as_filepath("quoted_fields.csv")
+        delegate = ReadOneGcsfsCsvReaderDelegate()
+        self.reader.parallel_streaming_read(
+            GcsfsFilePath.from_absolute_path(file_path),
+            delegate=delegate,
+            chunk_size=5,
+            min_range_size_bytes=100,
+        )
+        self.assertIsNotNone(delegate.df)
+        self.assertEqual(5, delegate.df.shape[0])  # type: ignore[union-attr]
+
+    def test_parallel_read_stops_early_notifies_success(self) -> None:
+        class _StopAfterFirstChunkDelegate(_TestGcsfsCsvReaderDelegate):
+            def on_dataframe(
+                self, encoding: str, chunk_num: int, df: pd.DataFrame
+            ) -> bool:
+                super().on_dataframe(encoding, chunk_num, df)
+                return False
+
+        file_path = fixtures.as_filepath("quoted_fields.csv")
+        serial_delegate = _StopAfterFirstChunkDelegate()
+        self.reader.streaming_read(
+            GcsfsFilePath.from_absolute_path(file_path),
+            delegate=serial_delegate,
+            chunk_size=5,
+        )
+        parallel_delegate = _StopAfterFirstChunkDelegate()
+        self.reader.parallel_streaming_read(
+            GcsfsFilePath.from_absolute_path(file_path),
+            delegate=parallel_delegate,
+            chunk_size=5,
+            min_range_size_bytes=100,
+        )
+
+        self.assertEqual("UTF-8", serial_delegate.successful_encoding)
+        self.assertEqual("UTF-8", parallel_delegate.successful_encoding)
+        self.assertEqual(1, len(parallel_delegate.dataframes))
+
+    def test_parallel_read_unsupported_args_reads_serially(self) -> None:
+        file_path = fixtures.as_filepath("quoted_fields.csv")
+        delegate = self._assert_parallel_read_matches_serial_read(
+            file_path, chunk_size=10, min_range_size_bytes=100, nrows=25
+        )
+        self.assertEqual(25, sum(df.shape[0] for _, df in delegate.dataframes))
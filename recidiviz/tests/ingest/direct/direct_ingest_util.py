@@ -20,7 +20,7 @@ import os
 import time
 import unittest
 from types import ModuleType
-from typing import List, Optional, Dict, Type, TextIO, Any
+from typing import List, Optional, Dict, Type, TextIO, Any, BinaryIO
 
 import attr
 import gcsfs
@@ -102,6 +102,12 @@ class _TestSafeGcsCsvReader(GcsfsCsvReader):
             path_str = self.fs.real_absolute_path_for_path(path)
         return open(path_str, encoding=encoding)
 
+    def _binary_file_pointer_for_path(self, path: GcsfsFilePath) -> BinaryIO:
+        return open(self.fs.real_absolute_path_for_path(path), "rb")
+
+    def _file_size_for_path(self, path: GcsfsFilePath) -> int:
+        return os.path.getsize(self.fs.real_absolute_path_for_path(path))
+
 
 class DirectIngestFakeGCSFileSystemDelegate(FakeGCSFileSystemDelegate):
     def __init__(self, controller: GcsfsDirectIngestController, can_start_ingest: bool):
@@ -158,7 +158,7 @@ class FakeDirectIngestBigQueryClient(BigQueryClient):
         self,
         query_job: bigquery.QueryJob,
         page_size: int,
-        process_fn: Callable[[bigquery.table.Row], None],
+        process_fn: Callable[[List[bigquery.table.Row]], None],
     ) -> None:
         raise ValueError("Must be implemented for use in tests.")
 
@@ -198,6 +198,7 @@ class FakeDirectIngestBigQueryClient(BigQueryClient):
         destination_dataset_ref: bigquery.DatasetReference,
         destination_table_id: str,
         destination_table_schema: List[bigquery.SchemaField],
+        source_format: str = bigquery.SourceFormat.CSV,
     ) -> bigquery.job.LoadJob:
         raise ValueError("Must be implemented for use in tests.")
 
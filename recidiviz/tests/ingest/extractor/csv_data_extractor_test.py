@@ -20,11 +20,16 @@ import csv
 import os
 import unittest
 from typing import Callable
+from unittest import mock
 
+from recidiviz.common.ingest_metadata import SystemLevel
 from recidiviz.ingest.extractor.csv_data_extractor import (
     CsvDataExtractor,
     IngestFieldCoordinates,
+    _ColumnPlan,
+    _iter_row_batches,
 )
+from recidiviz.ingest.models.ingest_info import IngestInfo
 from recidiviz.tests.ingest import fixtures
 
 
@@ -192,15 +197,126 @@ class CsvDataExtractorTest(unittest.TestCase):
         self.assertIsNotNone(ingest_info)
         self.assertFalse(ingest_info)
 
+    def test_column_plans(self):
+        extractor = _instantiate_extractor("multiple_entity_types_in_row_csv.yaml")
+
+        self.assertEqual(
+            _ColumnPlan(
+                lookup_key="incarceration_sentence.parole_eligibility_date",
+                class_name="incarceration_sentence",
+                field_name="parole_eligibility_date",
+                is_child_column=False,
+            ),
+            extractor._column_plans["PAROLE_DATE"],
+        )
+        self.assertEqual(
+            _ColumnPlan(
+                lookup_key=None,
+                class_name=None,
+                field_name=None,
+                is_child_column=False,
+            ),
+            extractor._column_plans["OFFENDER_BOOK_ID"],
+        )
+
+    def test_parse_file_unmapped_key(self):
+        extractor = _instantiate_extractor("multiple_entity_types_in_row_csv.yaml")
+        content = fixtures.as_string(
+            "testdata/data_extractor/csv", "standard_child_file.csv"
+        )
+        with self.assertRaises(ValueError) as e:
+            extractor.extract_and_populate_data(content)
+        self.assertEqual("Unmapped key: [ROOT_OFFENDER_ID]", str(e.exception))
+
+    def test_parse_file_with_child_keys(self):
+        extractor = _instantiate_extractor(
+            "state_person_with_children_csv.yaml", system_level=SystemLevel.STATE
+        )
+        content = fixtures.as_string(
+            "testdata/data_extractor/csv", "state_person_with_children.csv"
+        )
+
+        ingest_info = extractor.extract_and_populate_data(content)
+
+        expected_info = IngestInfo()
+        person_1 = expected_info.create_state_person(
+            state_person_id="1", surname="SMITH"
+        )
+        person_1.create_state_person_race(race="WHITE")
+        person_1.create_state_alias(full_name="JOHNNY SMITH")
+        person_1.create_state_alias(full_name="JOHN SMITH")
+        sentence_group_1 = person_1.create_state_sentence_group(status="ACTIVE")
+        sentence_group_1.create_state_incarceration_sentence(status="SERVING")
+        sentence_group_1.create_state_incarceration_sentence(status="COMPLETED")
+        person_2 = expected_info.create_state_person(
+            state_person_id="2", surname="JONES"
+        )
+        person_2.create_state_person_race(race="BLACK")
+        person_3 = expected_info.create_state_person(state_person_id="3", surname="DOE")
+        sentence_group_3 = person_3.create_state_sentence_group(status="COMPLETED")
+        sentence_group_3.create_state_incarceration_sentence(status="COMPLETED")
+
+        self.assertEqual(expected_info, ingest_info)
+
+    def test_parse_file_independent_of_row_batch_size(self):
+        content = fixtures.as_string(
+            "testdata/data_extractor/csv", "state_person_with_children.csv"
+        )
+        ingest_info = _instantiate_extractor(
+            "state_person_with_children_csv.yaml", system_level=SystemLevel.STATE
+        ).extract_and_populate_data(content)
+
+        with mock.patch(
+            "recidiviz.ingest.extractor.csv_data_extractor._ROW_BATCH_SIZE", 1
+        ):
+            ingest_info_single_row_batches = _instantiate_extractor(
+                "state_person_with_children_csv.yaml", system_level=SystemLevel.STATE
+            ).extract_and_populate_data(content)
+
+        self.assertEqual(3, len(ingest_info.state_people))
+        self.assertEqual(ingest_info, ingest_info_single_row_batches)
+
+    def test_iter_row_batches_matches_dict_reader(self):
+        content = [
+            " COL_A ,COL_B,COL_C",
+            "1,2,3",
+            "",
+            "4,5",
+            '6,"7,8",9',
+        ]
+
+        row_batches = list(_iter_row_batches(csv.reader(content), batch_size=2))
+
+        # Batches are counted in lines read, so blank lines leave batches short
+        self.assertEqual([1, 2], [len(batch) for batch in row_batches])
+        expected_rows = [
+            {key.strip(): value for key, value in row.items()}
+            for row in csv.DictReader(content)
+        ]
+        self.assertEqual(expected_rows, [row for batch in row_batches for row in batch])
+
+    def test_iter_row_batches_too_many_values(self):
+        content = ["COL_A,COL_B", "1,2,3"]
+
+        with self.assertRaises(ValueError):
+            list(_iter_row_batches(csv.reader(content), batch_size=10))
+
+    def test_iter_row_batches_empty(self):
+        self.assertEqual([], list(_iter_row_batches(csv.reader([]), batch_size=10)))
+
 
 def _instantiate_extractor(
-    yaml_filename: str, primary_key_override: Callable = None
+    yaml_filename: str,
+    primary_key_override: Callable = None,
+    system_level: SystemLevel = SystemLevel.COUNTY,
 ) -> CsvDataExtractor:
     yaml_path = os.path.join(
         os.path.dirname(__file__), "../testdata/data_extractor/yaml", yaml_filename
     )
     return CsvDataExtractor(
-        yaml_path, primary_key_override_callback=primary_key_override
+        yaml_path,
+        primary_key_override_callback=primary_key_override,
+        system_level=system_level,
     )
 
 
@@ -471,3 +471,109 @@ class TestBaseScraper(TestCase):
             scrape_key=scrape_key,
         )
         self.assertEqual(len(scraper.tasks), 0)
+
+    @patch.object(BaseScraper, "_fetch_response")
+    @patch.object(BaseScraper, "_fetch_content")
+    @patch.object(BaseScraper, "get_more_tasks")
+    def test_prefetch_next_tasks(self, mock_get_more, mock_fetch, mock_fetch_response):
+        json_task = Task.evolve(TEST_TASK, response_type=constants.ResponseType.JSON)
+        mock_get_more.return_value = [TEST_TASK, json_task, TEST_TASK]
+        mock_fetch.return_value = (TEST_HTML, None)
+
+        def fetch_response(_endpoint, cookies=None, **_kwargs):
+            cookies.update({"session": "abc"})
+            return Mock(text=TEST_HTML)
+
+        mock_fetch_response.side_effect = fetch_response
+        start_time = datetime.datetime.now()
+        req = QueueRequest(
+            scrape_type=constants.ScrapeType.BACKGROUND,
+            next_task=TEST_TASK,
+            scraper_start_time=start_time,
+        )
+
+        scraper = FakeScraper("test_prefetch")
+        scraper.region.queue = None
+        scraper.BATCH_WRITES = False
+        scraper.PREFETCH_TASK_COUNT = 1
+        scraper._generic_scrape(req)
+
+        expected_tasks = [
+            QueueRequest(
+                scrape_type=constants.ScrapeType.BACKGROUND,
+                next_task=Task.evolve(
+                    TEST_TASK, content=TEST_HTML, cookies={"session": "abc"}
+                ),
+                scraper_start_time=start_time,
+            ),
+            QueueRequest(
+                scrape_type=constants.ScrapeType.BACKGROUND,
+                next_task=json_task,
+                scraper_start_time=start_time,
+            ),
+            QueueRequest(
+                scrape_type=constants.ScrapeType.BACKGROUND,
+                next_task=TEST_TASK,
+                scraper_start_time=start_time,
+            ),
+        ]
+        self.assertEqual(expected_tasks, scraper.tasks)
+        self.assertEqual(1, mock_fetch_response.call_count)
+
+    @patch.object(BaseScraper, "_fetch_response")
+    @patch.object(BaseScraper, "_fetch_content")
+    @patch.object(BaseScraper, "get_more_tasks")
+    def test_prefetch_failure_leaves_task_unchanged(
+        self, mock_get_more, mock_fetch, mock_fetch_response
+    ):
+        mock_get_more.return_value = [TEST_TASK]
+        mock_fetch.return_value = (TEST_HTML, None)
+        mock_fetch_response.side_effect = ValueError("TEST ERROR")
+        start_time = datetime.datetime.now()
+        req = QueueRequest(
+            scrape_type=constants.ScrapeType.BACKGROUND,
+            next_task=TEST_TASK,
+            scraper_start_time=start_time,
+        )
+
+        scraper = FakeScraper("test_prefetch_failure")
+        scraper.region.queue = None
+        scraper.BATCH_WRITES = False
+        scraper.PREFETCH_TASK_COUNT = 2
+        scraper._generic_scrape(req)
+
+        expected_tasks = [
+            QueueRequest(
+                scrape_type=constants.ScrapeType.BACKGROUND,
+                next_task=TEST_TASK,
+                scraper_start_time=start_time,
+            )
+        ]
+        self.assertEqual(expected_tasks, scraper.tasks)
+
+    @patch.object(BaseScraper, "_fetch_content")
+    @patch.object(BaseScraper, "get_more_tasks")
+    def test_prefetched_content_passes_on_cookies(self, mock_get_more, mock_fetch):
+        mock_get_more.return_value = [TEST_TASK]
+        start_time = datetime.datetime.now()
+        req = QueueRequest(
+            scrape_type=constants.ScrapeType.BACKGROUND,
+            next_task=Task.evolve(
+                TEST_TASK, content=TEST_HTML, cookies={"session": "abc"}
+            ),
+            scraper_start_time=start_time,
+        )
+
+        scraper = FakeScraper("test")
+        scraper.BATCH_WRITES = False
+        scraper._generic_scrape(req)
+
+        expected_tasks = [
+            QueueRequest(
+                scrape_type=constants.ScrapeType.BACKGROUND,
+                next_task=Task.evolve(TEST_TASK, cookies={"session": "abc"}),
+                scraper_start_time=start_time,
+            )
+        ]
+        self.assertEqual(expected_tasks, scraper.tasks)
+        mock_fetch.assert_not_called()
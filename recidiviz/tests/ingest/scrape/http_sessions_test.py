@@ -0,0 +1,143 @@
+# Recidiviz - a data platform for criminal justice reform
+# Copyright (C) 2021 Recidiviz, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# =============================================================================
+"""Tests for http_sessions.py."""
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from mock import patch
+
+from recidiviz.ingest.scrape import http_sessions
+
+
+class _CookieHandler(BaseHTTPRequestHandler):
+    """Sets a cookie and echoes back any cookies sent with the request."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:  # pylint: disable=invalid-name
+        body = (self.headers.get("Cookie") or "").encode()
+        self.send_response(200)
+        self.send_header("Set-Cookie", "session=abc")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_args: object) -> None:
+        pass
+
+
+class TestGetSession(unittest.TestCase):
+    """Tests for get_session."""
+
+    def tearDown(self) -> None:
+        http_sessions.close_sessions()
+
+    def test_session_per_region(self) -> None:
+        session = http_sessions.get_session("us_xx")
+
+        self.assertIs(session, http_sessions.get_session("us_xx"))
+        self.assertIsNot(session, http_sessions.get_session("us_yy"))
+
+    @patch("recidiviz.utils.secrets.get_secret")
+    @patch("recidiviz.utils.environment.in_gcp")
+    def test_proxies_per_region(self, mock_in_gcp, mock_secret) -> None:
+        mock_in_gcp.return_value = True
+        test_secrets = {
+            "proxy_url": "proxy.net/",
+            "proxy_user": "real_user",
+            "proxy_password": "real_password",
+        }
+        mock_secret.side_effect = test_secrets.get
+
+        proxies = http_sessions.get_proxies("us_xx")
+
+        self.assertIsNotNone(proxies)
+        self.assertEqual(proxies, http_sessions.get_proxies("us_xx"))
+        self.assertNotEqual(proxies, http_sessions.get_proxies("us_yy"))
+
+        http_sessions.close_sessions()
+        self.assertNotEqual(proxies, http_sessions.get_proxies("us_xx"))
+
+    @patch("recidiviz.utils.secrets.get_secret")
+    @patch("recidiviz.utils.environment.in_gcp")
+    def test_proxy_connections_reused(self, mock_in_gcp, mock_secret) -> None:
+        mock_in_gcp.return_value = True
+        test_secrets = {
+            "proxy_url": "proxy.net/",
+            "proxy_user": "real_user",
+            "proxy_password": "real_password",
+        }
+        mock_secret.side_effect = test_secrets.get
+        adapter = http_sessions.get_session("us_xx").get_adapter("http://a.gov")
+
+        for _ in range(3):
+            adapter.proxy_manager_for(http_sessions.get_proxies("us_xx")["http"])
+
+        self.assertEqual(1, len(adapter.proxy_manager))
+
+    def test_response_cookies_not_stored(self) -> None:
+        server = ThreadingHTTPServer(("localhost", 0), _CookieHandler)
+        # Connections are kept alive, so don't wait on their handlers to exit
+        server.daemon_threads = True
+        thread = threading.Thread(target=server.serve_forever)
+        thread.start()
+        try:
+            url = f"http://localhost:{server.server_port}/"
+            session = http_sessions.get_session("us_xx")
+
+            response = session.get(url, cookies={"foo": "bar"})
+            self.assertEqual("foo=bar", response.text)
+            self.assertEqual({"session": "abc"}, response.cookies.get_dict())
+
+            response = session.get(url)
+            self.assertEqual("", response.text)
+            self.assertEqual({}, session.cookies.get_dict())
+        finally:
+            http_sessions.close_sessions()
+            server.shutdown()
+            server.server_close()
+            thread.join()
+
+
+class TestHostRateLimiter(unittest.TestCase):
+    """Tests for HostRateLimiter."""
+
+    @patch("time.sleep")
+    @patch("time.monotonic")
+    def test_wait(self, mock_monotonic, mock_sleep) -> None:
+        mock_monotonic.return_value = 100.0
+        rate_limiter = http_sessions.HostRateLimiter(min_interval_seconds=10)
+
+        rate_limiter.wait("http://a.gov/page1")
+        mock_sleep.assert_not_called()
+
+        # Another host is not limited
+        rate_limiter.wait("http://b.gov/page1")
+        mock_sleep.assert_not_called()
+
+        rate_limiter.wait("http://a.gov/page2")
+        mock_sleep.assert_called_with(10.0)
+
+        mock_monotonic.return_value = 105.0
+        rate_limiter.wait("http://a.gov/page3")
+        mock_sleep.assert_called_with(15.0)
+
+        mock_monotonic.return_value = 200.0
+        mock_sleep.reset_mock()
+        rate_limiter.wait("http://a.gov/page4")
+        mock_sleep.assert_not_called()
@@ -26,8 +26,10 @@ from recidiviz.ingest.models.scrape_key import ScrapeKey
 from recidiviz.ingest.scrape import constants, scrape_phase, scraper_control, sessions
 from recidiviz.ingest.scrape.base_scraper import BaseScraper
 from recidiviz.persistence import batch_persistence
+from recidiviz.server_blueprint_registry import LAZY_BLUEPRINTS
 from recidiviz.tests.utils.fake_region import fake_region
 from recidiviz.tests.utils.thread_pool import SerialExecutor
+from recidiviz.utils.lazy_blueprints import LazyBlueprintLoader
 
 
 def create_test_client():
@@ -420,6 +422,51 @@ class TestScraperStop(unittest.TestCase):
             any_order=True,
         )
 
+    @patch("recidiviz.utils.regions.get_supported_scrape_region_codes")
+    @patch("recidiviz.utils.regions.get_region")
+    @patch("recidiviz.ingest.scrape.scraper_control.ScraperCloudTaskManager")
+    @patch("recidiviz.ingest.scrape.sessions.update_phase")
+    @patch("recidiviz.ingest.scrape.sessions.close_session")
+    @patch("recidiviz.ingest.scrape.sessions.get_current_session")
+    def test_stop_lazily_loaded_app(
+        self,
+        mock_get_session,
+        mock_sessions,
+        mock_phase,
+        mock_task_manager,
+        mock_region,
+        mock_supported,
+    ):
+        """Tests that the next phase url can be built on a fresh server app,
+        before any request has been made under the /batch prefix."""
+        app = Flask(__name__)
+        LazyBlueprintLoader(app, LAZY_BLUEPRINTS)
+        app.config["TESTING"] = True
+        client = app.test_client()
+
+        session = sessions.ScrapeSession.new(
+            key=None,
+            region="us_xx",
+            scrape_type=constants.ScrapeType.BACKGROUND,
+            phase=scrape_phase.ScrapePhase.SCRAPE,
+        )
+        mock_get_session.return_value = session
+        mock_sessions.return_value = [session]
+        mock_region.return_value = fake_region(ingestor=create_autospec(BaseScraper))
+        mock_supported.return_value = ["us_ut"]
+
+        request_args = {"region": "us_ut", "scrape_type": "background"}
+        headers = {"X-Appengine-Cron": "test-cron"}
+        response = client.get(
+            "/scraper/stop", query_string=request_args, headers=headers
+        )
+        assert response.status_code == 200
+
+        mock_phase.assert_called_with(session, scrape_phase.ScrapePhase.PERSIST)
+        mock_task_manager.return_value.create_scraper_phase_task.assert_called_with(
+            region_code="us_ut", url="/batch/read_and_persist"
+        )
+
     @patch("recidiviz.utils.regions.get_supported_scrape_region_codes")
     @patch("recidiviz.utils.regions.get_region")
     @patch("recidiviz.ingest.scrape.scraper_control.ScraperCloudTaskManager")
@@ -25,7 +25,7 @@ import requests
 from mock import patch
 
 from recidiviz.ingest.models.scrape_key import ScrapeKey
-from recidiviz.ingest.scrape import constants, scrape_phase
+from recidiviz.ingest.scrape import constants, http_sessions, scrape_phase
 from recidiviz.ingest.scrape.constants import BATCH_PUBSUB_TYPE
 from recidiviz.ingest.scrape.scraper import FetchPageError, Scraper
 from recidiviz.ingest.scrape.sessions import ScrapeSession
@@ -436,6 +436,7 @@ class TestFetchPage(unittest.TestCase):
 
     def tearDown(self) -> None:
         self.task_manager_patcher.stop()
+        http_sessions.close_sessions()
 
     @patch("recidiviz.ingest.scrape.scraper_utils.get_headers")
     @patch("recidiviz.ingest.scrape.scraper_utils.get_proxies")
@@ -457,9 +458,9 @@ class TestFetchPage(unittest.TestCase):
         response = requests.Response()
         response._content = page  # pylint: disable=protected-access
         response.status_code = 200
-        with patch("requests.get", return_value=response):
+        with patch("requests.Session.get", return_value=response):
             assert scraper.fetch_page(url).content == page
-            requests.get.assert_called_with(
+            requests.Session.get.assert_called_with(
                 url,
                 proxies=proxies,
                 headers=headers,
@@ -472,7 +473,7 @@ class TestFetchPage(unittest.TestCase):
         mock_proxies.assert_called_with()
         mock_headers.assert_called_with()
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     @patch("recidiviz.ingest.scrape.scraper_utils.get_headers")
     @patch("recidiviz.ingest.scrape.scraper_utils.get_proxies")
     @patch("recidiviz.utils.regions.get_region")
@@ -516,7 +517,7 @@ class TestFetchPage(unittest.TestCase):
             verify=False,
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     @patch("recidiviz.ingest.scrape.scraper_utils.get_headers")
     @patch("recidiviz.ingest.scrape.scraper_utils.get_proxies")
     @patch("recidiviz.utils.regions.get_region")
@@ -17,13 +17,14 @@
 
 """Tests for optimized_metric_big_query_view_exporter.py."""
 
+import gzip
+import io
 import unittest
-from typing import Dict, Set, List, Callable
+from typing import Dict, List, Callable
 
 from google.cloud import bigquery
 
-import pytest
-from mock import call, create_autospec, patch
+from mock import create_autospec, patch
 
 from recidiviz.big_query.big_query_client import BigQueryClient
 from recidiviz.big_query.export.export_query_config import ExportBigQueryViewConfig
@@ -136,255 +137,6 @@ _DATA_VALUES = [
 ]
 
 
-class PlaceInCompactMatrixTest(unittest.TestCase):
-    """Tests for place_in_compact_matrix"""
-
-    @staticmethod
-    def _create_new_data_values():
-        return [[], [], [], [], []]
-
-    def test_place_happy_path_single_value(self):
-        fresh_data_values = self._create_new_data_values()
-        optimized_metric_big_query_view_exporter.place_in_compact_matrix(
-            _DATA_POINTS[3],
-            fresh_data_values,
-            _VALUE_KEYS,
-            _DIMENSION_MANIFEST,
-        )
-        self.assertEqual([[1], [0], [1], [0], [41]], fresh_data_values)
-
-        optimized_metric_big_query_view_exporter.place_in_compact_matrix(
-            _DATA_POINTS[8],
-            fresh_data_values,
-            _VALUE_KEYS,
-            _DIMENSION_MANIFEST,
-        )
-        self.assertEqual([[1, 1], [0, 1], [1, 1], [0, 0], [41, 38]], fresh_data_values)
-
-    def test_place_each_data_point_single_value(self):
-        fresh_data_values = self._create_new_data_values()
-        for data_point in _DATA_POINTS:
-            optimized_metric_big_query_view_exporter.place_in_compact_matrix(
-                data_point,
-                fresh_data_values,
-                _VALUE_KEYS,
-                _DIMENSION_MANIFEST,
-            )
-
-        self.assertEqual(_DATA_VALUES, fresh_data_values)
-
-    def test_place_each_data_point_multi_value(self):
-        multi_data_points = [{**dp, "total_population": 100} for dp in _DATA_POINTS]
-        multi_value_keys = ["total_population", "total_revocations"]
-
-        expected = [
-            [0, 0, 1, 1, 2, 0, 0, 1, 1, 2, 2],
-            [0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1],
-            [0, 1, 0, 1, 0, 0, 1, 0, 1, 0, 1],
-            [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-            [100, 100, 100, 100, 100, 100, 100, 100, 100, 100, 100],
-            [100, 68, 73, 41, 10, 30, 36, 51, 38, 15, 4],
-        ]
-
-        fresh_data_values = self._create_new_data_values()
-        fresh_data_values.append([])  # Add one more for this test case
-        for data_point in multi_data_points:
-            optimized_metric_big_query_view_exporter.place_in_compact_matrix(
-                data_point,
-                fresh_data_values,
-                multi_value_keys,
-                _DIMENSION_MANIFEST,
-            )
-
-        self.assertEqual(expected, fresh_data_values)
-
-    def test_place_value_not_in_dataset(self):
-        fresh_data_values = self._create_new_data_values()
-        new_data_point = {
-            "district": "6",
-            "year": 2020,
-            "month": 11,
-            "supervision_type": "PROBATION",
-            "other_value": 5,
-        }
-        optimized_metric_big_query_view_exporter.place_in_compact_matrix(
-            new_data_point,
-            fresh_data_values,
-            _VALUE_KEYS,
-            _DIMENSION_MANIFEST,
-        )
-        self.assertEqual([[2], [0], [1], [0], [0]], fresh_data_values)
-
-    def test_place_dimensions_not_in_dataset(self):
-        fresh_data_values = self._create_new_data_values()
-        with pytest.raises(KeyError) as e:
-            new_data_point = {
-                "district": "4",
-                "year": 2020,
-                "month": 5,
-                "supervision_type": "PAROLE",
-                "total_revocations": 10,
-            }
-            optimized_metric_big_query_view_exporter.place_in_compact_matrix(
-                new_data_point,
-                fresh_data_values,
-                _VALUE_KEYS,
-                _DIMENSION_MANIFEST,
-            )
-
-            self.assertIn("month: 5", e.message)
-
-
-class AddToManifestTest(unittest.TestCase):
-    """Tests for add_to_dimension_manifest"""
-
-    def test_add_all_new_dimensions(self):
-        data_point = _DATA_POINTS[2]
-        fresh_manifest: Dict[str, Set[str]] = {
-            "district": set(),
-            "month": set(),
-            "supervision_type": set(),
-            "year": set(),
-        }
-
-        expected = {
-            "district": {"5"},
-            "month": {"11"},
-            "supervision_type": {"parole"},
-            "year": {"2020"},
-        }
-
-        updated_manifest = (
-            optimized_metric_big_query_view_exporter.add_to_dimension_manifest(
-                data_point, fresh_manifest
-            )
-        )
-        self.assertEqual(expected, updated_manifest)
-
-    def test_add_to_existing_dimensions(self):
-        data_point = _DATA_POINTS[2]
-        existing_manifest: Dict[str, Set[str]] = {
-            "district": {"4"},
-            "month": {"11"},
-            "supervision_type": {"parole", "probation"},
-            "year": {"2020"},
-        }
-
-        expected = {
-            "district": {"4", "5"},
-            "month": {"11"},
-            "supervision_type": {"parole", "probation"},
-            "year": {"2020"},
-        }
-
-        updated_manifest = (
-            optimized_metric_big_query_view_exporter.add_to_dimension_manifest(
-                data_point, existing_manifest
-            )
-        )
-        self.assertEqual(expected, updated_manifest)
-
-    def test_add_data_point_with_empty_values(self):
-        data_point = {
-            "district": None,
-            "month": None,
-            "supervision_type": None,
-            "year": None,
-        }
-
-        existing_manifest: Dict[str, Set[str]] = {
-            "district": {"4"},
-            "month": {"11"},
-            "supervision_type": {"parole", "probation"},
-            "year": {"2020"},
-        }
-
-        expected: Dict[str, Set[str]] = {
-            "district": {"4", "none"},
-            "month": {"11", "none"},
-            "supervision_type": {"parole", "probation", "none"},
-            "year": {"2020", "none"},
-        }
-
-        updated_manifest = (
-            optimized_metric_big_query_view_exporter.add_to_dimension_manifest(
-                data_point, existing_manifest
-            )
-        )
-        self.assertEqual(expected, updated_manifest)
-
-    @staticmethod
-    def test_add_empty_data_point():
-        data_point = {}
-        existing_manifest: Dict[str, Set[str]] = {
-            "district": {"4"},
-            "month": {"11"},
-            "supervision_type": {"parole", "probation"},
-            "year": {"2020"},
-        }
-
-        with pytest.raises(KeyError):
-            optimized_metric_big_query_view_exporter.add_to_dimension_manifest(
-                data_point, existing_manifest
-            )
-
-
-class TransformManifestTest(unittest.TestCase):
-    """Tests for transform_dimension_manifest"""
-
-    def test_transform_happy_path(self):
-        dimensions_as_dictionary = {
-            "district": {"6", "5", "4"},
-            "year": {"2020"},
-            "supervision_type": {"probation", "parole"},
-            "month": {"11", "12"},
-        }
-
-        dimension_manifest = optimized_metric_big_query_view_exporter.transform_manifest_to_order_enforced_form(
-            dimensions_as_dictionary
-        )
-        self.assertEqual(_DIMENSION_MANIFEST, dimension_manifest)
-
-    def test_transform_with_other_types(self):
-        dimensions_as_dictionary = {
-            "district": {"6", "5", "4"},
-            "year": {"2020"},
-            "supervision_type": {"probation", "parole"},
-            "month": {"11", "12"},
-        }
-
-        dimension_manifest = optimized_metric_big_query_view_exporter.transform_manifest_to_order_enforced_form(
-            dimensions_as_dictionary
-        )
-        self.assertEqual(_DIMENSION_MANIFEST, dimension_manifest)
-
-    def test_transform_with_nones(self):
-        dimensions_as_dictionary = {
-            "district": {"all", "6", "5", "4"},
-            "year": {"2020"},
-            "supervision_type": {"probation", "parole", "none"},
-            "month": {"11", "12"},
-        }
-
-        expected = [
-            ("district", ["4", "5", "6", "all"]),
-            ("month", ["11", "12"]),
-            ("supervision_type", ["none", "parole", "probation"]),
-            ("year", ["2020"]),
-        ]
-
-        dimension_manifest = optimized_metric_big_query_view_exporter.transform_manifest_to_order_enforced_form(
-            dimensions_as_dictionary
-        )
-        self.assertEqual(expected, dimension_manifest)
-
-    def test_transform_empty(self):
-        dimension_manifest = optimized_metric_big_query_view_exporter.transform_manifest_to_order_enforced_form(
-            {}
-        )
-        self.assertEqual([], dimension_manifest)
-
-
 class GetRowValuesTest(unittest.TestCase):
     """Tests for get_row_values"""
 
@@ -456,21 +208,20 @@ class ConvertQueryResultsTest(unittest.TestCase):
         all_rows = _transform_dicts_to_bq_row(_DATA_POINTS)
 
         mock_query_job = create_autospec(bigquery.QueryJob)
-        mock_query_job.result.side_effect = [
-            all_rows,
-            all_rows,
-        ]
+        mock_query_job.result.side_effect = [all_rows]
 
         def fake_paged_process_fn(
             query_job: bigquery.QueryJob,
             _page_size: int,
-            process_fn: Callable[[bigquery.table.Row], None],
+            process_fn: Callable[[List[bigquery.table.Row]], None],
         ) -> None:
-            for row in query_job.result(
-                max_results=optimized_metric_big_query_view_exporter.QUERY_PAGE_SIZE,
-                start_index=0,
-            ):
-                process_fn(row)
+            process_fn(
+                list(
+                    query_job.result(
+                        page_size=optimized_metric_big_query_view_exporter.QUERY_PAGE_SIZE
+                    )
+                )
+            )
 
         mock_bq_client.paged_read_and_process.side_effect = fake_paged_process_fn
         mock_validator = create_autospec(OptimizedMetricBigQueryViewExportValidator)
@@ -504,24 +255,168 @@ class ConvertQueryResultsTest(unittest.TestCase):
 
         self.assertEqual(expected, optimized_representation)
 
-        mock_query_job.result.assert_has_calls(
-            [
-                call(
-                    max_results=optimized_metric_big_query_view_exporter.QUERY_PAGE_SIZE,
-                    start_index=0,
-                ),
-                call(
-                    max_results=optimized_metric_big_query_view_exporter.QUERY_PAGE_SIZE,
-                    start_index=0,
-                ),
-            ]
+        # The result set is only read once
+        mock_query_job.result.assert_called_once_with(
+            page_size=optimized_metric_big_query_view_exporter.QUERY_PAGE_SIZE
         )
 
-        mock_bq_client.paged_read_and_process.assert_called()
+        mock_bq_client.paged_read_and_process.assert_called_once()
         mock_bq_client.dataset_ref_for_id.assert_called()
         mock_bq_client.get_table.assert_called()
 
 
+class OptimizedMetricColumnAssemblerTest(unittest.TestCase):
+    """Tests for OptimizedMetricColumnAssembler"""
+
+    def test_build_happy_path(self):
+        assembler = (
+            optimized_metric_big_query_view_exporter.OptimizedMetricColumnAssembler(
+                ("district", "year", "month", "supervision_type"), _VALUE_KEYS
+            )
+        )
+        rows = _transform_dicts_to_bq_row(_DATA_POINTS)
+        assembler.add_rows(rows[:4])
+        assembler.add_rows(rows[4:])
+
+        expected = OptimizedMetricRepresentation(
+            value_matrix=_DATA_VALUES,
+            dimension_manifest=_DIMENSION_MANIFEST,
+            value_keys=_VALUE_KEYS,
+        )
+        self.assertEqual(expected, assembler.build())
+
+    def test_build_multi_value(self):
+        assembler = (
+            optimized_metric_big_query_view_exporter.OptimizedMetricColumnAssembler(
+                ("district", "year", "month", "supervision_type"),
+                ["total_population", "total_revocations"],
+            )
+        )
+        assembler.add_rows(
+            _transform_dicts_to_bq_row(
+                [{**dp, "total_population": 100} for dp in _DATA_POINTS]
+            )
+        )
+
+        expected = OptimizedMetricRepresentation(
+            value_matrix=[
+                [0, 0, 1, 1, 2, 0, 0, 1, 1, 2, 2],
+                [0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1],
+                [0, 1, 0, 1, 0, 0, 1, 0, 1, 0, 1],
+                [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+                [100, 100, 100, 100, 100, 100, 100, 100, 100, 100, 100],
+                [100, 68, 73, 41, 10, 30, 36, 51, 38, 15, 4],
+            ],
+            dimension_manifest=_DIMENSION_MANIFEST,
+            value_keys=["total_population", "total_revocations"],
+        )
+        self.assertEqual(expected, assembler.build())
+
+    def test_build_normalizes_dimensions_and_defaults_values(self):
+        data_points = [
+            {"district": "10", "supervision_type": None, "count": 3, "rate": 0.25},
+            {"district": "9", "supervision_type": "PAROLE", "count": None},
+            {"district": "ALL", "supervision_type": "Parole", "rate": 0.5},
+            {"district": "10", "supervision_type": "PROBATION", "count": 7},
+        ]
+        value_keys = ["count", "rate"]
+
+        assembler = (
+            optimized_metric_big_query_view_exporter.OptimizedMetricColumnAssembler(
+                ("supervision_type", "district"), value_keys
+            )
+        )
+        assembler.add_rows(_transform_dicts_to_bq_row(data_points))
+
+        expected = OptimizedMetricRepresentation(
+            value_matrix=[
+                [0, 1, 2, 0],
+                [0, 1, 1, 2],
+                [3, None, 0, 7],
+                [0.25, 0, 0.5, 0],
+            ],
+            dimension_manifest=[
+                ("district", ["10", "9", "all"]),
+                ("supervision_type", ["none", "parole", "probation"]),
+            ],
+            value_keys=value_keys,
+        )
+        self.assertEqual(expected, assembler.build())
+
+    def test_add_rows_missing_dimension(self):
+        assembler = (
+            optimized_metric_big_query_view_exporter.OptimizedMetricColumnAssembler(
+                ("district", "year", "month", "supervision_type"), _VALUE_KEYS
+            )
+        )
+
+        with self.assertRaises(KeyError):
+            assembler.add_rows(
+                _transform_dicts_to_bq_row([{"district": "4", "total_revocations": 1}])
+            )
+
+    def test_build_empty(self):
+        assembler = (
+            optimized_metric_big_query_view_exporter.OptimizedMetricColumnAssembler(
+                ("district",), _VALUE_KEYS
+            )
+        )
+
+        expected = OptimizedMetricRepresentation(
+            value_matrix=[[], []],
+            dimension_manifest=[("district", [])],
+            value_keys=_VALUE_KEYS,
+        )
+        self.assertEqual(expected, assembler.build())
+
+
+class WriteTransmissionFormatTest(unittest.TestCase):
+    """Tests for OptimizedMetricBigQueryViewExporter._write_transmission_format"""
+
+    def setUp(self) -> None:
+        self.formatted = OptimizedMetricRepresentation(
+            value_matrix=_DATA_VALUES,
+            dimension_manifest=_DIMENSION_MANIFEST,
+            value_keys=_VALUE_KEYS,
+        )
+        self.expected = ",".join(
+            str(value) for column in _DATA_VALUES for value in column
+        ).encode()
+
+    def test_write_uncompressed(self):
+        out = io.BytesIO()
+
+        # pylint: disable=protected-access
+        OptimizedMetricBigQueryViewExporter._write_transmission_format(
+            self.formatted, out
+        )
+
+        self.assertEqual(self.expected, out.getvalue())
+
+    def test_write_compressed(self):
+        out = io.BytesIO()
+
+        # pylint: disable=protected-access
+        OptimizedMetricBigQueryViewExporter._write_transmission_format(
+            self.formatted, out, should_compress=True
+        )
+
+        self.assertEqual(self.expected, gzip.decompress(out.getvalue()))
+
+    def test_write_empty(self):
+        formatted = OptimizedMetricRepresentation(
+            value_matrix=[[], []],
+            dimension_manifest=[("district", [])],
+            value_keys=_VALUE_KEYS,
+        )
+        out = io.BytesIO()
+
+        # pylint: disable=protected-access
+        OptimizedMetricBigQueryViewExporter._write_transmission_format(formatted, out)
+
+        self.assertEqual(b"", out.getvalue())
+
+
 def _transform_dicts_to_bq_row(data_points: List[Dict]) -> List[bigquery.table.Row]:
     rows: List[bigquery.table.Row] = []
     for data_point in data_points:
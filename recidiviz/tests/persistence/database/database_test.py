@@ -19,7 +19,9 @@
 import datetime
 from unittest import TestCase
 
+from mock import create_autospec, patch
 from more_itertools import one
+from sqlalchemy.orm import Session
 from sqlalchemy.sql import text
 
 from recidiviz.common.constants.bond import BondStatus
@@ -28,7 +30,7 @@ from recidiviz.common.constants.charge import ChargeStatus
 from recidiviz.common.constants.enum_overrides import EnumOverrides
 from recidiviz.common.constants.person_characteristics import Race
 from recidiviz.common.constants.county.sentence import SentenceStatus
-from recidiviz.common.ingest_metadata import IngestMetadata
+from recidiviz.common.ingest_metadata import IngestMetadata, SystemLevel
 from recidiviz.persistence.database.session_factory import SessionFactory
 from recidiviz.persistence.database.base_schema import JailsBase
 from recidiviz.persistence.database.schema.county import schema as county_schema
@@ -1551,3 +1553,38 @@ class TestDatabase(TestCase):
 
         assert_session.commit()
         assert_session.close()
+
+
+@patch(
+    "recidiviz.persistence.database.history.historical_snapshot_update.update_historical_snapshots"
+)
+class TestWritePeopleBulkHistoricalSnapshotWrites(TestCase):
+    """Tests that bulk historical snapshot writes are only used when enabled in
+    the ingest metadata."""
+
+    def testWritePeople_stateDefaultsToOrmSnapshotWrites(
+        self, mock_update_snapshots
+    ) -> None:
+        metadata = IngestMetadata(
+            region="us_xx",
+            jurisdiction_id="jid",
+            ingest_time=_INGEST_TIME,
+            system_level=SystemLevel.STATE,
+        )
+
+        database.write_people(create_autospec(Session), [], metadata)
+
+        self.assertFalse(mock_update_snapshots.call_args[1]["use_bulk_writes"])
+
+    def testWritePeople_bulkSnapshotWritesEnabled(self, mock_update_snapshots) -> None:
+        metadata = IngestMetadata(
+            region="us_xx",
+            jurisdiction_id="jid",
+            ingest_time=_INGEST_TIME,
+            system_level=SystemLevel.STATE,
+            use_bulk_historical_snapshot_writes=True,
+        )
+
+        database.write_people(create_autospec(Session), [], metadata)
+
+        self.assertTrue(mock_update_snapshots.call_args[1]["use_bulk_writes"])
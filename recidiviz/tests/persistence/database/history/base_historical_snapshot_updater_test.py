@@ -57,6 +57,7 @@ class BaseHistoricalSnapshotUpdaterTest(TestCase):
         person: SchemaPersonType,
         system_level: SystemLevel,
         ingest_time: datetime.datetime,
+        use_bulk_writes: bool = False,
     ):
         act_session = SessionFactory.for_schema_base(
             schema_base_for_system_level(system_level)
@@ -69,7 +70,13 @@ class BaseHistoricalSnapshotUpdaterTest(TestCase):
             ingest_time=ingest_time,
             system_level=system_level,
         )
-        update_historical_snapshots(act_session, [merged_person], [], metadata)
+        update_historical_snapshots(
+            act_session,
+            [merged_person],
+            [],
+            metadata,
+            use_bulk_writes=use_bulk_writes,
+        )
 
         act_session.commit()
         act_session.close()
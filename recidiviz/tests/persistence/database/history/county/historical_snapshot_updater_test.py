@@ -197,10 +197,18 @@ class TestCountyHistoricalSnapshotUpdater(BaseHistoricalSnapshotUpdaterTest):
         return person
 
     def testConvertCountyRecordTree(self):
+        self._run_convert_county_record_tree(use_bulk_writes=False)
+
+    def testConvertCountyRecordTree_bulkWrites(self):
+        self._run_convert_county_record_tree(use_bulk_writes=True)
+
+    def _run_convert_county_record_tree(self, use_bulk_writes: bool) -> None:
         person = self.generate_schema_county_person_obj_tree()
 
         ingest_time = datetime.datetime(2018, 7, 30)
-        self._commit_person(person, SystemLevel.COUNTY, ingest_time)
+        self._commit_person(
+            person, SystemLevel.COUNTY, ingest_time, use_bulk_writes=use_bulk_writes
+        )
 
         all_schema_objects = self._get_all_schema_objects_in_db(
             county_schema.Person, county_schema, _SCHEMA_OBJECT_TYPES_TO_IGNORE
@@ -59,10 +59,18 @@ class TestStateHistoricalSnapshotUpdater(BaseHistoricalSnapshotUpdaterTest):
         )
 
     def testStateRecordTreeSnapshotUpdate(self):
+        self._run_state_record_tree_snapshot_update(use_bulk_writes=False)
+
+    def testStateRecordTreeSnapshotUpdate_bulkWrites(self):
+        self._run_state_record_tree_snapshot_update(use_bulk_writes=True)
+
+    def _run_state_record_tree_snapshot_update(self, use_bulk_writes: bool) -> None:
         person = generate_schema_state_person_obj_tree()
 
         ingest_time_1 = datetime.datetime(2018, 7, 30)
-        self._commit_person(person, SystemLevel.STATE, ingest_time_1)
+        self._commit_person(
+            person, SystemLevel.STATE, ingest_time_1, use_bulk_writes=use_bulk_writes
+        )
 
         all_schema_objects = self._get_all_schema_objects_in_db(
             state_schema.StatePerson, state_schema, []
@@ -77,7 +85,9 @@ class TestStateHistoricalSnapshotUpdater(BaseHistoricalSnapshotUpdaterTest):
         person = one(update_session.query(state_schema.StatePerson).all())
         person.full_name = "new name"
         ingest_time_2 = datetime.datetime(2018, 7, 31)
-        self._commit_person(person, SystemLevel.STATE, ingest_time_2)
+        self._commit_person(
+            person, SystemLevel.STATE, ingest_time_2, use_bulk_writes=use_bulk_writes
+        )
         update_session.close()
 
         # Check that StatePerson had a new history table row written, but not
@@ -18,10 +18,12 @@
 """Tests for state/dao.py."""
 
 import datetime
-from typing import Optional
+from typing import Any, List, Optional
 from unittest import TestCase
 
 import pytest
+from more_itertools import one
+from sqlalchemy import event
 
 from recidiviz.common.constants.state import external_id_types
 from recidiviz.common.constants.state.state_sentence import StateSentenceStatus
@@ -30,6 +32,10 @@ from recidiviz.persistence.database.base_schema import StateBase
 from recidiviz.persistence.entity.state import entities
 from recidiviz.persistence.database.schema.state import dao
 from recidiviz.persistence.database.schema.state import schema
+from recidiviz.persistence.entity.entity_utils import get_all_db_objs_from_tree
+from recidiviz.tests.persistence.database.database_test_utils import (
+    generate_schema_state_person_obj_tree,
+)
 from recidiviz.tools.postgres import local_postgres_helpers
 
 _REGION = "region"
@@ -225,6 +231,50 @@ class TestDao(TestCase):
 
         self.assertCountEqual(people, expected_people)
 
+    def test_readPeopleByRootExternalIds_entireTreeHydratedOnRead(self) -> None:
+        # Arrange
+        person = generate_schema_state_person_obj_tree()
+        external_id = person.external_ids[0].external_id
+        state_code = person.external_ids[0].state_code.upper()
+        person.external_ids[0].state_code = state_code
+
+        session = SessionFactory.for_schema_base(StateBase)
+        session.add(person)
+        session.commit()
+        num_objs_in_tree = len(get_all_db_objs_from_tree(person))
+        session.close()
+
+        read_session = SessionFactory.for_schema_base(StateBase)
+        statements: List[str] = []
+
+        def _record_statement(
+            _conn: Any,
+            _cursor: Any,
+            statement: str,
+            _parameters: Any,
+            _context: Any,
+            _executemany: bool,
+        ) -> None:
+            statements.append(statement)
+
+        # Act
+        people = dao.read_people_by_cls_external_ids(
+            read_session, state_code, schema.StatePerson, [external_id]
+        )
+
+        engine = read_session.get_bind()
+        event.listen(engine, "before_cursor_execute", _record_statement)
+        try:
+            read_objs = get_all_db_objs_from_tree(one(people))
+        finally:
+            event.remove(engine, "before_cursor_execute", _record_statement)
+
+        # Assert
+        self.assertEqual(num_objs_in_tree, len(read_objs))
+        # The whole tree was hydrated by the read, so traversing it does not
+        # lazily load anything.
+        self.assertEqual([], statements)
+
     def test_readPeopleByRootExternalIds_SentenceGroupExternalId(self) -> None:
         # Arrange
         person = schema.StatePerson(person_id=1, state_code=_STATE_CODE)
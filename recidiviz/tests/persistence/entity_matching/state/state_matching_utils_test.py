@@ -43,6 +43,7 @@ from recidiviz.persistence.entity_matching.state.state_matching_utils import (
     read_persons_by_root_entity_cls,
     read_db_entity_trees_of_cls_to_merge,
     read_persons,
+    DbEntityTreeExternalIdIndex,
 )
 from recidiviz.persistence.entity.entity_utils import is_placeholder
 
@@ -258,6 +259,82 @@ class TestStateMatchingUtils(BaseStateMatchingUtilsTest):
             generate_child_entity_trees("fines", [sentence_group_tree]),
         )
 
+    def test_dbEntityTreeExternalIdIndex(self) -> None:
+        fine = schema.StateFine(state_code=_STATE_CODE, external_id=_EXTERNAL_ID)
+        fine_another = schema.StateFine(
+            state_code=_STATE_CODE, external_id=_EXTERNAL_ID_2
+        )
+        fine_same_id = schema.StateFine(
+            state_code=_STATE_CODE_ANOTHER, external_id=_EXTERNAL_ID
+        )
+        placeholder_fine = schema.StateFine(state_code=_STATE_CODE)
+        db_trees = [
+            EntityTree(entity=entity, ancestor_chain=[])
+            for entity in [fine, fine_another, placeholder_fine, fine_same_id]
+        ]
+        index = DbEntityTreeExternalIdIndex(db_trees)
+
+        ingested_fine = schema.StateFine(
+            state_code=_STATE_CODE, external_id=_EXTERNAL_ID
+        )
+        self.assertEqual(
+            [db_trees[0], db_trees[3]], index.get_match_candidates(ingested_fine)
+        )
+        ingested_fine_unknown_id = schema.StateFine(
+            state_code=_STATE_CODE, external_id=_EXTERNAL_ID_3
+        )
+        self.assertEqual([], index.get_match_candidates(ingested_fine_unknown_id))
+
+        # Entities without external ids cannot be narrowed down by the index
+        self.assertIsNone(
+            index.get_match_candidates(schema.StateFine(state_code=_STATE_CODE))
+        )
+        self.assertIsNone(
+            index.get_match_candidates(
+                schema.StatePersonAlias(state_code=_STATE_CODE, full_name="name")
+            )
+        )
+
+    def test_dbEntityTreeExternalIdIndex_multipleIdEntity(self) -> None:
+        person = schema.StatePerson(
+            state_code=_STATE_CODE,
+            external_ids=[
+                schema.StatePersonExternalId(
+                    state_code=_STATE_CODE, external_id=_EXTERNAL_ID
+                )
+            ],
+        )
+        index = DbEntityTreeExternalIdIndex(
+            [EntityTree(entity=person, ancestor_chain=[])]
+        )
+
+        self.assertIsNone(index.get_match_candidates(person))
+
+    def test_dbEntityTreeExternalIdIndex_update(self) -> None:
+        fine = schema.StateFine(state_code=_STATE_CODE, external_id=_EXTERNAL_ID)
+        fine_another = schema.StateFine(
+            state_code=_STATE_CODE, external_id=_EXTERNAL_ID_2
+        )
+        db_trees = [
+            EntityTree(entity=fine, ancestor_chain=[]),
+            EntityTree(entity=fine_another, ancestor_chain=[]),
+        ]
+        index = DbEntityTreeExternalIdIndex(db_trees)
+
+        ingested_fine = schema.StateFine(
+            state_code=_STATE_CODE, external_id=_EXTERNAL_ID_2
+        )
+        self.assertEqual([db_trees[1]], index.get_match_candidates(ingested_fine))
+
+        # Simulate merging an ingested entity onto the first DB entity that
+        # changes its external id.
+        fine.external_id = _EXTERNAL_ID_2
+        index.update([fine])
+
+        self.assertEqual(db_trees, index.get_match_candidates(ingested_fine))
+        ingested_fine.external_id = _EXTERNAL_ID
+        self.assertEqual([], index.get_match_candidates(ingested_fine))
+
     def test_addChildToEntity(self) -> None:
         fine = schema.StateFine(state_code=_STATE_CODE, fine_id=_ID)
         sentence_group = schema.StateSentenceGroup(
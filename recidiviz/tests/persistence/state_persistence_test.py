@@ -17,15 +17,19 @@
 """State tests for persistence.py."""
 
 from datetime import datetime
-from typing import Optional, Dict, List, Type
+from typing import Optional, Dict, List, Tuple, Type
 from unittest import TestCase
 
+import attr
 import pytest
 from mock import patch, Mock
+from more_itertools import one
 
 from recidiviz.common.constants.state.state_sentence import StateSentenceStatus
 from recidiviz.common.ingest_metadata import IngestMetadata, SystemLevel
+from recidiviz.ingest.models import ingest_info as ingest_info_py
 from recidiviz.ingest.models.ingest_info_pb2 import IngestInfo
+from recidiviz.ingest.scrape import ingest_utils
 from recidiviz.persistence import persistence
 from recidiviz.persistence.database.database_entity import DatabaseEntity
 from recidiviz.persistence.entity_matching.entity_matching_types import (
@@ -38,12 +42,16 @@ from recidiviz.persistence.entity_matching.state.state_entity_matcher import (
 from recidiviz.persistence.entity_matching.state.state_matching_delegate_factory import (
     StateMatchingDelegateFactory,
 )
+from recidiviz.persistence.entity_matching.state.state_matching_utils import (
+    DbEntityTreeExternalIdIndex,
+)
 from recidiviz.persistence.errors import EntityMatchingError
 from recidiviz.persistence.persistence import (
     OVERALL_THRESHOLD,
     ENTITY_MATCHING_THRESHOLD,
     ENUM_THRESHOLD,
     DATABASE_INVARIANT_THRESHOLD,
+    MAX_WRITE_SHARDS,
 )
 from recidiviz.persistence.database.session_factory import SessionFactory
 from recidiviz.persistence.database.base_schema import StateBase
@@ -78,6 +86,7 @@ SENTENCE_GROUP_ID = "SG1"
 SENTENCE_GROUP_ID_2 = "SG2"
 SENTENCE_GROUP_ID_3 = "SG3"
 SENTENCE_GROUP_ID_4 = "SG4"
+SENTENCE_GROUP_ID_5 = "SG5"
 
 STATE_ERROR_THRESHOLDS_WITH_FORTY_PERCENT_RATIOS = {
     SystemLevel.STATE: {
@@ -124,7 +133,8 @@ class _PatchedStateEntityMatcher(StateEntityMatcher):
         ingested_entity_tree: EntityTree,
         db_entity_trees: List[EntityTree],
         matched_entities_by_db_ids: Dict[int, List[DatabaseEntity]],
-        root_entity_cls: Type
+        root_entity_cls: Type,
+        db_entity_tree_index: Optional[DbEntityTreeExternalIdIndex] = None,
     ) -> IndividualMatchResult:
         if (
             isinstance(ingested_entity_tree.entity, self.erroring_class)
@@ -140,6 +150,7 @@ class _PatchedStateEntityMatcher(StateEntityMatcher):
             db_entity_trees=db_entity_trees,
             matched_entities_by_db_ids=matched_entities_by_db_ids,
             root_entity_cls=root_entity_cls,
+            db_entity_tree_index=db_entity_tree_index,
         )
 
 
@@ -450,3 +461,237 @@ class TestStatePersistence(TestCase):
             [expected_person, expected_person_2],
             converter.convert_schema_objects_to_entity(persons),
         )
+
+    def _build_two_person_ingest_info_and_db_people(
+        self,
+        sentence_group_ids: List[str],
+        sentence_group_ids_2: List[str],
+    ) -> Tuple[IngestInfo, List[schema.StatePerson]]:
+        """Builds an IngestInfo with two people, rooted at the sentence groups in |sentence_group_ids| and
+        |sentence_group_ids_2| respectively, and commits DB people holding SG1/SG2 and SG3. As long as the first person
+        has SG1 and the second person SG3, the two people land in different shards when writing with 3 shards.
+        """
+        ingest_info = IngestInfo()
+        ingest_info.state_people.add(
+            state_person_id="1_GENERATE", state_sentence_group_ids=sentence_group_ids
+        )
+        ingest_info.state_people.add(
+            state_person_id="2_GENERATE", state_sentence_group_ids=sentence_group_ids_2
+        )
+        for sentence_group_id in sentence_group_ids + sentence_group_ids_2:
+            ingest_info.state_sentence_groups.add(
+                state_sentence_group_id=sentence_group_id, county_code=COUNTY_CODE
+            )
+
+        db_person = schema.StatePerson(full_name=FULL_NAME_1, state_code=STATE_CODE)
+        db_person.sentence_groups = [
+            schema.StateSentenceGroup(
+                status=StateSentenceStatus.EXTERNAL_UNKNOWN.value,
+                external_id=SENTENCE_GROUP_ID,
+                state_code=STATE_CODE,
+            ),
+            schema.StateSentenceGroup(
+                status=StateSentenceStatus.EXTERNAL_UNKNOWN.value,
+                external_id=SENTENCE_GROUP_ID_2,
+                state_code=STATE_CODE,
+            ),
+        ]
+        db_person.external_ids = [
+            schema.StatePersonExternalId(
+                state_code=STATE_CODE,
+                external_id=EXTERNAL_ID,
+                id_type=ID_TYPE,
+            )
+        ]
+        db_person_2 = schema.StatePerson(full_name=FULL_NAME_1, state_code=STATE_CODE)
+        db_person_2.sentence_groups = [
+            schema.StateSentenceGroup(
+                status=StateSentenceStatus.EXTERNAL_UNKNOWN.value,
+                external_id=SENTENCE_GROUP_ID_3,
+                state_code=STATE_CODE,
+            )
+        ]
+        db_person_2.external_ids = [
+            schema.StatePersonExternalId(
+                state_code=STATE_CODE,
+                external_id=EXTERNAL_ID_2,
+                id_type=ID_TYPE,
+            )
+        ]
+
+        session = SessionFactory.for_schema_base(StateBase)
+        session.add(db_person)
+        session.add(db_person_2)
+        session.commit()
+        return ingest_info, [db_person, db_person_2]
+
+    @patch(
+        "recidiviz.persistence.persistence.STATE_CODE_TO_ENTITY_MATCHING_THRESHOLD_OVERRIDE",
+        STATE_CODE_TO_ENTITY_MATCHING_THRESHOLD_OVERRIDE_FAKE_PROJECT,
+    )
+    @patch(
+        "recidiviz.persistence.persistence.SYSTEM_TYPE_TO_ERROR_THRESHOLD",
+        STATE_ERROR_THRESHOLDS_WITH_FORTY_PERCENT_RATIOS,
+    )
+    @patch("recidiviz.persistence.entity_matching.entity_matching._get_matcher")
+    def test_state_writeSharded_dontPersistAboveAggregateThreshold(
+        self, mock_get_matcher
+    ):
+        # Arrange
+        # Two of four root entities error, both in the first person's shard. The second shard has no errors on its
+        # own, but must not be committed since the aggregate error ratio is above the threshold.
+        mock_get_matcher.side_effect = lambda *_: _PatchedStateEntityMatcher(
+            region_code=STATE_CODE,
+            erroring_class=schema.StateSentenceGroup,
+            erroring_external_ids=[SENTENCE_GROUP_ID, SENTENCE_GROUP_ID_2],
+        )
+        ingest_info, db_people = self._build_two_person_ingest_info_and_db_people(
+            [SENTENCE_GROUP_ID, SENTENCE_GROUP_ID_2, SENTENCE_GROUP_ID_5],
+            [SENTENCE_GROUP_ID_3],
+        )
+
+        # No updates
+        expected_people = [self.to_entity(db_person) for db_person in db_people]
+
+        # Act
+        result = persistence.write_sharded(ingest_info, DEFAULT_METADATA, num_shards=3)
+        session = SessionFactory.for_schema_base(StateBase)
+        persons = dao.read_people(session)
+
+        # Assert
+        self.assertFalse(result)
+        self.assertEqual(
+            expected_people, converter.convert_schema_objects_to_entity(persons)
+        )
+
+    @patch(
+        "recidiviz.persistence.persistence.STATE_CODE_TO_ENTITY_MATCHING_THRESHOLD_OVERRIDE",
+        STATE_CODE_TO_ENTITY_MATCHING_THRESHOLD_FORTY_PERCENT,
+    )
+    @patch(
+        "recidiviz.persistence.persistence.SYSTEM_TYPE_TO_ERROR_THRESHOLD",
+        STATE_ERROR_THRESHOLDS_WITH_FORTY_PERCENT_RATIOS,
+    )
+    @patch("recidiviz.persistence.entity_matching.entity_matching._get_matcher")
+    def test_state_writeSharded_persistsBelowAggregateThreshold(self, mock_get_matcher):
+        # Arrange
+        # One of three root entities errors. That is above the threshold within its own shard, but not in aggregate.
+        mock_get_matcher.side_effect = lambda *_: _PatchedStateEntityMatcher(
+            region_code=STATE_CODE,
+            erroring_class=schema.StateSentenceGroup,
+            erroring_external_ids=[SENTENCE_GROUP_ID],
+        )
+        ingest_info, _ = self._build_two_person_ingest_info_and_db_people(
+            [SENTENCE_GROUP_ID, SENTENCE_GROUP_ID_2], [SENTENCE_GROUP_ID_3]
+        )
+
+        # Act
+        result = persistence.write_sharded(ingest_info, DEFAULT_METADATA, num_shards=3)
+        session = SessionFactory.for_schema_base(StateBase)
+        persons = dao.read_people(session)
+
+        # Assert
+        self.assertTrue(result)
+        self.assertEqual(2, len(persons))
+        sentence_groups_by_external_id = {
+            sentence_group.external_id: sentence_group
+            for person in persons
+            for sentence_group in person.sentence_groups
+        }
+        # No county code because errors during match
+        self.assertIsNone(sentence_groups_by_external_id[SENTENCE_GROUP_ID].county_code)
+        for sentence_group_id in [SENTENCE_GROUP_ID_2, SENTENCE_GROUP_ID_3]:
+            self.assertEqual(
+                COUNTY_CODE,
+                sentence_groups_by_external_id[sentence_group_id].county_code,
+            )
+
+    def test_state_writeSharded_countySystemLevel(self) -> None:
+        with self.assertRaises(ValueError):
+            persistence.write_sharded(
+                IngestInfo(),
+                attr.evolve(DEFAULT_METADATA, system_level=SystemLevel.COUNTY),
+                num_shards=2,
+            )
+
+
+class TestShardIngestInfo(TestCase):
+    """Tests for sharding people in persistence.write_sharded."""
+
+    @staticmethod
+    def _sentence_group_ids(shard: IngestInfo) -> List[str]:
+        return sorted(
+            sentence_group.state_sentence_group_id
+            for sentence_group in shard.state_sentence_groups
+        )
+
+    def test_shardIngestInfo(self) -> None:
+        ingest_info = IngestInfo()
+        for i in range(20):
+            ingest_info.state_people.add(
+                state_person_id=f"{i}_GENERATE", state_sentence_group_ids=[f"SG{i}"]
+            )
+            ingest_info.state_sentence_groups.add(state_sentence_group_id=f"SG{i}")
+
+        shards = persistence._shard_ingest_info(ingest_info, 3)
+
+        self.assertEqual(3, len(shards))
+        self.assertEqual(20, sum(len(shard.state_people) for shard in shards))
+        self.assertCountEqual(
+            [f"SG{i}" for i in range(20)],
+            [
+                sentence_group_id
+                for shard in shards
+                for sentence_group_id in self._sentence_group_ids(shard)
+            ],
+        )
+        self.assertEqual(
+            [self._sentence_group_ids(shard) for shard in shards],
+            [
+                self._sentence_group_ids(shard)
+                for shard in persistence._shard_ingest_info(ingest_info, 3)
+            ],
+        )
+
+    def test_shardIngestInfo_sharedIds(self) -> None:
+        ingest_info_to_shard = ingest_info_py.IngestInfo()
+
+        def add_person_with_ids(
+            person_external_id: Optional[str], sentence_group_id: str
+        ) -> None:
+            person = ingest_info_to_shard.create_state_person()
+            if person_external_id:
+                person.create_state_person_external_id(
+                    state_person_external_id_id=person_external_id, id_type=ID_TYPE
+                )
+            person.create_state_sentence_group(
+                state_sentence_group_id=sentence_group_id
+            )
+
+        # People 0, 1 and 2 are connected through a shared person external id and a shared sentence group.
+        add_person_with_ids("P1", "SG1")
+        add_person_with_ids(None, "SG2")
+        add_person_with_ids("P1", "SG2")
+        for i in range(3, 30):
+            add_person_with_ids(f"P{i}", f"SG{i}")
+
+        shards = persistence._shard_ingest_info(
+            ingest_utils.convert_ingest_info_to_proto(ingest_info_to_shard),
+            MAX_WRITE_SHARDS,
+        )
+
+        shard = one(s for s in shards if "SG1" in self._sentence_group_ids(s))
+        self.assertIn("SG2", self._sentence_group_ids(shard))
+        self.assertEqual(30, sum(len(s.state_people) for s in shards))
+
+    def test_shardIngestInfo_noIds(self) -> None:
+        ingest_info = IngestInfo()
+        for i in range(3):
+            ingest_info.state_people.add(
+                state_person_id=f"{i}_GENERATE", full_name=FULL_NAME_1
+            )
+
+        shards = persistence._shard_ingest_info(ingest_info, 3)
+
+        self.assertEqual(1, len(shards))
+        self.assertEqual(3, len(shards[0].state_people))
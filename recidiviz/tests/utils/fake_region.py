@@ -39,7 +39,9 @@ def fake_region(
     are_ingest_view_exports_enabled_in_env: bool = False,
     queue: Optional[Dict[str, Any]] = None,
     shared_queue: Optional[str] = None,
-    region_module: Optional[ModuleType] = None
+    region_module: Optional[ModuleType] = None,
+    persistence_write_shards: Optional[int] = None,
+    use_bulk_historical_snapshot_writes: bool = False
 ) -> Region:
     """Fake Region Object"""
     region = create_autospec(Region)
@@ -67,6 +69,8 @@ def fake_region(
     )
     region.queue = queue
     region.shared_queue = shared_queue
+    region.persistence_write_shards = persistence_write_shards
+    region.use_bulk_historical_snapshot_writes = use_bulk_historical_snapshot_writes
     return region
 
 
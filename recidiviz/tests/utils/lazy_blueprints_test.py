@@ -0,0 +1,132 @@
+# Recidiviz - a data platform for criminal justice reform
+# Copyright (C) 2021 Recidiviz, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# =============================================================================
+"""Tests for lazy_blueprints.py."""
+import unittest
+
+from flask import Blueprint, Flask, url_for
+
+from recidiviz.utils.lazy_blueprints import LazyBlueprint, LazyBlueprintLoader
+
+first_blueprint = Blueprint("first", __name__)
+second_blueprint = Blueprint("second", __name__)
+other_blueprint = Blueprint("other", __name__)
+linking_blueprint = Blueprint("linking", __name__)
+
+
+@first_blueprint.route("/hello")
+def hello() -> str:
+    return "hello"
+
+
+@second_blueprint.route("/world")
+def world() -> str:
+    return "world"
+
+
+@other_blueprint.route("/")
+def other_root() -> str:
+    return "other"
+
+
+@linking_blueprint.route("/link")
+def link() -> str:
+    return url_for("other.other_root")
+
+
+class LazyBlueprintLoaderTest(unittest.TestCase):
+    """Tests for LazyBlueprintLoader."""
+
+    def setUp(self) -> None:
+        self.app = Flask(__name__)
+        self.loader = LazyBlueprintLoader(
+            self.app,
+            [
+                LazyBlueprint(__name__, "first_blueprint", "/greeting"),
+                LazyBlueprint(__name__, "second_blueprint", "/greeting"),
+                LazyBlueprint(__name__, "other_blueprint", "/other"),
+                LazyBlueprint(
+                    __name__, "linking_blueprint", "/linking", url_for_prefixes=["/other"]
+                ),
+            ],
+        )
+        self.client = self.app.test_client()
+
+    def _registered_blueprints(self) -> set:
+        return set(self.app.blueprints.keys())
+
+    def test_loads_blueprints_for_prefix_on_first_request(self) -> None:
+        self.assertEqual(set(), self._registered_blueprints())
+
+        response = self.client.get("/greeting/hello")
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(b"hello", response.data)
+        self.assertEqual({"first", "second"}, self._registered_blueprints())
+
+        response = self.client.get("/greeting/world")
+        self.assertEqual(b"world", response.data)
+        self.assertEqual(
+            {f"{__name__}.first_blueprint", f"{__name__}.second_blueprint"},
+            set(self.loader.import_seconds.keys()),
+        )
+
+    def test_prefix_without_path(self) -> None:
+        response = self.client.get("/other/")
+        self.assertEqual(b"other", response.data)
+        self.assertEqual({"other"}, self._registered_blueprints())
+
+    def test_unrelated_path_does_not_load(self) -> None:
+        response = self.client.get("/greetings/hello")
+        self.assertEqual(404, response.status_code)
+        self.assertEqual(set(), self._registered_blueprints())
+
+    def test_loads_url_for_prefixes(self) -> None:
+        response = self.client.get("/linking/link")
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(b"/other/", response.data)
+        self.assertEqual({"linking", "other"}, self._registered_blueprints())
+
+        response = self.client.get("/other/")
+        self.assertEqual(b"other", response.data)
+
+    def test_unknown_url_for_prefix(self) -> None:
+        with self.assertRaises(ValueError):
+            LazyBlueprintLoader(
+                Flask(__name__),
+                [
+                    LazyBlueprint(
+                        __name__, "linking_blueprint", "/linking", url_for_prefixes=["/x"]
+                    )
+                ],
+            )
+
+    def test_logs_import_time_report(self) -> None:
+        with self.assertLogs(level="INFO") as logs:
+            self.client.get("/other/")
+        self.assertIn(
+            f"Blueprint import times so far:\n{self.loader.import_time_report()}",
+            logs.output[-1],
+        )
+
+    def test_load_all(self) -> None:
+        self.loader.load_all()
+        self.assertEqual(
+            {"first", "second", "other", "linking"}, self._registered_blueprints()
+        )
+
+        # Loading again is a no-op
+        self.loader.load_all()
+        self.assertEqual(4, len(self.loader.import_time_report().splitlines()))
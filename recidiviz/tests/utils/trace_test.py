@@ -16,13 +16,16 @@
 # =============================================================================
 """Tests the trace various utilities"""
 
+import sys
 from typing import List
 import unittest
 
+import attr
 from mock import ANY, Mock, call, patch
 from parameterized import parameterized
 import pytest
 
+from recidiviz.ingest.models import ingest_info_pb2
 from recidiviz.utils import trace
 
 
@@ -129,6 +132,154 @@ class TestSpan(unittest.TestCase):
         )
 
 
+@trace.span
+def busy_method(iterations: int) -> int:
+    total = 0
+    for i in range(iterations):
+        total += i % 7
+    return total
+
+
+@attr.s
+class _Args:
+    name: str = attr.ib()
+    values: List[int] = attr.ib()
+
+
+@attr.s
+class _Entity:
+    entity_id: int = attr.ib()
+
+    def get_id(self) -> int:
+        return self.entity_id
+
+
+class TestSummarizeArgument(unittest.TestCase):
+    """Tests for summarize_argument"""
+
+    def test_builtins_matchRepr(self):
+        for value in [(2,), {"arg2": ["1", "2"]}, [None, 1.5, True], ()]:
+            self.assertEqual(repr(value), trace.summarize_argument(value))
+
+    def test_largeValues_truncated(self):
+        self.assertEqual(
+            "[0, 1, 2, 3, 4, 5, 6, 7, 8, 9, ...<100000 total>]",
+            trace.summarize_argument(list(range(100000))),
+        )
+        self.assertEqual(
+            repr("a" * 200) + "...<5000 total>",
+            trace.summarize_argument("a" * 5000),
+        )
+        self.assertEqual("[[<list of 3>]]", trace.summarize_argument([[[1, 2, 3]]]))
+
+    def test_objects(self):
+        ingest_info = ingest_info_pb2.IngestInfo()
+        ingest_info.people.add(person_id="123")
+        self.assertEqual(
+            f"<IngestInfo ({ingest_info.ByteSize()} bytes)>",
+            trace.summarize_argument(ingest_info),
+        )
+        self.assertEqual(
+            "_Args(name='a', values=[1, 2])",
+            trace.summarize_argument(_Args(name="a", values=[1, 2])),
+        )
+        self.assertEqual("<_Entity id=5>", trace.summarize_argument(_Entity(5)))
+        self.assertEqual("<SomeClass>", trace.summarize_argument(SomeClass()))
+
+    @patch("opencensus.trace.execution_context.get_opencensus_tracer")
+    def test_span_boundsSummary(self, mock_get_tracer):
+        mock_span = (
+            mock_get_tracer.return_value.span.return_value.__enter__.return_value
+        )
+
+        some_method(1, arg2=["x" * 150] * 10)
+
+        for attribute_call in mock_span.add_attribute.call_args_list:
+            self.assertLessEqual(
+                len(attribute_call[0][1]), trace.MAX_ARGUMENT_SUMMARY_LENGTH + 3
+            )
+
+
+class TestSpanProfiling(unittest.TestCase):
+    """Tests the sampling profiler for spans"""
+
+    def tearDown(self) -> None:
+        trace.configure_span_profiling(0)
+
+    def test_sample_countsStacksUnderRoot(self):
+        profiler = trace.SamplingProfiler(sys._getframe(), interval_seconds=1)
+
+        def inner() -> None:
+            profiler.sample()
+
+        inner()
+        inner()
+
+        self.assertEqual(2, profiler.num_samples)
+        self.assertEqual(1, len(profiler.stack_counts))
+        self.assertRegex(
+            profiler.hot_path_summary(),
+            r"^100% \(2 samples\): .*trace_test\.inner:\d+ > .*\.sample:\d+$",
+        )
+
+    def test_sample_otherRootNotCounted(self):
+        def make_profiler() -> trace.SamplingProfiler:
+            return trace.SamplingProfiler(sys._getframe(), interval_seconds=1)
+
+        profiler = make_profiler()
+        profiler.sample()
+
+        self.assertEqual(0, profiler.num_samples)
+
+    def test_sample_afterStopNotCounted(self):
+        profiler = trace.SamplingProfiler(sys._getframe(), interval_seconds=1)
+
+        def inner() -> None:
+            profiler.sample()
+
+        inner()
+        profiler.stop()
+        inner()
+
+        self.assertEqual(1, profiler.num_samples)
+        self.assertEqual(1, sum(profiler.stack_counts.values()))
+
+    @patch("recidiviz.utils.monitoring.measurements")
+    @patch("opencensus.trace.execution_context.get_opencensus_tracer")
+    def test_span_attachesHotPaths(self, mock_get_tracer, mock_measurements_method):
+        mock_span = (
+            mock_get_tracer.return_value.span.return_value.__enter__.return_value
+        )
+        mock_measurements = mock_measurements_method.return_value.__enter__.return_value
+        trace.configure_span_profiling(1.0, interval_seconds=0.001)
+
+        busy_method(3000000)
+
+        hot_paths = [
+            attribute_call[0][1]
+            for attribute_call in mock_span.add_attribute.call_args_list
+            if attribute_call[0][0] == "recidiviz.profile.hot_paths"
+        ]
+        self.assertEqual(1, len(hot_paths))
+        self.assertIn("trace_test.busy_method", hot_paths[0])
+        mock_measurements.measure_put_attachment.assert_called_with(
+            "hot_paths", hot_paths[0]
+        )
+
+    @patch("opencensus.trace.execution_context.get_opencensus_tracer")
+    def test_span_notProfiledByDefault(self, mock_get_tracer):
+        mock_span = (
+            mock_get_tracer.return_value.span.return_value.__enter__.return_value
+        )
+
+        busy_method(10)
+
+        self.assertNotIn(
+            "recidiviz.profile.hot_paths",
+            [c[0][0] for c in mock_span.add_attribute.call_args_list],
+        )
+
+
 class TestCompositeSampler(unittest.TestCase):
     """Tests composite sampler functionality"""
 
@@ -127,3 +127,41 @@ class TestExistenceValidationChecker(TestCase):
                 validation_job=job, was_successful=True, failure_description=None
             ),
         )
+
+    def test_existence_check_batch(self) -> None:
+        validation = ExistenceDataValidationCheck(
+            validation_type=ValidationCheckType.EXISTENCE,
+            view=BigQueryView(
+                dataset_id="my_dataset",
+                view_id="test_view",
+                view_query_template="select * from literally_anything",
+            ),
+        )
+        job = DataValidationJob(region_code="US_VA", validation=validation)
+        other_job = DataValidationJob(region_code="US_XX", validation=validation)
+
+        self.assertTrue(ExistenceValidationChecker.can_batch(validation))
+        self.assertEqual(
+            ExistenceValidationChecker.batch_query_str([job, other_job]),
+            """SELECT region_code, COUNT(*) AS num_rows
+FROM (SELECT * FROM `project-id.my_dataset.test_view` WHERE region_code IN ('US_VA', 'US_XX'))
+GROUP BY region_code
+""",
+        )
+        self.assertEqual(
+            ExistenceValidationChecker.run_check_on_batch_summary(
+                job, {"region_code": "US_VA", "num_rows": 2}
+            ),
+            DataValidationJobResult(
+                validation_job=job,
+                was_successful=False,
+                failure_description="Found [2] invalid rows, though [0] were expected",
+            ),
+        )
+        # There is no summary row for a region without any rows in the validation view
+        self.assertEqual(
+            ExistenceValidationChecker.run_check_on_batch_summary(other_job, None),
+            DataValidationJobResult(
+                validation_job=other_job, was_successful=True, failure_description=None
+            ),
+        )
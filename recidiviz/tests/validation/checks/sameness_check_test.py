@@ -19,6 +19,7 @@
 from typing import List, Dict
 from unittest import TestCase
 
+import attr
 from mock import patch
 
 from recidiviz.big_query.big_query_view import BigQueryView
@@ -524,3 +525,203 @@ class TestSamenessValidationChecker(TestCase):
                 f"validation returned an error rate of {actual_expected_error}.",
             ),
         )
+
+    def _aggregated_job(
+        self,
+        sameness_check_type: SamenessDataValidationCheckType,
+        max_allowed_error: float = 0.0,
+    ) -> DataValidationJob[SamenessDataValidationCheck]:
+        return DataValidationJob(
+            region_code="US_VA",
+            validation=SamenessDataValidationCheck(
+                validation_type=ValidationCheckType.SAMENESS,
+                comparison_columns=["a", "b", "c"],
+                sameness_check_type=sameness_check_type,
+                max_allowed_error=max_allowed_error,
+                aggregate_in_big_query=True,
+                view=BigQueryView(
+                    dataset_id="my_dataset",
+                    view_id="test_view",
+                    view_query_template="select * from literally_anything",
+                ),
+            ),
+        )
+
+    def test_aggregated_sameness_check_numbers_query(self) -> None:
+        self.mock_client.run_query_async.return_value = [
+            {
+                "null_count_0": 0,
+                "null_count_1": 0,
+                "null_count_2": 0,
+                "failed_row_count": 0,
+                "highest_error": None,
+                "failed_row_sample": [],
+            }
+        ]
+        job = self._aggregated_job(
+            SamenessDataValidationCheckType.NUMBERS, max_allowed_error=0.02
+        )
+
+        result = SamenessValidationChecker.run_check(job)
+
+        self.assertEqual(
+            result,
+            DataValidationJobResult(
+                validation_job=job, was_successful=True, failure_description=None
+            ),
+        )
+        query_str = self.mock_client.run_query_async.call_args[0][0]
+        self.assertIn(
+            "WITH validation_rows AS (\n"
+            "  SELECT * FROM `project-id.my_dataset.test_view` WHERE region_code = 'US_VA'\n"
+            "),",
+            query_str,
+        )
+        self.assertIn(
+            "GREATEST(CAST(a AS FLOAT64), CAST(b AS FLOAT64), CAST(c AS FLOAT64)) AS max_value",
+            query_str,
+        )
+        self.assertIn("COUNTIF(error > 0.02) AS failed_row_count", query_str)
+        self.assertNotIn(";", query_str)
+
+    def test_aggregated_sameness_check_numbers_above_margin(self) -> None:
+        self.mock_client.run_query_async.return_value = [
+            {
+                "null_count_0": 0,
+                "null_count_1": 0,
+                "null_count_2": 0,
+                "failed_row_count": 2,
+                "highest_error": 1 / 3,
+                "failed_row_sample": [
+                    '{"a":14,"b":21,"c":14}',
+                    '{"a":97,"b":100,"c":99}',
+                ],
+            }
+        ]
+        job = self._aggregated_job(
+            SamenessDataValidationCheckType.NUMBERS, max_allowed_error=0.02
+        )
+
+        result = SamenessValidationChecker.run_check(job)
+
+        self.assertEqual(
+            result,
+            DataValidationJobResult(
+                validation_job=job,
+                was_successful=False,
+                failure_description="2 row(s) had unacceptable margins of error. The acceptable margin "
+                "of error is only 0.02, but the validation returned rows with "
+                "errors as high as 0.3333. Sample of failing rows: "
+                '[\'{"a":14,"b":21,"c":14}\', \'{"a":97,"b":100,"c":99}\']',
+            ),
+        )
+
+    def test_aggregated_sameness_check_numbers_none_value(self) -> None:
+        self.mock_client.run_query_async.return_value = [
+            {
+                "null_count_0": 0,
+                "null_count_1": 3,
+                "null_count_2": 0,
+                "failed_row_count": 0,
+                "highest_error": None,
+                "failed_row_sample": [],
+            }
+        ]
+        job = self._aggregated_job(SamenessDataValidationCheckType.NUMBERS)
+
+        with self.assertRaises(ValueError) as e:
+            SamenessValidationChecker.run_check(job)
+        self.assertEqual(
+            str(e.exception),
+            "Unexpected None value for column [b] in validation [test_view].",
+        )
+
+    def test_aggregated_string_sameness_check_above_margin(self) -> None:
+        self.mock_client.run_query_async.return_value = [
+            {
+                "num_rows": 100,
+                "num_errors": 5,
+                "failed_row_sample": ['{"a":"a_value","b":"b_value","c":"c_value"}'],
+            }
+        ]
+        job = self._aggregated_job(
+            SamenessDataValidationCheckType.STRINGS, max_allowed_error=0.04
+        )
+
+        result = SamenessValidationChecker.run_check(job)
+
+        self.assertEqual(
+            result,
+            DataValidationJobResult(
+                validation_job=job,
+                was_successful=False,
+                failure_description="5 out of 100 row(s) did not contain matching strings. "
+                "The acceptable margin of error is only 0.04, but the "
+                "validation returned an error rate of 0.05. Sample of failing rows: "
+                '[\'{"a":"a_value","b":"b_value","c":"c_value"}\']',
+            ),
+        )
+        query_str = self.mock_client.run_query_async.call_args[0][0]
+        self.assertIn(
+            "COUNTIF(IFNULL(b, 'EMPTY_STRING_VALUE') != IFNULL(a, 'EMPTY_STRING_VALUE') "
+            "OR IFNULL(c, 'EMPTY_STRING_VALUE') != IFNULL(a, 'EMPTY_STRING_VALUE')) AS num_errors",
+            query_str,
+        )
+
+    def test_aggregated_string_sameness_check_within_margin(self) -> None:
+        self.mock_client.run_query_async.return_value = [
+            {"num_rows": 100, "num_errors": 4, "failed_row_sample": []}
+        ]
+        job = self._aggregated_job(
+            SamenessDataValidationCheckType.STRINGS, max_allowed_error=0.04
+        )
+
+        result = SamenessValidationChecker.run_check(job)
+
+        self.assertEqual(
+            result,
+            DataValidationJobResult(
+                validation_job=job, was_successful=True, failure_description=None
+            ),
+        )
+
+    def test_aggregated_sameness_check_batch(self) -> None:
+        job = self._aggregated_job(
+            SamenessDataValidationCheckType.NUMBERS, max_allowed_error=0.02
+        )
+        other_job = DataValidationJob(
+            region_code="US_XX",
+            validation=attr.evolve(job.validation, max_allowed_error=0.1),
+        )
+
+        query_str = SamenessValidationChecker.batch_query_str([job, other_job])
+
+        self.assertIn(
+            "SELECT * FROM `project-id.my_dataset.test_view` WHERE region_code IN ('US_VA', 'US_XX')",
+            query_str,
+        )
+        self.assertIn(
+            "COUNTIF(error > CASE region_code WHEN 'US_VA' THEN 0.02 WHEN 'US_XX' THEN 0.1 END) "
+            "AS failed_row_count",
+            query_str,
+        )
+        self.assertTrue(query_str.endswith("GROUP BY region_code\n"))
+
+        # There is no summary row for a region without any rows in the validation view
+        self.assertEqual(
+            SamenessValidationChecker.run_check_on_batch_summary(other_job, None),
+            DataValidationJobResult(
+                validation_job=other_job, was_successful=True, failure_description=None
+            ),
+        )
+
+    def test_sameness_check_batch_not_aggregated(self) -> None:
+        job = self._aggregated_job(SamenessDataValidationCheckType.NUMBERS)
+        job = attr.evolve(
+            job, validation=attr.evolve(job.validation, aggregate_in_big_query=False)
+        )
+
+        # Every row of the validation view is needed, so regions are not batched
+        self.assertFalse(SamenessValidationChecker.can_batch(job.validation))
+        with self.assertRaises(ValueError):
+            SamenessValidationChecker.batch_query_str([job, job])
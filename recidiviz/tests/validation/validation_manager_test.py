@@ -17,9 +17,10 @@
 
 """Tests for validation/validation_manager.py."""
 
-from typing import List, Set
+from typing import Any, Dict, List, Set, Union
 from unittest import TestCase
 
+import attr
 from flask import Flask
 from mock import patch, call, MagicMock
 
@@ -27,7 +28,10 @@ from recidiviz.big_query.big_query_view import BigQueryView
 from recidiviz.big_query.view_update_manager import BigQueryViewNamespace
 from recidiviz.tests.utils.matchers import UnorderedCollection
 from recidiviz.utils.environment import GCPEnvironment
-from recidiviz.validation.checks.existence_check import ExistenceDataValidationCheck
+from recidiviz.validation.checks.existence_check import (
+    ExistenceDataValidationCheck,
+    ExistenceValidationChecker,
+)
 from recidiviz.validation.checks.sameness_check import (
     SamenessDataValidationCheck,
     SamenessDataValidationCheckType,
@@ -45,6 +49,8 @@ from recidiviz.validation.validation_config import (
 from recidiviz.validation.validation_manager import (
     validation_manager_blueprint,
     _fetch_validation_jobs_to_perform,
+    _plan_validation_job_batches,
+    _run_job_batch,
 )
 from recidiviz.validation.validation_models import (
     DataValidationJob,
@@ -124,29 +130,64 @@ class TestHandleRequest(TestCase):
         app.config["TESTING"] = True
         self.client = app.test_client()
 
+        self.client_patcher = patch(
+            "recidiviz.validation.checks.validation_checker.BigQueryClientImpl"
+        )
+        self.mock_client = self.client_patcher.start().return_value
+
         self._TEST_VALIDATIONS = get_test_validations()
 
     def tearDown(self) -> None:
+        self.client_patcher.stop()
         self.project_id_patcher.stop()
         self.project_number_patcher.stop()
 
+    def _set_batch_summaries(
+        self, summaries_by_view_id: Dict[str, Union[List[Dict[str, Any]], Exception]]
+    ) -> None:
+        """Sets the summary rows returned by the batch query for each of the test validation views."""
+
+        def _run_query_async(query_str: str, _query_parameters: List) -> List:
+            for view_id, summaries in summaries_by_view_id.items():
+                if f".my_dataset.{view_id}`" in query_str:
+                    if isinstance(summaries, Exception):
+                        raise summaries
+                    return summaries
+            raise ValueError(f"Unexpected query: {query_str}")
+
+        self.mock_client.run_query_async.side_effect = _run_query_async
+
+    def _assert_batch_queries_run(self) -> None:
+        # The jobs for each validation are batched across regions
+        self.assertCountEqual(
+            [
+                call(
+                    ExistenceValidationChecker.batch_query_str(
+                        [self._TEST_VALIDATIONS[0], self._TEST_VALIDATIONS[2]]
+                    ),
+                    [],
+                ),
+                call(
+                    ExistenceValidationChecker.batch_query_str(
+                        [self._TEST_VALIDATIONS[1], self._TEST_VALIDATIONS[3]]
+                    ),
+                    [],
+                ),
+            ],
+            self.mock_client.run_query_async.call_args_list,
+        )
+
     @patch("recidiviz.big_query.view_update_manager.rematerialize_views_for_namespace")
     @patch("recidiviz.validation.validation_manager._emit_failures")
-    @patch("recidiviz.validation.validation_manager._run_job")
     @patch("recidiviz.validation.validation_manager._fetch_validation_jobs_to_perform")
     def test_handle_request_happy_path_no_failures(
         self,
         mock_fetch_validations: MagicMock,
-        mock_run_job: MagicMock,
         mock_emit_failures: MagicMock,
         mock_rematerialize_views: MagicMock,
     ) -> None:
         mock_fetch_validations.return_value = self._TEST_VALIDATIONS
-        mock_run_job.return_value = DataValidationJobResult(
-            validation_job=self._TEST_VALIDATIONS[0],
-            was_successful=True,
-            failure_description=None,
-        )
+        self._set_batch_summaries({"test_1": [], "test_2": []})
 
         headers = {"X-Appengine-Cron": "test-cron"}
         response = self.client.get("/validate", headers=headers)
@@ -154,98 +195,75 @@ class TestHandleRequest(TestCase):
         self.assertEqual(200, response.status_code)
         self.assertEqual(_API_RESPONSE_IF_NO_FAILURES, response.get_data().decode())
 
-        self.assertEqual(4, mock_run_job.call_count)
-        for job in self._TEST_VALIDATIONS:
-            mock_run_job.assert_any_call(job)
+        self._assert_batch_queries_run()
 
         mock_rematerialize_views.assert_called()
         mock_emit_failures.assert_not_called()
 
     @patch("recidiviz.big_query.view_update_manager.rematerialize_views_for_namespace")
     @patch("recidiviz.validation.validation_manager._emit_failures")
-    @patch("recidiviz.validation.validation_manager._run_job")
     @patch("recidiviz.validation.validation_manager._fetch_validation_jobs_to_perform")
     def test_handle_request_with_job_failures_and_validation_failures(
         self,
         mock_fetch_validations: MagicMock,
-        mock_run_job: MagicMock,
         mock_emit_failures: MagicMock,
         mock_rematerialize_views: MagicMock,
     ) -> None:
         mock_fetch_validations.return_value = self._TEST_VALIDATIONS
-        first_failure = DataValidationJobResult(
-            validation_job=self._TEST_VALIDATIONS[1],
-            was_successful=False,
-            failure_description="Oh no",
+        self._set_batch_summaries(
+            {
+                "test_1": [{"region_code": "US_VA", "num_rows": 3}],
+                "test_2": ValueError("Job failed to run!"),
+            }
         )
-        second_failure = DataValidationJobResult(
+        failure = DataValidationJobResult(
             validation_job=self._TEST_VALIDATIONS[2],
             was_successful=False,
-            failure_description="How awful",
+            failure_description="Found [3] invalid rows, though [0] were expected",
         )
-        mock_run_job.side_effect = [
-            DataValidationJobResult(
-                validation_job=self._TEST_VALIDATIONS[0],
-                was_successful=True,
-                failure_description=None,
-            ),
-            first_failure,
-            second_failure,
-            ValueError("Job failed to run!"),
-        ]
+
         headers = {"X-Appengine-Cron": "test-cron"}
         response = self.client.get("/validate", headers=headers)
 
         self.assertEqual(200, response.status_code)
         self.assertNotEqual(_API_RESPONSE_IF_NO_FAILURES, response.get_data().decode())
 
-        self.assertEqual(4, mock_run_job.call_count)
-        for job in self._TEST_VALIDATIONS:
-            mock_run_job.assert_any_call(job)
+        self._assert_batch_queries_run()
 
         mock_rematerialize_views.assert_called()
+        # A failed batch query fails to run every job in the batch
         mock_emit_failures.assert_called_with(
-            UnorderedCollection([self._TEST_VALIDATIONS[3]]),
-            UnorderedCollection([first_failure, second_failure]),
+            UnorderedCollection([self._TEST_VALIDATIONS[1], self._TEST_VALIDATIONS[3]]),
+            UnorderedCollection([failure]),
         )
 
     @patch("recidiviz.big_query.view_update_manager.rematerialize_views_for_namespace")
     @patch("recidiviz.validation.validation_manager._emit_failures")
-    @patch("recidiviz.validation.validation_manager._run_job")
     @patch("recidiviz.validation.validation_manager._fetch_validation_jobs_to_perform")
     def test_handle_request_happy_path_some_failures(
         self,
         mock_fetch_validations: MagicMock,
-        mock_run_job: MagicMock,
         mock_emit_failures: MagicMock,
         mock_rematerialize_views: MagicMock,
     ) -> None:
         mock_fetch_validations.return_value = self._TEST_VALIDATIONS
+        self._set_batch_summaries(
+            {
+                "test_1": [{"region_code": "US_VA", "num_rows": 2}],
+                "test_2": [{"region_code": "US_UT", "num_rows": 1}],
+            }
+        )
 
         first_failure = DataValidationJobResult(
             validation_job=self._TEST_VALIDATIONS[1],
             was_successful=False,
-            failure_description="Oh no",
+            failure_description="Found [1] invalid rows, though [0] were expected",
         )
         second_failure = DataValidationJobResult(
             validation_job=self._TEST_VALIDATIONS[2],
             was_successful=False,
-            failure_description="How awful",
+            failure_description="Found [2] invalid rows, though [0] were expected",
         )
-        mock_run_job.side_effect = [
-            DataValidationJobResult(
-                validation_job=self._TEST_VALIDATIONS[0],
-                was_successful=True,
-                failure_description=None,
-            ),
-            first_failure,
-            second_failure,
-            DataValidationJobResult(
-                validation_job=self._TEST_VALIDATIONS[3],
-                was_successful=True,
-                failure_description=None,
-            ),
-        ]
 
         headers = {"X-Appengine-Cron": "test-cron"}
         response = self.client.get("/validate", headers=headers)
@@ -253,9 +271,7 @@ class TestHandleRequest(TestCase):
         self.assertEqual(200, response.status_code)
         self.assertNotEqual(_API_RESPONSE_IF_NO_FAILURES, response.get_data().decode())
 
-        self.assertEqual(4, mock_run_job.call_count)
-        for job in self._TEST_VALIDATIONS:
-            mock_run_job.assert_any_call(job)
+        self._assert_batch_queries_run()
 
         mock_rematerialize_views.assert_called()
         mock_emit_failures.assert_called_with(
@@ -350,6 +366,160 @@ class TestHandleRequest(TestCase):
         )
 
 
+class TestRunJobBatches(TestCase):
+    """Tests for running validation jobs in batches across regions."""
+
+    def setUp(self) -> None:
+        self.metadata_patcher = patch("recidiviz.utils.metadata.project_id")
+        self.metadata_patcher.start().return_value = "recidiviz-456"
+
+        self.client_patcher = patch(
+            "recidiviz.validation.checks.validation_checker.BigQueryClientImpl"
+        )
+        self.mock_client = self.client_patcher.start().return_value
+
+        self.sameness_check = SamenessDataValidationCheck(
+            view=BigQueryView(
+                dataset_id="my_dataset",
+                view_id="sameness_view",
+                view_query_template="select * from literally_anything",
+            ),
+            comparison_columns=["a", "b"],
+            aggregate_in_big_query=True,
+        )
+
+    def tearDown(self) -> None:
+        self.client_patcher.stop()
+        self.metadata_patcher.stop()
+
+    def test_plan_validation_job_batches(self) -> None:
+        unaggregated_sameness_check = attr.evolve(
+            self.sameness_check,
+            view=BigQueryView(
+                dataset_id="my_dataset",
+                view_id="unaggregated_sameness_view",
+                view_query_template="select * from literally_anything",
+            ),
+            aggregate_in_big_query=False,
+        )
+        validation_jobs = get_test_validations() + [
+            DataValidationJob(validation=self.sameness_check, region_code="US_UT"),
+            DataValidationJob(validation=self.sameness_check, region_code="US_VA"),
+            DataValidationJob(
+                validation=unaggregated_sameness_check, region_code="US_UT"
+            ),
+            DataValidationJob(
+                validation=unaggregated_sameness_check, region_code="US_VA"
+            ),
+        ]
+
+        batches = _plan_validation_job_batches(validation_jobs)
+
+        self.assertEqual(
+            [
+                [validation_jobs[0], validation_jobs[2]],
+                [validation_jobs[1], validation_jobs[3]],
+                [validation_jobs[4], validation_jobs[5]],
+                # Sameness checks that are not aggregated in BigQuery are not batched
+                [validation_jobs[6]],
+                [validation_jobs[7]],
+            ],
+            batches,
+        )
+
+    def test_run_job_batch(self) -> None:
+        self.mock_client.run_query_async.return_value = [
+            {
+                "region_code": "US_UT",
+                "null_count_0": 0,
+                "null_count_1": 0,
+                "failed_row_count": 0,
+                "highest_error": None,
+                "failed_row_sample": [],
+            },
+            {
+                "region_code": "US_VA",
+                "null_count_0": 0,
+                "null_count_1": 0,
+                "failed_row_count": 0,
+                "highest_error": None,
+                "failed_row_sample": [],
+            },
+            {
+                "region_code": "US_XX",
+                "null_count_0": 0,
+                "null_count_1": 1,
+                "failed_row_count": 0,
+                "highest_error": None,
+                "failed_row_sample": [],
+            },
+        ]
+        batch = [
+            DataValidationJob(validation=self.sameness_check, region_code="US_UT"),
+            DataValidationJob(
+                validation=attr.evolve(self.sameness_check, max_allowed_error=0.2),
+                region_code="US_VA",
+            ),
+            DataValidationJob(validation=self.sameness_check, region_code="US_WW"),
+            DataValidationJob(validation=self.sameness_check, region_code="US_XX"),
+        ]
+
+        results = _run_job_batch(batch)
+
+        self.mock_client.run_query_async.assert_called_once()
+        query_str = self.mock_client.run_query_async.call_args[0][0]
+        self.assertIn(
+            "SELECT * FROM `recidiviz-456.my_dataset.sameness_view` "
+            "WHERE region_code IN ('US_UT', 'US_VA', 'US_WW', 'US_XX')",
+            query_str,
+        )
+        self.assertTrue(query_str.endswith("GROUP BY region_code\n"))
+        self.assertEqual(
+            [
+                DataValidationJobResult(
+                    validation_job=batch[0],
+                    was_successful=True,
+                    failure_description=None,
+                ),
+                DataValidationJobResult(
+                    validation_job=batch[1],
+                    was_successful=True,
+                    failure_description=None,
+                ),
+                DataValidationJobResult(
+                    validation_job=batch[2],
+                    was_successful=True,
+                    failure_description=None,
+                ),
+            ],
+            results[:3],
+        )
+        self.assertIsInstance(results[3], ValueError)
+
+    def test_run_job_batch_duplicate_summaries(self) -> None:
+        self.mock_client.run_query_async.return_value = [
+            {"region_code": "US_UT", "num_rows": 1},
+            {"region_code": "US_UT", "num_rows": 2},
+        ]
+        batch = [
+            DataValidationJob(validation=self.sameness_check, region_code="US_UT"),
+            DataValidationJob(validation=self.sameness_check, region_code="US_VA"),
+        ]
+
+        with self.assertRaises(ValueError):
+            _run_job_batch(batch)
+
+    def test_run_job_batch_query_fails(self) -> None:
+        self.mock_client.run_query_async.side_effect = ValueError("Query failed")
+        batch = [
+            DataValidationJob(validation=self.sameness_check, region_code="US_UT"),
+            DataValidationJob(validation=self.sameness_check, region_code="US_VA"),
+        ]
+
+        with self.assertRaises(ValueError):
+            _run_job_batch(batch)
+
+
 class TestFetchValidations(TestCase):
     """Tests the _fetch_validation_jobs_to_perform function."""
 
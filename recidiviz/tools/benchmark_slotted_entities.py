@@ -0,0 +1,96 @@
+# Recidiviz - a data platform for criminal justice reform
+# Copyright (C) 2021 Recidiviz, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# =============================================================================
+"""Measures the memory used by hydrated StatePerson graphs built from the state entity classes against graphs built
+from their slotted variants, which are what the calculation pipelines hydrate.
+
+Each synthetic person has at least one entity of every state entity type, with all back edges set.
+
+usage: python -m recidiviz.tools.benchmark_slotted_entities [--num_persons NUM_PERSONS]
+"""
+import argparse
+import logging
+import tracemalloc
+from typing import Callable, Dict, List
+
+import attr
+
+from recidiviz.calculator.pipeline.utils.slotted_entities import slotted_entity_class
+from recidiviz.persistence.entity.base_entity import Entity
+from recidiviz.tests.persistence.entity.state.entities_test_utils import (
+    generate_full_graph_state_person,
+)
+
+
+def _to_slotted(entity: Entity, converted: Dict[int, Entity]) -> Entity:
+    """Returns a copy of the graph rooted at |entity| made of slotted entities."""
+    if id(entity) in converted:
+        return converted[id(entity)]
+
+    slotted = object.__new__(slotted_entity_class(entity.__class__))
+    converted[id(entity)] = slotted
+    for field in attr.fields(entity.__class__):
+        value = getattr(entity, field.name)
+        if isinstance(value, Entity):
+            value = _to_slotted(value, converted)
+        elif isinstance(value, list):
+            value = [_to_slotted(v, converted) for v in value]
+        setattr(slotted, field.name, value)
+    return slotted
+
+
+def _regular_person() -> Entity:
+    return generate_full_graph_state_person(set_back_edges=True)
+
+
+def _slotted_person() -> Entity:
+    return _to_slotted(generate_full_graph_state_person(set_back_edges=True), {})
+
+
+def _bytes_per_person(build_person: Callable[[], Entity], num_persons: int) -> float:
+    tracemalloc.start()
+    persons: List[Entity] = []
+    start, _ = tracemalloc.get_traced_memory()
+    for _ in range(num_persons):
+        persons.append(build_person())
+    end, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return (end - start) / num_persons
+
+
+def main(num_persons: int) -> None:
+    regular_bytes = _bytes_per_person(_regular_person, num_persons)
+    slotted_bytes = _bytes_per_person(_slotted_person, num_persons)
+    logging.info("Measured [%s] hydrated persons", num_persons)
+    logging.info("Entity classes: [%.0f] bytes per person", regular_bytes)
+    logging.info(
+        "Slotted variants: [%.0f] bytes per person ([%.0f]%% of the entity classes)",
+        slotted_bytes,
+        slotted_bytes / regular_bytes * 100,
+    )
+
+
+if __name__ == "__main__":
+    logging.getLogger().setLevel(logging.INFO)
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--num_persons",
+        type=int,
+        default=1000,
+        help="The number of synthetic persons to build.",
+    )
+    args = parser.parse_args()
+    main(args.num_persons)
@@ -0,0 +1,101 @@
+# Recidiviz - a data platform for criminal justice reform
+# Copyright (C) 2021 Recidiviz, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# =============================================================================
+"""Benchmarks encoding and decoding hydrated StatePerson graphs with the StateEntityCoder against the PickleCoder
+that Beam otherwise falls back to.
+
+Each synthetic person has at least one entity of every state entity type, with all back edges set.
+
+usage: python -m recidiviz.tools.benchmark_state_entity_coder [--num_persons NUM_PERSONS] [--num_runs NUM_RUNS]
+"""
+import argparse
+import logging
+import timeit
+from typing import List
+
+import apache_beam as beam
+
+from recidiviz.calculator.pipeline.utils.state_entity_coder import StateEntityCoder
+from recidiviz.persistence.entity.state.entities import StatePerson
+from recidiviz.tests.persistence.entity.state.entities_test_utils import (
+    generate_full_graph_state_person,
+)
+
+
+def _synthetic_persons(num_persons: int) -> List[StatePerson]:
+    persons = []
+    for person_id in range(num_persons):
+        person = generate_full_graph_state_person(set_back_edges=True)
+        person.person_id = person_id
+        persons.append(person)
+    return persons
+
+
+def _benchmark_coder(
+    name: str, coder: beam.coders.Coder, persons: List[StatePerson], num_runs: int
+) -> None:
+    encoded = [coder.encode(person) for person in persons]
+    if [coder.decode(e) for e in encoded] != persons:
+        raise ValueError(f"{name} did not round trip the persons")
+
+    encode_seconds = min(
+        timeit.repeat(
+            lambda: [coder.encode(person) for person in persons],
+            number=1,
+            repeat=num_runs,
+        )
+    )
+    decode_seconds = min(
+        timeit.repeat(
+            lambda: [coder.decode(e) for e in encoded], number=1, repeat=num_runs
+        )
+    )
+
+    logging.info(
+        "%s: [%.0f] bytes per person, [%.1f] us to encode and [%.1f] us to decode each person",
+        name,
+        sum(len(e) for e in encoded) / len(persons),
+        encode_seconds / len(persons) * 1e6,
+        decode_seconds / len(persons) * 1e6,
+    )
+
+
+def main(num_persons: int, num_runs: int) -> None:
+    persons = _synthetic_persons(num_persons)
+    logging.info(
+        "Encoding and decoding [%s] persons, best of [%s] runs", num_persons, num_runs
+    )
+    _benchmark_coder("PickleCoder", beam.coders.PickleCoder(), persons, num_runs)
+    _benchmark_coder("StateEntityCoder", StateEntityCoder(), persons, num_runs)
+
+
+if __name__ == "__main__":
+    logging.getLogger().setLevel(logging.INFO)
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--num_persons",
+        type=int,
+        default=1000,
+        help="The number of synthetic persons to encode and decode.",
+    )
+    parser.add_argument(
+        "--num_runs",
+        type=int,
+        default=5,
+        help="The number of times to time each coder. The fastest run is reported.",
+    )
+    args = parser.parse_args()
+    main(args.num_persons, args.num_runs)
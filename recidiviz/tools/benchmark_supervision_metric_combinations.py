@@ -0,0 +1,140 @@
+# Recidiviz - a data platform for criminal justice reform
+# Copyright (C) 2021 Recidiviz, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# =============================================================================
+"""Benchmarks producing supervision metric combinations for a synthetic person with many supervision time buckets.
+
+Compares map_supervision_combinations using the cached MetricFieldPlans against the same run with a plan rebuilt for
+every event, which is equivalent to reflecting over the metric classes for every event.
+
+usage: python -m recidiviz.tools.benchmark_supervision_metric_combinations [--num_buckets NUM_BUCKETS] \
+          [--num_runs NUM_RUNS]
+"""
+import argparse
+import logging
+import timeit
+from datetime import date, timedelta
+from typing import List
+
+
+from recidiviz.calculator.pipeline.supervision import calculator
+from recidiviz.calculator.pipeline.supervision.metrics import SupervisionMetricType
+from recidiviz.calculator.pipeline.supervision.supervision_time_bucket import (
+    NonRevocationReturnSupervisionTimeBucket,
+    SupervisionTimeBucket,
+)
+from recidiviz.calculator.pipeline.utils import calculator_utils
+from recidiviz.calculator.pipeline.utils.person_utils import PersonMetadata
+from recidiviz.common.constants.person_characteristics import Gender
+from recidiviz.common.constants.state.state_case_type import StateSupervisionCaseType
+from recidiviz.common.constants.state.state_supervision_period import (
+    StateSupervisionPeriodSupervisionType,
+    StateSupervisionLevel,
+)
+from recidiviz.persistence.entity.state.entities import StatePerson
+
+_STATE_CODE = "US_XX"
+
+
+def _synthetic_person() -> StatePerson:
+    return StatePerson.new_with_defaults(
+        state_code=_STATE_CODE,
+        person_id=12345,
+        birthdate=date(1984, 8, 31),
+        gender=Gender.FEMALE,
+    )
+
+
+def _synthetic_buckets(num_buckets: int) -> List[SupervisionTimeBucket]:
+    """Returns |num_buckets| daily NonRevocationReturnSupervisionTimeBuckets ending today."""
+    end_date = date.today()
+    buckets: List[SupervisionTimeBucket] = []
+    for i in range(num_buckets):
+        event_date = end_date - timedelta(days=i)
+        buckets.append(
+            NonRevocationReturnSupervisionTimeBucket(
+                state_code=_STATE_CODE,
+                year=event_date.year,
+                month=event_date.month,
+                event_date=event_date,
+                is_on_supervision_last_day_of_month=False,
+                supervision_type=StateSupervisionPeriodSupervisionType.PAROLE,
+                case_type=StateSupervisionCaseType.GENERAL,
+                supervision_level=StateSupervisionLevel.HIGH,
+                supervision_level_raw_text="HIGH",
+                supervising_officer_external_id="OFFICER",
+                level_1_supervision_location_external_id="OFFICE",
+            )
+        )
+    return buckets
+
+
+def _run(person: StatePerson, buckets: List[SupervisionTimeBucket]) -> int:
+    combinations = calculator.map_supervision_combinations(
+        person,
+        buckets,
+        {metric_type: True for metric_type in SupervisionMetricType},
+        calculation_end_month=None,
+        calculation_month_count=-1,
+        person_metadata=PersonMetadata(prioritized_race_or_ethnicity="BLACK"),
+    )
+    return len(combinations)
+
+
+def main(num_buckets: int, num_runs: int) -> None:
+    person = _synthetic_person()
+    buckets = _synthetic_buckets(num_buckets)
+    num_combinations = _run(person, buckets)
+    logging.info(
+        "Producing [%s] metric combinations from [%s] buckets, best of [%s] runs",
+        num_combinations,
+        num_buckets,
+        num_runs,
+    )
+
+    cached_seconds = min(
+        timeit.repeat(lambda: _run(person, buckets), number=1, repeat=num_runs)
+    )
+    cached_metric_field_plan = calculator_utils.metric_field_plan
+    calculator_utils.metric_field_plan = cached_metric_field_plan.__wrapped__  # type: ignore[assignment]
+    try:
+        uncached_seconds = min(
+            timeit.repeat(lambda: _run(person, buckets), number=1, repeat=num_runs)
+        )
+    finally:
+        calculator_utils.metric_field_plan = cached_metric_field_plan  # type: ignore[assignment]
+
+    logging.info("Without cached plans: [%.3f] seconds", uncached_seconds)
+    logging.info("With cached plans: [%.3f] seconds", cached_seconds)
+    logging.info("Speedup: [%.2fx]", uncached_seconds / cached_seconds)
+
+
+if __name__ == "__main__":
+    logging.getLogger().setLevel(logging.INFO)
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--num_buckets",
+        type=int,
+        default=3650,
+        help="The number of supervision time buckets on the synthetic person.",
+    )
+    parser.add_argument(
+        "--num_runs",
+        type=int,
+        default=5,
+        help="The number of times to time each variant. The fastest run is reported.",
+    )
+    args = parser.parse_args()
+    main(args.num_buckets, args.num_runs)
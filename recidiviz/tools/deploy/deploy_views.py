@@ -17,7 +17,11 @@
 """
 Script for deploying updated views to BigQuery. Should not be run outside the context of a deploy.
 Run locally with the following command:
-    python -m recidiviz.big_query.view_update_manager --project_id [PROJECT_ID]
+    python -m recidiviz.tools.deploy.deploy_views --project_id [PROJECT_ID] [--skip_unchanged_views]
+
+If --skip_unchanged_views is set, views that have not changed since the last deploy (according to the view deploy
+manifest stored in GCS) are not updated or re-materialized. Do not use this flag if the schemas of any
+source tables may have changed since the last deploy.
 """
 import argparse
 import logging
@@ -43,6 +47,13 @@ def parse_arguments(argv: List[str]) -> Tuple[argparse.Namespace, List[str]]:
         choices=[GCP_PROJECT_STAGING, GCP_PROJECT_PRODUCTION],
         required=True,
     )
+    parser.add_argument(
+        "--skip_unchanged_views",
+        dest="skip_unchanged_views",
+        action="store_true",
+        default=False,
+        help="Skip views that are unchanged since the last deploy, according to the view deploy manifest.",
+    )
 
     return parser.parse_known_args(argv)
 
@@ -55,5 +66,7 @@ if __name__ == "__main__":
         for namespace, builders in VIEW_BUILDERS_BY_NAMESPACE.items():
             # TODO(#5785): Clarify use case of BigQueryViewNamespace filter (see ticket for more)
             create_dataset_and_deploy_views_for_view_builders(
-                bq_view_namespace=namespace, view_builders_to_update=builders
+                bq_view_namespace=namespace,
+                view_builders_to_update=builders,
+                skip_unchanged_views=known_args.skip_unchanged_views,
             )
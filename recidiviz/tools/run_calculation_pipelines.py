@@ -61,6 +61,9 @@ import logging
 import sys
 from typing import List, Tuple
 
+from recidiviz.calculator.pipeline.entity_snapshot import (
+    pipeline as entity_snapshot_pipeline,
+)
 from recidiviz.calculator.pipeline.incarceration import (
     pipeline as incarceration_pipeline,
 )
@@ -76,6 +79,7 @@ PIPELINE_MODULES = {
     "recidivism": recidivism_pipeline,
     "supervision": supervision_pipeline,
     "program": program_pipeline,
+    "entity_snapshot": entity_snapshot_pipeline,
 }
 
 
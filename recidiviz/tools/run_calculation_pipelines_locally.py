@@ -0,0 +1,154 @@
+# Recidiviz - a data platform for criminal justice reform
+# Copyright (C) 2021 Recidiviz, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# =============================================================================
+"""Script to run a calculation pipeline for a whole state on a single machine, without Beam.
+
+Persons are read from a local Postgres snapshot of the state database and reference views are read from a directory
+of newline-delimited JSON files named <view_name>.json (e.g. a BigQuery export of the reference_views dataset and the
+state_race_ethnicity_population_counts static reference table). Metrics are written as newline-delimited JSON files
+to the output directory, one file per Dataflow metrics table, so they can be compared against or loaded into a
+sandbox dataset.
+
+See recidiviz/calculator/pipeline/utils/local_batch_runner.py for more details.
+
+usage: python -m recidiviz.tools.run_calculation_pipelines_locally
+          --pipeline PIPELINE_TYPE \
+          --state_code STATE_CODE \
+          --database_url DATABASE_URL \
+          --reference_view_dir REFERENCE_VIEW_DIR \
+          --output_dir OUTPUT_DIR \
+          [--metric_types METRIC_TYPES] \
+          [--calculation_end_month CALCULATION_END_MONTH] \
+          [--calculation_month_count CALCULATION_MONTH_COUNT] \
+          [--person_filter_ids PERSON_FILTER_IDS] \
+          [--num_processes NUM_PROCESSES]
+
+Example:
+    python -m recidiviz.tools.run_calculation_pipelines_locally --pipeline supervision --state_code US_ND \
+    --database_url postgresql://localhost:5432/postgres --reference_view_dir ~/reference_views \
+    --output_dir ~/supervision_metrics --calculation_month_count 36 --num_processes 8
+"""
+import argparse
+import logging
+import multiprocessing
+import sys
+from typing import List, Tuple
+
+from recidiviz.calculator.pipeline.utils.local_batch_runner import (
+    DEFAULT_PERSON_BATCH_SIZE,
+    LOCAL_PIPELINE_SPECS,
+    LocalBatchRunConfig,
+    run_local_batch,
+)
+
+
+def parse_arguments(argv: List[str]) -> Tuple[argparse.Namespace, List[str]]:
+    """Parses the arguments needed to call the run_local_batch function."""
+    parser = argparse.ArgumentParser()
+
+    parser.add_argument(
+        "--pipeline",
+        dest="pipeline",
+        type=str,
+        choices=sorted(LOCAL_PIPELINE_SPECS),
+        required=True,
+    )
+    parser.add_argument("--state_code", dest="state_code", type=str, required=True)
+    parser.add_argument(
+        "--database_url",
+        dest="database_url",
+        type=str,
+        required=True,
+        help="SQLAlchemy URL of the Postgres database holding the state snapshot.",
+    )
+    parser.add_argument(
+        "--reference_view_dir",
+        dest="reference_view_dir",
+        type=str,
+        required=True,
+        help="Directory of newline-delimited JSON files named <view_name>.json.",
+    )
+    parser.add_argument("--output_dir", dest="output_dir", type=str, required=True)
+    parser.add_argument(
+        "--metric_types",
+        dest="metric_types",
+        type=str,
+        nargs="+",
+        default={"ALL"},
+        help="A list of the types of metric to calculate.",
+    )
+    parser.add_argument(
+        "--calculation_end_month",
+        dest="calculation_end_month",
+        type=str,
+        help="The year and month of the last month for which output metrics should be calculated (YYYY-MM).",
+    )
+    parser.add_argument(
+        "--calculation_month_count",
+        dest="calculation_month_count",
+        type=int,
+        default=-1,
+        help="The number of months to limit the monthly calculation output to. If set to -1, does not "
+        "limit the calculations.",
+    )
+    parser.add_argument(
+        "--person_filter_ids",
+        dest="person_filter_ids",
+        type=int,
+        nargs="+",
+        help="An optional list of DB person_id values. When present, the pipeline will only calculate metrics for "
+        "these people.",
+    )
+    parser.add_argument(
+        "--num_processes",
+        dest="num_processes",
+        type=int,
+        default=multiprocessing.cpu_count(),
+    )
+    parser.add_argument(
+        "--person_batch_size",
+        dest="person_batch_size",
+        type=int,
+        default=DEFAULT_PERSON_BATCH_SIZE,
+    )
+
+    return parser.parse_known_args(argv)
+
+
+def main(args: argparse.Namespace) -> None:
+    run_local_batch(
+        LocalBatchRunConfig(
+            pipeline=args.pipeline,
+            state_code=args.state_code.upper(),
+            database_url=args.database_url,
+            reference_view_dir=args.reference_view_dir,
+            output_dir=args.output_dir,
+            metric_types=set(args.metric_types),
+            calculation_end_month=args.calculation_end_month,
+            calculation_month_count=args.calculation_month_count,
+            person_id_filter_set=(
+                set(args.person_filter_ids) if args.person_filter_ids else None
+            ),
+            num_processes=args.num_processes,
+            person_batch_size=args.person_batch_size,
+        )
+    )
+
+
+if __name__ == "__main__":
+    logging.getLogger().setLevel(logging.INFO)
+    known_args, _ = parse_arguments(sys.argv[1:])
+    main(known_args)
@@ -0,0 +1,141 @@
+# Recidiviz - a data platform for criminal justice reform
+# Copyright (C) 2021 Recidiviz, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# =============================================================================
+"""Defers importing and registering Flask blueprints until the first request
+is made under their url prefix.
+
+Importing the module that defines a blueprint can pull in large parts of the
+codebase (e.g. every region module or SQLAlchemy schema). Loading blueprints
+lazily means a new server instance only pays for the blueprints it actually
+serves, and only once it needs them.
+"""
+import importlib
+import logging
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Callable, Dict, Iterable, List, Set, Tuple
+
+import attr
+from flask import Flask
+
+
+@attr.s(frozen=True)
+class LazyBlueprint:
+    """A blueprint defined as |attribute_name| in |module_name|, to be
+    registered under |url_prefix|.
+
+    |url_for_prefixes| lists the url prefixes of other blueprints whose
+    endpoints this blueprint builds urls for with url_for. Those blueprints are
+    loaded along with this one, as url_for fails for unregistered endpoints.
+    """
+
+    module_name: str = attr.ib()
+    attribute_name: str = attr.ib()
+    url_prefix: str = attr.ib()
+    url_for_prefixes: Tuple[str, ...] = attr.ib(default=(), converter=tuple)
+
+    @property
+    def qualified_name(self) -> str:
+        return f"{self.module_name}.{self.attribute_name}"
+
+
+class LazyBlueprintLoader:
+    """Wraps the WSGI app of |app| so that, before a request is handled, all
+    blueprints with a url prefix matching the request path are imported and
+    registered with the app, along with any blueprints they build urls for."""
+
+    def __init__(self, app: Flask, blueprints: Iterable[LazyBlueprint]):
+        blueprints = list(blueprints)
+        self.app = app
+        self._blueprints_by_prefix: Dict[str, List[LazyBlueprint]] = defaultdict(list)
+        for blueprint in blueprints:
+            self._blueprints_by_prefix[blueprint.url_prefix].append(blueprint)
+        for blueprint in blueprints:
+            for url_for_prefix in blueprint.url_for_prefixes:
+                if url_for_prefix not in self._blueprints_by_prefix:
+                    raise ValueError(
+                        f"Blueprint [{blueprint.qualified_name}] builds urls for "
+                        f"unknown url prefix [{url_for_prefix}]"
+                    )
+        self._loaded_prefixes: Set[str] = set()
+        self._lock = threading.Lock()
+
+        # Seconds spent importing each blueprint module, keyed by the blueprint's qualified name
+        self.import_seconds: Dict[str, float] = {}
+
+        self._wsgi_app = app.wsgi_app
+        app.wsgi_app = self  # type: ignore[assignment]
+
+    def __call__(
+        self, environ: Dict[str, Any], start_response: Callable[..., Any]
+    ) -> Any:
+        if len(self._loaded_prefixes) < len(self._blueprints_by_prefix):
+            path = environ.get("PATH_INFO", "")
+            for url_prefix in self._blueprints_by_prefix:
+                if path == url_prefix or path.startswith(url_prefix + "/"):
+                    self.load(url_prefix)
+        return self._wsgi_app(environ, start_response)
+
+    def load(self, url_prefix: str) -> None:
+        """Imports and registers all blueprints for |url_prefix| and the url
+        prefixes they build urls for, if that has not happened already."""
+        if url_prefix in self._loaded_prefixes:
+            return
+        with self._lock:
+            prefixes_to_load = [url_prefix]
+            loaded_any = False
+            while prefixes_to_load:
+                prefix = prefixes_to_load.pop()
+                if prefix in self._loaded_prefixes:
+                    continue
+                for blueprint in self._blueprints_by_prefix[prefix]:
+                    self._load_blueprint(blueprint)
+                    prefixes_to_load.extend(blueprint.url_for_prefixes)
+                self._loaded_prefixes.add(prefix)
+                loaded_any = True
+            if loaded_any:
+                logging.info(
+                    "Blueprint import times so far:\n%s", self.import_time_report()
+                )
+
+    def _load_blueprint(self, blueprint: LazyBlueprint) -> None:
+        start = time.perf_counter()
+        module = importlib.import_module(blueprint.module_name)
+        self.import_seconds[blueprint.qualified_name] = time.perf_counter() - start
+        logging.info(
+            "Imported blueprint [%s] in [%.3f] seconds",
+            blueprint.qualified_name,
+            self.import_seconds[blueprint.qualified_name],
+        )
+        self.app.register_blueprint(
+            getattr(module, blueprint.attribute_name), url_prefix=blueprint.url_prefix
+        )
+
+    def load_all(self) -> None:
+        for url_prefix in self._blueprints_by_prefix:
+            self.load(url_prefix)
+
+    def import_time_report(self) -> str:
+        """Returns the import time of each loaded blueprint, slowest first.
+        Modules shared between blueprints are attributed to whichever blueprint
+        happened to import them first."""
+        return "\n".join(
+            f"{seconds:8.3f}s {name}"
+            for name, seconds in sorted(
+                self.import_seconds.items(), key=lambda item: -item[1]
+            )
+        )
@@ -90,6 +90,12 @@ class Region:
         stripe: (string) Stripe to which this region belongs to. This is used
             further divide up a timezone
         facility_id: (string) Default facility ID for region
+        persistence_write_shards: (int) For state direct ingest regions, the
+            number of shards to persist each ingest file in, in parallel. If
+            unset, files are persisted in a single transaction.
+        use_bulk_historical_snapshot_writes: (bool) For direct ingest regions,
+            whether to write historical snapshots with set-based statements
+            instead of one ORM object at a time.
     """
 
     region_code: str = attr.ib(converter=_to_lower)
@@ -111,6 +117,8 @@ class Region:
     is_direct_ingest: Optional[bool] = attr.ib(default=False)
     stripe: Optional[str] = attr.ib(default="0")
     facility_id: Optional[str] = attr.ib(default=None)
+    persistence_write_shards: Optional[int] = attr.ib(default=None)
+    use_bulk_historical_snapshot_writes: Optional[bool] = attr.ib(default=False)
 
     # TODO(#3162): Once SQL preprocessing flow is enabled for all direct ingest regions, delete these configs
     raw_vs_ingest_file_name_differentiation_enabled_env = attr.ib(default=None)
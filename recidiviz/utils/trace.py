@@ -16,12 +16,21 @@
 # =============================================================================
 """Functionality to make it easier to create and export traces"""
 
+import datetime
+import enum
+import os
+import random
+import sys
+import time
+from collections import Counter
 from contextvars import ContextVar
 from functools import wraps
-import time
-from typing import Any, Callable, Dict, List
+from types import FrameType
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+import attr
 from flask import request
+from google.protobuf.message import Message
 from opencensus.stats import measure, view, aggregation
 from opencensus.trace import (
     execution_context,
@@ -49,6 +58,203 @@ monitoring.register_views([duration_distribution_view])
 # detect recursion.
 stack: ContextVar[List[int]] = ContextVar("stack", default=[])
 
+# Max length of the summary recorded for the args or kwargs of a span.
+MAX_ARGUMENT_SUMMARY_LENGTH = 1000
+_MAX_SUMMARIZED_STRING_LENGTH = 200
+_MAX_SUMMARIZED_ITEMS = 10
+_MAX_SUMMARIZED_DEPTH = 2
+
+# The fraction of spans to run the sampling profiler for, see configure_span_profiling.
+_span_profile_rate = float(os.environ.get("RECIDIVIZ_SPAN_PROFILE_RATE", "0"))
+_span_profile_interval_seconds = 0.01
+# The profiler of the outermost span being profiled in this context, if any.
+_active_profiler: ContextVar[Optional["SamplingProfiler"]] = ContextVar(
+    "active_profiler", default=None
+)
+
+
+def _original(module_name: str, attribute: str) -> Any:
+    """Returns the given attribute of a module as it was before gevent monkey
+    patching, if gevent is in use."""
+    try:
+        # pylint: disable=import-outside-toplevel
+        from gevent import monkey
+
+        return monkey.get_original(module_name, attribute)
+    except ImportError:
+        return getattr(__import__(module_name), attribute)
+
+
+# The profiler needs a real OS thread, which keeps sampling while the profiled
+# code holds on to the gevent hub.
+_start_new_thread = _original("_thread", "start_new_thread")
+_get_ident = _original("_thread", "get_ident")
+_allocate_lock = _original("_thread", "allocate_lock")
+_sleep = _original("time", "sleep")
+
+
+def summarize_argument(value: Any, depth: int = 0) -> str:
+    """Returns a bounded, type-aware summary of |value| for recording on a
+    span. Small builtin values are rendered the same as by repr, while large
+    strings and collections are truncated, protos are described by their size,
+    entities by their id, and other objects by their type."""
+    if value is None or isinstance(
+        value, (bool, int, float, enum.Enum, datetime.date, datetime.timedelta)
+    ):
+        return repr(value)
+    if isinstance(value, (str, bytes)):
+        if len(value) <= _MAX_SUMMARIZED_STRING_LENGTH:
+            return repr(value)
+        return f"{value[:_MAX_SUMMARIZED_STRING_LENGTH]!r}...<{len(value)} total>"
+    if isinstance(value, Message):
+        return f"<{value.DESCRIPTOR.name} ({value.ByteSize()} bytes)>"
+    if isinstance(value, (list, tuple, set, frozenset, dict)):
+        return _summarize_collection(value, depth)
+    if attr.has(type(value)):
+        if hasattr(value, "get_id"):
+            return f"<{type(value).__name__} id={value.get_id()}>"
+        if depth >= _MAX_SUMMARIZED_DEPTH:
+            return f"<{type(value).__name__}>"
+        fields = ", ".join(
+            f"{field.name}={summarize_argument(getattr(value, field.name), depth + 1)}"
+            for field in attr.fields(type(value))[:_MAX_SUMMARIZED_ITEMS]
+            if field.repr
+        )
+        return f"{type(value).__name__}({fields})"
+    if callable(getattr(value, "get_id", None)):
+        return f"<{type(value).__name__} id={value.get_id()}>"
+    return f"<{type(value).__name__}>"
+
+
+def _summarize_collection(value: Any, depth: int) -> str:
+    if depth >= _MAX_SUMMARIZED_DEPTH:
+        return f"<{type(value).__name__} of {len(value)}>"
+
+    if isinstance(value, dict):
+        items = [
+            f"{summarize_argument(k, depth + 1)}: {summarize_argument(v, depth + 1)}"
+            for k, v in list(value.items())[:_MAX_SUMMARIZED_ITEMS]
+        ]
+    else:
+        items = [
+            summarize_argument(item, depth + 1)
+            for item in list(value)[:_MAX_SUMMARIZED_ITEMS]
+        ]
+    if len(value) > _MAX_SUMMARIZED_ITEMS:
+        items.append(f"...<{len(value)} total>")
+
+    contents = ", ".join(items)
+    if isinstance(value, dict):
+        return f"{{{contents}}}"
+    if isinstance(value, list):
+        return f"[{contents}]"
+    if isinstance(value, tuple):
+        return f"({contents},)" if len(value) == 1 else f"({contents})"
+    if not value:
+        return f"{type(value).__name__}()"
+    return f"{{{contents}}}"
+
+
+def _bounded_summary(value: Any) -> str:
+    summary = summarize_argument(value)
+    if len(summary) > MAX_ARGUMENT_SUMMARY_LENGTH:
+        return summary[:MAX_ARGUMENT_SUMMARY_LENGTH] + "..."
+    return summary
+
+
+def configure_span_profiling(
+    sample_rate: float, interval_seconds: float = 0.01
+) -> None:
+    """Runs the sampling profiler for |sample_rate| of all spans that are not
+    nested in another profiled span, sampling the stack every
+    |interval_seconds|. A |sample_rate| of 0 turns profiling off.
+
+    The initial rate can be set with the RECIDIVIZ_SPAN_PROFILE_RATE
+    environment variable.
+    """
+    global _span_profile_rate, _span_profile_interval_seconds
+    _span_profile_rate = sample_rate
+    _span_profile_interval_seconds = interval_seconds
+
+
+class SamplingProfiler:
+    """Wall-clock profiler that samples the stack of the thread that created
+    it every |interval_seconds| from a background thread, until stopped.
+
+    Only samples where |root_frame| is on the stack are counted, so that time
+    spent in other greenlets that share the thread is not attributed to the
+    profiled code."""
+
+    # Max number of innermost frames kept for each sampled stack
+    MAX_STACK_DEPTH = 12
+
+    def __init__(self, root_frame: FrameType, interval_seconds: float):
+        self.root_frame = root_frame
+        self.interval_seconds = interval_seconds
+        self.thread_id = _get_ident()
+        self.stack_counts: Counter[Tuple[str, ...]] = Counter()
+        self.num_samples = 0
+        self._stopped = False
+        # Guards the sample counts, which are written from the sampling thread
+        # and read from the profiled thread
+        self._lock = _allocate_lock()
+
+    def start(self) -> None:
+        _start_new_thread(self._run, ())
+
+    def stop(self) -> None:
+        """Stops sampling. No samples are recorded once this returns."""
+        with self._lock:
+            self._stopped = True
+
+    def _run(self) -> None:
+        while not self._stopped:
+            _sleep(self.interval_seconds)
+            self.sample()
+
+    def sample(self) -> None:
+        """Records the current stack of the profiled thread, if it is
+        running the profiled code."""
+        # pylint: disable=protected-access
+        frame: Optional[FrameType] = sys._current_frames().get(self.thread_id)
+        frames = []
+        while frame is not None and frame is not self.root_frame:
+            frames.append(frame)
+            frame = frame.f_back
+        if frame is None:
+            return
+
+        sampled_stack = tuple(
+            f"{f.f_globals.get('__name__')}.{f.f_code.co_name}:{f.f_lineno}"
+            for f in reversed(frames[: self.MAX_STACK_DEPTH])
+        )
+        with self._lock:
+            if self._stopped:
+                return
+            self.num_samples += 1
+            self.stack_counts[sampled_stack] += 1
+
+    def hot_path_summary(self, max_stacks: int = 5) -> str:
+        """Returns the most frequently sampled stacks, outermost frame first,
+        along with the share of samples they were seen in."""
+        with self._lock:
+            num_samples = self.num_samples
+            most_common_stacks = self.stack_counts.most_common(max_stacks)
+        return "\n".join(
+            f"{count / num_samples:.0%} ({count} samples): {' > '.join(frames)}"
+            for frames, count in most_common_stacks
+        )
+
+
+def _maybe_start_profiler(root_frame: FrameType) -> Optional[SamplingProfiler]:
+    if not _span_profile_rate or _active_profiler.get() is not None:
+        return None
+    if random.random() >= _span_profile_rate:
+        return None
+    profiler = SamplingProfiler(root_frame, _span_profile_interval_seconds)
+    profiler.start()
+    return profiler
+
 
 def span(func: Callable) -> Callable:
     """Creates a new span for this function in the trace.
@@ -62,8 +268,10 @@ def span(func: Callable) -> Callable:
         tracer: tracer_module.Tracer = execution_context.get_opencensus_tracer()
         with tracer.span(name=func.__qualname__) as new_span:
             new_span.add_attribute("recidiviz.function.module", func.__module__)
-            new_span.add_attribute("recidiviz.function.args", str(args))
-            new_span.add_attribute("recidiviz.function.kwargs", str(kwargs))
+            new_span.add_attribute("recidiviz.function.args", _bounded_summary(args))
+            new_span.add_attribute(
+                "recidiviz.function.kwargs", _bounded_summary(kwargs)
+            )
 
             with monitoring.measurements(
                 {
@@ -73,6 +281,9 @@ def span(func: Callable) -> Callable:
                 }
             ) as measurements:
                 stack_token = stack.set(stack.get() + [id(func)])
+                # pylint: disable=protected-access
+                profiler = _maybe_start_profiler(sys._getframe())
+                profiler_token = _active_profiler.set(profiler) if profiler else None
                 start = time.perf_counter()
 
                 try:
@@ -82,6 +293,12 @@ def span(func: Callable) -> Callable:
                         m_duration_s, time.perf_counter() - start
                     )
                     stack.reset(stack_token)
+                    if profiler and profiler_token:
+                        profiler.stop()
+                        _active_profiler.reset(profiler_token)
+                        hot_paths = profiler.hot_path_summary()
+                        new_span.add_attribute("recidiviz.profile.hot_paths", hot_paths)
+                        measurements.measure_put_attachment("hot_paths", hot_paths)
 
     return run_inside_new_span
 
@@ -17,6 +17,7 @@
 
 """Models an existence check, which identifies a validation issue by observing that there is any row returned
 in a given validation result set."""
+from typing import Any, Dict, List, Optional
 
 import attr
 
@@ -64,23 +65,53 @@ class ExistenceValidationChecker(ValidationChecker[ExistenceDataValidationCheck]
     def run_check(
         cls, validation_job: DataValidationJob[ExistenceDataValidationCheck]
     ) -> DataValidationJobResult:
-        was_successful = True
         invalid_rows = 0
         query_job = BigQueryClientImpl().run_query_async(validation_job.query_str(), [])
 
         # We need to iterate over the collection to initialize the query result set
         for _ in query_job:
             invalid_rows += 1
-            if validation_job.validation.num_allowed_rows < invalid_rows:
-                was_successful = False
-
-        description = None
-        if not was_successful:
-            num_allowed_rows = validation_job.validation.num_allowed_rows
-            description = f"Found [{invalid_rows}] invalid rows, though [{num_allowed_rows}] were expected"
-
-        return DataValidationJobResult(
-            validation_job=validation_job,
-            was_successful=was_successful,
-            failure_description=description,
+
+        return _result_for_invalid_rows(validation_job, invalid_rows)
+
+    @classmethod
+    def can_batch(cls, validation: ExistenceDataValidationCheck) -> bool:
+        return True
+
+    @classmethod
+    def batch_query_str(
+        cls, validation_jobs: List[DataValidationJob[ExistenceDataValidationCheck]]
+    ) -> str:
+        validation_query_str = validation_jobs[0].validation.query_str_for_region_codes(
+            [job.region_code for job in validation_jobs]
         )
+        return f"""SELECT region_code, COUNT(*) AS num_rows
+FROM ({validation_query_str.rstrip().rstrip(";")})
+GROUP BY region_code
+"""
+
+    @classmethod
+    def run_check_on_batch_summary(
+        cls,
+        validation_job: DataValidationJob[ExistenceDataValidationCheck],
+        summary: Optional[Dict[str, Any]],
+    ) -> DataValidationJobResult:
+        invalid_rows = summary["num_rows"] if summary else 0
+        return _result_for_invalid_rows(validation_job, invalid_rows)
+
+
+def _result_for_invalid_rows(
+    validation_job: DataValidationJob[ExistenceDataValidationCheck], invalid_rows: int
+) -> DataValidationJobResult:
+    num_allowed_rows = validation_job.validation.num_allowed_rows
+    was_successful = invalid_rows <= num_allowed_rows
+
+    description = None
+    if not was_successful:
+        description = f"Found [{invalid_rows}] invalid rows, though [{num_allowed_rows}] were expected"
+
+    return DataValidationJobResult(
+        validation_job=validation_job,
+        was_successful=was_successful,
+        failure_description=description,
+    )
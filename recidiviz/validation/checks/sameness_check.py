@@ -18,7 +18,7 @@
 """Models a sameness check, which identifies a validation issue by observing that values in a configured set of
 columns are not the same."""
 from enum import Enum
-from typing import List, Set
+from typing import Any, Dict, List, Optional, Set
 
 import attr
 from google.cloud.bigquery import QueryJob
@@ -35,6 +35,9 @@ from recidiviz.validation.validation_config import ValidationRegionConfig
 
 EMPTY_STRING_VALUE = "EMPTY_STRING_VALUE"
 
+# The maximum number of failing rows returned by a sameness check that is aggregated in BigQuery
+FAILED_ROW_SAMPLE_SIZE = 5
+
 
 class SamenessDataValidationCheckType(Enum):
     # For comparing integers and/or floats
@@ -85,6 +88,10 @@ class SamenessDataValidationCheck(DataValidationCheck):
 
     validation_type: ValidationCheckType = attr.ib(default=ValidationCheckType.SAMENESS)
 
+    # Whether to compute the errors in BigQuery, which then returns only a summary of the results and a sample of the
+    # failing rows, instead of returning every row of the validation view to be compared here
+    aggregate_in_big_query: bool = attr.ib(default=False)
+
     def updated_for_region(
         self, region_config: ValidationRegionConfig
     ) -> "SamenessDataValidationCheck":
@@ -106,6 +113,9 @@ class SamenessValidationChecker(ValidationChecker[SamenessDataValidationCheck]):
     def run_check(
         cls, validation_job: DataValidationJob[SamenessDataValidationCheck]
     ) -> DataValidationJobResult:
+        if validation_job.validation.aggregate_in_big_query:
+            return SamenessValidationChecker.run_aggregated_check(validation_job)
+
         comparison_columns = validation_job.validation.comparison_columns
         max_allowed_error = validation_job.validation.max_allowed_error
 
@@ -237,3 +247,258 @@ class SamenessValidationChecker(ValidationChecker[SamenessDataValidationCheck]):
             was_successful=was_successful,
             failure_description=description,
         )
+
+    @staticmethod
+    def run_aggregated_check(
+        validation_job: DataValidationJob[SamenessDataValidationCheck],
+    ) -> DataValidationJobResult:
+        """Performs the validation check for sameness check types in BigQuery, which returns a single row
+        summarizing the errors in the validation view."""
+        validation = validation_job.validation
+        query_str = _aggregated_query_str(
+            [validation_job], validation_job.query_str(), group_by_region=False
+        )
+
+        rows = list(BigQueryClientImpl().run_query_async(query_str, []))
+        if len(rows) != 1:
+            raise ValueError(
+                f"Expected a single summary row for validation [{validation.validation_name}], found [{len(rows)}]."
+            )
+        return _result_from_summary(validation_job, rows[0])
+
+    @classmethod
+    def can_batch(cls, validation: SamenessDataValidationCheck) -> bool:
+        # Checks that are not aggregated in BigQuery need every row of the validation view, so each region is
+        # queried separately to avoid holding the rows for every region in memory at once
+        return validation.aggregate_in_big_query
+
+    @classmethod
+    def batch_query_str(
+        cls, validation_jobs: List[DataValidationJob[SamenessDataValidationCheck]]
+    ) -> str:
+        validation = validation_jobs[0].validation
+        if not cls.can_batch(validation):
+            raise ValueError(
+                f"Cannot batch validation [{validation.validation_name}], which is not aggregated in BigQuery."
+            )
+        validation_query_str = validation.query_str_for_region_codes(
+            [job.region_code for job in validation_jobs]
+        )
+        return _aggregated_query_str(
+            validation_jobs, validation_query_str, group_by_region=True
+        )
+
+    @classmethod
+    def run_check_on_batch_summary(
+        cls,
+        validation_job: DataValidationJob[SamenessDataValidationCheck],
+        summary: Optional[Dict[str, Any]],
+    ) -> DataValidationJobResult:
+        # There is no summary row for a region with no rows in the validation view
+        if summary is None:
+            return DataValidationJobResult(
+                validation_job=validation_job,
+                was_successful=True,
+                failure_description=None,
+            )
+        return _result_from_summary(validation_job, summary)
+
+
+def _validation_rows_query(validation_query_str: str) -> str:
+    return validation_query_str.rstrip().rstrip(";")
+
+
+def _failed_row_sample_column(
+    comparison_columns: List[str], is_failed: str, order_by: str = ""
+) -> str:
+    order_by_clause = f"ORDER BY {order_by} " if order_by else ""
+    return (
+        f"ARRAY_AGG(IF({is_failed}, TO_JSON_STRING(STRUCT({', '.join(comparison_columns)})), NULL) "
+        f"IGNORE NULLS {order_by_clause}LIMIT {FAILED_ROW_SAMPLE_SIZE}) AS failed_row_sample"
+    )
+
+
+def _aggregated_query_str(
+    validation_jobs: List[DataValidationJob[SamenessDataValidationCheck]],
+    validation_query_str: str,
+    group_by_region: bool,
+) -> str:
+    """Returns a query that summarizes the errors in the rows returned by |validation_query_str| for the given jobs,
+    which are for the same validation. If |group_by_region| is set, the query returns a summary row per region
+    instead of a single summary row."""
+    validation = validation_jobs[0].validation
+    if validation.sameness_check_type == SamenessDataValidationCheckType.NUMBERS:
+        return _aggregated_numbers_query(
+            validation_query_str,
+            validation.comparison_columns,
+            _max_allowed_error_expression(validation_jobs),
+            group_by_region,
+        )
+    if validation.sameness_check_type == SamenessDataValidationCheckType.STRINGS:
+        return _aggregated_strings_query(
+            validation_query_str, validation.comparison_columns, group_by_region
+        )
+
+    raise ValueError(
+        f"Unexpected sameness_check_type of {validation.sameness_check_type}."
+    )
+
+
+def _max_allowed_error_expression(
+    validation_jobs: List[DataValidationJob[SamenessDataValidationCheck]],
+) -> str:
+    """Returns a SQL expression for the max allowed error of each row, which may be overridden for some regions."""
+    max_allowed_errors = {job.validation.max_allowed_error for job in validation_jobs}
+    if len(max_allowed_errors) == 1:
+        return repr(max_allowed_errors.pop())
+
+    cases = " ".join(
+        f"WHEN '{job.region_code}' THEN {job.validation.max_allowed_error!r}"
+        for job in validation_jobs
+    )
+    return f"CASE region_code {cases} END"
+
+
+def _aggregated_numbers_query(
+    validation_query_str: str,
+    comparison_columns: List[str],
+    max_allowed_error: str,
+    group_by_region: bool,
+) -> str:
+    """Returns a query that computes the error of each row returned by the validation query in the same way as
+    run_check_for_numbers, and summarizes them with the number of rows with a None value in each comparison column,
+    the number of failing rows, the highest error of those rows and a sample of them."""
+    float_columns = ", ".join(
+        f"CAST({column} AS FLOAT64)" for column in comparison_columns
+    )
+    null_counts = ",\n  ".join(
+        f"COUNTIF({column} IS NULL) AS null_count_{i}"
+        for i, column in enumerate(comparison_columns)
+    )
+    is_failed = f"error > {max_allowed_error}"
+    region_column = "region_code, " if group_by_region else ""
+    summary_region_column = "region_code,\n  " if group_by_region else ""
+    return f"""WITH validation_rows AS (
+  {_validation_rows_query(validation_query_str)}
+),
+comparison_values AS (
+  SELECT
+    {region_column}{', '.join(comparison_columns)},
+    GREATEST({float_columns}) AS max_value,
+    LEAST({float_columns}) AS min_value
+  FROM validation_rows
+),
+row_errors AS (
+  SELECT
+    *,
+    CASE
+      WHEN max_value = 0 AND min_value = 0 THEN 0.0
+      -- Comparing negative values to 0
+      WHEN max_value = 0 THEN 1.0
+      ELSE (max_value - min_value) / max_value
+    END AS error
+  FROM comparison_values
+)
+SELECT
+  {summary_region_column}{null_counts},
+  COUNTIF({is_failed}) AS failed_row_count,
+  MAX(IF({is_failed}, error, NULL)) AS highest_error,
+  {_failed_row_sample_column(comparison_columns, is_failed, order_by="error DESC")}
+FROM row_errors
+{_group_by_region_clause(group_by_region)}"""
+
+
+def _aggregated_strings_query(
+    validation_query_str: str, comparison_columns: List[str], group_by_region: bool
+) -> str:
+    """Returns a query that compares the values in each row returned by the validation query in the same way as
+    run_check_for_strings, and summarizes them with the number of rows, the number of rows whose values do not match
+    and a sample of those rows."""
+    first_value, *other_values = [
+        f"IFNULL({column}, '{EMPTY_STRING_VALUE}')" for column in comparison_columns
+    ]
+    is_failed = " OR ".join(f"{value} != {first_value}" for value in other_values)
+    region_column = "region_code,\n  " if group_by_region else ""
+    return f"""WITH validation_rows AS (
+  {_validation_rows_query(validation_query_str)}
+)
+SELECT
+  {region_column}COUNT(*) AS num_rows,
+  COUNTIF({is_failed}) AS num_errors,
+  {_failed_row_sample_column(comparison_columns, is_failed)}
+FROM validation_rows
+{_group_by_region_clause(group_by_region)}"""
+
+
+def _group_by_region_clause(group_by_region: bool) -> str:
+    return "GROUP BY region_code\n" if group_by_region else ""
+
+
+def _failed_row_sample_description(summary: Dict[str, Any]) -> str:
+    return f" Sample of failing rows: {list(summary['failed_row_sample'])}"
+
+
+def _result_from_summary(
+    validation_job: DataValidationJob[SamenessDataValidationCheck],
+    summary: Dict[str, Any],
+) -> DataValidationJobResult:
+    if (
+        validation_job.validation.sameness_check_type
+        == SamenessDataValidationCheckType.NUMBERS
+    ):
+        return _numbers_result_from_summary(validation_job, summary)
+    return _strings_result_from_summary(validation_job, summary)
+
+
+def _numbers_result_from_summary(
+    validation_job: DataValidationJob[SamenessDataValidationCheck],
+    summary: Dict[str, Any],
+) -> DataValidationJobResult:
+    validation = validation_job.validation
+    for i, column in enumerate(validation.comparison_columns):
+        if summary[f"null_count_{i}"]:
+            raise ValueError(
+                f"Unexpected None value for column [{column}] in validation [{validation.validation_name}]."
+            )
+
+    failed_row_count = summary["failed_row_count"]
+    was_successful = failed_row_count == 0
+
+    description = (
+        f"{failed_row_count} row(s) had unacceptable margins of error. The acceptable "
+        f"margin of error is only {validation.max_allowed_error}, but the validation returned rows with errors "
+        f"as high as {round(summary['highest_error'], 4)}."
+        + _failed_row_sample_description(summary)
+        if not was_successful
+        else None
+    )
+    return DataValidationJobResult(
+        validation_job=validation_job,
+        was_successful=was_successful,
+        failure_description=description,
+    )
+
+
+def _strings_result_from_summary(
+    validation_job: DataValidationJob[SamenessDataValidationCheck],
+    summary: Dict[str, Any],
+) -> DataValidationJobResult:
+    max_allowed_error = validation_job.validation.max_allowed_error
+    num_errors = summary["num_errors"]
+    num_rows = summary["num_rows"]
+
+    error_rate = (num_errors / num_rows) if num_rows > 0 else 0.0
+    was_successful = error_rate <= max_allowed_error
+
+    description = (
+        f"{num_errors} out of {num_rows} row(s) did not contain matching strings. The acceptable "
+        f"margin of error is only {max_allowed_error}, but the validation returned an error rate of "
+        f"{error_rate}." + _failed_row_sample_description(summary)
+        if not was_successful
+        else None
+    )
+    return DataValidationJobResult(
+        validation_job=validation_job,
+        was_successful=was_successful,
+        failure_description=description,
+    )
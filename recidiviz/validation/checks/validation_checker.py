@@ -18,8 +18,9 @@
 """An interface for validation checkers."""
 
 import abc
-from typing import Generic
+from typing import Any, Dict, Generic, List, Optional
 
+from recidiviz.big_query.big_query_client import BigQueryClientImpl
 from recidiviz.validation.validation_models import (
     DataValidationType,
     DataValidationJob,
@@ -35,3 +36,45 @@ class ValidationChecker(Generic[DataValidationType]):
         self, validation_job: DataValidationJob[DataValidationType]
     ) -> DataValidationJobResult:
         pass
+
+    @abc.abstractmethod
+    def can_batch(self, validation: DataValidationType) -> bool:
+        """Returns whether jobs for the given validation in different regions can be performed with a single batch
+        query. Only validations whose batch query returns a single summary row per region can be batched, so that the
+        results for every region do not need to be held in memory at once."""
+
+    @abc.abstractmethod
+    def batch_query_str(
+        self, validation_jobs: List[DataValidationJob[DataValidationType]]
+    ) -> str:
+        """Returns a single query for the results of all of the given jobs, which are for the same validation in
+        different regions. The query returns at most one summary row per region, with a region_code column with the
+        region of the job it is for."""
+
+    @abc.abstractmethod
+    def run_check_on_batch_summary(
+        self,
+        validation_job: DataValidationJob[DataValidationType],
+        summary: Optional[Dict[str, Any]],
+    ) -> DataValidationJobResult:
+        """Performs the check for the given job on the summary row for its region returned by the batch query, which
+        is None if the validation view has no rows for the region."""
+
+    def fetch_batch_summaries(
+        self, validation_jobs: List[DataValidationJob[DataValidationType]]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Runs the batch query for the given jobs, and returns the resulting summary row for each region code."""
+        query_job = BigQueryClientImpl().run_query_async(
+            self.batch_query_str(validation_jobs), []
+        )
+
+        summaries_by_region: Dict[str, Dict[str, Any]] = {}
+        for row in query_job:
+            region_code = row["region_code"]
+            if region_code in summaries_by_region:
+                raise ValueError(
+                    f"Expected a single summary row for region [{region_code}] in validation "
+                    f"[{validation_jobs[0].validation.validation_name}], found more than one."
+                )
+            summaries_by_region[region_code] = row
+        return summaries_by_region
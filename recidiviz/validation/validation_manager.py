@@ -19,7 +19,7 @@
 from concurrent import futures
 from http import HTTPStatus
 import logging
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, Union
 
 from opencensus.stats import aggregation, measure, view
 
@@ -40,6 +40,7 @@ from recidiviz.validation.configured_validations import (
 from recidiviz.validation.validation_models import (
     DataValidationJob,
     DataValidationJobResult,
+    ValidationCheckType,
 )
 
 m_failed_to_run_validations = measure.MeasureInt(
@@ -81,6 +82,10 @@ monitoring.register_views([failed_validations_view, failed_to_run_validations_vi
 
 validation_manager_blueprint = Blueprint("validation_manager", __name__)
 
+# The maximum number of validation queries to run in BigQuery at once, which leaves room under the project's quota for
+# concurrent interactive queries for other queries run while validations are running
+MAX_CONCURRENT_VALIDATION_QUERIES = 50
+
 
 @validation_manager_blueprint.route("/validate")
 @requires_gae_auth
@@ -103,21 +108,49 @@ def execute_validation(
 
     # Fetch collection of validation jobs to perform
     validation_jobs = _fetch_validation_jobs_to_perform(region_code_filter)
-    logging.info("Performing a total of %s validation jobs...", len(validation_jobs))
+    validation_job_batches = _plan_validation_job_batches(validation_jobs)
+    logging.info(
+        "Performing a total of %s validation jobs in %s batches...",
+        len(validation_jobs),
+        len(validation_job_batches),
+    )
 
     # Perform all validations and track failures
     failed_to_run_validations: List[DataValidationJob] = []
     failed_validations: List[DataValidationJobResult] = []
-    with futures.ThreadPoolExecutor() as executor:
-        future_to_jobs = {
-            executor.submit(structured_logging.with_context(_run_job), job): job
-            for job in validation_jobs
+    with futures.ThreadPoolExecutor(
+        max_workers=MAX_CONCURRENT_VALIDATION_QUERIES
+    ) as executor:
+        future_to_job_batches = {
+            executor.submit(
+                structured_logging.with_context(_run_job_batch), batch
+            ): batch
+            for batch in validation_job_batches
         }
 
-        for future in futures.as_completed(future_to_jobs):
-            job = future_to_jobs[future]
+        for future in futures.as_completed(future_to_job_batches):
+            batch = future_to_job_batches[future]
             try:
-                result = future.result()
+                batch_results = future.result()
+            except Exception as e:
+                logging.error(
+                    "Failed to execute asynchronous query for validation job batch [%s] due to error: %s",
+                    batch,
+                    e,
+                )
+                failed_to_run_validations.extend(batch)
+                continue
+
+            for job, result in zip(batch, batch_results):
+                if isinstance(result, Exception):
+                    logging.error(
+                        "Failed to execute asynchronous query for validation job [%s] due to error: %s",
+                        job,
+                        result,
+                    )
+                    failed_to_run_validations.append(job)
+                    continue
+
                 if not result.was_successful:
                     failed_validations.append(result)
                 logging.info(
@@ -125,13 +158,6 @@ def execute_validation(
                     job.validation.validation_name,
                     job.region_code,
                 )
-            except Exception as e:
-                logging.error(
-                    "Failed to execute asynchronous query for validation job [%s] due to error: %s",
-                    job,
-                    e,
-                )
-                failed_to_run_validations.append(job)
 
     if failed_validations or failed_to_run_validations:
         logging.error(
@@ -155,6 +181,56 @@ def _run_job(job: DataValidationJob) -> DataValidationJobResult:
     return validation_checker.run_check(job)
 
 
+def _run_job_batch(
+    batch: List[DataValidationJob],
+) -> List[Union[DataValidationJobResult, Exception]]:
+    """Performs the given jobs, which are for the same validation in different regions, with a single query that
+    summarizes the validation results of each of their regions. Returns the result of each job, or the error raised
+    while performing it. Raises if the query fails."""
+    if len(batch) == 1:
+        try:
+            return [_run_job(batch[0])]
+        except Exception as e:
+            return [e]
+
+    validation_checker = checker_for_validation(batch[0])
+    summaries_by_region = validation_checker.fetch_batch_summaries(batch)
+
+    results: List[Union[DataValidationJobResult, Exception]] = []
+    for job in batch:
+        try:
+            results.append(
+                validation_checker.run_check_on_batch_summary(
+                    job, summaries_by_region.get(job.region_code)
+                )
+            )
+        except Exception as e:
+            results.append(e)
+    return results
+
+
+def _plan_validation_job_batches(
+    validation_jobs: List[DataValidationJob],
+) -> List[List[DataValidationJob]]:
+    """Groups the jobs for each validation across regions into a batch, so that the view for each validation is
+    queried once for all regions. Jobs for validations that cannot be batched are each run on their own."""
+    batches: List[List[DataValidationJob]] = []
+    batches_by_validation: Dict[
+        Tuple[ValidationCheckType, str], List[DataValidationJob]
+    ] = {}
+    for job in validation_jobs:
+        if not checker_for_validation(job).can_batch(job.validation):
+            batches.append([job])
+            continue
+
+        batch_key = (job.validation.validation_type, job.validation.validation_name)
+        if batch_key not in batches_by_validation:
+            batches_by_validation[batch_key] = []
+            batches.append(batches_by_validation[batch_key])
+        batches_by_validation[batch_key].append(job)
+    return batches
+
+
 def _fetch_validation_jobs_to_perform(
     region_code_filter: Optional[str] = None,
 ) -> List[DataValidationJob]:
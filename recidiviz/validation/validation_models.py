@@ -18,7 +18,7 @@
 """Models representing data validation."""
 import abc
 from enum import Enum
-from typing import Optional, TypeVar, Generic
+from typing import List, Optional, TypeVar, Generic
 
 import attr
 
@@ -61,6 +61,10 @@ class DataValidationCheck(BuildableAttr):
     def query_str_for_region_code(self, region_code: str) -> str:
         return f"{self.view.select_query} WHERE region_code = '{region_code}';"
 
+    def query_str_for_region_codes(self, region_codes: List[str]) -> str:
+        region_codes_str = ", ".join(f"'{region_code}'" for region_code in region_codes)
+        return f"{self.view.select_query} WHERE region_code IN ({region_codes_str});"
+
 
 DataValidationType = TypeVar("DataValidationType", bound=DataValidationCheck)
 